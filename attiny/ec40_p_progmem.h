@@ -0,0 +1,233 @@
+#ifndef EC40_P_PROGMEM_H
+#define EC40_P_PROGMEM_H
+
+// Tablas P (nibble 14) comprimidas, auto-generadas por progmem_tables.py
+// Índice = (Temp_C + 40) * 10; las celdas no observadas devuelven un valor sin definir
+// 49 tablas, 1772 bytes de flash
+
+#include <stdint.h>
+#include <avr/pgmspace.h>
+
+#define EC40_ENC_PACKED 0
+#define EC40_ENC_XOR_DELTA 1
+#define EC40_ENC_RLE 2
+
+// house, nib7 | codificación << 4, t_lo, span, offset en EC40_P_DATA
+typedef struct {
+    uint8_t house;
+    uint8_t nib7_enc;
+    uint16_t t_lo;
+    uint16_t span;
+    uint16_t off;
+} ec40_ptable_t;
+
+#define EC40_P_TABLE_COUNT 49
+
+static const ec40_ptable_t EC40_P_DIR[EC40_P_TABLE_COUNT] PROGMEM = {
+    {0, 0x8 | (EC40_ENC_RLE << 4), 896, 27, 0},
+    {3, 0x0 | (EC40_ENC_XOR_DELTA << 4), 531, 49, 3},
+    {3, 0x1 | (EC40_ENC_RLE << 4), 580, 222, 6},
+    {3, 0x2 | (EC40_ENC_XOR_DELTA << 4), 535, 15, 94},
+    {18, 0x0 | (EC40_ENC_PACKED << 4), 597, 3, 97},
+    {18, 0x2 | (EC40_ENC_PACKED << 4), 594, 6, 99},
+    {18, 0x8 | (EC40_ENC_RLE << 4), 600, 162, 102},
+    {39, 0x8 | (EC40_ENC_RLE << 4), 533, 36, 144},
+    {44, 0x8 | (EC40_ENC_PACKED << 4), 575, 1, 158},
+    {53, 0x2 | (EC40_ENC_PACKED << 4), 534, 3, 159},
+    {53, 0x8 | (EC40_ENC_RLE << 4), 533, 70, 161},
+    {71, 0x1 | (EC40_ENC_PACKED << 4), 560, 2, 193},
+    {71, 0x8 | (EC40_ENC_RLE << 4), 498, 62, 194},
+    {73, 0x8 | (EC40_ENC_PACKED << 4), 601, 22, 221},
+    {79, 0x8 | (EC40_ENC_PACKED << 4), 609, 1, 232},
+    {92, 0x8 | (EC40_ENC_PACKED << 4), 945, 1, 233},
+    {94, 0x8 | (EC40_ENC_PACKED << 4), 590, 2, 234},
+    {95, 0x1 | (EC40_ENC_PACKED << 4), 566, 74, 235},
+    {95, 0x8 | (EC40_ENC_RLE << 4), 516, 124, 272},
+    {96, 0x2 | (EC40_ENC_PACKED << 4), 666, 53, 304},
+    {96, 0x8 | (EC40_ENC_RLE << 4), 720, 170, 331},
+    {121, 0x1 | (EC40_ENC_PACKED << 4), 590, 74, 373},
+    {121, 0x8 | (EC40_ENC_RLE << 4), 530, 135, 410},
+    {124, 0x2 | (EC40_ENC_PACKED << 4), 530, 55, 452},
+    {124, 0x8 | (EC40_ENC_RLE << 4), 529, 124, 480},
+    {131, 0x1 | (EC40_ENC_PACKED << 4), 517, 3, 518},
+    {131, 0x2 | (EC40_ENC_RLE << 4), 516, 18, 520},
+    {131, 0x8 | (EC40_ENC_RLE << 4), 528, 136, 526},
+    {132, 0x8 | (EC40_ENC_PACKED << 4), 603, 16, 564},
+    {135, 0x8 | (EC40_ENC_XOR_DELTA << 4), 803, 143, 572},
+    {151, 0x8 | (EC40_ENC_PACKED << 4), 604, 14, 581},
+    {155, 0x8 | (EC40_ENC_RLE << 4), 601, 27, 588},
+    {173, 0x1 | (EC40_ENC_RLE << 4), 583, 180, 601},
+    {173, 0x2 | (EC40_ENC_RLE << 4), 580, 107, 688},
+    {173, 0x8 | (EC40_ENC_RLE << 4), 584, 180, 707},
+    {184, 0x2 | (EC40_ENC_PACKED << 4), 525, 9, 737},
+    {184, 0x8 | (EC40_ENC_RLE << 4), 524, 115, 742},
+    {187, 0x1 | (EC40_ENC_RLE << 4), 582, 69, 779},
+    {187, 0x8 | (EC40_ENC_RLE << 4), 525, 127, 807},
+    {205, 0x1 | (EC40_ENC_RLE << 4), 516, 79, 838},
+    {205, 0x8 | (EC40_ENC_RLE << 4), 516, 172, 864},
+    {232, 0x1 | (EC40_ENC_RLE << 4), 584, 93, 903},
+    {232, 0x8 | (EC40_ENC_RLE << 4), 529, 74, 924},
+    {247, 0x0 | (EC40_ENC_XOR_DELTA << 4), 254, 417, 955},
+    {247, 0x1 | (EC40_ENC_XOR_DELTA << 4), 376, 639, 958},
+    {247, 0x2 | (EC40_ENC_XOR_DELTA << 4), 240, 747, 961},
+    {247, 0x8 | (EC40_ENC_XOR_DELTA << 4), 550, 60, 964},
+    {251, 0x8 | (EC40_ENC_PACKED << 4), 610, 1, 967},
+    {255, 0x8 | (EC40_ENC_PACKED << 4), 584, 47, 968},
+};
+
+static const uint8_t EC40_P_DATA[992] PROGMEM = {
+    0x4F, 0x49, 0x80, 0x06, 0x00, 0x00, 0x90, 0xE0, 0x70, 0x01, 0x50, 0xC0, 0xB0, 0xF3, 0x25, 0xA4,
+    0x85, 0x04, 0xF3, 0x27, 0xE7, 0x52, 0xC3, 0x22, 0xE1, 0x02, 0x42, 0xE2, 0xC1, 0x21, 0x11, 0x81,
+    0x61, 0x31, 0xD1, 0xE1, 0xD1, 0x30, 0x11, 0xF1, 0xC0, 0xB1, 0xE0, 0x70, 0x01, 0x50, 0xC0, 0xB0,
+    0xF0, 0x81, 0xB0, 0x20, 0x50, 0x70, 0x00, 0x90, 0xE0, 0xA0, 0xD0, 0x10, 0x60, 0xF0, 0x80, 0xA0,
+    0xD0, 0x40, 0x30, 0x70, 0x00, 0x41, 0xA1, 0xF1, 0x11, 0x20, 0x51, 0xC0, 0x50, 0x20, 0x00, 0x70,
+    0xE0, 0x90, 0xD0, 0xA0, 0xE0, 0x90, 0x00, 0x70, 0x56, 0x2F, 0x2F, 0x2F, 0x2B, 0x10, 0x00, 0x00,
+    0x00, 0x25, 0x60, 0x8A, 0xD4, 0x37, 0x70, 0xB0, 0xC0, 0x50, 0x20, 0x00, 0x70, 0xE0, 0xD1, 0xA0,
+    0xE0, 0x91, 0x00, 0x51, 0xC2, 0x81, 0x11, 0xF1, 0xA2, 0x41, 0x01, 0x32, 0xD2, 0x12, 0x52, 0x12,
+    0x32, 0x93, 0xD4, 0x63, 0x54, 0xE5, 0x45, 0xC6, 0x46, 0x58, 0xA8, 0x0A, 0x7A, 0xAD, 0x8B, 0xE0,
+    0xF6, 0xA9, 0x32, 0xF2, 0xC1, 0x51, 0xB1, 0xC0, 0xE0, 0x90, 0x00, 0x70, 0x30, 0x00, 0xC0, 0xA8,
+    0x60, 0xD3, 0x10, 0x60, 0x20, 0x50, 0xF0, 0x80, 0x10, 0x60, 0x40, 0x31, 0xA0, 0x91, 0xE0, 0xD0,
+    0x40, 0x31, 0x11, 0xF0, 0xC1, 0xB1, 0x21, 0xC2, 0x92, 0x32, 0x73, 0xB3, 0x64, 0xD4, 0x16, 0x82,
+    0x70, 0x81, 0x5F, 0xF7, 0xD2, 0x72, 0x41, 0xD2, 0x12, 0x21, 0x50, 0x81, 0x10, 0x60, 0x31, 0xD1,
+    0x90, 0xE0, 0xA0, 0xD0, 0x40, 0x30, 0x10, 0x60, 0xF0, 0x80, 0xC0, 0xB0, 0x50, 0x2C, 0xD5, 0x07,
+    0x0B, 0x00, 0x0E, 0x00, 0x0F, 0x02, 0x00, 0x08, 0xA0, 0x40, 0x21, 0xD9, 0xA0, 0x60, 0x00, 0x0B,
+    0x00, 0x07, 0x00, 0x50, 0x0F, 0x00, 0xC0, 0x20, 0x70, 0x09, 0xA0, 0xD1, 0x6F, 0x8A, 0xD4, 0x37,
+    0x04, 0x3A, 0xDF, 0x81, 0x62, 0x5B, 0xC5, 0x20, 0x7E, 0x9D, 0xAE, 0x97, 0x05, 0x2B, 0xF0, 0x02,
+    0xF5, 0x75, 0xA3, 0x13, 0x52, 0x12, 0x41, 0xA1, 0xD0, 0xE1, 0xA0, 0xD0, 0x31, 0x10, 0x60, 0xF0,
+    0x80, 0xC0, 0xB0, 0x50, 0x20, 0xB0, 0xC0, 0xE0, 0x90, 0x00, 0x7F, 0x7F, 0x7F, 0x7F, 0x78, 0x20,
+    0x70, 0x43, 0x70, 0x9E, 0x0B, 0x20, 0x16, 0x43, 0xAD, 0xF8, 0x06, 0x25, 0x10, 0xF0, 0xA0, 0x43,
+    0x00, 0xC0, 0x25, 0x00, 0x00, 0xAD, 0x0E, 0x00, 0x20, 0xC0, 0xF0, 0x11, 0xF0, 0x81, 0xD1, 0x31,
+    0x01, 0x32, 0xF1, 0x11, 0x21, 0xF2, 0x63, 0xD4, 0x42, 0x61, 0x82, 0x52, 0xC2, 0x02, 0x42, 0xE5,
+    0x62, 0x42, 0x83, 0x52, 0x13, 0xA2, 0x07, 0x98, 0x53, 0x84, 0xD5, 0x34, 0xF4, 0x84, 0x44, 0xD5,
+    0x85, 0xC5, 0x45, 0xCE, 0x50, 0x20, 0x57, 0x90, 0xEA, 0xD1, 0x6F, 0x8A, 0xD4, 0x37, 0x04, 0xD0,
+    0x0F, 0x10, 0x65, 0x0C, 0x02, 0x07, 0x09, 0x0A, 0x09, 0x00, 0xB0, 0x00, 0xC8, 0x50, 0x2C, 0x0E,
+    0x90, 0x74, 0x00, 0x7E, 0x9B, 0xC5, 0x26, 0x1F, 0x81, 0x64, 0x15, 0x52, 0x12, 0x41, 0xA1, 0x91,
+    0xE0, 0xA0, 0x41, 0x30, 0x10, 0xF1, 0x80, 0xC0, 0xB0, 0x50, 0x20, 0xB0, 0xC0, 0x02, 0x31, 0x01,
+    0xE1, 0xB1, 0xC0, 0x21, 0x60, 0x31, 0x40, 0xA1, 0x80, 0xF0, 0x60, 0x10, 0x50, 0x20, 0x6F, 0x6F,
+    0x6F, 0x6F, 0x6A, 0xC0, 0x73, 0x4D, 0xA8, 0xF6, 0x15, 0x28, 0xF6, 0x13, 0x40, 0xDE, 0x09, 0xA0,
+    0x36, 0x00, 0x10, 0xB0, 0x20, 0x00, 0xC0, 0x07, 0x00, 0x30, 0x00, 0x09, 0x00, 0x05, 0x03, 0xF0,
+    0x4F, 0x4F, 0x4F, 0x47, 0x80, 0xF0, 0x60, 0x10, 0x50, 0x20, 0x60, 0x10, 0x80, 0xF0, 0xD0, 0xA0,
+    0x30, 0x41, 0x00, 0xB0, 0xC1, 0x50, 0x00, 0x71, 0xE0, 0xD3, 0xA2, 0x71, 0xB2, 0x81, 0x62, 0x82,
+    0x43, 0x03, 0xD3, 0x87, 0x32, 0xE0, 0xC0, 0x10, 0xDC, 0x00, 0x70, 0x30, 0x40, 0xD0, 0x05, 0xD0,
+    0xF0, 0x80, 0x10, 0x60, 0x20, 0x50, 0xF0, 0x80, 0x10, 0x61, 0x40, 0xA0, 0xD0, 0x91, 0xE1, 0xD0,
+    0x31, 0x12, 0xF1, 0xB2, 0x22, 0xE2, 0x72, 0x02, 0x93, 0x53, 0x33, 0x84, 0x55, 0xF5, 0x7F, 0x7A,
+    0xFA, 0xAA, 0x68, 0x10, 0x52, 0x07, 0xE9, 0xDA, 0xE0, 0x90, 0x20, 0x0B, 0x07, 0x03, 0x00, 0x05,
+    0x00, 0xC6, 0x04, 0xE4, 0x08, 0xE0, 0x9D, 0xA0, 0x00, 0x20, 0x0C, 0x07, 0xB0, 0xC0, 0x50, 0x01,
+    0xE1, 0x22, 0xA1, 0x91, 0x64, 0xC0, 0x31, 0x13, 0x80, 0x00, 0x20, 0x52, 0xB0, 0xF0, 0x80, 0xC0,
+    0x21, 0x70, 0x00, 0x91, 0xE0, 0xA2, 0x61, 0xF1, 0x40, 0x3F, 0x3F, 0x3F, 0x3F, 0x3F, 0x31, 0xB1,
+    0x51, 0x01, 0x90, 0xD2, 0x10, 0xF1, 0x80, 0xA0, 0xD0, 0x40, 0x30, 0x70, 0x00, 0x40, 0x30, 0xA0,
+    0xD0, 0xF0, 0x80, 0x10, 0x60, 0x20, 0x50, 0xB0, 0xC0, 0x50, 0x20, 0x00, 0x70, 0xE0, 0x90, 0xD0,
+    0x90, 0xA0, 0x90, 0x00, 0x70, 0x20, 0x50, 0xC1, 0x80, 0x51, 0x20, 0xB0, 0xC0, 0xE0, 0x90, 0x00,
+    0x70, 0x30, 0x40, 0x00, 0x70, 0xE0, 0x90, 0xB0, 0xC0, 0x50, 0x20, 0x60, 0x10, 0xF0, 0x80, 0x11,
+    0x60, 0x39, 0x80, 0x60, 0x80, 0xF2, 0xAF, 0xA8, 0xFF, 0xF2, 0x4B, 0xC8, 0x45, 0xE4, 0x53, 0x33,
+    0xF2, 0x11, 0x50, 0x14, 0x21, 0x80, 0xD1, 0xA0, 0x30, 0x40, 0x01, 0xB0, 0xC0, 0x50, 0x20, 0x00,
+    0x70, 0xE0, 0x90, 0xD0, 0xA0, 0xE0, 0x9F, 0x9F, 0x9F, 0x9F, 0x9F, 0x9F, 0x9F, 0x9F, 0x9F, 0x98,
+    0x20, 0xDA, 0x34, 0x07, 0x03, 0xD0, 0xDA, 0xF0, 0x80, 0x10, 0x60, 0x20, 0x50, 0xF0, 0x80, 0x10,
+    0x60, 0x41, 0x31, 0xD0, 0xE2, 0xA1, 0x31, 0x61, 0x80, 0xB2, 0x50, 0xC1, 0xE2, 0x02, 0x41, 0xE3,
+    0xB4, 0x64, 0xA4, 0x55, 0xF6, 0x77, 0xE5, 0x57, 0x15, 0x73, 0xF0, 0xB4, 0x98, 0x64, 0xA2, 0x32,
+    0x42, 0xD2, 0x12, 0x21, 0xB1, 0x51, 0x72, 0x91, 0xD0, 0xE1, 0x01, 0x51, 0xC2, 0x80, 0xF0, 0xB2,
+    0xC0, 0x91, 0x00, 0x70, 0x41, 0x00, 0x70, 0x03, 0xD3, 0x63, 0x51, 0x12, 0x41, 0xA1, 0xD0, 0xE1,
+    0xA0, 0xD0, 0x31, 0x61, 0xF0, 0x80, 0xC0, 0xB0, 0x50, 0x20, 0xB0, 0xC0, 0xE0, 0x90, 0x43, 0x27,
+    0xDF, 0xDF, 0xDF, 0xDF, 0xD9, 0x40, 0x80, 0x10, 0x60, 0x20, 0x50, 0xB1, 0xC0, 0x21, 0x01, 0xE1,
+    0xD1, 0xE1, 0x02, 0x50, 0xC2, 0x82, 0x22, 0xE2, 0x73, 0x03, 0xB3, 0x64, 0x15, 0xD4, 0x37, 0xC8,
+    0xBF, 0xBF, 0xBF, 0xBF, 0xB8, 0x11, 0xD2, 0x31, 0x72, 0x23, 0x08, 0xF6, 0xD5, 0x44, 0x84, 0x53,
+    0x63, 0xD7, 0x11, 0x20, 0xC3, 0x22, 0xE2, 0x01, 0x70, 0x41, 0x00, 0xE1, 0x90, 0xB0, 0xC0, 0x50,
+    0x20, 0x11, 0x41, 0xD0, 0x81, 0x12, 0x60, 0x7F, 0x73, 0xF1, 0xA0, 0x42, 0x31, 0x42, 0xA3, 0x83,
+    0x51, 0xE1, 0x25, 0x95, 0x76, 0xF5, 0x43, 0x07, 0xD3, 0x52, 0xF4, 0x90, 0x28, 0x64, 0xD3, 0xA2,
+    0x32, 0x61, 0xC2, 0x51, 0xB1, 0xE1, 0x90, 0x71, 0x30, 0x40, 0x00, 0x70, 0xE0, 0x90, 0xB0, 0xC0,
+    0x50, 0x20, 0x60, 0x10, 0x30, 0x40, 0xD0, 0xA0, 0x8F, 0x82, 0x50, 0x06, 0x00, 0x00, 0x0D, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x07, 0x00, 0x00, 0xE0, 0xA8, 0xF6, 0x12, 0x60, 0x18, 0xFD, 0xA3, 0x04,
+    0x7B, 0x52, 0x00, 0x00, 0x59, 0x00, 0x0A, 0x80, 0x07, 0x00, 0x00, 0x03, 0x00, 0x04, 0x00, 0x00
+};
+
+// P_BASE (nib7 = 2) de oregon_p_lut_complete.py, dos nibbles por byte
+#define EC40_P_BASE_T_LO 240
+#define EC40_P_BASE_SPAN 775
+static const uint8_t EC40_P_BASE[388] PROGMEM = {
+    0xA4, 0x37, 0x09, 0xEC, 0xB2, 0x51, 0x62, 0x5C, 0xB9, 0xE7, 0x0A, 0xD9, 0xE7, 0x00, 0x5C, 0xBF,
+    0x8C, 0xB2, 0x57, 0x09, 0xE0, 0x73, 0x4D, 0xA0, 0xF6, 0x15, 0x26, 0x08, 0x0D, 0xA3, 0x48, 0x0B,
+    0xC0, 0x20, 0x7E, 0x9D, 0xAE, 0x90, 0x75, 0x0B, 0xCE, 0x90, 0xA3, 0x40, 0x18, 0xFB, 0xC8, 0xF6,
+    0x10, 0x40, 0xA4, 0x37, 0x00, 0xEC, 0x02, 0x50, 0x60, 0x5C, 0xB9, 0x07, 0x0A, 0xD9, 0xE7, 0x02,
+    0x5C, 0x0F, 0x0C, 0xB0, 0x50, 0x09, 0xE0, 0x03, 0x0D, 0x08, 0x00, 0x10, 0x20, 0x10, 0xF0, 0xA0,
+    0x4B, 0x25, 0x70, 0x90, 0xA0, 0x90, 0x70, 0x20, 0xCB, 0xF8, 0x61, 0x8F, 0x0A, 0x04, 0x07, 0x34,
+    0xDA, 0x8F, 0x01, 0x52, 0x8F, 0x60, 0x30, 0xDA, 0xE9, 0xDA, 0x34, 0x61, 0x80, 0xBC, 0x05, 0xCB,
+    0x9E, 0x70, 0x43, 0x00, 0x9E, 0xCB, 0x25, 0x16, 0x43, 0xA0, 0xF8, 0x10, 0x25, 0x16, 0x08, 0x0D,
+    0x43, 0x70, 0xCB, 0x25, 0x70, 0x9E, 0xAD, 0x9E, 0x70, 0x25, 0xCB, 0xF8, 0x61, 0x8F, 0xDA, 0x34,
+    0x07, 0x34, 0xDA, 0x8F, 0x61, 0x52, 0x8F, 0x61, 0x34, 0xDA, 0xE9, 0xDA, 0x34, 0x61, 0x8F, 0xBC,
+    0x25, 0xCB, 0x9E, 0x70, 0x43, 0x70, 0x9E, 0xCB, 0x25, 0x16, 0x43, 0xAD, 0xF8, 0x10, 0x25, 0x06,
+    0xF8, 0x0D, 0x43, 0x70, 0xCB, 0x25, 0x70, 0x9E, 0xAD, 0x9E, 0x70, 0x25, 0xCB, 0xF8, 0x61, 0x8F,
+    0x0A, 0x34, 0x07, 0x04, 0xDA, 0x80, 0x61, 0x02, 0x8F, 0x61, 0x34, 0xDA, 0x09, 0x0A, 0x34, 0x60,
+    0x8F, 0xBC, 0x25, 0xCB, 0x0E, 0x70, 0x40, 0x70, 0x90, 0x00, 0x20, 0x00, 0x40, 0x00, 0x00, 0x10,
+    0x00, 0x00, 0xF0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0E, 0x00, 0x00, 0x00, 0x00, 0x0B, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0x00, 0x00, 0xD0, 0x00, 0x00,
+    0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x09, 0x00, 0x00, 0x07, 0x02,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x40, 0x00, 0xF0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x0B, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x09, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x30, 0x00, 0x00, 0x50, 0x00, 0x00, 0x00, 0xE0,
+    0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x40, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x09, 0x00, 0x00, 0x07, 0x00, 0x00,
+    0x00, 0x01, 0x00, 0x00, 0x00, 0x60, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x50
+};
+
+static inline uint8_t ec40_dec_packed(uint16_t off, uint16_t i)
+{
+    uint8_t b = pgm_read_byte(&EC40_P_DATA[off + (i >> 1)]);
+    return (i & 1) ? (b & 0x0F) : (b >> 4);
+}
+
+static inline uint8_t ec40_base_p(uint16_t temp_idx)
+{
+    if (temp_idx < EC40_P_BASE_T_LO || temp_idx - EC40_P_BASE_T_LO >= EC40_P_BASE_SPAN) return 0;
+    uint16_t i = temp_idx - EC40_P_BASE_T_LO;
+    uint8_t b = pgm_read_byte(&EC40_P_BASE[i >> 1]);
+    return (i & 1) ? (b & 0x0F) : (b >> 4);
+}
+
+static inline uint8_t ec40_dec_xor_delta(uint16_t off, uint16_t t_lo, uint16_t i)
+{
+    const uint8_t *q = &EC40_P_DATA[off];
+    uint8_t x = pgm_read_byte(q);
+    uint16_t n = pgm_read_word(q + 1);
+    for (q += 3; n; n--, q += 2) {
+        uint16_t e = pgm_read_word(q);
+        if ((e >> 4) == i) return e & 0x0F;
+        if ((e >> 4) > i) break;
+    }
+    return ec40_base_p(t_lo + i) ^ x;
+}
+
+static inline uint8_t ec40_dec_rle(uint16_t off, uint16_t i)
+{
+    const uint8_t *q = &EC40_P_DATA[off];
+    for (;;) {
+        uint8_t b = pgm_read_byte(q++);
+        uint8_t n = (b & 0x0F) + 1;
+        if (i < n) return b >> 4;
+        i -= n;
+    }
+}
+
+// P de (house, nib7, temp_idx); 0xFF si no hay tabla o temp_idx queda fuera de su rango
+static inline uint8_t ec40_progmem_p(uint8_t house, uint8_t nib7, uint16_t temp_idx)
+{
+    for (uint8_t k = 0; k < EC40_P_TABLE_COUNT; k++) {
+        const ec40_ptable_t *t = &EC40_P_DIR[k];
+        uint8_t ne = pgm_read_byte(&t->nib7_enc);
+        if (pgm_read_byte(&t->house) != house || (ne & 0x0F) != nib7) continue;
+        uint16_t t_lo = pgm_read_word(&t->t_lo);
+        uint16_t off = pgm_read_word(&t->off);
+        if (temp_idx < t_lo || temp_idx - t_lo >= pgm_read_word(&t->span)) return 0xFF;
+        uint16_t i = temp_idx - t_lo;
+        switch (ne >> 4) {
+        case EC40_ENC_PACKED: return ec40_dec_packed(off, i);
+        case EC40_ENC_XOR_DELTA: return ec40_dec_xor_delta(off, t_lo, i);
+        case EC40_ENC_RLE: return ec40_dec_rle(off, i);
+        }
+        return 0xFF;
+    }
+    return 0xFF;
+}
+
+#endif
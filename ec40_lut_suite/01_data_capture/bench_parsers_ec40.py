@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark del parser de bloques de texto (7 regex) frente al parser NDJSON
+('rtl_433 -F json') de logger_ec40.py sobre un log grande reproducido.
+
+Si no se pasan logs con --text/--json, se sintetizan ambos a partir de un CSV
+de capturas (ec40_live.csv) repetido --repeat veces, con los mismos registros
+en los dos formatos.
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from logger_ec40 import make_parser
+
+BASE_DIR = Path(__file__).parent.parent
+DEFAULT_CSV = BASE_DIR / "ec40_live.csv"
+
+SEPARATOR = "_ _ " * 20 + "\n"
+
+
+def load_rows(csv_path):
+    with open(csv_path, "r") as f:
+        return [r for r in csv.DictReader(f) if r.get("raw168") and r.get("raw64")]
+
+
+def synth_text_log(rows, repeat):
+    """Bloques con el formato de texto por defecto de rtl_433."""
+    lines = []
+    for _ in range(repeat):
+        for r in rows:
+            lines.append(SEPARATOR)
+            lines.append(f"time      : {r['timestamp']}\n")
+            lines.append(f"model     : {r['model']}  House Code: {r['house_code']}\n")
+            lines.append(f"Channel   : {r['channel']}            Battery   : {r['battery']}"
+                         f"            Celsius   : {r['temp']} C\n")
+            lines.append(f"codes     : {{168}}{r['raw168']}\n")
+            lines.append(f"codes     : {{64}}{r['raw64']}\n")
+    lines.append("\n")
+    return lines
+
+
+def synth_json_log(rows, repeat):
+    """Un registro NDJSON por trama, con los códigos en la lista 'codes'."""
+    lines = []
+    for _ in range(repeat):
+        for r in rows:
+            rec = {
+                "time": r["timestamp"],
+                "model": r["model"],
+                "id": int(r["house_code"]),
+                "channel": int(r["channel"]),
+                "battery_ok": int(r["battery"]),
+                "temperature_C": float(r["temp"]),
+                "codes": [f"{{168}}{r['raw168']}", f"{{64}}{r['raw64']}"],
+            }
+            lines.append(json.dumps(rec) + "\n")
+    return lines
+
+
+def run_parser(fmt, lines):
+    feed = make_parser(fmt)
+    out = []
+    t0 = time.perf_counter()
+    for line in lines:
+        done, data = feed(line)
+        if data:
+            out.append(data)
+    return out, time.perf_counter() - t0
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--csv", default=str(DEFAULT_CSV), help="CSV para sintetizar los logs")
+    ap.add_argument("--repeat", type=int, default=200, help="repeticiones del CSV (default: 200)")
+    ap.add_argument("--text", metavar="FILE", help="log de texto de rtl_433 ya grabado")
+    ap.add_argument("--json", metavar="FILE", help="log NDJSON de rtl_433 ya grabado")
+    args = ap.parse_args()
+
+    if args.text or args.json:
+        text_lines = open(args.text).readlines() if args.text else []
+        json_lines = open(args.json).readlines() if args.json else []
+    else:
+        rows = load_rows(args.csv)
+        text_lines = synth_text_log(rows, args.repeat)
+        json_lines = synth_json_log(rows, args.repeat)
+
+    results = {}
+    for fmt, lines in (("text", text_lines), ("json", json_lines)):
+        if not lines:
+            continue
+        frames, elapsed = run_parser(fmt, lines)
+        results[fmt] = (frames, elapsed)
+        rate = len(frames) / elapsed if elapsed else float("inf")
+        print(f"{fmt:5s}: {len(lines):8d} líneas -> {len(frames):7d} tramas "
+              f"en {elapsed:.3f}s  ({rate:,.0f} tramas/s)")
+
+    if len(results) == 2:
+        (tf, tt), (jf, jt) = results["text"], results["json"]
+        same = len(tf) == len(jf) and all(a == b for a, b in zip(tf, jf))
+        print(f"\nSalidas idénticas: {'sí' if same else 'NO'}")
+        if tt and jt:
+            print(f"Aceleración JSON vs regex: x{(len(jf) / jt) / (len(tf) / tt):.2f}")
+
+
+if __name__ == "__main__":
+    main()
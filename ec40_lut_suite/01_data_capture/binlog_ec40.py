@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Log binario de capturas EC40: registros de tamaño fijo, solo append.
+
+Cada línea CSV ocupa ~200 bytes con campos derivables del payload
+(sensor_type_hex, rolling_code_hex, checksum_hex...). Aquí cada trama ocupa
+38 bytes:
+
+  ts       uint32   segundos epoch (hora local del timestamp CSV)
+  payload  8 bytes  EC40 post-reflect (raw64 / payload64_hex)
+  raw168   21 bytes trama Manchester completa
+  house    uint8
+  channel  uint8
+  flags    uint8    bit0 = battery, bit1 = battery conocido
+  temp10   int16    temperatura x10
+
+Cabecera de 16 bytes: magic 'EC40BIN1', versión y tamaño de registro.
+La escritura solo usa 'struct' (el logger no necesita NumPy); la lectura
+mapea el fichero en memoria como array estructurado de NumPy.
+
+Uso:
+  python3 binlog_ec40.py to-bin ec40_live.csv ec40_live.bin
+  python3 binlog_ec40.py to-csv ec40_live.bin salida.csv [--schema live|merged]
+  python3 binlog_ec40.py info ec40_live.bin
+"""
+
+import argparse
+import csv
+import os
+import struct
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MAGIC = b"EC40BIN1"
+VERSION = 1
+HEADER = struct.Struct("<8sHH4x")
+RECORD = struct.Struct("<I8s21sBBBh")
+
+FLAG_BATTERY = 0x01
+FLAG_BATTERY_KNOWN = 0x02
+
+TIME_FMT = "%Y-%m-%d %H:%M:%S"
+
+if np is not None:
+    RECORD_DTYPE = np.dtype([
+        ("ts", "<u4"),
+        ("payload", "u1", 8),
+        ("raw168", "u1", 21),
+        ("house", "u1"),
+        ("channel", "u1"),
+        ("flags", "u1"),
+        ("temp10", "<i2"),
+    ])
+    assert RECORD_DTYPE.itemsize == RECORD.size
+
+LIVE_HEADER = [
+    "timestamp", "model", "raw168", "raw64", "temp", "channel", "house_code",
+    "battery", "sensor_type_hex", "rolling_code_hex", "checksum_hex",
+]
+MERGED_HEADER = [
+    "timestamp", "raw168_hex", "payload64_hex", "temperature_C", "channel",
+    "house", "b3_low", "b7", "R12", "source_file",
+]
+
+
+def _epoch(stamp):
+    try:
+        return int(time.mktime(time.strptime(stamp[:19], TIME_FMT)))
+    except (TypeError, ValueError):
+        return 0
+
+
+def pack_record(timestamp, payload_hex, raw168_hex, house, channel, temp_c, battery=None):
+    flags = 0
+    if battery is not None:
+        flags = FLAG_BATTERY_KNOWN | (FLAG_BATTERY if battery else 0)
+    return RECORD.pack(
+        _epoch(timestamp) if isinstance(timestamp, str) else int(timestamp or 0),
+        bytes.fromhex(payload_hex),
+        bytes.fromhex(raw168_hex),
+        int(house) & 0xFF,
+        int(channel) & 0xFF,
+        flags,
+        int(round(float(temp_c) * 10)),
+    )
+
+
+class BinlogWriter:
+    """Añade registros a un log binario (lo crea con cabecera si no existe)."""
+
+    def __init__(self, path):
+        self.path = path
+        new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._f = open(path, "ab")
+        if new:
+            self._f.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+            self._f.flush()
+
+    def append(self, data):
+        """Añade una trama con las claves de logger_ec40 (raw64, raw168, temp...)."""
+        self._f.write(pack_record(
+            data.get("timestamp") or time.time(),
+            data["raw64"], data["raw168"],
+            data.get("house_code") or 0, data.get("channel") or 0,
+            data["temp"], data.get("battery"),
+        ))
+
+    def flush(self):
+        self._f.flush()
+
+    def close(self):
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _check_header(f):
+    head = f.read(HEADER.size)
+    if len(head) < HEADER.size:
+        raise ValueError("Fichero demasiado corto para ser un log EC40")
+    magic, version, size = HEADER.unpack(head)
+    if magic != MAGIC or size != RECORD.size:
+        raise ValueError(f"No es un log EC40 v{VERSION} (magic={magic!r}, registro={size})")
+    return version
+
+
+def read_binlog(path):
+    """
+    Devuelve el log como array estructurado de NumPy mapeado en memoria
+    (sin copiar). Un registro final incompleto, p. ej. si el logger se
+    cortó a mitad de escritura, se ignora.
+    """
+    if np is None:
+        raise ImportError("read_binlog necesita NumPy (pip install numpy)")
+    with open(path, "rb") as f:
+        _check_header(f)
+    n = (os.path.getsize(path) - HEADER.size) // RECORD.size
+    if n == 0:
+        return np.zeros(0, dtype=RECORD_DTYPE)
+    return np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER.size, shape=(n,))
+
+
+def iter_binlog(path):
+    """Recorre el log sin NumPy: tuplas (ts, payload, raw168, house, channel, flags, temp10)."""
+    with open(path, "rb") as f:
+        _check_header(f)
+        while True:
+            chunk = f.read(RECORD.size)
+            if len(chunk) < RECORD.size:
+                break
+            yield RECORD.unpack(chunk)
+
+
+# ---------------------------------------------------------------------------
+# Conversión desde / hacia los esquemas CSV existentes
+# ---------------------------------------------------------------------------
+
+def _csv_records(path):
+    """
+    Lee cualquiera de los CSV de capturas y devuelve tuplas
+    (timestamp, payload_hex, raw168_hex, house, channel, temp, battery).
+    """
+    with open(path, "r", newline="") as f:
+        first = ""
+        for first in f:
+            if first.strip():
+                break
+        f.seek(0)
+        if first.strip() and not first[0].isalpha():
+            # ec40_live_1.csv: sin cabecera, columnas del logger antiguo
+            for parts in csv.reader(f):
+                if len(parts) >= 7:
+                    yield parts[0], parts[2], parts[1], parts[5], parts[4], parts[3], parts[6]
+            return
+
+        for row in csv.DictReader(f):
+            if not row:
+                continue
+            if "raw64" in row:
+                yield (row["timestamp"], row["raw64"], row["raw168"], row["house_code"],
+                       row["channel"], row["temp"], row.get("battery"))
+            elif "payload64_hex" in row:
+                yield (row.get("timestamp", ""), row["payload64_hex"], row["raw168_hex"],
+                       row["house"], row["channel"], row["temperature_C"], None)
+            elif "ec40_hex" in row:
+                yield ("", row["ec40_hex"], row["raw_hex"], row["device_id"],
+                       row["channel"], row["temperatura"], None)
+
+
+def csv_to_binlog(csv_path, bin_path):
+    """Convierte un CSV de capturas (live, merged, live_1 o tramas) a log binario."""
+    count = skipped = 0
+    with open(bin_path, "ab") as out:
+        if out.tell() == 0:
+            out.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        for ts, payload, raw168, house, channel, temp, batt in _csv_records(csv_path):
+            try:
+                battery = int(batt) if batt not in (None, "") else None
+                out.write(pack_record(ts, payload, raw168, house, channel, temp, battery))
+                count += 1
+            except (ValueError, TypeError):
+                skipped += 1
+    return count, skipped
+
+
+def _unpack_fields(ts, payload, raw168, house, channel, flags, temp10):
+    stamp = time.strftime(TIME_FMT, time.localtime(ts)) if ts else ""
+    battery = (flags & FLAG_BATTERY) if flags & FLAG_BATTERY_KNOWN else ""
+    temp = temp10 / 10.0
+    if temp10 == 0 and payload[5] & 0x08:
+        # -0.0 °C: el signo va en el payload (bit 3 del byte 5)
+        temp = -0.0
+    return stamp, bytes(payload), bytes(raw168), house, channel, battery, temp
+
+
+def binlog_to_csv(bin_path, csv_path, schema="live", model="Oregon-THN132N"):
+    """
+    Reconstruye un CSV con el esquema de ec40_live.csv ('live') o de
+    ec40_capturas_merged.csv ('merged'); los campos hex se derivan del payload.
+    """
+    header = LIVE_HEADER if schema == "live" else MERGED_HEADER
+    source = os.path.basename(bin_path)
+    count = 0
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for rec in iter_binlog(bin_path):
+            stamp, payload, raw168, house, channel, battery, temp = _unpack_fields(*rec)
+            if schema == "live":
+                stype = payload[0] >> 4
+                chk = (payload[6] << 4) | (payload[7] >> 4)
+                writer.writerow([stamp, model, raw168.hex(), payload.hex(), temp, channel, house,
+                                 battery, f"0x{stype:X}", f"0x{payload[1]:X}", f"0x{chk:X}"])
+            else:
+                b3_low = payload[3] & 0x0F
+                r12 = (b3_low << 8) | payload[7]
+                writer.writerow([stamp, raw168.hex(), payload.hex(), temp, channel, house,
+                                 f"0x{b3_low:X}", f"0x{payload[7]:02X}", f"0x{r12:03X}", source])
+            count += 1
+    return count
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Log binario de capturas EC40")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("to-bin", help="CSV -> log binario (append)")
+    p.add_argument("csv")
+    p.add_argument("bin")
+    p = sub.add_parser("to-csv", help="log binario -> CSV")
+    p.add_argument("bin")
+    p.add_argument("csv")
+    p.add_argument("--schema", choices=("live", "merged"), default="live")
+    p = sub.add_parser("info", help="resumen y tamaño del log")
+    p.add_argument("bin")
+    args = ap.parse_args()
+
+    try:
+        if args.cmd == "to-bin":
+            count, skipped = csv_to_binlog(args.csv, args.bin)
+            print(f"{count} registros añadidos a {args.bin} ({skipped} filas inválidas)")
+            print(f"CSV: {os.path.getsize(args.csv)} bytes -> binario: {os.path.getsize(args.bin)} bytes")
+        elif args.cmd == "to-csv":
+            count = binlog_to_csv(args.bin, args.csv, args.schema)
+            print(f"{count} registros escritos en {args.csv} (esquema {args.schema})")
+        else:
+            arr = read_binlog(args.bin)
+            print(f"{args.bin}: {len(arr)} registros de {RECORD.size} bytes")
+            if len(arr):
+                houses = np.unique(arr["house"])
+                print(f"Houses: {', '.join(str(h) for h in houses)}")
+                print(f"Temp: {arr['temp10'].min() / 10:.1f} .. {arr['temp10'].max() / 10:.1f} °C")
+    except (OSError, ValueError, ImportError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
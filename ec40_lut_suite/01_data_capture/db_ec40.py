@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Base de datos SQLite de capturas EC40 (opcional), en modo WAL.
+
+El logger añade a ec40_live.csv mientras los scripts de análisis leen el
+mismo fichero sin ninguna coordinación. Con SQLite en WAL el logger inserta
+por lotes en transacciones y varios procesos pueden consultar a la vez sin
+bloquearse ni ver filas a medias.
+
+Esquema:
+  sources   (id, name)           fichero CSV importado o 'logger'
+  receivers (id, name)           receptor que oyó la trama
+  frames    (id, ts, timestamp, model, raw168, payload64, house, channel,
+             temp_c, temp_idx, nib7, battery, source_id, receiver_id)
+  frame_receivers (frame_id, receiver_id)
+                                 todos los receptores que oyeron la trama
+                                 (fan-in del supervisor); receiver_id de
+                                 frames es el primero
+  índices por house, temp_idx y ts; (source_id, payload64, timestamp) es
+  único, así que reimportar un CSV no duplica filas.
+
+Uso:
+  python3 logger_ec40.py --db ec40.db
+  python3 db_ec40.py import ec40.db ../ec40_live.csv ../ec40_capturas_merged.csv
+  python3 db_ec40.py export ec40.db salida.csv [--schema live|merged]
+  python3 db_ec40.py info ec40.db
+"""
+
+import argparse
+import csv
+import os
+import sqlite3
+import sys
+import time
+
+from binlog_ec40 import LIVE_HEADER, MERGED_HEADER
+
+TIME_FMT = "%Y-%m-%d %H:%M:%S"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    id   INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS receivers (
+    id   INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS frames (
+    id          INTEGER PRIMARY KEY,
+    ts          INTEGER NOT NULL,
+    timestamp   TEXT NOT NULL,
+    model       TEXT,
+    raw168      TEXT,
+    payload64   TEXT NOT NULL,
+    house       INTEGER,
+    channel     INTEGER,
+    temp_c      REAL,
+    temp_idx    INTEGER,
+    nib7        INTEGER,
+    battery     INTEGER,
+    source_id   INTEGER NOT NULL REFERENCES sources(id),
+    receiver_id INTEGER REFERENCES receivers(id),
+    UNIQUE (source_id, payload64, timestamp)
+);
+CREATE TABLE IF NOT EXISTS frame_receivers (
+    frame_id    INTEGER NOT NULL REFERENCES frames(id),
+    receiver_id INTEGER NOT NULL REFERENCES receivers(id),
+    PRIMARY KEY (frame_id, receiver_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS frame_receivers_receiver ON frame_receivers(receiver_id);
+CREATE INDEX IF NOT EXISTS frames_house ON frames(house, temp_idx);
+CREATE INDEX IF NOT EXISTS frames_temp_idx ON frames(temp_idx);
+CREATE INDEX IF NOT EXISTS frames_ts ON frames(ts);
+"""
+
+INSERT = """
+INSERT OR IGNORE INTO frames
+    (ts, timestamp, model, raw168, payload64, house, channel, temp_c,
+     temp_idx, nib7, battery, source_id, receiver_id)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# La trama se busca por su clave única, así que también enlaza las ya importadas
+LINK_RECEIVER = """
+INSERT OR IGNORE INTO frame_receivers (frame_id, receiver_id)
+SELECT id, ? FROM frames WHERE source_id = ? AND payload64 = ? AND timestamp = ?
+"""
+
+
+def connect(path, timeout=30.0):
+    """Abre (o crea) la base de datos en modo WAL con el esquema creado."""
+    conn = sqlite3.connect(path, timeout=timeout)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _named_id(conn, table, name):
+    conn.execute(f"INSERT OR IGNORE INTO {table} (name) VALUES (?)", (name,))
+    return conn.execute(f"SELECT id FROM {table} WHERE name = ?", (name,)).fetchone()[0]
+
+
+def _epoch(stamp):
+    try:
+        return int(time.mktime(time.strptime(stamp[:19], TIME_FMT)))
+    except (TypeError, ValueError):
+        return 0
+
+
+def frame_values(timestamp, model, raw168, payload, house, channel, temp, battery):
+    """Tupla de columnas de 'frames' (sin source/receiver) a partir de campos de texto."""
+    payload = payload.strip().lower()
+    bytes.fromhex(payload)            # ValueError si no es hex
+    temp_c = float(temp)
+    return (
+        _epoch(timestamp), timestamp or "", model or None, (raw168 or "").lower() or None,
+        payload,
+        int(house) if house not in (None, "") else None,
+        int(channel) if channel not in (None, "") else None,
+        temp_c, int(round((temp_c + 40) * 10)),
+        int(payload[7], 16) if len(payload) > 7 else None,
+        int(battery) if battery not in (None, "") else None,
+    )
+
+
+class DbWriter:
+    """
+    Inserción por lotes desde el logger (misma interfaz que BinlogWriter:
+    append / flush / close). Cada flush es una transacción.
+    """
+
+    def __init__(self, path, source="logger", receiver="local"):
+        self.conn = connect(path)
+        with self.conn:
+            self.source_id = _named_id(self.conn, "sources", source)
+            self.receiver_id = _named_id(self.conn, "receivers", receiver)
+        self._batch = []
+        self.inserted = 0
+
+    def append(self, data):
+        stamp = data.get("timestamp") or time.strftime(TIME_FMT)
+        self._batch.append(frame_values(
+            stamp, data.get("model"), data.get("raw168"), data["raw64"],
+            data.get("house_code"), data.get("channel"), data["temp"], data.get("battery"),
+        ) + (self.source_id, self.receiver_id))
+
+    def flush(self):
+        if not self._batch:
+            return
+        with self.conn:
+            self.conn.executemany(INSERT, self._batch)
+            self.conn.executemany(LINK_RECEIVER, [(self.receiver_id, self.source_id, v[4], v[1])
+                                                  for v in self._batch])
+        self.inserted += len(self._batch)
+        self._batch.clear()
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ---------------------------------------------------------------------------
+# Importación desde los CSV existentes
+# ---------------------------------------------------------------------------
+
+def _csv_frames(path):
+    """
+    Recorre cualquier CSV de capturas y devuelve (receptores, campos) con
+    receptores = lista de nombres (vacía si la fuente no los trae) y
+    campos = (timestamp, model, raw168, payload, house, channel, temp, battery).
+    Esquemas: live (y fan-in con 'receivers'), merged, live_1 sin cabecera,
+    tramas_thn132n y el normalizado.
+    """
+    with open(path, "r", newline="") as f:
+        first = ""
+        for first in f:
+            if first.strip():
+                break
+        f.seek(0)
+        if first.strip() and not first[0].isalpha():
+            for p in csv.reader(f):
+                if len(p) >= 7:
+                    yield [], (p[0], "Oregon-THN132N", p[1], p[2], p[5], p[4], p[3], p[6])
+            return
+
+        for row in csv.DictReader(f):
+            if "raw64" in row:
+                receivers = [r for r in (row.get("receivers") or "").split(";") if r]
+                yield receivers, (
+                    row["timestamp"], row.get("model"), row["raw168"], row["raw64"],
+                    row["house_code"], row["channel"], row["temp"], row.get("battery"))
+            elif "payload64_hex" in row:
+                yield [], (row.get("timestamp", ""), "Oregon-THN132N", row.get("raw168_hex"),
+                             row["payload64_hex"], row["house"], row["channel"],
+                             row["temperature_C"], None)
+            elif "ec40_hex" in row:
+                yield [], ("", None, row["raw_hex"], row["ec40_hex"], row["device_id"],
+                             row["channel"], row["temperatura"], None)
+
+
+def import_csv(conn, path, batch_size=5000):
+    """Importa un CSV en transacciones de batch_size filas. Devuelve (nuevas, inválidas)."""
+    with conn:
+        source_id = _named_id(conn, "sources", os.path.basename(path))
+    receivers = {}
+    batch, links = [], []
+    inserted = 0
+    invalid = 0
+
+    def flush():
+        nonlocal inserted
+        with conn:
+            before = conn.total_changes
+            conn.executemany(INSERT, batch)
+            inserted += conn.total_changes - before
+            conn.executemany(LINK_RECEIVER, links)
+        batch.clear()
+        links.clear()
+
+    for names, fields in _csv_frames(path):
+        try:
+            values = frame_values(*fields)
+        except (ValueError, TypeError, AttributeError):
+            invalid += 1
+            continue
+        rids = []
+        for name in names:
+            if name not in receivers:
+                with conn:
+                    receivers[name] = _named_id(conn, "receivers", name)
+            rids.append(receivers[name])
+        batch.append(values + (source_id, rids[0] if rids else None))
+        links += [(rid, source_id, values[4], values[1]) for rid in rids]
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+    return inserted, invalid
+
+
+# ---------------------------------------------------------------------------
+# Exportación a CSV (compatibilidad con los scripts existentes)
+# ---------------------------------------------------------------------------
+
+def export_csv(conn, csv_path, schema="live", where="", params=()):
+    """Escribe las tramas (ordenadas por ts) con el esquema de ec40_live.csv o del merged."""
+    header = LIVE_HEADER if schema == "live" else MERGED_HEADER
+    query = (
+        "SELECT f.timestamp, f.model, f.raw168, f.payload64, f.temp_c, f.channel, f.house, "
+        "f.battery, s.name FROM frames f JOIN sources s ON s.id = f.source_id "
+        f"{'WHERE ' + where if where else ''} ORDER BY f.ts, f.id"
+    )
+    count = 0
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for stamp, model, raw168, payload, temp, ch, house, batt, source in conn.execute(query, params):
+            b = bytes.fromhex(payload)
+            if schema == "live":
+                chk = (b[6] << 4) | (b[7] >> 4)
+                writer.writerow([stamp, model or "Oregon-THN132N", raw168 or "", payload, temp, ch, house,
+                                 "" if batt is None else batt, f"0x{b[0] >> 4:X}", f"0x{b[1]:X}", f"0x{chk:X}"])
+            else:
+                b3_low = b[3] & 0x0F
+                writer.writerow([stamp, raw168 or "", payload, temp, ch, house, f"0x{b3_low:X}",
+                                 f"0x{b[7]:02X}", f"0x{(b3_low << 8) | b[7]:03X}", source])
+            count += 1
+    return count
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Base de datos SQLite de capturas EC40")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("import", help="importar CSV de capturas (cualquier esquema)")
+    p.add_argument("db")
+    p.add_argument("csv", nargs="+")
+    p = sub.add_parser("export", help="exportar a CSV")
+    p.add_argument("db")
+    p.add_argument("csv")
+    p.add_argument("--schema", choices=("live", "merged"), default="live")
+    p.add_argument("--house", type=int, default=None, help="solo este house")
+    p = sub.add_parser("info", help="resumen de la base de datos")
+    p.add_argument("db")
+    args = ap.parse_args()
+
+    try:
+        conn = connect(args.db)
+        if args.cmd == "import":
+            for path in args.csv:
+                t0 = time.perf_counter()
+                added, invalid = import_csv(conn, path)
+                print(f"{path}: {added} tramas nuevas, {invalid} filas inválidas "
+                      f"({time.perf_counter() - t0:.2f}s)")
+        elif args.cmd == "export":
+            where, params = ("f.house = ?", (args.house,)) if args.house is not None else ("", ())
+            count = export_csv(conn, args.csv, args.schema, where, params)
+            print(f"{count} tramas escritas en {args.csv} (esquema {args.schema})")
+        else:
+            total = conn.execute("SELECT COUNT(*) FROM frames").fetchone()[0]
+            print(f"{args.db}: {total} tramas")
+            for name, n in conn.execute(
+                    "SELECT s.name, COUNT(*) FROM frames f JOIN sources s ON s.id = f.source_id "
+                    "GROUP BY s.id ORDER BY s.id"):
+                print(f"  {name:28s} {n:6d}")
+            houses = [str(h) for (h,) in conn.execute(
+                "SELECT DISTINCT house FROM frames WHERE house IS NOT NULL ORDER BY house")]
+            print(f"Houses: {', '.join(houses)}")
+            for name, n in conn.execute(
+                    "SELECT r.name, COUNT(*) FROM frame_receivers fr JOIN receivers r ON r.id = fr.receiver_id "
+                    "GROUP BY r.id ORDER BY r.id"):
+                print(f"  receptor {name:19s} {n:6d}")
+        conn.close()
+    except (OSError, sqlite3.Error) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
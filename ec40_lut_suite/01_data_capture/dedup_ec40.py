@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Deduplicación acotada y por ventana temporal para el logger EC40.
+
+OS v2.1 repite cada mensaje dos veces seguidas, y rtl_433 puede entregar
+ambas copias: eso es una retransmisión y se descarta. La misma trama vista
+de nuevo pasada la ventana (p. ej. 40 s después, con la temperatura estable)
+es una re-observación legítima y se conserva, porque es justo el dato
+temporal que necesita el análisis del rolling code.
+
+Solo se guarda la última trama de cada sensor (model, house, channel), así
+que la memoria es O(1) por sensor activo. Los sensores sin actividad durante
+`ttl` segundos, o los más antiguos si se supera `max_sensors`, se desalojan.
+"""
+
+import time
+from collections import OrderedDict
+
+
+class FrameDeduper:
+    """
+    Contadores:
+    - hits: retransmisiones descartadas (misma trama del mismo sensor dentro de la ventana)
+    - misses: tramas aceptadas
+    - reobservations: tramas aceptadas iguales a la anterior del sensor pero fuera de la ventana
+    - evictions: sensores desalojados (por ttl o por capacidad)
+    """
+
+    def __init__(self, window=10.0, ttl=3600.0, max_sensors=256, clock=time.monotonic):
+        self.window = window
+        self.ttl = ttl
+        self.max_sensors = max_sensors
+        self.clock = clock
+        # sensor -> (raw168, instante de la última vez que se oyó)
+        self._last = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.reobservations = 0
+        self.evictions = 0
+
+    @staticmethod
+    def sensor_key(data):
+        return (data.get("model"), data.get("house_code"), data.get("channel"))
+
+    def _expire(self, now):
+        # El OrderedDict está ordenado por última actividad: basta mirar el principio
+        limit = now - self.ttl
+        while self._last:
+            _, (_, seen_at) = next(iter(self._last.items()))
+            if seen_at >= limit:
+                break
+            self._last.popitem(last=False)
+            self.evictions += 1
+
+    def check(self, data, now=None):
+        """True si la trama debe registrarse, False si es una retransmisión."""
+        if now is None:
+            now = self.clock()
+        self._expire(now)
+
+        key = self.sensor_key(data)
+        frame = data["raw168"]
+        prev = self._last.get(key)
+
+        if prev is not None and prev[0] == frame:
+            if now - prev[1] <= self.window:
+                # Se refresca el instante: una ráfaga de copias sigue siendo una sola trama
+                self._last[key] = (frame, now)
+                self._last.move_to_end(key)
+                self.hits += 1
+                return False
+            self.reobservations += 1
+
+        self._last[key] = (frame, now)
+        self._last.move_to_end(key)
+        if len(self._last) > self.max_sensors:
+            self._last.popitem(last=False)
+            self.evictions += 1
+        self.misses += 1
+        return True
+
+    def __len__(self):
+        return len(self._last)
+
+    def summary(self):
+        return (f"hits={self.hits} misses={self.misses} "
+                f"reobs={self.reobservations} evictions={self.evictions} "
+                f"sensores={len(self._last)}")
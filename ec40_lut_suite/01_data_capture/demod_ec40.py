@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Demodulador OOK/Manchester vectorizado (NumPy) para volcados de rtl_433.
+
+Todo el resto de herramientas parte de la salida ya decodificada de rtl_433,
+así que las tramas que rtl_433 descarta (checksum malo, truncadas) se
+pierden. Este script trabaja directamente sobre las muestras:
+
+  rtl_433 -R 12 -w captura.cu8      (I/Q uint8, 250 kHz por defecto)
+  rtl_433 -R 12 -w captura.ook      (pulsos OOK en texto, µs)
+
+Pasos (todos con operaciones de array, sin bucles por muestra):
+  1. envolvente |I|+|Q| suavizada y umbral automático (o --level)
+  2. longitudes de los tramos alto/bajo -> número de semibits de 488 µs
+  3. pares de semibits -> bits raw (alto,bajo = 1; bajo,alto = 0)
+  4. búsqueda de KNOWN_PREAMBLE (555555559995a5a6aa6a) y corte de 168 bits
+  5. Manchester de los 128 bits de datos (10 = 0, 01 = 1), LSB primero,
+     y reflexión de nibbles -> payload64 (EC40 post-reflect)
+
+Cada trama se emite con su estado (ok / manchester / truncada) y si el
+checksum OS v2.1 del payload cuadra, para poder estudiar las anomalías R12/P.
+
+Uso:
+  python3 demod_ec40.py captura.cu8 [-s 250000] [-o tramas_demod.csv]
+  python3 demod_ec40.py captura.ook
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+
+import numpy as np
+
+KNOWN_PREAMBLE = "555555559995a5a6aa6a"
+T_UNIT_US = 488
+RAW_BITS = 168
+HEADER_BITS = 40
+
+PREAMBLE_BITS = np.unpackbits(np.frombuffer(bytes.fromhex(KNOWN_PREAMBLE), dtype=np.uint8))
+
+# Marca de separador en el flujo de semibits (tramo demasiado largo o corto)
+BREAK = 2
+
+OUT_HEADER = [
+    "offset_s", "raw168_hex", "payload64_hex", "temperature_C", "channel",
+    "house", "status", "checksum_ok",
+]
+
+
+# ---------------------------------------------------------------------------
+# Entrada: muestras cu8 o pulsos .ook -> tramos (nivel, duración en µs)
+# ---------------------------------------------------------------------------
+
+def cu8_runs(iq, sample_rate, level=None, smooth_us=T_UNIT_US / 4):
+    """Tramos alto/bajo de un bloque de muestras I/Q uint8 intercaladas."""
+    iq = iq[: len(iq) // 2 * 2].astype(np.float32) - 127.5
+    mag = np.abs(iq[0::2]) + np.abs(iq[1::2])
+
+    k = max(1, int(smooth_us * 1e-6 * sample_rate))
+    if k > 1:
+        c = np.cumsum(mag, dtype=np.float64)
+        mag = ((c[k:] - c[:-k]) / k).astype(np.float32)
+
+    if level is None:
+        noise = np.median(mag)
+        peak = np.percentile(mag, 99.9)
+        level = noise + (peak - noise) / 2
+
+    high = mag > level
+    edges = np.flatnonzero(high[1:] != high[:-1]) + 1
+    starts = np.concatenate(([0], edges))
+    lengths = np.diff(np.concatenate((starts, [len(high)])))
+    us_per_sample = 1e6 / sample_rate
+    return high[starts].astype(np.int8), lengths * us_per_sample, starts * us_per_sample
+
+
+def ook_runs(path):
+    """
+    Tramos de un fichero de pulsos OOK de rtl_433 (-w *.ook): líneas
+    'pulso hueco' en µs, con comentarios ';' y bloques ';end'.
+    """
+    pairs = []
+    with open(path, "r") as f:
+        for line in f:
+            if line.startswith(";end"):
+                pairs.append((0, 1e6))   # separa bloques
+                continue
+            if not line.strip() or line.startswith(";"):
+                continue
+            parts = line.split()
+            if len(parts) >= 2:
+                pairs.append((float(parts[0]), float(parts[1])))
+    if not pairs:
+        empty = np.zeros(0)
+        return empty.astype(np.int8), empty, empty
+    p = np.asarray(pairs, dtype=np.float64)
+    levels = np.tile(np.array([1, 0], dtype=np.int8), len(p))
+    durations = p.reshape(-1)
+    offsets = np.concatenate(([0.0], np.cumsum(durations)[:-1]))
+    keep = durations > 0
+    return levels[keep], durations[keep], offsets[keep]
+
+
+# ---------------------------------------------------------------------------
+# Tramos -> semibits -> bits raw -> tramas
+# ---------------------------------------------------------------------------
+
+def runs_to_halfbits(levels, durations, offsets, unit_us=T_UNIT_US):
+    """
+    Cada tramo dura 1 o 2 semibits en una trama Manchester válida; el resto
+    se convierte en un separador. Un silencio largo (y el inicio del flujo)
+    aporta además un semibit bajo en cada extremo: el primer bit raw de la trama (0 = bajo,alto) y el
+    último (1 = alto,bajo) tienen esa mitad fundida con el silencio.
+    Devuelve el flujo de semibits (0/1/BREAK) y el instante (µs) de cada uno.
+    """
+    counts = np.rint(durations / unit_us).astype(np.int64)
+    valid = (counts >= 1) & (counts <= 2)
+    gap = ~valid & (levels == 0) & (counts > 2)
+
+    # Cada silencio se parte en tres tramos: bajo, separador, bajo
+    rep = np.where(gap, 3, 1)
+    run = np.repeat(np.arange(len(counts)), rep)
+    sub = np.arange(len(run)) - np.repeat(np.cumsum(rep) - rep, rep)
+    is_gap = gap[run]
+    vals = np.where(valid[run], levels[run], BREAK)
+    vals = np.where(is_gap & (sub != 1), 0, vals).astype(np.int8)
+    counts = np.where(valid[run], counts[run], 1)
+    starts = offsets[run] + np.where(is_gap & (sub == 2), durations[run] - unit_us,
+                                     sub * unit_us)
+
+    half = np.repeat(vals, counts)
+    # Instante del semibit: inicio del tramo + posición dentro del tramo
+    first = np.repeat(starts, counts)
+    pos = np.arange(len(half)) - np.repeat(np.cumsum(counts) - counts, counts)
+    t = first + pos * unit_us
+    # El inicio del fichero cuenta como silencio (los .ook empiezan en pulso)
+    t0 = t[0] if len(t) else 0.0
+    return (np.concatenate(([BREAK, 0], half)).astype(np.int8),
+            np.concatenate(([t0 - 2 * unit_us, t0 - unit_us], t)))
+
+
+def halfbits_to_raw(half, phase):
+    """Pares de semibits desde 'phase': (1,0) -> 1, (0,1) -> 0, otro -> BREAK."""
+    h = half[phase:]
+    h = h[: len(h) // 2 * 2]
+    a, b = h[0::2], h[1::2]
+    raw = np.full(len(a), BREAK, dtype=np.int8)
+    raw[(a == 1) & (b == 0)] = 1
+    raw[(a == 0) & (b == 1)] = 0
+    return raw
+
+
+def find_preambles(raw):
+    """Posiciones donde empieza KNOWN_PREAMBLE (filtrando candidatos bit a bit)."""
+    n = len(raw) - len(PREAMBLE_BITS)
+    if n < 0:
+        return np.zeros(0, dtype=np.int64)
+    cand = np.flatnonzero(raw[:n + 1] == PREAMBLE_BITS[0])
+    for k in range(1, len(PREAMBLE_BITS)):
+        cand = cand[raw[cand + k] == PREAMBLE_BITS[k]]
+        if not len(cand):
+            break
+    return cand
+
+
+def decode_frames(raw, starts):
+    """
+    Corta 168 bits desde cada preámbulo y decodifica el payload de todas las
+    tramas a la vez. Devuelve (bits N×168, payload N×8, estado N).
+    """
+    idx = starts[:, None] + np.arange(RAW_BITS)[None, :]
+    inside = idx < len(raw)
+    bits = np.where(inside, raw[np.minimum(idx, len(raw) - 1)], BREAK).astype(np.int8)
+
+    truncated = (bits == BREAK).any(axis=1)
+    data = bits[:, HEADER_BITS:]
+    first, second = data[:, 0::2], data[:, 1::2]
+    manchester_ok = (first != second) & (first != BREAK) & (second != BREAK)
+
+    # 10 -> 0, 01 -> 1: el bit es el segundo semisímbolo; LSB primero por byte
+    pre = np.packbits(np.where(manchester_ok, second, 0).astype(np.uint8).reshape(-1, 8, 8),
+                      axis=2, bitorder="little").reshape(-1, 8)
+    payload = ((pre & 0x0F) << 4) | (pre >> 4)
+
+    status = np.where(truncated, "truncada",
+                      np.where(manchester_ok.all(axis=1), "ok", "manchester"))
+    return bits, payload, status
+
+
+def os21_checksum_ok(payload):
+    """msg[6] == suma de nibbles de msg[0..5] con los nibbles intercambiados."""
+    p = payload.astype(np.int64)
+    s = ((p[:, :6] >> 4) + (p[:, :6] & 0x0F)).sum(axis=1) & 0xFF
+    return (((s & 0x0F) << 4) | (s >> 4)) == p[:, 6]
+
+
+def payload_fields(payload):
+    """house, channel y temperatura a partir del payload (vectorizado)."""
+    nib = np.empty((len(payload), 16), dtype=np.int64)
+    nib[:, 0::2] = payload >> 4
+    nib[:, 1::2] = payload & 0x0F
+    house = nib[:, 5] | (nib[:, 6] << 4)
+    channel = nib[:, 4]
+    temp = (nib[:, 10] * 100 + nib[:, 9] * 10 + nib[:, 8]) / 10.0
+    temp = np.where(nib[:, 11] & 0x8, -temp, temp)
+    return house, channel, temp
+
+
+def demodulate_runs(levels, durations, offsets):
+    """Tramos -> lista de tramas (dicts) ordenadas por instante."""
+    half, t_half = runs_to_halfbits(levels, durations, offsets)
+    frames = []
+    for phase in (0, 1):
+        raw = halfbits_to_raw(half, phase)
+        starts = find_preambles(raw)
+        if not len(starts):
+            continue
+        bits, payload, status = decode_frames(raw, starts)
+        chk = os21_checksum_ok(payload)
+        house, channel, temp = payload_fields(payload)
+        raw_hex = np.packbits(np.where(bits == BREAK, 0, bits).astype(np.uint8), axis=1)
+        for i, s in enumerate(starts):
+            complete = status[i] != "truncada"
+            frames.append({
+                "offset_s": round(t_half[phase + 2 * s] / 1e6, 6),
+                "raw168_hex": raw_hex[i].tobytes().hex(),
+                "payload64_hex": payload[i].tobytes().hex() if complete else "",
+                "temperature_C": float(temp[i]) if complete else "",
+                "channel": int(channel[i]) if complete else "",
+                "house": int(house[i]) if complete else "",
+                "status": status[i],
+                "checksum_ok": int(chk[i]) if complete else 0,
+            })
+    frames.sort(key=lambda f: f["offset_s"])
+    return frames
+
+
+def demodulate_cu8(path, sample_rate, level=None, chunk_s=30.0):
+    """
+    Procesa el fichero cu8 por bloques (memoria acotada) con solape de una
+    trama; una trama se asigna al bloque donde empieza.
+    """
+    frame_s = (RAW_BITS * 2 + 40) * T_UNIT_US * 1e-6
+    chunk = int(chunk_s * sample_rate) * 2
+    overlap = int(frame_s * sample_rate) * 2
+    data = np.memmap(path, dtype=np.uint8, mode="r")
+    frames = []
+    for start in range(0, len(data), chunk):
+        block = np.asarray(data[start:start + chunk + overlap])
+        levels, durations, offsets = cu8_runs(block, sample_rate, level)
+        t0 = start / 2 / sample_rate
+        limit = t0 + chunk / 2 / sample_rate
+        for f in demodulate_runs(levels, durations, offsets):
+            f["offset_s"] = round(f["offset_s"] + t0, 6)
+            if f["offset_s"] < limit:
+                frames.append(f)
+    return frames
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Demodulador OOK/Manchester EC40 para volcados de rtl_433")
+    ap.add_argument("input", help="fichero .cu8 (I/Q uint8) o .ook (pulsos de rtl_433)")
+    ap.add_argument("-s", "--sample-rate", type=float, default=250000,
+                    help="frecuencia de muestreo del .cu8 (default: 250000)")
+    ap.add_argument("--level", type=float, default=None,
+                    help="umbral de la envolvente (default: automático)")
+    ap.add_argument("-o", "--output", default="tramas_demod.csv", help="CSV de salida")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    try:
+        if args.input.endswith(".ook"):
+            frames = demodulate_runs(*ook_runs(args.input))
+            span = ""
+        else:
+            frames = demodulate_cu8(args.input, args.sample_rate, args.level)
+            span = f" ({os.path.getsize(args.input) / 2 / args.sample_rate:.1f} s de señal)"
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - t0
+
+    with open(args.output, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=OUT_HEADER)
+        writer.writeheader()
+        writer.writerows(frames)
+
+    by_status = {}
+    for fr in frames:
+        by_status[fr["status"]] = by_status.get(fr["status"], 0) + 1
+    bad_chk = sum(1 for fr in frames if fr["status"] == "ok" and not fr["checksum_ok"])
+    print(f"{len(frames)} tramas en {elapsed:.2f}s{span}: "
+          + ", ".join(f"{k}={v}" for k, v in sorted(by_status.items()))
+          + f", checksum erróneo={bad_chk}")
+    print(f"Guardado en {args.output}")
+
+
+if __name__ == "__main__":
+    main()
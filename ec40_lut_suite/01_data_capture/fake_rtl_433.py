@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Falso rtl_433: vuelca un log grabado (texto o NDJSON) por stdout como si
+fuera un receptor en vivo. Sirve para probar logger_ec40.py y
+supervisor_ec40.py sin hardware.
+
+Con --drop se pierde una fracción de las tramas (receptor lejano) y con
+--delay se espera entre tramas.
+
+Ejemplo (dos receptores que oyen el mismo sensor):
+  python3 supervisor_ec40.py \\
+      "a=cmd:python3 fake_rtl_433.py rtl.log --drop 0.2 --seed 1" \\
+      "b=cmd:python3 fake_rtl_433.py rtl.log --drop 0.2 --seed 2"
+"""
+
+import argparse
+import random
+import sys
+import time
+
+
+def records(lines):
+    """Agrupa el log en registros: bloques '_ _' para texto, una línea para JSON."""
+    block = []
+    for line in lines:
+        if line.lstrip().startswith("{"):
+            yield [line]
+            continue
+        if line.startswith("_ _") and block:
+            yield block
+            block = []
+        block.append(line)
+    if block:
+        yield block
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Reproduce un log de rtl_433 por stdout")
+    ap.add_argument("log", help="log grabado de rtl_433 (texto o NDJSON)")
+    ap.add_argument("--drop", type=float, default=0.0, help="fracción de tramas perdidas (0-1)")
+    ap.add_argument("--delay", type=float, default=0.0, help="segundos entre tramas")
+    ap.add_argument("--seed", type=int, default=None, help="semilla para --drop")
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    with open(args.log, "r", encoding="utf-8", errors="replace") as f:
+        for rec in records(f):
+            if args.drop and rng.random() < args.drop:
+                continue
+            sys.stdout.writelines(rec)
+            sys.stdout.flush()
+            if args.delay:
+                time.sleep(args.delay)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,26 @@
 #!/usr/bin/env python3
+import argparse
+import asyncio
 import subprocess
 import csv
+import itertools
+import json
+import sys
 import time
 import re
 
+from dedup_ec40 import FrameDeduper
+from binlog_ec40 import BinlogWriter
+from db_ec40 import DbWriter
+from lut_online_ec40 import OnlineLut
+from validator_ec40 import LiveValidator
+from metrics_ec40 import CaptureMetrics, serve_metrics
+
 CSV_FILE = "ec40_live.csv"
 
+RTL_CMD = ["rtl_433", "-R", "12"]
+RTL_JSON_ARGS = ["-F", "json"]
+
 CSV_HEADER = [
     "timestamp",
     "model",
@@ -28,8 +43,9 @@ re_temp   = re.compile(r"Celsius\s+:\s+([-0-9.]+)")
 re_ch     = re.compile(r"Channel\s+:\s+(\d+)")
 re_house  = re.compile(r"House Code:\s+(\d+)")
 re_batt   = re.compile(r"Battery\s+:\s+(\d+)")
+re_time   = re.compile(r"time\s*:\s*(\d{4}-\d\d-\d\d[ T]\d\d:\d\d:\d\d)")
 
-seen = set()
+TIME_FMT = "%Y-%m-%d %H:%M:%S"
 
 def ensure_csv():
     try:
@@ -65,6 +81,7 @@ def parse_block(block):
     ch     = re_ch.search(block)
     house  = re_house.search(block)
     batt   = re_batt.search(block)
+    tm     = re_time.search(block)
 
     if not model or not raw168 or not raw64 or not temp:
         return None
@@ -86,63 +103,562 @@ def parse_block(block):
         "battery": int(batt.group(1)) if batt else None,
         "sensor_type_hex": f"0x{stype:X}",
         "rolling_code_hex": f"0x{roll:X}",
-        "checksum_hex": f"0x{chk:X}"
+        "checksum_hex": f"0x{chk:X}",
+        "time": tm.group(1).replace("T", " ") if tm else None
     }
 
 
-def main():
-    ensure_csv()
+def _json_codes(rec):
+    """
+    Extrae raw168/raw64 de un registro JSON de rtl_433.
+    Acepta claves explícitas 'raw168'/'raw64', la lista 'codes'
+    ("{168}5555...") o la lista 'rows' ({"len": 168, "data": "5555..."}).
+    """
+    raw168 = rec.get("raw168")
+    raw64 = rec.get("raw64")
+    for code in rec.get("codes") or ():
+        if code.startswith("{168}"):
+            raw168 = code[5:]
+        elif code.startswith("{64}"):
+            raw64 = code[4:]
+    for row in rec.get("rows") or ():
+        if row.get("len") == 168:
+            raw168 = row.get("data")
+        elif row.get("len") == 64:
+            raw64 = row.get("data")
+    return raw168, raw64
+
+
+def parse_json_record(line):
+    """Equivalente a parse_block para una línea NDJSON de 'rtl_433 -F json'."""
+    try:
+        rec = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(rec, dict):
+        return None
+
+    model = rec.get("model")
+    temp = rec.get("temperature_C")
+    raw168, raw64 = _json_codes(rec)
+
+    if not model or not raw168 or not raw64 or temp is None:
+        return None
+
+    # decodificación EC40
+    stype, roll, chk = decode_ec40_fields(raw64)
+
+    house = rec.get("id", rec.get("house_code"))
+    batt = rec.get("battery_ok", rec.get("battery"))
+    ch = rec.get("channel")
+
+    return {
+        "model": model,
+        "raw168": raw168,
+        "raw64": raw64,
+        "temp": float(temp),
+        "channel": int(ch) if ch is not None else None,
+        "house_code": int(house) if house is not None else None,
+        "battery": int(batt) if batt is not None else None,
+        "sensor_type_hex": f"0x{stype:X}",
+        "rolling_code_hex": f"0x{roll:X}",
+        "checksum_hex": f"0x{chk:X}",
+        "time": rec.get("time")
+    }
+
+
+def missing_fields(record, fmt):
+    """Campos obligatorios que faltan en un registro que no se pudo parsear."""
+    if fmt == "json":
+        try:
+            rec = json.loads(record)
+        except ValueError:
+            return ["json"]
+        if not isinstance(rec, dict):
+            return ["json"]
+        raw168, raw64 = _json_codes(rec)
+        present = {"model": rec.get("model"), "raw168": raw168, "raw64": raw64,
+                   "temp": rec.get("temperature_C")}
+        return [k for k, v in present.items() if v is None or v == ""]
+    checks = (("model", re_model), ("raw168", re_raw168), ("raw64", re_raw64), ("temp", re_temp))
+    return [k for k, rx in checks if not rx.search(record)]
 
-    print("Escuchando rtl_433… (Ctrl+C para salir)\n")
 
+def is_block_end(line):
+    """Una línea vacía o el separador '_ _ _' de rtl_433 cierra el bloque."""
+    return line.strip() == "" or line.startswith("_ _")
+
+
+def make_parser(fmt, metrics=None):
+    """
+    Devuelve feed(line) -> (completo, data).
+    En formato 'text' acumula líneas hasta el fin de bloque y aplica parse_block;
+    en formato 'json' cada línea es un registro completo.
+    Con metrics (CaptureMetrics) se mide cada parseo y, para los registros no
+    vacíos que fallan, se anotan los campos que faltan.
+    """
+    def parse(record, parser):
+        if not metrics:
+            return parser(record)
+        t0 = time.perf_counter()
+        data = parser(record)
+        if data is not None:
+            metrics.frame_parsed(data, time.perf_counter() - t0)
+        elif record.strip() and not record.startswith("_ _"):
+            metrics.parse_failed(missing_fields(record, fmt))
+        return data
+
+    if fmt == "json":
+        def feed(line):
+            if not line.lstrip().startswith("{"):
+                return False, None
+            return True, parse(line, parse_json_record)
+        return feed
+
+    block = []
+
+    def feed(line):
+        block.append(line)
+        if not is_block_end(line):
+            return False, None
+        data = parse("".join(block), parse_block)
+        block.clear()
+        return True, data
+    return feed
+
+
+def rtl_command(fmt):
+    return RTL_CMD + RTL_JSON_ARGS if fmt == "json" else RTL_CMD
+
+
+def open_lines(fmt, replay_path):
+    """
+    Fuente de líneas síncrona: log grabado ('-' = stdin) o subproceso rtl_433.
+    Devuelve (iterable de líneas, proceso o None).
+    """
+    if replay_path == "-":
+        return sys.stdin, None
+    if replay_path:
+        return open(replay_path, "r", encoding="utf-8", errors="replace"), None
     p = subprocess.Popen(
-        ["rtl_433", "-R", "12"],
+        rtl_command(fmt),
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
         text=True,
         bufsize=1,
     )
+    return p.stdout, p
+
+
+class ReplayPacer:
+    """
+    Ritmo de reproducción de un log grabado.
+    speed <= 0: a máxima velocidad. speed = N: respeta los instantes
+    originales del log acelerados N veces (1 = tiempo real).
+    Además fija el timestamp de la fila al del log, para poder rellenar
+    ec40_live.csv con capturas archivadas.
+    """
+
+    def __init__(self, speed=0.0):
+        self.speed = speed
+        self._t0 = None
+        self._w0 = None
+        self.frames = 0
+        self._start = time.monotonic()
+
+    def prepare(self, data):
+        """Anota la trama con el instante del log y devuelve los segundos a esperar."""
+        self.frames += 1
+        stamp = data.get("time")
+        try:
+            epoch = time.mktime(time.strptime(stamp, TIME_FMT))
+        except (TypeError, ValueError):
+            return 0.0
+        data["timestamp"] = stamp
+        data["epoch"] = epoch
+
+        if self.speed <= 0:
+            return 0.0
+        now = time.monotonic()
+        if self._t0 is None:
+            self._t0, self._w0 = epoch, now
+            return 0.0
+        return max(0.0, self._w0 + (epoch - self._t0) / self.speed - now)
+
+    def summary(self):
+        elapsed = time.monotonic() - self._start
+        rate = self.frames / elapsed if elapsed else 0.0
+        return f"{self.frames} tramas en {elapsed:.3f}s ({rate:,.0f} tramas/s)"
+
+
+def build_row(data):
+    """Fila CSV (en el orden de CSV_HEADER) para una trama ya parseada."""
+    return [
+        data.get("timestamp") or time.strftime(TIME_FMT),
+        data["model"],
+        data["raw168"],
+        data["raw64"],
+        data["temp"],
+        data["channel"],
+        data["house_code"],
+        data["battery"],
+        data["sensor_type_hex"],
+        data["rolling_code_hex"],
+        data["checksum_hex"],
+    ]
+
+
+def print_new(data):
+    print(f"[new] {data['model']}  {data['temp']}°C "
+          f"EC40={data['raw64']} "
+          f"type={data['sensor_type_hex']} roll={data['rolling_code_hex']} chk={data['checksum_hex']}")
+
+
+def run_sync(dedup, fmt="text", replay_path=None, speed=0.0, binlog=None, validator=None,
+             metrics=None, db=None, lut=None):
+    """Modo clásico: lee, parsea y escribe en el mismo hilo."""
+    lines, p = open_lines(fmt, replay_path)
+    feed = make_parser(fmt, metrics)
+    pacer = ReplayPacer(speed) if replay_path else None
+
+    try:
+        # La línea vacía final cierra el último bloque si la fuente termina sin separador
+        for line in itertools.chain(lines, ["\n"]):
+            done, data = feed(line)
+
+            if data and pacer:
+                wait = pacer.prepare(data)
+                if wait:
+                    time.sleep(wait)
+
+            if data and dedup.check(data, data.get("epoch")):
+                if metrics:
+                    t0 = time.perf_counter()
+                with open(CSV_FILE, "a", newline="") as f:
+                    writer = csv.writer(f)
+                    writer.writerow(build_row(data))
+                if binlog:
+                    binlog.append(data)
+                    binlog.flush()
+                if db:
+                    db.append(data)
+                    db.flush()
+                if lut:
+                    lut.append(data)
+                    lut.flush()
+                if metrics:
+                    metrics.rows_flushed(1, time.perf_counter() - t0)
+
+                print_new(data)
+                if validator:
+                    validator.check(data)
+
+    except KeyboardInterrupt:
+        print("\nSaliendo…")
+        if p:
+            p.kill()
+    print(f"[dedup] {dedup.summary()}")
+    if pacer:
+        print(f"[replay] {pacer.summary()}")
+
+
+# ---------------------------------------------------------------------------
+# Modo asíncrono: lector -> parser -> escritor, unidos por colas acotadas
+# ---------------------------------------------------------------------------
+
+class PipelineStats:
+    """
+    Contadores del pipeline asíncrono.
+    Para cada cola se guarda la profundidad máxima observada y cuántas veces
+    (y cuánto tiempo) el productor tuvo que esperar porque estaba llena:
+    eso es la contrapresión que ve el lector de rtl_433.
+    """
+
+    def __init__(self, queues, dedup):
+        self.queues = queues
+        self.dedup = dedup
+        self.lines_read = 0
+        self.blocks = 0
+        self.frames = 0
+        self.rows_written = 0
+        self.batches = 0
+        self.max_depth = {name: 0 for name in queues}
+        self.stalls = {name: 0 for name in queues}
+        self.stall_time = {name: 0.0 for name in queues}
+
+    def summary(self):
+        parts = [
+            f"lineas={self.lines_read} bloques={self.blocks} tramas={self.frames} "
+            f"filas={self.rows_written} lotes={self.batches}"
+        ]
+        for name, q in self.queues.items():
+            parts.append(
+                f"cola {name}: {q.qsize()}/{q.maxsize} (max {self.max_depth[name]}), "
+                f"esperas={self.stalls[name]} ({self.stall_time[name]:.3f}s)"
+            )
+        parts.append(f"dedup: {self.dedup.summary()}")
+        return " | ".join(parts)
+
+
+async def _put(q, item, stats, name):
+    """Encola registrando la contrapresión si la cola está llena."""
+    if q.full():
+        stats.stalls[name] += 1
+        t0 = time.monotonic()
+        await q.put(item)
+        stats.stall_time[name] += time.monotonic() - t0
+    else:
+        q.put_nowait(item)
+    depth = q.qsize()
+    if depth > stats.max_depth[name]:
+        stats.max_depth[name] = depth
+
+
+async def reader_task(lines, line_q, stats):
+    """Lee líneas de la fuente (rtl_433 o fichero) tan rápido como llegan."""
+    async for line in lines:
+        stats.lines_read += 1
+        await _put(line_q, line, stats, "lineas")
+    # Cierra el último bloque si la fuente termina sin separador
+    await _put(line_q, "\n", stats, "lineas")
+    await _put(line_q, None, stats, "lineas")
+
+
+async def parser_task(line_q, row_q, stats, fmt, pacer=None, validator=None, metrics=None):
+    """Agrupa líneas en registros, los parsea y descarta retransmisiones."""
+    feed = make_parser(fmt, metrics)
+    while True:
+        line = await line_q.get()
+        if line is None:
+            break
+        done, data = feed(line)
+        if not done:
+            continue
+
+        stats.blocks += 1
+        if not data:
+            continue
+
+        if pacer:
+            wait = pacer.prepare(data)
+            if wait:
+                await asyncio.sleep(wait)
+
+        if not stats.dedup.check(data, data.get("epoch")):
+            continue
+        if validator:
+            validator.check(data)
+
+        stats.frames += 1
+        await _put(row_q, data, stats, "filas")
+    await _put(row_q, None, stats, "filas")
+
+
+async def writer_task(row_q, stats, batch_size, flush_interval, binlog=None, metrics=None,
+                      db=None, lut=None):
+    """
+    Escribe filas por lotes: vuelca cuando el lote llega a batch_size
+    o cuando pasan flush_interval segundos desde la primera fila pendiente.
+    Con binlog, cada trama se añade también al log binario; con db, cada
+    lote es una transacción en la base de datos SQLite; con lut, cada lote
+    actualiza la LUT incremental (ver lut_online_ec40.py).
+    """
+    batch = []
+    deadline = None
+    with open(CSV_FILE, "a", newline="") as f:
+        writer = csv.writer(f)
+
+        def flush():
+            t0 = time.perf_counter()
+            writer.writerows(batch)
+            f.flush()
+            if binlog:
+                binlog.flush()
+            if db:
+                db.flush()
+            if lut:
+                lut.flush()
+            if metrics:
+                metrics.rows_flushed(len(batch), time.perf_counter() - t0)
+            stats.rows_written += len(batch)
+            stats.batches += 1
+            batch.clear()
+
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                data = await asyncio.wait_for(row_q.get(), timeout)
+            except asyncio.TimeoutError:
+                flush()
+                deadline = None
+                continue
+
+            if data is None:
+                break
+
+            batch.append(build_row(data))
+            if binlog:
+                binlog.append(data)
+            if db:
+                db.append(data)
+            if lut:
+                lut.append(data)
+            print_new(data)
+            if deadline is None:
+                deadline = time.monotonic() + flush_interval
+            if len(batch) >= batch_size:
+                flush()
+                deadline = None
+
+        if batch:
+            flush()
+
+
+async def report_task(stats, interval):
+    while True:
+        await asyncio.sleep(interval)
+        print(f"[pipeline] {stats.summary()}")
+
+
+async def stream_lines(stream):
+    """Líneas de un asyncio.StreamReader (stdout de rtl_433 o un socket)."""
+    while True:
+        raw = await stream.readline()
+        if not raw:
+            break
+        yield raw.decode("utf-8", errors="replace")
+
+
+async def file_lines(f):
+    """
+    Líneas de un fichero. Un fichero regular no se puede esperar con el
+    event loop: se lee en síncrono cediendo el control cada pocas líneas.
+    """
+    with f:
+        for i, line in enumerate(f):
+            yield line
+            if i % 256 == 0:
+                await asyncio.sleep(0)
+
+
+async def run_async(dedup, queue_size, batch_size, flush_interval, report_interval,
+                    fmt="text", replay_path=None, speed=0.0, binlog=None, validator=None,
+                    metrics=None, db=None, lut=None):
+    line_q = asyncio.Queue(maxsize=queue_size)
+    row_q = asyncio.Queue(maxsize=queue_size)
+    stats = PipelineStats({"lineas": line_q, "filas": row_q}, dedup)
+    if metrics:
+        metrics.queues = stats.queues
+
+    proc = None
+    pacer = ReplayPacer(speed) if replay_path else None
+    if replay_path:
+        lines = file_lines(sys.stdin if replay_path == "-" else
+                            open(replay_path, "r", encoding="utf-8", errors="replace"))
+    else:
+        proc = await asyncio.create_subprocess_exec(
+            *rtl_command(fmt),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        lines = stream_lines(proc.stdout)
+
+    reporter = asyncio.create_task(report_task(stats, report_interval))
+    try:
+        await asyncio.gather(
+            reader_task(lines, line_q, stats),
+            parser_task(line_q, row_q, stats, fmt, pacer, validator, metrics),
+            writer_task(row_q, stats, batch_size, flush_interval, binlog, metrics, db, lut),
+        )
+    finally:
+        reporter.cancel()
+        if proc and proc.returncode is None:
+            proc.kill()
+        print(f"[pipeline] {stats.summary()}")
+        if pacer:
+            print(f"[replay] {pacer.summary()}")
+
+
+def main():
+    global CSV_FILE
+    ap = argparse.ArgumentParser(description="Logger de tramas EC40 (Oregon THN132N) desde rtl_433")
+    ap.add_argument("--async", dest="use_async", action="store_true",
+                    help="pipeline asíncrono con colas acotadas y escritura por lotes")
+    ap.add_argument("--format", choices=("text", "json"), default="text",
+                    help="salida de rtl_433: bloques de texto o NDJSON ('-F json')")
+    ap.add_argument("--replay", metavar="FILE",
+                    help="reproducir un log grabado de rtl_433 (texto o JSON, '-' = stdin) en vez de lanzarlo")
+    ap.add_argument("--speed", type=float, default=0.0,
+                    help="con --replay: 0 = máxima velocidad, N = instantes originales acelerados N veces")
+    ap.add_argument("--csv", default=CSV_FILE,
+                    help=f"CSV de salida (default: {CSV_FILE})")
+    ap.add_argument("--binlog", metavar="FILE",
+                    help="añadir también cada trama a un log binario compacto (ver binlog_ec40.py)")
+    ap.add_argument("--db", metavar="FILE",
+                    help="insertar también cada trama en una base de datos SQLite en WAL (ver db_ec40.py)")
+    ap.add_argument("--lut", metavar="DIR",
+                    help="actualizar la LUT de R12/P incremental en DIR con cada trama (ver lut_online_ec40.py)")
+    ap.add_argument("--validate", action="store_true",
+                    help="comparar cada trama nueva con el generador (ver validator_ec40.py)")
+    ap.add_argument("--dedup-window", type=float, default=10.0,
+                    help="segundos en los que la misma trama del mismo sensor es retransmisión (default: 10)")
+    ap.add_argument("--dedup-ttl", type=float, default=3600.0,
+                    help="segundos sin oír un sensor antes de olvidarlo (default: 3600)")
+    ap.add_argument("--dedup-max-sensors", type=int, default=256,
+                    help="sensores recordados como máximo (default: 256)")
+    ap.add_argument("--queue-size", type=int, default=1000,
+                    help="capacidad de cada cola del pipeline (default: 1000)")
+    ap.add_argument("--batch-size", type=int, default=50,
+                    help="filas por lote de escritura (default: 50)")
+    ap.add_argument("--flush-interval", type=float, default=1.0,
+                    help="segundos máximos que una fila espera en el lote (default: 1.0)")
+    ap.add_argument("--report-interval", type=float, default=30.0,
+                    help="segundos entre informes de contrapresión (default: 30)")
+    ap.add_argument("--metrics-port", type=int, default=None,
+                    help="servir métricas Prometheus en http://<host>:PORT/metrics (desactivado por defecto)")
+    ap.add_argument("--metrics-host", default="127.0.0.1",
+                    help="dirección del endpoint de métricas (default: 127.0.0.1)")
+    args = ap.parse_args()
+
+    CSV_FILE = args.csv
+    ensure_csv()
+
+    if args.replay:
+        print(f"Reproduciendo {args.replay}…\n")
+    else:
+        print("Escuchando rtl_433… (Ctrl+C para salir)\n")
+
+    dedup = FrameDeduper(args.dedup_window, args.dedup_ttl, args.dedup_max_sensors)
+    binlog = BinlogWriter(args.binlog) if args.binlog else None
+    db = DbWriter(args.db) if args.db else None
+    lut = OnlineLut(args.lut) if args.lut else None
+    validator = LiveValidator() if args.validate else None
+    metrics = None
+    if args.metrics_port is not None:
+        metrics = CaptureMetrics(dedup)
+        serve_metrics(metrics, args.metrics_port, args.metrics_host)
+        print(f"Métricas en http://{args.metrics_host}:{args.metrics_port}/metrics\n")
 
-    block = ""
     try:
-        for line in p.stdout:
-            block += line
-
-            # Fin de bloque
-            if line.strip() == "" or line.startswith("_ _"):
-                data = parse_block(block)
-
-                if data:
-                    key = data["raw168"]
-
-                    if key not in seen:
-                        seen.add(key)
-
-                        with open(CSV_FILE, "a", newline="") as f:
-                            writer = csv.writer(f)
-                            writer.writerow([
-                                time.strftime("%Y-%m-%d %H:%M:%S"),
-                                data["model"],
-                                data["raw168"],
-                                data["raw64"],
-                                data["temp"],
-                                data["channel"],
-                                data["house_code"],
-                                data["battery"],
-                                data["sensor_type_hex"],
-                                data["rolling_code_hex"],
-                                data["checksum_hex"],
-                            ])
-
-                        print(f"[new] {data['model']}  {data['temp']}°C "
-                              f"EC40={data['raw64']} "
-                              f"type={data['sensor_type_hex']} roll={data['rolling_code_hex']} chk={data['checksum_hex']}")
-
-                block = ""
+        if not args.use_async:
+            run_sync(dedup, args.format, args.replay, args.speed, binlog, validator, metrics, db, lut)
+            return
 
+        asyncio.run(run_async(dedup, args.queue_size, args.batch_size,
+                              args.flush_interval, args.report_interval,
+                              args.format, args.replay, args.speed, binlog, validator,
+                              metrics, db, lut))
     except KeyboardInterrupt:
         print("\nSaliendo…")
-        p.kill()
+    finally:
+        if binlog:
+            binlog.close()
+        if db:
+            db.close()
+        if lut:
+            lut.close()
+        if validator:
+            validator.report()
 
 
 if __name__ == "__main__":
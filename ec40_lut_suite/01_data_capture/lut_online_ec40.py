@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Mantenimiento incremental de la LUT de R12/P a medida que llegan tramas.
+
+En vez de volver a pasar build_r12_lut.py, generate_complete_p_lut.py y
+extract_p_lut.py sobre todo el histórico, cada trama nueva suma 1 a su celda
+(house, nib7, temp_idx) -> {R12: veces}. La moda de la celda (empate: el
+R12 visto primero, igual que build_r12_lut.py) y sus conflictos se
+recalculan solo para esa celda.
+
+Un house queda 'sucio' si cambia la moda de alguna de sus celdas o aparece
+un R12 nuevo en una; solo para esos houses se reescriben, en cada flush:
+
+  r12_lut_h<house>.json   {"house": 247, "tables": {"2": {"580": "0x186"}},
+                           "conflicts": {"2:581": ["0x186", "0x187"]}}
+  r12_lut_h<house>.py     R12_TABLES[(house, nib7)][temp_idx], R12_CONFLICTS, get_r12()
+  p_table_h<house>.h      P (nibble 14) por nib7, de t_lo a t_hi (0x0 sin dato)
+
+El estado (cuentas por celda y offset leído de cada CSV) se guarda en
+.lut_state.json dentro del directorio de salida con escritura atómica (tmp +
+os.replace), antes de reescribir los artefactos: tras un corte no se
+cuentan tramas dos veces y los houses pendientes se regeneran al arrancar.
+Como el estado incluye todo el histórico de celdas, un flush solo guarda si
+algo cambió y como mucho una vez cada SAVE_INTERVAL segundos (close() y el
+final de una lectura sin --follow guardan siempre); tras un corte se pierden
+a lo sumo las tramas de ese intervalo.
+
+Fuentes:
+  - el logger, como BinlogWriter/DbWriter (append / flush / close):
+      python3 logger_ec40.py --lut ../lut_online
+  - un CSV live, live_1 (sin cabecera) o merged, leyendo solo lo añadido
+    desde la última vez:
+      python3 lut_online_ec40.py ../ec40_live.csv [--follow] [--out ../lut_online]
+  python3 lut_online_ec40.py --status
+No conviene usar las dos sobre el mismo directorio: el logger también
+escribe el CSV y las tramas se contarían dos veces.
+"""
+
+import argparse
+import csv
+import json
+import os
+import time
+from pathlib import Path
+
+OUT_DIR = Path(__file__).parent.parent / "lut_online"
+STATE_NAME = ".lut_state.json"
+PER_LINE = 14
+SAVE_INTERVAL = 5.0
+# ec40_live_1.csv no tiene cabecera: ts, raw168, raw64, temp, channel, house, ...
+HEADERLESS_FIELDS = (2, 5, 3)
+
+
+def _atomic_write(path, text):
+    tmp = Path(str(path) + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def _mode(counts):
+    """R12 más frecuente; en empate, el primero insertado (el visto antes)."""
+    return max(counts.items(), key=lambda kv: kv[1])[0]
+
+
+def frame_key(payload, house, temp):
+    """(house, nib7, temp_idx, R12) de una trama, o None si no es válida."""
+    try:
+        payload = payload.strip().lower()
+        nib = [int(c, 16) for c in payload]
+        if len(nib) != 16:
+            return None
+        t = int(round((float(temp) + 40) * 10))
+        return int(house), nib[7], t, (nib[7] << 8) | (nib[14] << 4) | nib[15]
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+class OnlineLut:
+    """LUT de R12 por (house, nib7, temp_idx) actualizada trama a trama."""
+
+    def __init__(self, out_dir=OUT_DIR, save_interval=SAVE_INTERVAL):
+        self.out_dir = Path(out_dir)
+        self.save_interval = save_interval
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.state_path = self.out_dir / STATE_NAME
+        self.cells = {}
+        self.offsets = {}
+        self.dirty = set()
+        self.frames = 0
+        self.emitted = 0
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+        for key, values in state.get("cells", {}).items():
+            h, n, t = (int(x) for x in key.split(":"))
+            self.cells[(h, n, t)] = {int(r, 16): c for r, c in values}
+        self.offsets = state.get("offsets", {})
+        self.frames = state.get("frames", 0)
+        # Houses que quedaron pendientes en la última ejecución
+        self.dirty = set(state.get("dirty", []))
+        self._saved = (self.frames, dict(self.offsets))
+        self._last_save = None
+        if self.dirty:
+            self._emit()
+
+    def add(self, house, nib7, temp_idx, r12):
+        cell = self.cells.setdefault((house, nib7, temp_idx), {})
+        old = _mode(cell) if cell else None
+        is_new = r12 not in cell
+        cell[r12] = cell.get(r12, 0) + 1
+        self.frames += 1
+        if is_new or _mode(cell) != old:
+            self.dirty.add(house)
+
+    def append(self, data):
+        """Interfaz del logger: una trama parseada (raw64, house_code, temp)."""
+        key = frame_key(data.get("raw64", ""), data.get("house_code"), data.get("temp"))
+        if key:
+            self.add(*key)
+
+    def flush(self, force=False):
+        """
+        Guarda el estado y regenera los houses sucios si algo cambió desde el
+        último guardado, como mucho una vez cada save_interval segundos (el
+        logger llama a flush con cada trama); force=True ignora el intervalo.
+        """
+        changed = self.dirty or self._saved != (self.frames, self.offsets)
+        if not changed:
+            return
+        now = time.monotonic()
+        if not force and self._last_save is not None and now - self._last_save < self.save_interval:
+            return
+        self._save()
+        if self.dirty:
+            self._emit()
+            self._save()
+        self._saved = (self.frames, dict(self.offsets))
+        self._last_save = now
+
+    def close(self):
+        self.flush(force=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _save(self):
+        state = {
+            "frames": self.frames,
+            "offsets": self.offsets,
+            "dirty": sorted(self.dirty),
+            "cells": {f"{h}:{n}:{t}": [[f"0x{r:03X}", c] for r, c in counts.items()]
+                      for (h, n, t), counts in sorted(self.cells.items())},
+        }
+        _atomic_write(self.state_path, json.dumps(state, separators=(",", ":")))
+
+    def house_tables(self, house):
+        """({nib7: {temp_idx: R12}}, {(nib7, temp_idx): (moda, alternativas...)}) de un house."""
+        tables, conflicts = {}, {}
+        for (h, n, t), counts in sorted(self.cells.items()):
+            if h != house:
+                continue
+            mode = _mode(counts)
+            tables.setdefault(n, {})[t] = mode
+            if len(counts) > 1:
+                conflicts[(n, t)] = (mode,) + tuple(r for r in counts if r != mode)
+        return tables, conflicts
+
+    def _emit(self):
+        for house in sorted(self.dirty):
+            tables, conflicts = self.house_tables(house)
+            self._write_json(house, tables, conflicts)
+            self._write_py(house, tables, conflicts)
+            self._write_h(house, tables)
+            self.emitted += 1
+        self.dirty.clear()
+
+    def _write_json(self, house, tables, conflicts):
+        data = {
+            "house": house,
+            "tables": {str(n): {str(t): f"0x{r:03X}" for t, r in tab.items()} for n, tab in sorted(tables.items())},
+            "conflicts": {f"{n}:{t}": [f"0x{r:03X}" for r in vals] for (n, t), vals in sorted(conflicts.items())},
+        }
+        _atomic_write(self.out_dir / f"r12_lut_h{house}.json", json.dumps(data, indent=2))
+
+    def _write_py(self, house, tables, conflicts):
+        lines = [
+            f"# LUT del house {house} auto-generada por lut_online_ec40.py",
+            "# R12_TABLES[(house, nib7)][temp_idx] = R12, temp_idx = round((t + 40) * 10)",
+            "",
+            "R12_TABLES = {",
+        ]
+        for n, tab in sorted(tables.items()):
+            lines.append(f"    ({house}, 0x{n:X}): {{")
+            lines += [f"        {t}: 0x{r:03X}," for t, r in tab.items()]
+            lines.append("    },")
+        lines += ["}", "", "# (house, nib7, temp_idx) -> R12 observados, la moda primero", "R12_CONFLICTS = {"]
+        for (n, t), vals in sorted(conflicts.items()):
+            lines.append(f"    ({house}, 0x{n:X}, {t}): ({', '.join(f'0x{r:03X}' for r in vals)},),")
+        lines += [
+            "}",
+            "",
+            "",
+            "def get_r12(temp_c, house, nib7):",
+            '    """R12 observado (moda) para una temperatura; KeyError si no hay datos."""',
+            "    return R12_TABLES[(house, nib7)][int(round((temp_c + 40) * 10))]",
+            "",
+        ]
+        _atomic_write(self.out_dir / f"r12_lut_h{house}.py", "\n".join(lines))
+
+    def _write_h(self, house, tables):
+        guard = f"R12_LUT_H{house}_P_TABLE_H"
+        lines = [
+            f"#ifndef {guard}",
+            f"#define {guard}",
+            "",
+            "#include <stdint.h>",
+            "",
+            f"// P (nibble 14) del house {house} por nib7, auto-generado por lut_online_ec40.py",
+            "// Index = (Temp_C + 40) * 10 - T_LO; 0x0 donde no hay trama",
+            "",
+        ]
+        for n, tab in sorted(tables.items()):
+            lo, hi = min(tab), max(tab)
+            values = [(tab[t] >> 4) & 0xF if t in tab else 0 for t in range(lo, hi + 1)]
+            name = f"P_TABLE_H{house}_N{n:X}"
+            lines.append(f"// nib7 0x{n:X}: {lo / 10 - 40:.1f}C a {hi / 10 - 40:.1f}C, {len(tab)} temperaturas")
+            lines.append(f"#define {name}_T_LO {lo}")
+            lines.append(f"const uint8_t {name}[{len(values)}] = {{")
+            for i in range(0, len(values), PER_LINE):
+                chunk = values[i:i + PER_LINE]
+                last = i + PER_LINE >= len(values)
+                lines.append("    " + ", ".join(f"0x{v:X}" for v in chunk) + ("" if last else ","))
+            lines += ["};", ""]
+        lines += ["#endif", ""]
+        _atomic_write(self.out_dir / f"p_table_h{house}.h", "\n".join(lines))
+
+
+def _row_fields(header):
+    """Índices (payload, house, temp) para los esquemas live y merged."""
+    for payload, house, temp in (("raw64", "house_code", "temp"), ("payload64_hex", "house", "temperature_C")):
+        if payload in header:
+            return header.index(payload), header.index(house), header.index(temp)
+    raise ValueError("el CSV no tiene columnas raw64/house_code/temp ni payload64_hex/house/temperature_C")
+
+
+def consume_csv(lut, path):
+    """
+    Procesa las líneas completas añadidas al CSV desde el último offset.
+    Devuelve cuántas; un CSV con columnas desconocidas se avisa y se omite.
+    """
+    key = str(Path(path).resolve())
+    offset = lut.offsets.get(key, 0)
+    if os.path.getsize(path) < offset:
+        print(f"[lut] {path} es más corto que el offset guardado; se relee desde el principio")
+        offset = 0
+    with open(path, "rb") as f:
+        header_line = f.readline()
+        while header_line and not header_line.strip():
+            header_line = f.readline()
+        if not header_line:
+            return 0
+        first = header_line.decode("utf-8", "replace")
+        if first[0].isalpha():
+            try:
+                fields = _row_fields(next(csv.reader([first])))
+            except ValueError as e:
+                print(f"[lut] {path}: {e}; se omite")
+                return 0
+            offset = max(offset, f.tell())
+        else:
+            fields = HEADERLESS_FIELDS
+        f.seek(offset)
+        chunk = f.read()
+    end = chunk.rfind(b"\n") + 1       # una línea a medio escribir se deja para la próxima
+    n = 0
+    for row in csv.reader(chunk[:end].decode("utf-8", "replace").splitlines()):
+        if len(row) <= max(fields):
+            continue
+        k = frame_key(row[fields[0]], row[fields[1]], row[fields[2]])
+        if k:
+            lut.add(*k)
+            n += 1
+    lut.offsets[key] = offset + end
+    return n
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Actualiza la LUT de R12/P con las tramas nuevas de un CSV")
+    ap.add_argument("csv", nargs="*", help="CSV live o merged (se lee solo lo nuevo)")
+    ap.add_argument("--out", default=str(OUT_DIR), help=f"directorio de estado y artefactos (default: {OUT_DIR.name})")
+    ap.add_argument("--follow", action="store_true", help="seguir leyendo lo que se añada (como tail -f)")
+    ap.add_argument("--interval", type=float, default=2.0, help="segundos entre lecturas con --follow (default: 2)")
+    ap.add_argument("--save-interval", type=float, default=SAVE_INTERVAL,
+                    help=f"segundos mínimos entre guardados del estado (default: {SAVE_INTERVAL:g})")
+    ap.add_argument("--status", action="store_true", help="resumen del estado guardado")
+    args = ap.parse_args()
+
+    lut = OnlineLut(args.out, args.save_interval)
+    if args.status or not args.csv:
+        houses = sorted({h for h, _, _ in lut.cells})
+        n_conf = sum(1 for c in lut.cells.values() if len(c) > 1)
+        print(f"{lut.state_path}: {lut.frames} tramas, {len(lut.cells)} celdas, "
+              f"{n_conf} con conflicto, {len(houses)} houses")
+        for path, off in sorted(lut.offsets.items()):
+            print(f"  {path}: {off} bytes leídos")
+        return
+
+    try:
+        while True:
+            t0 = time.perf_counter()
+            n = sum(consume_csv(lut, p) for p in args.csv)
+            before = set(lut.dirty)
+            lut.flush(force=not args.follow)
+            dirty = sorted(before - lut.dirty)
+            if n or not args.follow:
+                print(f"[lut] {n} tramas nuevas, {len(dirty)} houses regenerados"
+                      f"{': ' + ', '.join(map(str, dirty)) if dirty else ''} "
+                      f"({(time.perf_counter() - t0) * 1000:.1f} ms)")
+            if not args.follow:
+                break
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        print("\nSaliendo…")
+    finally:
+        # Lo ya contado se guarda aunque un CSV falle a medias
+        lut.close()
+
+
+if __name__ == "__main__":
+    main()
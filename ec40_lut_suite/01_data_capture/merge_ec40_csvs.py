@@ -1,11 +1,376 @@
 #!/usr/bin/env python3
+"""
+Fusiona los CSV de capturas ec40_capturas*.csv en ec40_capturas_merged.csv.
+
+Modo incremental (por defecto): para cada fuente se guarda una marca de agua
+(offset en bytes hasta la última línea completa leída + hash de los últimos
+bytes antes de ese offset) en <salida>.state.json. En cada ejecución solo se
+leen las líneas nuevas; si el hash ya no cuadra (fichero reescrito o
+truncado) la fuente se relee entera. La deduplicación usa la clave
+(payload64, timestamp) contra un índice de hashes persistente en <salida>.idx,
+así que una fila ya fusionada nunca se vuelve a añadir.
+
+La salida nunca se toma como fuente (antes el glob la incluía y por eso el
+merged tiene filas repetidas que solo difieren en source_file).
+
+--full reescribe la salida ordenada por timestamp a partir de las fuentes y
+de las filas que ya tenía la salida, sin duplicados, y reinicia el estado.
+--stream hace lo mismo con memoria acotada: cada fuente se ordena por
+bloques de --chunk-rows filas en ficheros temporales y los bloques se
+combinan con un merge k-vías (heapq) por timestamp. Como las filas salen en
+orden, los duplicados (misma clave = mismo timestamp) son consecutivos y
+basta recordar las claves del timestamp actual.
+
+Uso:
+  python3 merge_ec40_csvs.py                       # ec40_capturas*.csv
+  python3 merge_ec40_csvs.py a.csv b.csv -o merged.csv
+  python3 merge_ec40_csvs.py --full
+  python3 merge_ec40_csvs.py --stream --chunk-rows 50000
+"""
+
+import argparse
+import csv
 import glob
+import hashlib
+import heapq
+import itertools
+import json
 import os
-import pandas as pd
+import tempfile
+import time
+
+OUT_FILE = "ec40_capturas_merged.csv"
+
+MERGED_HEADER = [
+    "timestamp", "raw168_hex", "payload64_hex", "temperature_C", "channel",
+    "house", "b3_low", "b7", "R12", "source_file",
+]
+
+# Bytes antes de la marca de agua que se comprueban para detectar reescrituras
+TAIL_BYTES = 4096
+
+
+def row_key(row):
+    """Hash de la clave de deduplicación (payload64, timestamp)."""
+    key = f"{row.get('payload64_hex', '').strip().lower()}|{row.get('timestamp', '').strip()}"
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+def _tail_hash(path, offset):
+    with open(path, "rb") as f:
+        start = max(0, offset - TAIL_BYTES)
+        f.seek(start)
+        return hashlib.blake2b(f.read(offset - start), digest_size=16).hexdigest()
+
+
+class KeyIndex:
+    """Conjunto de claves ya fusionadas, persistido como un hash por línea (solo append)."""
+
+    def __init__(self, path):
+        self.path = path
+        self.keys = set()
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                self.keys.update(line.strip() for line in f if line.strip())
+        self._pending = []
+
+    def add(self, key):
+        """True si la clave es nueva."""
+        if key in self.keys:
+            return False
+        self.keys.add(key)
+        self._pending.append(key)
+        return True
+
+    def save(self):
+        if self._pending:
+            with open(self.path, "a") as f:
+                f.write("".join(k + "\n" for k in self._pending))
+            self._pending.clear()
+
+    def reset(self):
+        self.keys.clear()
+        self._pending.clear()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class MergeState:
+    """Marcas de agua por fuente y tamaño de la salida tras la última fusión."""
+
+    def __init__(self, path):
+        self.path = path
+        self.sources = {}
+        self.output_size = 0
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                data = json.load(f)
+            self.sources = data.get("sources", {})
+            self.output_size = data.get("output_size", 0)
+
+    def watermark(self, name, path):
+        """Offset desde el que leer la fuente (0 si es nueva o ha cambiado)."""
+        mark = self.sources.get(name)
+        if not mark:
+            return 0
+        offset = mark["offset"]
+        if os.path.getsize(path) < offset or _tail_hash(path, offset) != mark["hash"]:
+            print(f"  {name}: cambió desde la última fusión, se relee entera")
+            return 0
+        return offset
+
+    def advance(self, name, path, offset, header):
+        self.sources[name] = {"offset": offset, "hash": _tail_hash(path, offset), "header": header}
+
+    def save(self, output_size):
+        self.output_size = output_size
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"sources": self.sources, "output_size": output_size,
+                       "updated": time.strftime("%Y-%m-%d %H:%M:%S")}, f, indent=2)
+        os.replace(tmp, self.path)
+
+
+def read_new_rows(path, offset, header=None):
+    """
+    Filas (dict) de las líneas completas a partir de offset.
+    Devuelve (filas, nuevo offset, cabecera). Una última línea sin '\\n'
+    (el logger aún escribiendo) se deja para la próxima ejecución.
+    """
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    end = data.rfind(b"\n") + 1
+    lines = data[:end].decode("utf-8", errors="replace").splitlines()
+    if offset == 0 or header is None:
+        while lines and not lines[0].strip():
+            lines.pop(0)
+        if not lines:
+            return [], offset + end, header
+        header = next(csv.reader([lines.pop(0)]))
+    rows = [dict(zip(header, parts)) for parts in csv.reader(lines) if parts]
+    return rows, offset + end, header
+
+
+def to_merged(row, source):
+    out = {k: row.get(k, "") for k in MERGED_HEADER}
+    out["source_file"] = source
+    return out
+
+
+def find_sources(patterns, out_file):
+    """Fuentes por defecto: ec40_capturas*.csv, nunca la propia salida ni sus ficheros de estado."""
+    files = patterns or sorted(glob.glob("ec40_capturas*.csv"))
+    out_abs = os.path.abspath(out_file)
+    return [f for f in files if os.path.abspath(f) != out_abs]
+
+
+def _index_output_tail(out_file, index, start):
+    """Recuperación: indexa las filas de la salida escritas tras la última fusión registrada."""
+    if not os.path.exists(out_file) or os.path.getsize(out_file) <= start:
+        return 0
+    rows, _, _ = read_new_rows(out_file, start, MERGED_HEADER if start else None)
+    for row in rows:
+        index.add(row_key(row))
+    return len(rows)
+
+
+def incremental_merge(files, out_file):
+    state = MergeState(out_file + ".state.json")
+    index = KeyIndex(out_file + ".idx")
+
+    new_output = not os.path.exists(out_file) or os.path.getsize(out_file) == 0
+    if new_output:
+        # Salida borrada: el índice y las marcas de agua ya no valen
+        index.reset()
+        state.sources = {}
+    recovered = _index_output_tail(out_file, index, 0 if not index.keys else state.output_size)
+    if recovered:
+        print(f"Indexadas {recovered} filas de {out_file} sin registrar en el índice")
+
+    new_rows = []
+    read = 0
+    for path in files:
+        name = os.path.basename(path)
+        offset = state.watermark(name, path)
+        header = state.sources.get(name, {}).get("header") if offset else None
+        rows, end, header = read_new_rows(path, offset, header)
+        read += len(rows)
+        added = 0
+        for row in rows:
+            if index.add(row_key(row)):
+                new_rows.append(to_merged(row, name))
+                added += 1
+        state.advance(name, path, end, header)
+        print(f"  {name}: {len(rows)} filas nuevas leídas, {added} añadidas")
+
+    new_rows.sort(key=lambda r: r["timestamp"])
+    with open(out_file, "a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=MERGED_HEADER)
+        if new_output:
+            writer.writeheader()
+        writer.writerows(new_rows)
+    index.save()
+    state.save(os.path.getsize(out_file))
+    print(f"Filas leídas: {read}, añadidas a {out_file}: {len(new_rows)}")
+
+
+def full_merge(files, out_file):
+    """Reescribe la salida ordenada y sin duplicados; conserva las filas que ya tenía."""
+    rows = []
+    if os.path.exists(out_file):
+        previous, _, _ = read_new_rows(out_file, 0)
+        rows.extend(previous)
+    for path in files:
+        found, _, _ = read_new_rows(path, 0)
+        rows.extend(to_merged(r, os.path.basename(path)) for r in found)
+
+    # Ante la misma clave gana la fila de una fuente real, no la autoingerida
+    own = os.path.basename(out_file)
+    rows.sort(key=lambda r: r.get("source_file") == own)
+
+    index = KeyIndex(out_file + ".idx")
+    index.reset()
+    unique = [to_merged(r, r.get("source_file", "")) for r in rows if index.add(row_key(r))]
+    unique.sort(key=lambda r: r["timestamp"])
+
+    tmp = out_file + ".tmp"
+    with open(tmp, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=MERGED_HEADER)
+        writer.writeheader()
+        writer.writerows(unique)
+    os.replace(tmp, out_file)
+    index.save()
+
+    _reset_state(files, out_file)
+    print(f"Filas totales: {len(rows)}, tras eliminar duplicados: {len(unique)}")
+
+
+def _reset_state(files, out_file):
+    """Marcas de agua al final de cada fuente tras reescribir la salida entera."""
+    state = MergeState(out_file + ".state.json")
+    state.sources = {}
+    for path in files:
+        with open(path, "r", newline="") as f:
+            header = next(csv.reader(l for l in _complete_lines(f) if l.strip()), None)
+        state.advance(os.path.basename(path), path, _complete_size(path), header)
+    state.save(os.path.getsize(out_file))
+
+
+def _complete_size(path):
+    """Bytes hasta el último '\n' (una última línea a medias no cuenta)."""
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        pos = size
+        while pos > 0:
+            step = min(4096, pos)
+            f.seek(pos - step)
+            chunk = f.read(step)
+            nl = chunk.rfind(b"\n")
+            if nl >= 0:
+                return pos - step + nl + 1
+            pos -= step
+    return 0
+
+
+def _complete_lines(f):
+    for line in f:
+        if not line.endswith("\n"):
+            break
+        yield line
+
+
+def _iter_source(path):
+    """Filas de una fuente leídas en streaming (solo líneas completas)."""
+    with open(path, "r", newline="", encoding="utf-8", errors="replace") as f:
+        reader = csv.reader(l for l in _complete_lines(f) if l.strip())
+        header = next(reader, None)
+        if header is None:
+            return
+        for parts in reader:
+            if parts:
+                yield dict(zip(header, parts))
+
+
+def _write_run(rows, tmpdir, n):
+    rows.sort(key=lambda r: r["timestamp"])
+    path = os.path.join(tmpdir, f"run{n:05d}.csv")
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=MERGED_HEADER)
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+def _sorted_runs(path, source, chunk_rows, tmpdir, counter):
+    """Parte una fuente en bloques de chunk_rows filas ordenados por timestamp."""
+    runs = []
+    rows = iter(_iter_source(path))
+    while True:
+        chunk = [to_merged(r, r.get("source_file", "") if source is None else source)
+                 for r in itertools.islice(rows, chunk_rows)]
+        if not chunk:
+            break
+        runs.append(_write_run(chunk, tmpdir, next(counter)))
+    return runs
+
+
+def stream_merge(files, out_file, chunk_rows):
+    """
+    Como full_merge pero con memoria acotada a chunk_rows filas más una
+    fila por bloque durante la mezcla.
+    """
+    out_dir = os.path.dirname(os.path.abspath(out_file))
+    counter = itertools.count()
+    total = written = 0
+    index = KeyIndex(out_file + ".idx")
+    index.reset()
+
+    with tempfile.TemporaryDirectory(dir=out_dir, prefix=".merge_") as tmpdir:
+        runs = []
+        for path in files:
+            runs += _sorted_runs(path, os.path.basename(path), chunk_rows, tmpdir, counter)
+        # Los bloques de la salida anterior van al final: ante un empate de
+        # timestamp heapq.merge respeta el orden de las entradas y gana la fuente real
+        if os.path.exists(out_file):
+            runs += _sorted_runs(out_file, None, chunk_rows, tmpdir, counter)
+        print(f"{len(runs)} bloques ordenados de hasta {chunk_rows} filas")
+
+        tmp = out_file + ".tmp"
+        current_ts, seen = None, set()
+        with open(tmp, "w", newline="") as out, open(index.path, "a") as idx:
+            writer = csv.DictWriter(out, fieldnames=MERGED_HEADER)
+            writer.writeheader()
+            for row in heapq.merge(*(_iter_source(r) for r in runs), key=lambda r: r["timestamp"]):
+                total += 1
+                if row["timestamp"] != current_ts:
+                    current_ts, seen = row["timestamp"], set()
+                key = row_key(row)
+                if key in seen:
+                    continue
+                seen.add(key)
+                writer.writerow(row)
+                idx.write(key + "\n")
+                written += 1
+        os.replace(tmp, out_file)
+
+    _reset_state(files, out_file)
+    print(f"Filas totales: {total}, tras eliminar duplicados: {written}")
+
 
 def main():
-    # Buscar todos los CSV tipo ec40_capturas*.csv
-    files = sorted(glob.glob("ec40_capturas*.csv"))
+    ap = argparse.ArgumentParser(description="Fusiona CSV de capturas EC40")
+    ap.add_argument("files", nargs="*", help="CSV de entrada (default: ec40_capturas*.csv)")
+    ap.add_argument("-o", "--output", default=OUT_FILE, help=f"CSV fusionado (default: {OUT_FILE})")
+    ap.add_argument("--full", action="store_true",
+                    help="reescribir la salida completa, ordenada y sin duplicados")
+    ap.add_argument("--stream", action="store_true",
+                    help="como --full pero con memoria acotada (ordenación por bloques + merge k-vías)")
+    ap.add_argument("--chunk-rows", type=int, default=50000,
+                    help="filas por bloque en --stream (default: 50000)")
+    args = ap.parse_args()
+
+    files = find_sources(args.files, args.output)
     if not files:
         print("No se encontraron ficheros ec40_capturas*.csv")
         return
@@ -14,35 +379,14 @@ def main():
     for f in files:
         print("  -", f)
 
-    dfs = []
-    for f in files:
-        try:
-            df = pd.read_csv(f)
-            df["source_file"] = os.path.basename(f)
-            dfs.append(df)
-        except Exception as e:
-            print(f"Error leyendo {f}: {e}")
-
-    if not dfs:
-        print("No hay datos válidos.")
-        return
-
-    all_df = pd.concat(dfs, ignore_index=True)
-
-    # Eliminar duplicados exactos (misma fila completa)
-    before = len(all_df)
-    all_df = all_df.drop_duplicates()
-    after = len(all_df)
-    print(f"Filas totales: {before}, tras eliminar duplicados: {after}")
-
-    # Ordenar por timestamp si existe
-    if "timestamp" in all_df.columns:
-        all_df["timestamp"] = pd.to_datetime(all_df["timestamp"], errors="coerce")
-        all_df = all_df.sort_values("timestamp").reset_index(drop=True)
+    if args.stream:
+        stream_merge(files, args.output, args.chunk_rows)
+    elif args.full:
+        full_merge(files, args.output)
+    else:
+        incremental_merge(files, args.output)
+    print(f"Fichero unificado guardado en: {args.output}")
 
-    out_file = "ec40_capturas_merged.csv"
-    all_df.to_csv(out_file, index=False)
-    print(f"Fichero unificado guardado en: {out_file}")
 
 if __name__ == "__main__":
     main()
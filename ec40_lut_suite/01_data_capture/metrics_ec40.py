@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Métricas del logger EC40 en formato de texto de Prometheus.
+
+El logger solo cuenta (enteros y un bisect por histograma); todo el formateo
+se hace al servir /metrics, en un hilo aparte con http.server. Lo que ya
+cuentan otras piezas (dedup, profundidad de las colas) se lee en el momento
+del scrape, sin coste en el bucle principal.
+
+Uso:
+  python3 logger_ec40.py --metrics-port 9433
+  curl -s localhost:9433/metrics
+"""
+
+import bisect
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Segundos: el parseo de un bloque ronda los µs; la escritura, de µs a ms
+PARSE_BUCKETS = (5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 1e-3, 1e-2)
+WRITE_BUCKETS = (1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 1.0)
+
+
+class Histogram:
+    """Histograma acumulativo con cubetas fijas (le = límite superior)."""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def render(self, name, help_text):
+        lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+        acc = 0
+        for le, n in zip(self.buckets, self.counts):
+            acc += n
+            lines.append(f'{name}_bucket{{le="{le:g}"}} {acc}')
+        acc += self.counts[-1]
+        lines.append(f'{name}_bucket{{le="+Inf"}} {acc}')
+        lines.append(f"{name}_sum {self.sum:.9f}")
+        lines.append(f"{name}_count {acc}")
+        return lines
+
+
+class CaptureMetrics:
+    """
+    Contadores del proceso de captura. 'dedup' (FrameDeduper) y 'queues'
+    (nombre -> asyncio.Queue) son opcionales y se consultan al servir.
+    """
+
+    def __init__(self, dedup=None, queues=None):
+        self.dedup = dedup
+        self.queues = queues or {}
+        self.frames_parsed = 0
+        self.frames_failed = 0
+        self.parse_failures = {}      # campo que falta -> total
+        self.rows_written = 0
+        self.house_frames = {}        # house -> tramas parseadas
+        self.parse_latency = Histogram(PARSE_BUCKETS)
+        self.write_latency = Histogram(WRITE_BUCKETS)
+        self.started = time.time()
+
+    def frame_parsed(self, data, elapsed):
+        self.frames_parsed += 1
+        house = data.get("house_code")
+        self.house_frames[house] = self.house_frames.get(house, 0) + 1
+        self.parse_latency.observe(elapsed)
+
+    def parse_failed(self, missing):
+        """missing: lista de campos que faltan en el registro descartado."""
+        self.frames_failed += 1
+        for field in missing or ("desconocido",):
+            self.parse_failures[field] = self.parse_failures.get(field, 0) + 1
+
+    def rows_flushed(self, count, elapsed):
+        self.rows_written += count
+        self.write_latency.observe(elapsed)
+
+    def render(self):
+        out = [
+            "# HELP ec40_frames_read_total Registros de rtl_433 leídos (parseados o descartados).",
+            "# TYPE ec40_frames_read_total counter",
+            f"ec40_frames_read_total {self.frames_parsed + self.frames_failed}",
+            "# HELP ec40_frames_parsed_total Tramas EC40 parseadas.",
+            "# TYPE ec40_frames_parsed_total counter",
+            f"ec40_frames_parsed_total {self.frames_parsed}",
+            "# HELP ec40_parse_failures_total Registros descartados, por campo que falta.",
+            "# TYPE ec40_parse_failures_total counter",
+        ]
+        for field, n in sorted(self.parse_failures.items()):
+            out.append(f'ec40_parse_failures_total{{field="{field}"}} {n}')
+        if self.dedup is not None:
+            out += [
+                "# HELP ec40_duplicates_total Retransmisiones descartadas por el dedup.",
+                "# TYPE ec40_duplicates_total counter",
+                f"ec40_duplicates_total {self.dedup.hits}",
+                "# HELP ec40_dedup_sensors Sensores recordados por el dedup.",
+                "# TYPE ec40_dedup_sensors gauge",
+                f"ec40_dedup_sensors {len(self.dedup)}",
+            ]
+        out += [
+            "# HELP ec40_rows_written_total Filas escritas en el CSV.",
+            "# TYPE ec40_rows_written_total counter",
+            f"ec40_rows_written_total {self.rows_written}",
+        ]
+        if self.queues:
+            out += ["# HELP ec40_queue_depth Elementos en cada cola del pipeline asíncrono.",
+                    "# TYPE ec40_queue_depth gauge"]
+            for name, q in self.queues.items():
+                out.append(f'ec40_queue_depth{{queue="{name}"}} {q.qsize()}')
+        # Tasa por house: rate(ec40_house_frames_total[5m]) en Prometheus
+        out += ["# HELP ec40_house_frames_total Tramas parseadas por house code.",
+                "# TYPE ec40_house_frames_total counter"]
+        for house, n in sorted(self.house_frames.items(), key=lambda kv: (kv[0] is None, kv[0] or 0)):
+            label = "" if house is None else house
+            out.append(f'ec40_house_frames_total{{house="{label}"}} {n}')
+        out += self.parse_latency.render("ec40_parse_seconds", "Tiempo de parseo por registro.")
+        out += self.write_latency.render("ec40_write_seconds", "Tiempo de escritura por volcado al CSV.")
+        out += ["# HELP ec40_start_time_seconds Inicio del proceso (epoch).",
+                "# TYPE ec40_start_time_seconds gauge",
+                f"ec40_start_time_seconds {self.started:.0f}"]
+        return "\n".join(out) + "\n"
+
+
+def serve_metrics(metrics, port, host="127.0.0.1"):
+    """Sirve /metrics en un hilo demonio. Devuelve el servidor (para shutdown())."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
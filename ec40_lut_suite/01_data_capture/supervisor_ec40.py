@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Supervisor de captura multi-receptor (varios dongles RTL-SDR).
+
+Lanza o se conecta a N fuentes de rtl_433 a la vez y fusiona sus tramas en
+un único CSV ordenado, escrito por un solo proceso (sin carreras entre
+loggers sobre el mismo fichero). Una misma trama raw168 oída por varios
+receptores dentro de --window segundos se registra una sola vez, con la
+lista de receptores que la oyeron en la columna 'receivers'.
+
+Fuentes (se puede anteponer un nombre: 'norte=cmd:rtl_433 -d 0 -R 12'):
+  cmd:<comando>    subproceso (rtl_433 o fake_rtl_433.py)
+  file:<ruta>      log grabado, con los instantes del propio log
+  tcp:<host>:<port> socket con la salida de rtl_433
+
+Orden: cada trama tiene un instante (reloj de pared para cmd/tcp, 'time' del
+log para file). Un grupo se emite cuando la marca de agua, el mínimo de los
+instantes de las fuentes aún abiertas, supera su instante + ventana. Así la
+salida queda ordenada aunque los ficheros se lean a distinta velocidad.
+"""
+
+import argparse
+import asyncio
+import csv
+import shlex
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from logger_ec40 import (
+    CSV_HEADER, TIME_FMT, make_parser, build_row, rtl_command,
+    stream_lines, file_lines,
+)
+
+OUT_FILE = "ec40_fanin.csv"
+OUT_HEADER = CSV_HEADER + ["receivers"]
+
+
+class Source:
+    """Una fuente de líneas de rtl_433 con su reloj de eventos."""
+
+    def __init__(self, name, spec, fmt):
+        self.name = name
+        self.kind, _, self.target = spec.partition(":")
+        if self.kind not in ("cmd", "file", "tcp") or not self.target:
+            raise ValueError(f"Fuente no válida: {spec!r} (usa cmd:, file: o tcp:)")
+        self.fmt = fmt
+        # Los ficheros usan el instante del log; el resto, el reloj de pared
+        self.log_clock = self.kind == "file"
+        # Posición de la fuente según lo que ya ha consumido el merger
+        self.latest = float("-inf")
+        self.done = False
+        self.frames = 0
+        self._proc = None
+        self._writer = None
+
+    async def lines(self):
+        if self.kind == "file":
+            return file_lines(open(self.target, "r", encoding="utf-8", errors="replace"))
+        if self.kind == "tcp":
+            host, _, port = self.target.rpartition(":")
+            reader, self._writer = await asyncio.open_connection(host, int(port))
+            return stream_lines(reader)
+        cmd = shlex.split(self.target) if self.target != "rtl_433" else rtl_command(self.fmt)
+        self._proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        return stream_lines(self._proc.stdout)
+
+    def mark(self, now):
+        """Instante hasta el que esta fuente ya no puede aportar tramas."""
+        return self.latest if self.log_clock else now
+
+    def close(self):
+        if self._proc and self._proc.returncode is None:
+            self._proc.kill()
+        if self._writer:
+            self._writer.close()
+
+
+class FanInMerger:
+    """
+    Agrupa por raw168 las tramas que llegan de varios receptores dentro de
+    la ventana y las entrega en orden de instante.
+    Solo guarda las tramas cuya ventana sigue abierta.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self._pending = {}   # raw168 -> grupo
+        self._closed = []    # grupos cerrados antes de tiempo por una repetición
+        self.heard = 0
+        self.duplicates = 0
+        self.emitted = 0
+        self.by_count = Counter()
+
+    def add(self, data, receiver, ts):
+        self.heard += 1
+        key = data["raw168"]
+        group = self._pending.get(key)
+        if group is not None:
+            if ts - group["ts"] <= self.window:
+                self.duplicates += 1
+                if receiver not in group["receivers"]:
+                    group["receivers"].append(receiver)
+                return
+            # Misma trama fuera de la ventana: es una observación nueva
+            self._closed.append(self._pending.pop(key))
+        self._pending[key] = {"ts": ts, "data": data, "receivers": [receiver]}
+
+    def pop_ready(self, watermark):
+        ready = self._closed
+        self._closed = []
+        for key in [k for k, g in self._pending.items() if g["ts"] + self.window <= watermark]:
+            ready.append(self._pending.pop(key))
+        ready.sort(key=lambda g: g["ts"])
+        for g in ready:
+            self.by_count[len(g["receivers"])] += 1
+        self.emitted += len(ready)
+        return ready
+
+    def summary(self):
+        spread = " ".join(f"{k}rx={v}" for k, v in sorted(self.by_count.items()))
+        return (f"oídas={self.heard} únicas={self.emitted} "
+                f"duplicadas={self.duplicates} pendientes={len(self._pending)} [{spread}]")
+
+
+async def source_task(src, queue):
+    feed = make_parser(src.fmt)
+    last = 0.0
+
+    async def put(data):
+        nonlocal last
+        ts = time.time()
+        if src.log_clock:
+            try:
+                ts = time.mktime(time.strptime(data.get("time"), TIME_FMT))
+            except (TypeError, ValueError):
+                ts = last
+        last = max(last, ts)
+        src.frames += 1
+        await queue.put((src, last, data))
+
+    try:
+        lines = await src.lines()
+        async for line in lines:
+            done, data = feed(line)
+            if data:
+                await put(data)
+        done, data = feed("\n")
+        if data:
+            await put(data)
+    except (OSError, ValueError) as e:
+        print(f"[{src.name}] Error: {e}")
+    finally:
+        src.close()
+        await queue.put((src, None, None))
+
+
+async def merge_task(sources, queue, merger, out_path, tick):
+    remaining = len(sources)
+    with open(out_path, "a", newline="") as f:
+        writer = csv.writer(f)
+
+        def emit(watermark):
+            for g in merger.pop_ready(watermark):
+                data = g["data"]
+                data["timestamp"] = time.strftime(TIME_FMT, time.localtime(g["ts"]))
+                writer.writerow(build_row(data) + [";".join(g["receivers"])])
+            f.flush()
+
+        while remaining:
+            try:
+                src, ts, data = await asyncio.wait_for(queue.get(), tick)
+                if ts is None:
+                    src.done = True
+                    remaining -= 1
+                else:
+                    src.latest = ts
+                    merger.add(data, src.name, ts)
+            except asyncio.TimeoutError:
+                pass
+
+            now = time.time()
+            marks = [s.mark(now) for s in sources if not s.done]
+            emit(min(marks) if marks else float("inf"))
+
+        emit(float("inf"))
+
+
+async def run(sources, out_path, window, queue_size, tick):
+    queue = asyncio.Queue(maxsize=queue_size)
+    merger = FanInMerger(window)
+    try:
+        await asyncio.gather(
+            merge_task(sources, queue, merger, out_path, tick),
+            *(source_task(s, queue) for s in sources),
+        )
+    finally:
+        for s in sources:
+            s.close()
+        for s in sources:
+            print(f"[{s.name}] {s.frames} tramas")
+        print(f"[fan-in] {merger.summary()}")
+
+
+def parse_sources(specs, fmt):
+    sources = []
+    for i, spec in enumerate(specs):
+        name, sep, rest = spec.partition("=")
+        if not sep or ":" in name:
+            name, rest = f"rx{i}", spec
+        sources.append(Source(name, rest, fmt))
+    return sources
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Supervisor de captura EC40 multi-receptor")
+    ap.add_argument("sources", nargs="+", help="fuentes: [nombre=]cmd:…, file:… o tcp:host:port")
+    ap.add_argument("--format", choices=("text", "json"), default="text",
+                    help="formato de salida de rtl_433 de todas las fuentes")
+    ap.add_argument("--window", type=float, default=2.0,
+                    help="segundos en los que la misma trama de varios receptores es una sola (default: 2)")
+    ap.add_argument("-o", "--output", default=OUT_FILE, help=f"CSV de salida (default: {OUT_FILE})")
+    ap.add_argument("--queue-size", type=int, default=1000, help="capacidad de la cola común")
+    ap.add_argument("--tick", type=float, default=0.2,
+                    help="segundos entre comprobaciones de la marca de agua (default: 0.2)")
+    args = ap.parse_args()
+
+    try:
+        sources = parse_sources(args.sources, args.format)
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+
+    try:
+        with open(args.output, "x", newline="") as f:
+            csv.writer(f).writerow(OUT_HEADER)
+    except FileExistsError:
+        pass
+
+    print(f"Fusionando {len(sources)} fuentes en {args.output}… (Ctrl+C para salir)\n")
+    try:
+        asyncio.run(run(sources, args.output, args.window, args.queue_size, args.tick))
+    except KeyboardInterrupt:
+        print("\nSaliendo…")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Validación en vivo: compara cada trama capturada con la que produciría el
+generador (mismos pasos que generate_frame en generate_verification_table.py):
+cabecera + R1/M como suma de nibbles y P = LUT base (nib7=2) XOR
+NIB7_XOR_TABLE[nib7], tomados de Docs/oregon_p_lut_complete.py.
+
+La LUT de P se expande al arrancar a una lista densa indexada por
+temp_idx = (t + 40) * 10 (con el mismo "valor más proximo" que get_p para los
+huecos), así que cada comprobación son unas pocas operaciones de enteros:
+unos microsegundos por trama.
+
+Uso desde el logger:
+  python3 logger_ec40.py --validate
+Prueba sobre un CSV existente:
+  python3 validator_ec40.py ../ec40_live.csv
+"""
+
+import csv
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "04_universal_mp_analysis" / "Docs"))
+
+from oregon_p_lut_complete import get_p, NIB7_XOR_TABLE
+
+# -40.0 °C .. +100.0 °C
+TEMP_IDX_MAX = 1400
+
+HEX = {c: int(c, 16) for c in "0123456789abcdefABCDEF"}
+
+POSITION_NAMES = {12: "R1", 13: "M", 14: "P"}
+
+
+class LiveValidator:
+    """
+    Estadísticas incrementales por (house, nib7):
+    [total, coincidencias, errores R1, errores M, errores P, errores cabecera]
+    """
+
+    def __init__(self, verbose=True):
+        self.p_base = [get_p((i - 400) / 10.0, 0x2) for i in range(TEMP_IDX_MAX + 1)]
+        self.p_xor = [NIB7_XOR_TABLE.get(n, 0x0) for n in range(16)]
+        self.stats = {}
+        self.verbose = verbose
+        self.total = 0
+        self.matches = 0
+        self.elapsed = 0.0
+
+    def expected(self, house, channel, temp_c, nib7):
+        """Los 15 nibbles que generaría generate_frame."""
+        t10 = int(round(abs(temp_c) * 10))
+        nib = [0xE, 0xC, 0x4, 0x0,
+               channel & 0xF, house & 0xF, (house >> 4) & 0xF, nib7,
+               t10 % 10, (t10 // 10) % 10, (t10 // 100) % 10,
+               0x0 if temp_c >= 0 else 0x8]
+        s = sum(nib) & 0xFF
+        idx = int(round((temp_c + 40) * 10))
+        if idx < 0:
+            idx = 0
+        elif idx > TEMP_IDX_MAX:
+            idx = TEMP_IDX_MAX
+        nib.append(s & 0xF)
+        nib.append(s >> 4)
+        nib.append((self.p_base[idx] ^ self.p_xor[nib7]) & 0xF)
+        return nib
+
+    def check(self, data):
+        """
+        Valida una trama del logger (claves raw64, house_code, channel, temp).
+        Devuelve la lista de posiciones que difieren (vacía si coincide).
+        """
+        t0 = time.perf_counter()
+        raw = data["raw64"]
+        house = data.get("house_code") or 0
+        captured = [HEX[c] for c in raw[:15]]
+        nib7 = captured[7]
+        gen = self.expected(house, data.get("channel") or 0, data["temp"], nib7)
+        diffs = [i for i in range(15) if captured[i] != gen[i]]
+
+        st = self.stats.get((house, nib7))
+        if st is None:
+            st = self.stats[(house, nib7)] = [0, 0, 0, 0, 0, 0]
+        st[0] += 1
+        self.total += 1
+        if not diffs:
+            st[1] += 1
+            self.matches += 1
+        else:
+            for pos in diffs:
+                st[2 + min(pos - 12, 3) if pos >= 12 else 5] += 1
+        self.elapsed += time.perf_counter() - t0
+
+        if diffs and self.verbose:
+            where = ",".join(POSITION_NAMES.get(p, f"pos{p}") for p in diffs)
+            print(f"[mismatch] house={house} nib7=0x{nib7:X} {data['temp']}°C "
+                  f"capturada={raw[:15]} generada={''.join(f'{n:x}' for n in gen)} ({where})")
+        return diffs
+
+    def summary(self):
+        pct = self.matches / self.total * 100 if self.total else 0.0
+        cost = self.elapsed / self.total * 1e6 if self.total else 0.0
+        return f"{self.matches}/{self.total} coinciden ({pct:.1f}%), {cost:.1f} µs/trama"
+
+    def report(self):
+        print(f"[validación] {self.summary()}")
+        print("  House  Nib7  Total   OK      %    R1   M    P   Cab")
+        for (house, nib7), st in sorted(self.stats.items()):
+            total, ok, r1, m, p, hdr = st
+            print(f"  {house:5d}  0x{nib7:X}  {total:5d} {ok:5d} {ok / total * 100:6.1f}%"
+                  f" {r1:4d} {m:4d} {p:4d} {hdr:4d}")
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Uso: python3 validator_ec40.py <csv del logger> [--quiet]")
+        sys.exit(1)
+
+    validator = LiveValidator(verbose="--quiet" not in sys.argv)
+    with open(sys.argv[1], "r") as f:
+        for row in csv.DictReader(f):
+            try:
+                validator.check({
+                    "raw64": row["raw64"],
+                    "house_code": int(row["house_code"]),
+                    "channel": int(row["channel"]),
+                    "temp": float(row["temp"]),
+                })
+            except (ValueError, KeyError):
+                continue
+    validator.report()
+
+
+if __name__ == "__main__":
+    main()
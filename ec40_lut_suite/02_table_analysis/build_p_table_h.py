@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Genera oregon_p_table_247.h: tabla P (nibble 14 del payload EC40) del
+house 247 indexada por temp_idx = (Temp_C + 40) * 10, desde
+tramas_thn132n.csv. Las posiciones sin trama quedan a 0x0.
+
+Uso:
+  python3 build_p_table_h.py [tramas_thn132n.csv] [-o oregon_p_table_247.h]
+"""
+
+import argparse
+import csv
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+TRAMAS_FILE = BASE_DIR / "01_data_capture" / "tramas_thn132n.csv"
+OUT_FILE = BASE_DIR / "oregon_p_table_247.h"
+
+HOUSE = 247
+N_ENTRIES = 901      # temp_idx 0..900 (-40.0 °C .. 50.0 °C)
+PER_LINE = 14
+
+
+def build_table(csv_path, house=HOUSE):
+    table = [0] * N_ENTRIES
+    lo, hi = N_ENTRIES, -1
+    with open(csv_path, "r", newline="") as f:
+        for row in csv.DictReader(f):
+            try:
+                if int(row["device_id"]) != house:
+                    continue
+                temp_idx = int(round((float(row["temperatura"]) + 40) * 10))
+                p = int(row["ec40_hex"][14], 16)
+            except (ValueError, KeyError, IndexError, TypeError):
+                continue
+            if 0 <= temp_idx < N_ENTRIES:
+                table[temp_idx] = p
+                lo, hi = min(lo, temp_idx), max(hi, temp_idx)
+    return table, lo, hi
+
+
+def write_header(table, lo, hi, out_path, source_name, house=HOUSE):
+    guard = f"OREGON_P_TABLE_{house}_H"
+    lines = [
+        f"#ifndef {guard}",
+        f"#define {guard}",
+        "",
+        "#include <stdint.h>",
+        "",
+        f"// P_TABLE for House {house} (0x{house:02X})",
+        f"// Extracted from {source_name}",
+        f"// Temp Range: {lo / 10 - 40:.1f}C to {hi / 10 - 40:.1f}C (TempIdx {lo} to {hi})",
+        "// Index = (Temp_C + 40) * 10",
+        "",
+        f"const uint8_t P_TABLE_HOUSE_{house}[] = {{",
+    ]
+    for i in range(0, len(table), PER_LINE):
+        chunk = table[i:i + PER_LINE]
+        last = i + PER_LINE >= len(table)
+        body = ", ".join(f"0x{v:X}" for v in chunk)
+        lines.append("    " + body + ("" if last else ", "))
+    lines += ["};", "", "#endif", ""]
+    with open(out_path, "w") as f:
+        f.write("\n".join(lines))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Genera la tabla P del house 247 como cabecera C")
+    ap.add_argument("csv", nargs="?", default=str(TRAMAS_FILE), help="tramas_thn132n.csv")
+    ap.add_argument("-o", "--output", default=str(OUT_FILE), help=f"cabecera de salida (default: {OUT_FILE.name})")
+    args = ap.parse_args()
+
+    table, lo, hi = build_table(args.csv)
+    if hi < 0:
+        print(f"No hay tramas del house {HOUSE} en {args.csv}")
+        return
+    write_header(table, lo, hi, args.output, Path(args.csv).name)
+    print(f"{args.output}: {sum(1 for v in table if v)} valores no nulos, temp_idx {lo}..{hi}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,75 +1,198 @@
 #!/usr/bin/env python3
+"""
+Construye la LUT de R12 por (house, nib7, temp_idx) en una sola pasada
+vectorizada.
+
+R12 = ((byte3 & 0xF) << 8) | byte7 = nib7 << 8 | nib14 << 4 | nib15, así que
+depende del house y de nib7: una tabla por (house, nib7), indexada por
+temp_idx = round((t + 40) * 10). Para cada clave se toma la moda (empate:
+el R12 visto primero) y se anotan los conflictos (claves con más de un R12).
+
+Los nibbles salen de la matriz mapeada en memoria de 04_utilities
+(nibble_matrix.py), sin parsear el CSV en cada ejecución.
+
+Salidas:
+  r12_lut.json   {"tables": {"247:2": {"580": "0x186", ...}},
+                  "conflicts": {"247:2:581": [["0x186", 3], ["0x187", 1]]}}
+  r12_lut.py     R12_TABLES[(house, nib7)][temp_idx] = R12, R12_CONFLICTS, get_r12()
+                 y la misma tabla densa: R12_DENSE (array('H'), una fila de
+                 TEMP_IDX_SIZE celdas por clave de R12_KEYS, R12_MISSING si
+                 no se observó); ver r12_lookup.py
+
+Uso:
+  python3 build_r12_lut.py [../ec40_capturas_merged.csv] [--json F] [--py F]
+  python3 build_r12_lut.py --scale 50      # medir con el dataset replicado x50
+"""
+
+import argparse
 import json
-import pandas as pd
-from collections import Counter
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import numpy as np
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR / "04_utilities"))
+
+from nibble_matrix import load_matrix
+
+MERGED_FILE = BASE_DIR / "ec40_capturas_merged.csv"
+JSON_FILE = BASE_DIR / "r12_lut.json"
+PY_FILE = Path(__file__).parent / "r12_lut.py"
+
+# temp_idx + _T_OFF cabe en 16 bits para cualquier temperatura del sensor
+_T_OFF = 1 << 15
+
+# Tabla densa: temp_idx 0..1023 (-40.0 °C .. 62.3 °C); celda sin observar = 0xFFFF
+TEMP_IDX_SIZE = 1024
+R12_MISSING = 0xFFFF
+
+
+def group_modes(house, nib7, temp_idx, r12):
+    """
+    Moda y conflictos por (house, nib7, temp_idx), vectorizado.
+    Devuelve (house, nib7, temp_idx, r12_moda, soporte, total) por clave y
+    (clave_idx, r12, cuenta) de las alternativas, con clave_idx el índice de
+    la clave en los arrays anteriores.
+    """
+    key = (((house.astype(np.int64) << 4) | nib7) << 16) | (temp_idx.astype(np.int64) + _T_OFF)
+    pair = (key << 12) | r12
+
+    pairs, first, counts = np.unique(pair, return_index=True, return_counts=True)
+    pkey = pairs >> 12
+    # Dentro de cada clave: más frecuente primero, empate por primera aparición
+    order = np.lexsort((first, -counts, pkey))
+    pairs, counts, pkey = pairs[order], counts[order], pkey[order]
+    is_mode = np.r_[True, pkey[1:] != pkey[:-1]]
+
+    keys = pkey[is_mode]
+    group = np.cumsum(is_mode) - 1
+    total = np.bincount(group, weights=counts).astype(np.int64)
+    modes = (
+        (keys >> 20).astype(np.int64),
+        ((keys >> 16) & 0xF).astype(np.int64),
+        (keys & 0xFFFF).astype(np.int64) - _T_OFF,
+        pairs[is_mode] & 0xFFF,
+        counts[is_mode],
+        total,
+    )
+    alternates = (group[~is_mode], pairs[~is_mode] & 0xFFF, counts[~is_mode])
+    return modes, alternates
+
+
+def build_lut(nibbles, house, temp_idx):
+    nib = np.asarray(nibbles, dtype=np.int64)
+    r12 = (nib[:, 7] << 8) | (nib[:, 14] << 4) | nib[:, 15]
+    return group_modes(np.asarray(house), nib[:, 7], np.asarray(temp_idx), r12)
+
+
+def dense_table(tables):
+    """(claves ordenadas, matriz uint16 len(claves)×TEMP_IDX_SIZE con R12_MISSING en los huecos)."""
+    keys = sorted(tables)
+    dense = np.full((len(keys), TEMP_IDX_SIZE), R12_MISSING, dtype=np.uint16)
+    for row, key in enumerate(keys):
+        for t, r in tables[key].items():
+            if 0 <= t < TEMP_IDX_SIZE:
+                dense[row, t] = r
+    return keys, dense
+
+
+def write_outputs(modes, alternates, json_path, py_path):
+    house, nib7, tidx, r12, support, total = modes
+    tables = {}
+    for h, n, t, r in zip(house.tolist(), nib7.tolist(), tidx.tolist(), r12.tolist()):
+        tables.setdefault((h, n), {})[t] = r
+    conflicts = {}
+    for g, r, c in zip(alternates[0].tolist(), alternates[1].tolist(), alternates[2].tolist()):
+        k = (int(house[g]), int(nib7[g]), int(tidx[g]))
+        conflicts.setdefault(k, [(int(r12[g]), int(support[g]))]).append((r, c))
+
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "tables": {f"{h}:{n}": {str(t): f"0x{r:03X}" for t, r in sorted(tab.items())}
+                       for (h, n), tab in sorted(tables.items())},
+            "conflicts": {f"{h}:{n}:{t}": [[f"0x{r:03X}", c] for r, c in vals]
+                          for (h, n, t), vals in sorted(conflicts.items())},
+        }, f, indent=2)
+
+    with open(py_path, "w", encoding="utf-8") as f:
+        f.write("# LUT auto-generada por build_r12_lut.py\n")
+        f.write("# R12_TABLES[(house, nib7)][temp_idx] = R12, temp_idx = round((t + 40) * 10)\n\n")
+        f.write("import sys\n")
+        f.write("from array import array\n\n")
+        f.write("R12_TABLES = {\n")
+        for (h, n), tab in sorted(tables.items()):
+            f.write(f"    ({h}, 0x{n:X}): {{\n")
+            for t, r in sorted(tab.items()):
+                f.write(f"        {t}: 0x{r:03X},\n")
+            f.write("    },\n")
+        f.write("}\n\n")
+        f.write("# (house, nib7, temp_idx) -> ((R12, veces), ...), la moda primero\n")
+        f.write("R12_CONFLICTS = {\n")
+        for (h, n, t), vals in sorted(conflicts.items()):
+            body = ", ".join(f"(0x{r:03X}, {c})" for r, c in vals)
+            f.write(f"    ({h}, 0x{n:X}, {t}): ({body},),\n")
+        f.write("}\n\n")
+
+        keys, dense = dense_table(tables)
+        f.write("# Tabla densa (little-endian): fila = índice en R12_KEYS, columna = temp_idx\n")
+        f.write(f"TEMP_IDX_SIZE = {TEMP_IDX_SIZE}\n")
+        f.write(f"R12_MISSING = 0x{R12_MISSING:04X}\n")
+        f.write("R12_KEYS = (\n")
+        for h, n in keys:
+            f.write(f"    ({h}, 0x{n:X}),\n")
+        f.write(")\n")
+        f.write("R12_DENSE = array('H')\n")
+        f.write("R12_DENSE.frombytes(bytes.fromhex(\n")
+        for line in textwrap.wrap(dense.astype("<u2").tobytes().hex(), 96):
+            f.write(f"    '{line}'\n")
+        f.write("))\n")
+        f.write("if sys.byteorder == 'big':\n")
+        f.write("    R12_DENSE.byteswap()\n\n\n")
+        f.write("def get_r12(temp_c, house, nib7):\n")
+        f.write('    """R12 observado (moda) para una temperatura; KeyError si no hay datos."""\n')
+        f.write("    return R12_TABLES[(house, nib7)][int(round((temp_c + 40) * 10))]\n")
+    return tables, conflicts
 
-MERGED_FILE = "ec40_capturas_merged.csv"
 
 def main():
+    ap = argparse.ArgumentParser(description="Construye la LUT de R12 por (house, nib7, temp_idx)")
+    ap.add_argument("csv", nargs="?", default=str(MERGED_FILE), help=f"CSV de capturas (default: {MERGED_FILE.name})")
+    ap.add_argument("--json", default=str(JSON_FILE), help=f"salida JSON (default: {JSON_FILE.name} en la raíz)")
+    ap.add_argument("--py", default=str(PY_FILE), help=f"salida módulo Python (default: {PY_FILE.name})")
+    ap.add_argument("--scale", type=int, default=1,
+                    help="replicar el dataset N veces para medir el agrupado (no escribe salidas)")
+    args = ap.parse_args()
+
     try:
-        df = pd.read_csv(MERGED_FILE)
-    except Exception as e:
-        print(f"Error leyendo {MERGED_FILE}: {e}")
+        mx = load_matrix(args.csv)
+    except (OSError, ValueError) as e:
+        print(f"Error leyendo {args.csv}: {e}")
         return
+    nibbles, house, temp_idx = mx["nibbles"], mx["house"], mx["temp_idx"]
+    if args.scale > 1:
+        nibbles = np.tile(nibbles, (args.scale, 1))
+        house, temp_idx = np.tile(house, args.scale), np.tile(temp_idx, args.scale)
 
-    required_cols = {"temperature_C", "R12"}
-    if not required_cols.issubset(df.columns):
-        print(f"Faltan columnas en {MERGED_FILE}. Necesito: {required_cols}")
+    t0 = time.perf_counter()
+    modes, alternates = build_lut(nibbles, house, temp_idx)
+    t1 = time.perf_counter()
+    n_keys = len(modes[0])
+    n_conf = len(np.unique(alternates[0]))
+    n_tables = len(np.unique(modes[0] * 16 + modes[1]))
+    print(f"{len(house)} tramas -> {n_tables} tablas (house, nib7), {n_keys} claves, "
+          f"{n_conf} con conflicto; agrupado en {(t1 - t0) * 1000:.1f} ms")
+    if args.scale > 1:
         return
 
-    # Normalizar temperatura a pasos de 0.1 ºC
-    df["temp_0_1"] = df["temperature_C"].round(1)
-
-    lut = {}
-    conflicts = []
-
-    for temp, group in df.groupby("temp_0_1"):
-        # Contar ocurrencias de cada R12 para esta temperatura
-        c = Counter(group["R12"])
-        most_common = c.most_common()
-
-        if len(most_common) == 0:
-            continue
-
-        # Elegimos el más frecuente
-        r12_best, count_best = most_common[0]
-
-        # Si hay más de un valor, lo anotamos como conflicto
-        if len(most_common) > 1:
-            conflicts.append((temp, most_common))
-
-        lut[str(float(temp))] = r12_best  # clave como string para JSON
-
-    # Mostrar un pequeño resumen
-    print("Temperaturas en LUT:", len(lut))
-    print("Ejemplo (primeras 10):")
-    for i, (t, r) in enumerate(sorted(lut.items(), key=lambda x: float(x[0]))):
-        if i >= 10:
-            break
-        print(f"  {t} °C -> {r}")
-
-    if conflicts:
-        print("\nATENCIÓN: Conflictos detectados (R12 distintos para la misma temperatura):")
-        for temp, values in conflicts:
-            print(f"  Temp {temp} °C:")
-            for r12_val, cnt in values:
-                print(f"    {r12_val}  ({cnt} veces)")
-    else:
-        print("\nSin conflictos: cada temperatura tiene un único R12 observado.")
-
-    # Guardar LUT en JSON
-    with open("r12_lut.json", "w", encoding="utf-8") as f:
-        json.dump(lut, f, indent=2, sort_keys=True)
-    print("\nLUT guardada en r12_lut.json")
-
-    # Guardar LUT como módulo Python
-    with open("r12_lut.py", "w", encoding="utf-8") as f:
-        f.write("# LUT auto-generada: temperatura (str) en °C -> R12 (hex string)\n")
-        f.write("R12_LUT = {\n")
-        for t, r in sorted(lut.items(), key=lambda x: float(x[0])):
-            f.write(f"    {t!r}: {r!r},\n")
-        f.write("}\n")
-    print("LUT guardada en r12_lut.py (dict R12_LUT)")
+    tables, conflicts = write_outputs(modes, alternates, args.json, args.py)
+    for (h, n), tab in sorted(tables.items()):
+        c = sum(1 for k in conflicts if k[:2] == (h, n))
+        print(f"  house {h:3d} nib7 0x{n:X}: {len(tab):4d} temperaturas, {c:3d} con conflicto")
+    print(f"\nLUT guardada en {args.json} y {args.py}")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Consulta de R12/P sobre la tabla densa de r12_lut.py (generada por
+build_r12_lut.py), indexada por temp_idx = round((t + 40) * 10).
+
+Una consulta es aritmética de índices sobre un array('H'): sin formatear la
+temperatura a texto ni parsear hex. Las celdas sin observar valen
+R12_MISSING (0xFFFF), igual que las temperaturas fuera de rango o los
+(house, nib7) sin tabla. P = nibble 14 = (R12 >> 4) & 0xF.
+
+Uso:
+  from r12_lookup import lookup, lookup_many, p_of, R12_MISSING
+  r12 = lookup(21.5, 247, 0x1)                    # int o R12_MISSING
+  arr = lookup_many(np.arange(18, 25, 0.1), 247, 0x1)  # uint16
+  p = p_of(arr)                                   # 0xFF donde falta
+
+  python3 r12_lookup.py --bench 100000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from r12_lut import R12_DENSE, R12_KEYS, R12_MISSING, R12_TABLES, TEMP_IDX_SIZE
+
+P_MISSING = 0xFF
+
+_ROW = {key: i for i, key in enumerate(R12_KEYS)}
+# Vista NumPy sin copia de la misma memoria
+_DENSE = np.frombuffer(R12_DENSE, dtype=np.uint16).reshape(len(R12_KEYS), TEMP_IDX_SIZE)
+_MISSING_ROW = np.full(TEMP_IDX_SIZE, R12_MISSING, dtype=np.uint16)
+
+
+def lookup(temp_c, house, nib7):
+    """R12 para una temperatura, o R12_MISSING si no se observó."""
+    row = _ROW.get((house, nib7))
+    t = int(round((temp_c + 40) * 10))
+    if row is None or not 0 <= t < TEMP_IDX_SIZE:
+        return R12_MISSING
+    return R12_DENSE[row * TEMP_IDX_SIZE + t]
+
+
+def lookup_many(temps, house, nib7):
+    """
+    R12 (uint16) para un array de temperaturas; R12_MISSING donde no hay dato.
+    Un escalar da un array de un elemento.
+    """
+    row = _ROW.get((house, nib7))
+    table = _DENSE[row] if row is not None else _MISSING_ROW
+    idx = np.rint((np.atleast_1d(np.asarray(temps, dtype=np.float64)) + 40) * 10).astype(np.int64)
+    inside = (idx >= 0) & (idx < TEMP_IDX_SIZE)
+    out = table[np.clip(idx, 0, TEMP_IDX_SIZE - 1)]
+    out[~inside] = R12_MISSING
+    return out
+
+
+def p_of(r12):
+    """P = (R12 >> 4) & 0xF, con P_MISSING donde R12 es R12_MISSING."""
+    r12 = np.asarray(r12)
+    return np.where(r12 == R12_MISSING, P_MISSING, (r12 >> 4) & 0xF).astype(np.uint8)
+
+
+def bench(n, house=247, nib7=0x1, seed=0):
+    """
+    Compara el dict por cadenas (formato antiguo), el dict por temp_idx y la
+    tabla densa. Devuelve {nombre: (segundos, consultas distintas de la referencia)}.
+    """
+    rng = np.random.default_rng(seed)
+    temps = np.round(rng.uniform(-16.0, 55.0, n), 1)
+    temps_list = temps.tolist()
+
+    # Formato antiguo de R12_LUT: '-15.9' -> '0x24C'
+    legacy = {f"{t / 10 - 40:.1f}": f"0x{r:03X}" for t, r in R12_TABLES[(house, nib7)].items()}
+    table = R12_TABLES[(house, nib7)]
+
+    def run_legacy():
+        out = []
+        for t in temps_list:
+            v = legacy.get(f"{round(t, 1):.1f}")
+            out.append(int(v, 16) if v is not None else R12_MISSING)
+        return out
+
+    def run_dict():
+        return [table.get(int(round((t + 40) * 10)), R12_MISSING) for t in temps_list]
+
+    def run_dense():
+        return [lookup(t, house, nib7) for t in temps_list]
+
+    def run_many():
+        return lookup_many(temps, house, nib7)
+
+    # Referencia: dict por temp_idx. El formato antiguo falla en '-0.0'
+    # (round() da -0.0 y la clave guardada es '0.0'), así que puede diferir.
+    results = {}
+    ref = None
+    for name, fn in (("dict por temp_idx", run_dict), ("dict por cadena (antiguo)", run_legacy),
+                     ("denso, escalar", run_dense), ("denso, lookup_many", run_many)):
+        t0 = time.perf_counter()
+        out = fn()
+        secs = time.perf_counter() - t0
+        out = np.asarray(out, dtype=np.uint16)
+        if ref is None:
+            ref = out
+        results[name] = (secs, int(np.count_nonzero(out != ref)))
+    return results
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Consulta densa de R12/P y benchmark frente al dict")
+    ap.add_argument("--bench", type=int, default=100000, metavar="N", help="consultas del benchmark (default: 100000)")
+    ap.add_argument("--house", type=int, default=247)
+    ap.add_argument("--nib7", type=lambda v: int(v, 16), default=0x1, help="nib7 en hex (default: 1)")
+    args = ap.parse_args()
+
+    print(f"Tabla densa: {len(R12_KEYS)} claves x {TEMP_IDX_SIZE} temp_idx, "
+          f"{_DENSE.nbytes} bytes, {int((_DENSE != R12_MISSING).sum())} celdas observadas")
+    print(f"{args.bench} consultas, house {args.house}, nib7 0x{args.nib7:X}:")
+    results = bench(args.bench, args.house, args.nib7)
+    base = results["dict por cadena (antiguo)"][0]
+    for name, (secs, diff) in results.items():
+        print(f"  {name:26s} {secs * 1000:8.2f} ms  {base / secs:6.1f}x  "
+              f"{'ok' if not diff else f'{diff} distintas'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,477 +1,1431 @@
-# LUT auto-generada: temperatura (str) en °C -> R12 (hex string)
-R12_LUT = {
-    '-16.0': '0x2A1',
-    '-15.9': '0x24C',
-    '-15.8': '0x239',
-    '-15.7': '0x278',
-    '-15.6': '0x20D',
-    '-15.5': '0x292',
-    '-15.4': '0x2E7',
-    '-15.3': '0x2CD',
-    '-15.2': '0x2B8',
-    '-15.1': '0x227',
-    '-15.0': '0x252',
-    '-14.9': '0x21D',
-    '-14.8': '0x268',
-    '-14.7': '0x229',
-    '-14.6': '0x25C',
-    '-14.5': '0x2C3',
-    '-14.4': '0x2B6',
-    '-14.3': '0x29C',
-    '-14.2': '0x2E9',
-    '-14.1': '0x276',
-    '-14.0': '0x203',
-    '-13.9': '0x2AB',
-    '-13.8': '0x2DE',
-    '-13.7': '0x29F',
-    '-13.6': '0x2EA',
-    '-13.5': '0x275',
-    '-13.4': '0x200',
-    '-13.2': '0x25F',
-    '-13.1': '0x2C0',
-    '-13.0': '0x2B5',
-    '-12.9': '0x2FA',
-    '-12.8': '0x28F',
-    '-12.7': '0x0A3',
-    '-12.6': '0x2BB',
-    '-12.5': '0x224',
-    '-12.4': '0x251',
-    '-12.3': '0x27B',
-    '-12.2': '0x20E',
-    '-12.1': '0x291',
-    '-12.0': '0x2E4',
-    '-11.9': '0x209',
-    '-11.8': '0x27C',
-    '-11.7': '0x23D',
-    '-11.6': '0x025',
-    '-11.5': '0x2D7',
-    '-11.4': '0x2A2',
-    '-11.2': '0x2FD',
-    '-11.1': '0x262',
-    '-11.0': '0x217',
-    '-10.9': '0x258',
-    '-10.8': '0x22D',
-    '-10.7': '0x26C',
-    '-10.5': '0x286',
-    '-10.3': '0x2D9',
-    '-10.2': '0x0C1',
-    '-10.1': '0x233',
-    '-10.0': '0x02B',
-    '-9.9': '0x284',
-    '-9.7': '0x2B0',
-    '-9.6': '0x2C5',
-    '-9.4': '0x22F',
-    '-9.3': '0x205',
-    '-9.2': '0x01D',
-    '-9.1': '0x2EF',
-    '-9.0': '0x29A',
-    '-8.9': '0x0B8',
-    '-8.8': '0x2A0',
-    '-8.7': '0x2E1',
-    '-8.6': '0x0F9',
-    '-8.5': '0x20B',
-    '-8.4': '0x27E',
-    '-8.3': '0x254',
-    '-8.1': '0x2BE',
-    '-8.0': '0x2CB',
-    '-7.9': '0x2E9',
-    '-7.8': '0x29C',
-    '-7.6': '0x2A8',
-    '-7.5': '0x237',
-    '-7.4': '0x242',
-    '-7.2': '0x21D',
-    '-7.1': '0x282',
-    '-7.0': '0x09A',
-    '-6.9': '0x2B8',
-    '-6.8': '0x2CD',
-    '-6.7': '0x0E1',
-    '-6.6': '0x2F9',
-    '-6.5': '0x266',
-    '-6.4': '0x213',
-    '-6.2': '0x24C',
-    '-6.0': '0x2A6',
-    '-5.9': '0x24B',
-    '-5.8': '0x23E',
-    '-5.7': '0x012',
-    '-5.6': '0x20A',
-    '-5.4': '0x2E0',
-    '-5.3': '0x2CA',
-    '-5.1': '0x220',
-    '-5.0': '0x255',
-    '-4.8': '0x26F',
-    '-4.6': '0x25B',
-    '-4.5': '0x2C4',
-    '-4.4': '0x0DC',
-    '-4.3': '0x29B',
-    '-4.1': '0x01C',
-    '-4.0': '0x204',
-    '-3.9': '0x0C1',
-    '-3.8': '0x2D9',
-    '-3.7': '0x298',
-    '-3.6': '0x080',
-    '-3.5': '0x272',
-    '-3.3': '0x22D',
-    '-3.2': '0x035',
-    '-3.1': '0x2C7',
-    '-2.9': '0x2FD',
-    '-2.7': '0x2C9',
-    '-2.6': '0x2BC',
-    '-2.4': '0x256',
-    '-2.2': '0x1D2',
-    '-2.1': '0x296',
-    '-2.0': '0x138',
-    '-1.9': '0x20E',
-    '-1.7': '0x23A',
-    '-1.5': '0x2D0',
-    '-1.3': '0x28F',
-    '-1.0': '0x210',
-    '-0.8': '0x22A',
-    '-0.6': '0x21E',
-    '-0.4': '0x2F4',
-    '-0.2': '0x2AB',
-    '-0.0': '0x241',
-    '0.1': '0x2B7',
-    '0.2': '0x228',
-    '0.3': '0x186',
-    '0.4': '0x277',
-    '0.6': '0x29D',
-    '0.8': '0x2A9',
-    '1.0': '0x293',
-    '1.2': '0x279',
-    '1.3': '0x1D7',
-    '1.4': '0x226',
-    '1.6': '0x2CC',
-    '1.7': '0x162',
-    '1.8': '0x2F8',
-    '1.9': '0x156',
-    '2.0': '0x260',
-    '2.1': '0x1CE',
-    '2.2': '0x28A',
-    '2.3': '0x124',
-    '2.5': '0x17B',
-    '2.7': '0x24A',
-    '2.8': '0x1D0',
-    '2.9': '0x27E',
-    '3.0': '0x1EA',
-    '3.1': '0x244',
-    '3.2': '0x100',
-    '3.3': '0x2AE',
-    '3.4': '0x15F',
-    '3.5': '0x2F1',
-    '3.7': '0x1C0',
-    '3.8': '0x25A',
-    '3.9': '0x1F4',
-    '4.0': '0x287',
-    '4.1': '0x129',
-    '4.2': '0x26D',
-    '4.4': '0x232',
-    '4.6': '0x103',
-    '4.7': '0x176',
-    '4.8': '0x137',
-    '4.9': '0x299',
-    '5.0': '0x10D',
-    '5.1': '0x2A3',
-    '5.2': '0x1E7',
-    '5.3': '0x192',
-    '5.4': '0x263',
-    '5.5': '0x1CD',
-    '5.6': '0x289',
-    '5.8': '0x2BD',
-    '5.9': '0x113',
-    '6.1': '0x250',
-    '6.2': '0x114',
-    '6.3': '0x2BA',
-    '6.4': '0x14B',
-    '6.5': '0x13E',
-    '6.6': '0x27A',
-    '6.8': '0x195',
-    '6.9': '0x1E0',
-    '7.1': '0x201',
-    '7.2': '0x145',
-    '7.3': '0x2EB',
-    '7.4': '0x11A',
-    '7.5': '0x16F',
-    '7.6': '0x22B',
-    '7.7': '0x185',
-    '7.8': '0x21F',
-    '7.9': '0x1B1',
-    '8.0': '0x193',
-    '8.1': '0x23D',
-    '8.2': '0x179',
-    '8.4': '0x2FD',
-    '8.5': '0x153',
-    '8.6': '0x217',
-    '8.8': '0x1F8',
-    '8.9': '0x256',
-    '9.0': '0x1C2',
-    '9.1': '0x26C',
-    '9.3': '0x15D',
-    '9.5': '0x102',
-    '9.6': '0x19D',
-    '9.7': '0x233',
-    '9.8': '0x1A9',
-    '9.9': '0x1DC',
-    '10.0': '0x2C5',
-    '10.1': '0x16B',
-    '10.2': '0x22F',
-    '10.3': '0x181',
-    '10.4': '0x1AB',
-    '10.5': '0x205',
-    '10.6': '0x141',
-    '10.7': '0x134',
-    '10.8': '0x2AE',
-    '10.9': '0x100',
-    '11.0': '0x14F',
-    '11.1': '0x2E1',
-    '11.2': '0x1A5',
-    '11.3': '0x1D0',
-    '11.4': '0x221',
-    '11.5': '0x18F',
-    '11.6': '0x110',
-    '11.7': '0x2BE',
-    '11.8': '0x124',
-    '11.9': '0x151',
-    '12.0': '0x1BC',
-    '12.1': '0x1C9',
-    '12.2': '0x28D',
-    '12.3': '0x123',
-    '12.4': '0x109',
-    '12.5': '0x17C',
-    '12.6': '0x1E3',
-    '12.7': '0x196',
-    '12.8': '0x1D7',
-    '12.9': '0x1A2',
-    '13.0': '0x1ED',
-    '13.1': '0x02E',
-    '13.2': '0x0B1',
-    '13.3': '0x172',
-    '13.4': '0x158',
-    '13.5': '0x2F6',
-    '13.6': '0x269',
-    '13.7': '0x21C',
-    '13.8': '0x25D',
-    '13.9': '0x228',
-    '14.0': '0x280',
-    '14.1': '0x2F5',
-    '14.2': '0x26A',
-    '14.3': '0x21F',
-    '14.4': '0x235',
-    '14.5': '0x240',
-    '14.6': '0x2DF',
-    '14.7': '0x2AA',
-    '14.8': '0x2EB',
-    '14.9': '0x145',
-    '15.0': '0x10A',
-    '15.1': '0x17F',
-    '15.2': '0x1E0',
-    '15.3': '0x195',
-    '15.4': '0x1BF',
-    '15.5': '0x1CA',
-    '15.6': '0x155',
-    '15.7': '0x120',
-    '15.8': '0x161',
-    '15.9': '0x114',
-    '16.0': '0x1F9',
-    '16.1': '0x18C',
-    '16.2': '0x113',
-    '16.3': '0x166',
-    '16.4': '0x14C',
-    '16.5': '0x139',
-    '16.6': '0x1A6',
-    '16.7': '0x1D3',
-    '16.8': '0x192',
-    '16.9': '0x1E7',
-    '17.0': '0x1A8',
-    '17.1': '0x1DD',
-    '17.2': '0x142',
-    '17.3': '0x137',
-    '17.4': '0x11D',
-    '17.5': '0x168',
-    '17.6': '0x1F7',
-    '17.7': '0x182',
-    '17.8': '0x1C3',
-    '17.9': '0x1B6',
-    '18.0': '0x194',
-    '18.1': '0x1E1',
-    '18.2': '0x17E',
-    '18.3': '0x10B',
-    '18.4': '0x882',
-    '18.5': '0x154',
-    '18.6': '0x1CB',
-    '18.7': '0x1BE',
-    '18.8': '0x1FF',
-    '18.9': '0x829',
-    '19.1': '0x813',
-    '19.2': '0x12F',
-    '19.3': '0x8F9',
-    '19.5': '0x8A6',
-    '19.6': '0x839',
-    '19.7': '0x84C',
-    '19.8': '0x1AE',
-    '19.9': '0x878',
-    '20.0': '0x2CC',
-    '20.1': '0x2B9',
-    '20.2': '0x85E',
-    '20.3': '0x82B',
-    '20.4': '0x801',
-    '20.5': '0x874',
-    '20.6': '0x293',
-    '20.7': '0x89E',
-    '20.8': '0x8DF',
-    '20.9': '0x8AA',
-    '21.0': '0x8E5',
-    '21.1': '0x2E8',
-    '21.2': '0x277',
-    '21.3': '0x202',
-    '21.4': '0x1F3',
-    '21.5': '0x030',
-    '21.6': '0x119',
-    '21.7': '0x16C',
-    '21.8': '0x12D',
-    '21.9': '0x158',
-    '22.0': '0x1B5',
-    '22.1': '0x1C0',
-    '22.2': '0x15F',
-    '22.3': '0x12A',
-    '22.5': '0x0C3',
-    '22.6': '0x1EA',
-    '22.7': '0x19F',
-    '22.9': '0x1AB',
-    '23.0': '0x1E4',
-    '23.1': '0x027',
-    '23.2': '0x0B8',
-    '23.3': '0x0CD',
-    '23.4': '0x151',
-    '23.6': '0x1BB',
-    '23.7': '0x1CE',
-    '23.9': '0x1FA',
-    '24.0': '0x0E4',
-    '24.1': '0x127',
-    '24.2': '0x00E',
-    '24.3': '0x1CD',
-    '24.4': '0x1E7',
-    '24.5': '0x024',
-    '24.6': '0x10D',
-    '24.7': '0x0CE',
-    '24.9': '0x14C',
-    '25.1': '0x0C0',
-    '25.2': '0x1E9',
-    '25.3': '0x02A',
-    '25.4': '0x1B6',
-    '25.5': '0x1C3',
-    '25.6': '0x0EA',
-    '25.7': '0x129',
-    '25.9': '0x11D',
-    '26.1': '0x185',
-    '26.2': '0x0AC',
-    '26.3': '0x16F',
-    '26.5': '0x130',
-    '26.6': '0x274',
-    '26.7': '0x201',
-    '26.8': '0x240',
-    '26.9': '0x1EE',
-    '27.0': '0x27A',
-    '27.1': '0x1D4',
-    '27.2': '0x290',
-    '27.3': '0x13E',
-    '27.4': '0x114',
-    '27.5': '0x2BA',
-    '27.6': '0x1FE',
-    '27.8': '0x1CA',
-    '27.9': '0x1BF',
-    '28.0': '0x246',
-    '28.1': '0x1E8',
-    '28.2': '0x177',
-    '28.3': '0x102',
-    '28.4': '0x2F3',
-    '28.5': '0x15D',
-    '28.6': '0x1C2',
-    '28.7': '0x1B7',
-    '28.8': '0x22D',
-    '28.9': '0x183',
-    '29.0': '0x217',
-    '29.1': '0x1B9',
-    '29.2': '0x126',
-    '29.3': '0x153',
-    '29.4': '0x179',
-    '29.5': '0x10C',
-    '29.6': '0x193',
-    '29.7': '0x1E6',
-    '29.8': '0x1A7',
-    '29.9': '0x1D2',
-    '30.0': '0x110',
-    '30.1': '0x165',
-    '30.2': '0x1FA',
-    '30.3': '0x18F',
-    '30.4': '0x1A5',
-    '30.5': '0x1D0',
-    '30.6': '0x14F',
-    '30.7': '0x13A',
-    '30.8': '0x17B',
-    '30.9': '0x10E',
-    '31.0': '0x141',
-    '31.1': '0x2EF',
-    '31.2': '0x1AB',
-    '31.3': '0x205',
-    '31.4': '0x1F4',
-    '31.6': '0x11E',
-    '31.8': '0x12A',
-    '31.9': '0x15F',
-    '32.0': '0x811',
-    '32.1': '0x1C7',
-    '32.2': '0x158',
-    '32.3': '0x12D',
-    '32.4': '0x107',
-    '32.5': '0x172',
-    '32.6': '0x1ED',
-    '32.7': '0x198',
-    '32.8': '0x1D9',
-    '32.9': '0x1AC',
-    '33.0': '0x1E3',
-    '33.1': '0x196',
-    '33.2': '0x109',
-    '33.3': '0x17C',
-    '33.4': '0x156',
-    '33.6': '0x81F',
-    '33.8': '0x82B',
-    '34.0': '0x8F6',
-    '34.1': '0x120',
-    '34.3': '0x869',
-    '34.7': '0x8DC',
-    '35.2': '0x84D',
-    '35.5': '0x867',
-    '35.7': '0x88D',
-    '36.0': '0x854',
-    '36.3': '0x8CB',
-    '36.6': '0x80B',
-    '36.9': '0x84A',
-    '37.2': '0x8EF',
-    '37.8': '0x86E',
-    '38.1': '0x84C',
-    '38.4': '0x88C',
-    '38.8': '0x852',
-    '39.1': '0x81D',
-    '39.5': '0x8A8',
-    '39.8': '0x803',
-    '40.1': '0x110',
-    '40.3': '0x859',
-    '40.6': '0x899',
-    '41.0': '0x897',
-    '41.5': '0x857',
-    '41.9': '0x889',
-    '42.4': '0x8D1',
-    '43.0': '0x835',
-    '43.5': '0x8F5',
-    '44.0': '0x883',
-    '44.5': '0x843',
-    '45.0': '0x8D2',
-    '45.6': '0x88D',
-    '46.2': '0x8CB',
-    '46.8': '0x84A',
-    '47.4': '0x8C5',
-    '47.9': '0x86E',
-    '48.9': '0x852',
-    '49.6': '0x842',
-    '52.2': '0x889',
-    '54.5': '0x844',
+# LUT auto-generada por build_r12_lut.py
+# R12_TABLES[(house, nib7)][temp_idx] = R12, temp_idx = round((t + 40) * 10)
+
+import sys
+from array import array
+
+R12_TABLES = {
+    (0, 0x8): {
+        896: 0x842,
+        922: 0x889,
+    },
+    (3, 0x0): {
+        531: 0x02E,
+        532: 0x0B1,
+        535: 0x09B,
+        538: 0x030,
+        541: 0x098,
+        543: 0x072,
+        546: 0x0B2,
+        548: 0x086,
+        553: 0x023,
+        555: 0x07C,
+        557: 0x096,
+        560: 0x04F,
+        561: 0x03A,
+        563: 0x0D0,
+        565: 0x08F,
+        566: 0x010,
+        568: 0x024,
+        570: 0x01E,
+        572: 0x0F4,
+        573: 0x081,
+        574: 0x0AB,
+        575: 0x0DE,
+        576: 0x041,
+        577: 0x034,
+        578: 0x075,
+        579: 0x000,
+    },
+    (3, 0x1): {
+        580: 0x194,
+        581: 0x1E1,
+        582: 0x17E,
+        583: 0x10B,
+        585: 0x154,
+        586: 0x1CB,
+        587: 0x1BE,
+        588: 0x1FF,
+        592: 0x12F,
+        598: 0x1AE,
+        603: 0x188,
+        609: 0x109,
+        614: 0x1F3,
+        618: 0x12D,
+        623: 0x12A,
+        626: 0x1EA,
+        630: 0x1E4,
+        634: 0x151,
+        637: 0x1CE,
+        641: 0x127,
+        644: 0x1E7,
+        646: 0x10D,
+        649: 0x14C,
+        652: 0x1E9,
+        655: 0x1C3,
+        657: 0x129,
+        659: 0x11D,
+        661: 0x185,
+        663: 0x16F,
+        665: 0x130,
+        667: 0x1DA,
+        669: 0x1EE,
+        671: 0x1D4,
+        673: 0x13E,
+        674: 0x114,
+        676: 0x1FE,
+        678: 0x1CA,
+        679: 0x1BF,
+        681: 0x1E8,
+        682: 0x177,
+        683: 0x102,
+        685: 0x15D,
+        686: 0x1C2,
+        687: 0x1B7,
+        688: 0x1F6,
+        689: 0x183,
+        691: 0x1B9,
+        692: 0x126,
+        693: 0x153,
+        694: 0x179,
+        695: 0x10C,
+        696: 0x193,
+        697: 0x1E6,
+        698: 0x1A7,
+        699: 0x1D2,
+        700: 0x110,
+        701: 0x165,
+        702: 0x1FA,
+        703: 0x18F,
+        704: 0x1A5,
+        705: 0x1D0,
+        706: 0x14F,
+        707: 0x13A,
+        708: 0x17B,
+        709: 0x10E,
+        710: 0x141,
+        712: 0x1AB,
+        714: 0x1F4,
+        716: 0x11E,
+        718: 0x12A,
+        719: 0x15F,
+        721: 0x1C7,
+        722: 0x158,
+        723: 0x12D,
+        724: 0x107,
+        725: 0x172,
+        726: 0x1ED,
+        727: 0x198,
+        728: 0x1D9,
+        729: 0x1AC,
+        730: 0x1E3,
+        731: 0x196,
+        732: 0x109,
+        733: 0x17C,
+        734: 0x156,
+        741: 0x120,
+        801: 0x110,
+    },
+    (3, 0x2): {
+        535: 0x2F6,
+        536: 0x269,
+        537: 0x21C,
+        538: 0x25D,
+        539: 0x228,
+        540: 0x280,
+        541: 0x2F5,
+        542: 0x26A,
+        543: 0x21F,
+        544: 0x235,
+        545: 0x240,
+        546: 0x2DF,
+        547: 0x2AA,
+        548: 0x2EB,
+        549: 0x29E,
+    },
+    (79, 0x8): {
+        609: 0x8AA,
+    },
+    (92, 0x8): {
+        945: 0x844,
+    },
+    (96, 0x2): {
+        666: 0x274,
+        667: 0x201,
+        668: 0x240,
+        669: 0x235,
+        670: 0x27A,
+        671: 0x20F,
+        672: 0x290,
+        673: 0x2E5,
+        675: 0x2BA,
+        676: 0x225,
+        678: 0x211,
+        679: 0x264,
+        680: 0x246,
+        681: 0x233,
+        682: 0x2AC,
+        683: 0x2D9,
+        684: 0x2F3,
+        685: 0x286,
+        687: 0x26C,
+        688: 0x22D,
+        689: 0x258,
+        690: 0x217,
+        692: 0x2FD,
+        694: 0x2A2,
+        696: 0x248,
+        697: 0x23D,
+        699: 0x209,
+        700: 0x2CB,
+        702: 0x221,
+        703: 0x254,
+        705: 0x20B,
+        708: 0x2A0,
+        709: 0x2D5,
+        711: 0x2EF,
+        713: 0x205,
+        714: 0x22F,
+        716: 0x2C5,
+        718: 0x2F1,
+    },
+    (96, 0x8): {
+        720: 0x811,
+        722: 0x8FB,
+        723: 0x88E,
+        725: 0x8D1,
+        727: 0x83B,
+        729: 0x80F,
+        731: 0x835,
+        734: 0x8F5,
+        736: 0x81F,
+        738: 0x82B,
+        740: 0x8F6,
+        743: 0x869,
+        747: 0x8DC,
+        752: 0x84D,
+        755: 0x867,
+        757: 0x88D,
+        760: 0x854,
+        763: 0x8CB,
+        766: 0x80B,
+        769: 0x84A,
+        772: 0x8EF,
+        778: 0x86E,
+        781: 0x84C,
+        784: 0x88C,
+        788: 0x852,
+        791: 0x81D,
+        795: 0x8A8,
+        798: 0x803,
+        806: 0x899,
+        810: 0x897,
+        815: 0x857,
+        819: 0x889,
+        824: 0x8D1,
+        830: 0x835,
+        835: 0x8F5,
+        840: 0x883,
+        845: 0x843,
+        850: 0x8D2,
+        856: 0x88D,
+        862: 0x8CB,
+        868: 0x84A,
+        874: 0x8C5,
+        889: 0x852,
+    },
+    (135, 0x8): {
+        803: 0x859,
+        879: 0x86E,
+        945: 0x844,
+    },
+    (247, 0x0): {
+        254: 0x031,
+        257: 0x0F1,
+        259: 0x01B,
+        261: 0x0C6,
+        264: 0x087,
+        265: 0x018,
+        268: 0x032,
+        271: 0x097,
+        273: 0x0A3,
+        275: 0x049,
+        278: 0x063,
+        281: 0x064,
+        284: 0x025,
+        286: 0x0CF,
+        289: 0x00F,
+        292: 0x040,
+        295: 0x0EB,
+        298: 0x0C1,
+        300: 0x02B,
+        303: 0x0DD,
+        306: 0x042,
+        308: 0x01D,
+        311: 0x0B8,
+        314: 0x0F9,
+        317: 0x039,
+        320: 0x0A6,
+        322: 0x0F1,
+        325: 0x05A,
+        328: 0x070,
+        330: 0x09A,
+        333: 0x0E1,
+        336: 0x07E,
+        338: 0x021,
+        341: 0x026,
+        343: 0x012,
+        346: 0x08D,
+        349: 0x04D,
+        352: 0x002,
+        354: 0x036,
+        356: 0x0DC,
+        359: 0x01C,
+        361: 0x0C1,
+        364: 0x080,
+        368: 0x035,
+        373: 0x0A4,
+        591: 0x006,
+        601: 0x0D4,
+        615: 0x030,
+        625: 0x0C3,
+        631: 0x027,
+        632: 0x0B8,
+        633: 0x0CD,
+        634: 0x0E7,
+        637: 0x078,
+        640: 0x0E4,
+        641: 0x091,
+        642: 0x00E,
+        644: 0x051,
+        645: 0x024,
+        647: 0x0CE,
+        651: 0x0C0,
+        653: 0x02A,
+        654: 0x000,
+        656: 0x0EA,
+        657: 0x09F,
+        659: 0x0AB,
+        661: 0x033,
+        662: 0x0AC,
+        663: 0x0D9,
+        665: 0x086,
+        666: 0x019,
+        668: 0x02D,
+        670: 0x017,
+    },
+    (247, 0x1): {
+        376: 0x18D,
+        378: 0x1D2,
+        380: 0x138,
+        383: 0x1E1,
+        385: 0x10B,
+        387: 0x154,
+        390: 0x1CB,
+        392: 0x1F1,
+        394: 0x1C5,
+        396: 0x12F,
+        398: 0x170,
+        400: 0x19A,
+        402: 0x1F3,
+        403: 0x186,
+        406: 0x146,
+        410: 0x148,
+        412: 0x1A2,
+        413: 0x1D7,
+        416: 0x117,
+        417: 0x162,
+        419: 0x156,
+        421: 0x1CE,
+        423: 0x124,
+        425: 0x17B,
+        427: 0x191,
+        428: 0x1D0,
+        430: 0x1EA,
+        432: 0x100,
+        434: 0x15F,
+        435: 0x12A,
+        437: 0x1C0,
+        439: 0x1F4,
+        441: 0x129,
+        444: 0x1E9,
+        446: 0x103,
+        447: 0x176,
+        448: 0x137,
+        450: 0x10D,
+        452: 0x1E7,
+        453: 0x192,
+        455: 0x1CD,
+        456: 0x152,
+        458: 0x166,
+        459: 0x113,
+        461: 0x18B,
+        462: 0x114,
+        464: 0x14B,
+        465: 0x13E,
+        466: 0x1A1,
+        468: 0x195,
+        469: 0x1E0,
+        472: 0x145,
+        473: 0x130,
+        474: 0x11A,
+        475: 0x16F,
+        477: 0x185,
+        478: 0x1C4,
+        479: 0x1B1,
+        480: 0x193,
+        481: 0x1E6,
+        482: 0x179,
+        484: 0x126,
+        485: 0x153,
+        486: 0x1CC,
+        488: 0x1F8,
+        489: 0x18D,
+        490: 0x1C2,
+        491: 0x1B7,
+        493: 0x15D,
+        495: 0x102,
+        496: 0x19D,
+        497: 0x1E8,
+        498: 0x1A9,
+        499: 0x1DC,
+        500: 0x11E,
+        501: 0x16B,
+        502: 0x1F4,
+        503: 0x181,
+        504: 0x1AB,
+        505: 0x1DE,
+        506: 0x141,
+        507: 0x134,
+        508: 0x175,
+        509: 0x100,
+        510: 0x14F,
+        511: 0x13A,
+        512: 0x1A5,
+        513: 0x1D0,
+        514: 0x1FA,
+        515: 0x18F,
+        516: 0x110,
+        517: 0x165,
+        518: 0x124,
+        519: 0x151,
+        520: 0x1BC,
+        521: 0x1C9,
+        522: 0x156,
+        523: 0x123,
+        524: 0x109,
+        525: 0x17C,
+        526: 0x1E3,
+        527: 0x196,
+        528: 0x1D7,
+        529: 0x1A2,
+        530: 0x1ED,
+        531: 0x198,
+        532: 0x107,
+        533: 0x172,
+        534: 0x158,
+        535: 0x12D,
+        536: 0x1B2,
+        537: 0x1C7,
+        538: 0x186,
+        539: 0x1F3,
+        540: 0x15B,
+        541: 0x12E,
+        542: 0x1B1,
+        543: 0x1C4,
+        544: 0x1EE,
+        545: 0x19B,
+        546: 0x104,
+        547: 0x171,
+        548: 0x130,
+        549: 0x145,
+        550: 0x10A,
+        551: 0x17F,
+        552: 0x1E0,
+        553: 0x195,
+        554: 0x1BF,
+        555: 0x1CA,
+        556: 0x155,
+        557: 0x120,
+        558: 0x161,
+        559: 0x114,
+        560: 0x1F9,
+        561: 0x18C,
+        562: 0x113,
+        563: 0x166,
+        564: 0x14C,
+        565: 0x139,
+        566: 0x1A6,
+        567: 0x1D3,
+        568: 0x192,
+        569: 0x1E7,
+        570: 0x1A8,
+        571: 0x1DD,
+        572: 0x142,
+        573: 0x137,
+        574: 0x11D,
+        575: 0x168,
+        576: 0x1F7,
+        577: 0x182,
+        578: 0x1C3,
+        579: 0x1B6,
+        580: 0x194,
+        614: 0x1F3,
+        615: 0x186,
+        616: 0x119,
+        617: 0x16C,
+        618: 0x12D,
+        619: 0x158,
+        620: 0x1B5,
+        621: 0x1C0,
+        622: 0x15F,
+        623: 0x12A,
+        625: 0x175,
+        626: 0x1EA,
+        627: 0x19F,
+        629: 0x1AB,
+        631: 0x191,
+        633: 0x17B,
+        636: 0x1BB,
+        639: 0x1FA,
+        640: 0x152,
+        641: 0x127,
+        642: 0x1B8,
+        643: 0x1CD,
+        644: 0x1E7,
+        645: 0x192,
+        646: 0x10D,
+        647: 0x178,
+        649: 0x14C,
+        652: 0x1E9,
+        654: 0x1B6,
+        656: 0x15C,
+        659: 0x11D,
+        660: 0x1F0,
+        663: 0x16F,
+        666: 0x1AF,
+        667: 0x1DA,
+        670: 0x1A1,
+        671: 0x1D4,
+        672: 0x14B,
+        676: 0x1FE,
+        680: 0x19D,
+        686: 0x1C2,
+        692: 0x126,
+        699: 0x1D2,
+        707: 0x13A,
+        717: 0x16B,
+        728: 0x1D9,
+        740: 0x155,
+        753: 0x19B,
+        769: 0x1E9,
+        786: 0x1C5,
+        807: 0x14F,
+        813: 0x1AB,
+        830: 0x196,
+        834: 0x123,
+        859: 0x16F,
+        866: 0x1DD,
+        889: 0x1F1,
+        896: 0x1E1,
+        902: 0x188,
+        910: 0x133,
+        915: 0x1F3,
+        926: 0x19F,
+        931: 0x1E4,
+        970: 0x1D4,
+        971: 0x1A1,
+        979: 0x1CA,
+        1014: 0x18F,
+    },
+    (247, 0x2): {
+        240: 0x2A1,
+        241: 0x24C,
+        242: 0x239,
+        243: 0x278,
+        244: 0x20D,
+        245: 0x292,
+        246: 0x2E7,
+        247: 0x2CD,
+        248: 0x2B8,
+        249: 0x227,
+        250: 0x252,
+        251: 0x21D,
+        252: 0x268,
+        253: 0x229,
+        254: 0x25C,
+        255: 0x2C3,
+        256: 0x2B6,
+        257: 0x29C,
+        258: 0x2E9,
+        259: 0x276,
+        260: 0x203,
+        261: 0x2AB,
+        262: 0x2DE,
+        263: 0x29F,
+        264: 0x2EA,
+        265: 0x275,
+        266: 0x200,
+        268: 0x25F,
+        269: 0x2C0,
+        270: 0x2B5,
+        271: 0x2FA,
+        272: 0x28F,
+        274: 0x2BB,
+        275: 0x224,
+        276: 0x251,
+        277: 0x27B,
+        278: 0x20E,
+        279: 0x291,
+        280: 0x2E4,
+        281: 0x209,
+        282: 0x27C,
+        283: 0x23D,
+        285: 0x2D7,
+        286: 0x2A2,
+        288: 0x2FD,
+        289: 0x262,
+        290: 0x217,
+        291: 0x258,
+        292: 0x22D,
+        293: 0x26C,
+        295: 0x286,
+        297: 0x2D9,
+        299: 0x233,
+        301: 0x284,
+        303: 0x2B0,
+        304: 0x2C5,
+        306: 0x22F,
+        307: 0x205,
+        309: 0x2EF,
+        310: 0x29A,
+        312: 0x2A0,
+        313: 0x2E1,
+        314: 0x294,
+        315: 0x20B,
+        316: 0x27E,
+        317: 0x254,
+        319: 0x2BE,
+        320: 0x2CB,
+        321: 0x2E9,
+        322: 0x29C,
+        324: 0x2A8,
+        325: 0x237,
+        326: 0x242,
+        328: 0x21D,
+        329: 0x282,
+        331: 0x2B8,
+        332: 0x2CD,
+        334: 0x2F9,
+        335: 0x266,
+        336: 0x213,
+        338: 0x24C,
+        340: 0x2A6,
+        341: 0x24B,
+        342: 0x23E,
+        344: 0x20A,
+        346: 0x2E0,
+        347: 0x2CA,
+        349: 0x220,
+        350: 0x255,
+        352: 0x26F,
+        354: 0x25B,
+        355: 0x2C4,
+        357: 0x29B,
+        360: 0x204,
+        362: 0x2D9,
+        363: 0x298,
+        365: 0x272,
+        367: 0x22D,
+        369: 0x2C7,
+        371: 0x2FD,
+        373: 0x2C9,
+        374: 0x2BC,
+        376: 0x256,
+        379: 0x296,
+        381: 0x20E,
+        383: 0x23A,
+        385: 0x2D0,
+        387: 0x28F,
+        390: 0x210,
+        392: 0x22A,
+        394: 0x21E,
+        396: 0x2F4,
+        398: 0x2AB,
+        400: 0x241,
+        401: 0x2B7,
+        402: 0x228,
+        404: 0x277,
+        406: 0x29D,
+        408: 0x2A9,
+        410: 0x293,
+        412: 0x279,
+        414: 0x226,
+        416: 0x2CC,
+        418: 0x2F8,
+        420: 0x260,
+        422: 0x28A,
+        427: 0x24A,
+        429: 0x27E,
+        431: 0x244,
+        433: 0x2AE,
+        435: 0x2F1,
+        438: 0x25A,
+        440: 0x287,
+        442: 0x26D,
+        444: 0x232,
+        449: 0x299,
+        451: 0x2A3,
+        454: 0x263,
+        456: 0x289,
+        458: 0x2BD,
+        461: 0x250,
+        463: 0x2BA,
+        466: 0x27A,
+        471: 0x201,
+        473: 0x2EB,
+        476: 0x22B,
+        478: 0x21F,
+        481: 0x23D,
+        484: 0x2FD,
+        486: 0x217,
+        489: 0x256,
+        491: 0x26C,
+        497: 0x233,
+        500: 0x2C5,
+        502: 0x22F,
+        505: 0x205,
+        508: 0x2AE,
+        511: 0x2E1,
+        514: 0x221,
+        517: 0x2BE,
+        522: 0x28D,
+        525: 0x2A7,
+        528: 0x20C,
+        531: 0x243,
+        534: 0x283,
+        536: 0x269,
+        539: 0x228,
+        542: 0x26A,
+        545: 0x240,
+        551: 0x2A4,
+        552: 0x23B,
+        554: 0x264,
+        555: 0x211,
+        558: 0x2BA,
+        560: 0x222,
+        561: 0x257,
+        563: 0x2BD,
+        566: 0x27D,
+        568: 0x249,
+        569: 0x23C,
+        571: 0x206,
+        572: 0x299,
+        574: 0x2C6,
+        575: 0x2B3,
+        576: 0x22C,
+        577: 0x259,
+        578: 0x218,
+        579: 0x26D,
+        580: 0x24F,
+        581: 0x23A,
+        582: 0x2A5,
+        583: 0x2D0,
+        585: 0x28F,
+        596: 0x241,
+        600: 0x2CC,
+        601: 0x2B9,
+        602: 0x226,
+        603: 0x253,
+        604: 0x279,
+        605: 0x20C,
+        606: 0x293,
+        607: 0x2E6,
+        608: 0x2A7,
+        609: 0x2D2,
+        610: 0x29D,
+        611: 0x2E8,
+        612: 0x277,
+        613: 0x202,
+        614: 0x228,
+        621: 0x21B,
+        658: 0x2B3,
+        746: 0x2D1,
+        815: 0x22F,
+        873: 0x297,
+        965: 0x29E,
+        986: 0x26C,
+    },
+    (247, 0x8): {
+        550: 0x8A9,
+        553: 0x836,
+        555: 0x869,
+        558: 0x8C2,
+        560: 0x85A,
+        563: 0x8C5,
+        565: 0x89A,
+        568: 0x831,
+        572: 0x8E1,
+        575: 0x8CB,
+        577: 0x821,
+        579: 0x815,
+        581: 0x842,
+        583: 0x8A8,
+        584: 0x882,
+        586: 0x868,
+        588: 0x85C,
+        589: 0x829,
+        591: 0x813,
+        592: 0x88C,
+        593: 0x8F9,
+        595: 0x8A6,
+        596: 0x839,
+        597: 0x84C,
+        598: 0x80D,
+        599: 0x878,
+        600: 0x8B4,
+        601: 0x8C1,
+        602: 0x85E,
+        603: 0x82B,
+        604: 0x801,
+        605: 0x874,
+        607: 0x89E,
+        608: 0x8DF,
+        609: 0x8AA,
+    },
+    (251, 0x8): {
+        610: 0x8E5,
+    },
 }
+
+# (house, nib7, temp_idx) -> ((R12, veces), ...), la moda primero
+R12_CONFLICTS = {
+}
+
+# Tabla densa (little-endian): fila = índice en R12_KEYS, columna = temp_idx
+TEMP_IDX_SIZE = 1024
+R12_MISSING = 0xFFFF
+R12_KEYS = (
+    (0, 0x8),
+    (3, 0x0),
+    (3, 0x1),
+    (3, 0x2),
+    (79, 0x8),
+    (92, 0x8),
+    (96, 0x2),
+    (96, 0x8),
+    (135, 0x8),
+    (247, 0x0),
+    (247, 0x1),
+    (247, 0x2),
+    (247, 0x8),
+    (251, 0x8),
+)
+R12_DENSE = array('H')
+R12_DENSE.frombytes(bytes.fromhex(
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffff4208ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffff8908ffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff2e00b100ffffffff9b00'
+    'ffffffff3000ffffffff9800ffff7200ffffffffb200ffff8600ffffffffffffffff2300ffff7c00ffff9600ffffffff'
+    '4f003a00ffffd000ffff8f001000ffff2400ffff1e00fffff4008100ab00de004100340075000000ffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffff9401e1017e010b01ffff5401cb01be01ff01ffffffffffff'
+    '2f01ffffffffffffffffffffae01ffffffffffffffff8801ffffffffffffffffffff0901fffffffffffffffff301ffff'
+    'ffffffff2d01ffffffffffffffff2a01ffffffffea01ffffffffffffe401ffffffffffff5101ffffffffce01ffffffff'
+    'ffff2701ffffffffe701ffff0d01ffffffff4c01ffffffffe901ffffffffc301ffff2901ffff1d01ffff8501ffff6f01'
+    'ffff3001ffffda01ffffee01ffffd401ffff3e011401fffffe01ffffca01bf01ffffe80177010201ffff5d01c201b701'
+    'f6018301ffffb9012601530179010c019301e601a701d20110016501fa018f01a501d0014f013a017b010e014101ffff'
+    'ab01fffff401ffff1e01ffff2a015f01ffffc70158012d0107017201ed019801d901ac01e301960109017c015601ffff'
+    'ffffffffffffffffffff2001ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff1001ffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'fffffffffffffffffffffffffffff60269021c025d0228028002f5026a021f0235024002df02aa02eb029e02ffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffaa08ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff4408ffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff74020102400235027a020f02'
+    '9002e502ffffba022502ffff1102640246023302ac02d902f3028602ffff6c022d0258021702fffffd02ffffa202ffff'
+    '48023d02ffff0902cb02ffff21025402ffff0b02ffffffffa002d502ffffef02ffff05022f02ffffc502fffff102ffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff1108fffffb088e08ffffd108ffff3b08'
+    'ffff0f08ffff3508fffffffff508ffff1f08ffff2b08fffff608ffffffff6908ffffffffffffdc08ffffffffffffffff'
+    '4d08ffffffff6708ffff8d08ffffffff5408ffffffffcb08ffffffff0b08ffffffff4a08ffffffffef08ffffffffffff'
+    'ffffffff6e08ffffffff4c08ffffffff8c08ffffffffffff5208ffffffff1d08ffffffffffffa808ffffffff0308ffff'
+    'ffffffffffffffffffffffff9908ffffffffffff9708ffffffffffffffff5708ffffffffffff8908ffffffffffffffff'
+    'd108ffffffffffffffffffff3508fffffffffffffffff508ffffffffffffffff8308ffffffffffffffff4308ffffffff'
+    'ffffffffd208ffffffffffffffffffff8d08ffffffffffffffffffffcb08ffffffffffffffffffff4a08ffffffffffff'
+    'ffffffffc508ffffffffffffffffffffffffffffffffffffffffffffffffffffffff5208ffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff5908ffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff6e08'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff4408ffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffff3100fffffffff100ffff1b00ffffc600ffffffff'
+    '87001800ffffffff3200ffffffff9700ffffa300ffff4900ffffffff6300ffffffff6400ffffffff2500ffffcf00ffff'
+    'ffff0f00ffffffff4000ffffffffeb00ffffffffc100ffff2b00ffffffffdd00ffffffff4200ffff1d00ffffffffb800'
+    'fffffffff900ffffffff3900ffffffffa600fffff100ffffffff5a00ffffffff7000ffff9a00ffffffffe100ffffffff'
+    '7e00ffff2100ffffffff2600ffff1200ffffffff8d00ffffffff4d00ffffffff0200ffff3600ffffdc00ffffffff1c00'
+    'ffffc100ffffffff8000ffffffffffff3500ffffffffffffffffa400ffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff0600ffffffffffffffffffffffffffffffff'
+    'ffffd400ffffffffffffffffffffffffffffffffffffffffffffffffffff3000ffffffffffffffffffffffffffffffff'
+    'ffffc300ffffffffffffffffffff2700b800cd00e700ffffffff7800ffffffffe40091000e00ffff51002400ffffce00'
+    'ffffffffffffc000ffff2a000000ffffea009f00ffffab00ffff3300ac00d900ffff86001900ffff2d00ffff1700ffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffff8d01ffffd201ffff3801ffffffffe101ffff0b01ffff5401ffffffffcb01ffff'
+    'f101ffffc501ffff2f01ffff7001ffff9a01fffff3018601ffffffff4601ffffffffffff4801ffffa201d701ffffffff'
+    '17016201ffff5601ffffce01ffff2401ffff7b01ffff9101d001ffffea01ffff0001ffff5f012a01ffffc001fffff401'
+    'ffff2901ffffffffe901ffff030176013701ffff0d01ffffe7019201ffffcd015201ffff66011301ffff8b011401ffff'
+    '4b013e01a101ffff9501e001ffffffff450130011a016f01ffff8501c401b1019301e6017901ffff26015301cc01ffff'
+    'f8018d01c201b701ffff5d01ffff02019d01e801a901dc011e016b01f4018101ab01de0141013401750100014f013a01'
+    'a501d001fa018f011001650124015101bc01c9015601230109017c01e3019601d701a201ed0198010701720158012d01'
+    'b201c7018601f3015b012e01b101c401ee019b0104017101300145010a017f01e0019501bf01ca015501200161011401'
+    'f9018c01130166014c013901a601d3019201e701a801dd01420137011d016801f7018201c301b6019401ffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'fffffffffffffffffffffffff301860119016c012d015801b501c0015f012a01ffff7501ea019f01ffffab01ffff9101'
+    'ffff7b01ffffffffbb01fffffffffa0152012701b801cd01e70192010d017801ffff4c01ffffffffe901ffffb601ffff'
+    '5c01ffffffff1d01f001ffffffff6f01ffffffffaf01da01ffffffffa101d4014b01fffffffffffffe01ffffffffffff'
+    '9d01ffffffffffffffffffffc201ffffffffffffffffffff2601ffffffffffffffffffffffffd201ffffffffffffffff'
+    'ffffffffffff3a01ffffffffffffffffffffffffffffffffffff6b01ffffffffffffffffffffffffffffffffffffffff'
+    'd901ffffffffffffffffffffffffffffffffffffffffffff5501ffffffffffffffffffffffffffffffffffffffffffff'
+    'ffff9b01ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffe901ffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffc501ffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffff4f01ffffffffffffffffffffab01ffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffff9601ffffffffffff2301ffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffff6f01ffffffffffffffffffffffffdd01ffffffffffffffffffff'
+    'fffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff101ffffffffffffffffffffffff'
+    'e101ffffffffffffffffffff8801ffffffffffffffffffffffffffff3301fffffffffffffffff301ffffffffffffffff'
+    'ffffffffffffffffffffffff9f01ffffffffffffffffe401ffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffd401a101ffffffffffffffffffffffffffffca01ffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff8f01ffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffa1024c02390278020d029202e702cd02b802270252021d02680229025c02c302'
+    'b6029c02e90276020302ab02de029f02ea0275020002ffff5f02c002b502fa028f02ffffbb02240251027b020e029102'
+    'e40209027c023d02ffffd702a202fffffd026202170258022d026c02ffff8602ffffd902ffff3302ffff8402ffffb002'
+    'c502ffff2f020502ffffef029a02ffffa002e10294020b027e025402ffffbe02cb02e9029c02ffffa80237024202ffff'
+    '1d028202ffffb802cd02fffff90266021302ffff4c02ffffa6024b023e02ffff0a02ffffe002ca02ffff20025502ffff'
+    '6f02ffff5b02c402ffff9b02ffffffff0402ffffd9029802ffff7202ffff2d02ffffc702fffffd02ffffc902bc02ffff'
+    '5602ffffffff9602ffff0e02ffff3a02ffffd002ffff8f02ffffffff1002ffff2a02ffff1e02fffff402ffffab02ffff'
+    '4102b7022802ffff7702ffff9d02ffffa902ffff9302ffff7902ffff2602ffffcc02fffff802ffff6002ffff8a02ffff'
+    'ffffffffffff4a02ffff7e02ffff4402ffffae02fffff102ffffffff5a02ffff8702ffff6d02ffff3202ffffffffffff'
+    'ffff9902ffffa302ffffffff6302ffff8902ffffbd02ffffffff5002ffffba02ffffffff7a02ffffffffffffffff0102'
+    'ffffeb02ffffffff2b02ffff1f02ffffffff3d02fffffffffd02ffff1702ffffffff5602ffff6c02ffffffffffffffff'
+    'ffff3302ffffffffc502ffff2f02ffffffff0502ffffffffae02ffffffffe102ffffffff2102ffffffffbe02ffffffff'
+    'ffffffff8d02ffffffffa702ffffffff0c02ffffffff4302ffffffff8302ffff6902ffffffff2802ffffffff6a02ffff'
+    'ffff4002ffffffffffffffffffffa4023b02ffff64021102ffffffffba02ffff22025702ffffbd02ffffffff7d02ffff'
+    '49023c02ffff06029902ffffc602b3022c02590218026d024f023a02a502d002ffff8f02ffffffffffffffffffffffff'
+    'ffffffffffffffff4102ffffffffffffcc02b9022602530279020c029302e602a702d2029d02e802770202022802ffff'
+    'ffffffffffffffffffff1b02ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffb302ffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffd102ffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffff2f02ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff9702ffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffff9e02ffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffff6c02ffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffa908ffff'
+    'ffff3608ffff6908ffffffffc208ffff5a08ffffffffc508ffff9a08ffffffff3108ffffffffffffe108ffffffffcb08'
+    'ffff2108ffff1508ffff4208ffffa8088208ffff6808ffff5c082908ffff13088c08f908ffffa60839084c080d087808'
+    'b408c1085e082b0801087408ffff9e08df08aa08ffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffe508ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
+    'ffffffffffffffffffffffffffffffff'
+))
+if sys.byteorder == 'big':
+    R12_DENSE.byteswap()
+
+
+def get_r12(temp_c, house, nib7):
+    """R12 observado (moda) para una temperatura; KeyError si no hay datos."""
+    return R12_TABLES[(house, nib7)][int(round((temp_c + 40) * 10))]
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Omple els buits de les LUT de P (nibble 14) fent servir l'estructura del
+protocol en lloc del veí més proper.
+
+Com que R12 = M[e] XOR P[d], el nibble 14 també es descompon:
+p(t) = a[e] ^ b[d], amb e la part entera (amb signe; -0.x és una fila pròpia)
+i d la dècima. Cada cel·la observada és una aresta e—d amb pes XOR; dins
+d'una component connexa, a[e] ^ b[d] queda determinat per a qualsevol
+parella (e, d) encara que no s'hagi capturat. A més, per un mateix house
+P(nib7) = P(2) ^ NIB7_XOR_TABLE[nib7], així que les captures de tots els
+nib7 de la taula es combinen en el domini de nib7 = 2.
+
+Les arestes s'afegeixen per suport descendent (union-find amb potencial
+XOR); les que contradiuen el que ja està fixat es rebutgen. Les components
+amb més d'un MAX_CONFLICT_RATIO d'arestes rebutjades no infereixen res.
+
+Cada cel·la porta la seva procedència: observed (moda de les captures
+reals, sense tramas_thn132n.csv, que surt del generador), inferred
+(deduïda per l'estructura) o unknown.
+
+Sortida: Docs/oregon_p_lut_filled.py, amb P_FILLED[(house, nib7)] = bytes
+de TEMP_IDX_SIZE cel·les, cel·la = procedència << 4 | P, i get_p() /
+provenance() en O(1).
+
+Ús:
+  python3 fill_lut_gaps.py                  # genera Docs/oregon_p_lut_filled.py
+  python3 fill_lut_gaps.py --holdout 0.1    # amaga un 10% de les cel·les i mesura l'encert
+"""
+
+import argparse
+import sys
+import textwrap
+from pathlib import Path
+
+import numpy as np
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR / "04_utilities"))
+sys.path.insert(0, str(Path(__file__).parent / "Docs"))
+
+from capture_store import captured, load_store
+from oregon_p_lut_complete import NIB7_XOR_TABLE
+from table_bundle import cell_modes
+
+OUTPUT_FILE = Path(__file__).parent / "Docs" / "oregon_p_lut_filled.py"
+
+TEMP_IDX_SIZE = 1024
+PROV_UNKNOWN, PROV_OBSERVED, PROV_INFERRED = 0, 1, 2
+PROVENANCE_NAMES = ("unknown", "observed", "inferred")
+MAX_CONFLICT_RATIO = 0.05
+
+
+def row_col(temp_idx):
+    """(e, d) de cada temp_idx: fila = part entera amb signe (-0.x -> -1), columna = dècima."""
+    t10 = np.asarray(temp_idx, dtype=np.int64) - 400
+    a = np.abs(t10)
+    e = np.where(t10 >= 0, a // 10, -(a // 10) - 1)
+    return e, a % 10
+
+
+class XorUnionFind:
+    """Union-find amb el XOR de cada node respecte a l'arrel."""
+
+    def __init__(self):
+        self.parent = {}
+        self.pot = {}
+
+    def find(self, x):
+        if x not in self.parent:
+            self.parent[x] = x
+            self.pot[x] = 0
+            return x, 0
+        path = []
+        while self.parent[x] != x:
+            path.append(x)
+            x = self.parent[x]
+        # Compressió: cada node del camí penja directament de l'arrel
+        acc = 0
+        for node in reversed(path):
+            acc ^= self.pot[node]
+            self.pot[node] = acc
+            self.parent[node] = x
+        return x, (self.pot[path[0]] if path else 0)
+
+    def add(self, u, v, val):
+        """Imposa u ^ v = val. False si contradiu el que ja està fixat."""
+        ru, pu = self.find(u)
+        rv, pv = self.find(v)
+        if ru == rv:
+            return pu ^ pv == val
+        self.parent[rv] = ru
+        self.pot[rv] = pu ^ pv ^ val
+        return True
+
+    def value(self, u, v):
+        """u ^ v si estan a la mateixa component, si no None."""
+        if u not in self.parent or v not in self.parent:
+            return None
+        ru, pu = self.find(u)
+        rv, pv = self.find(v)
+        return pu ^ pv if ru == rv else None
+
+
+def observed_cells(store):
+    """
+    (house, nib7) -> (temp_idx, P, suport) amb la moda de P per cel·la.
+    Només compten les captures reals: les trames del generador no són observacions.
+    """
+    ok = captured(store) & (store["nib7"] >= 0) & (store["p"] >= 0)
+    ok &= (store["temp_idx"] >= 0) & (store["temp_idx"] < TEMP_IDX_SIZE)
+    house, nib7, tidx, p, support = cell_modes(store["house"][ok], store["nib7"][ok],
+                                               store["temp_idx"][ok], store["p"][ok])
+    cells = {}
+    key = house * 16 + nib7
+    bounds = np.flatnonzero(np.r_[True, key[1:] != key[:-1], True])
+    for a, b in zip(bounds[:-1], bounds[1:]):
+        cells[(int(house[a]), int(nib7[a]))] = (tidx[a:b], p[a:b].astype(np.uint8), support[a:b])
+    return cells
+
+
+def fill_group(group, max_ratio=MAX_CONFLICT_RATIO):
+    """
+    Omple les taules d'un grup de nib7 que comparteixen estructura.
+    group: nib7 -> (xor respecte al domini comú, temp_idx, P, suport).
+    Retorna ({nib7: array de cel·les}, estadístiques).
+    """
+    edges = []
+    for nib7, (xor, tidx, p, support) in group.items():
+        e, d = row_col(tidx)
+        for ei, di, pi, si, ti in zip(e.tolist(), d.tolist(), (p ^ xor).tolist(), support.tolist(), tidx.tolist()):
+            edges.append((-si, ti, ei, di, pi))
+    edges.sort()
+
+    uf = XorUnionFind()
+    accepted = []
+    for _, _, e, d, p in edges:
+        accepted.append(uf.add(("e", e), ("d", d), p))
+
+    # Arestes i rebutjos per component
+    comp_edges, comp_rejected = {}, {}
+    for (_, _, e, _, _), ok in zip(edges, accepted):
+        root = uf.find(("e", e))[0]
+        comp_edges[root] = comp_edges.get(root, 0) + 1
+        comp_rejected[root] = comp_rejected.get(root, 0) + (not ok)
+    usable = {r for r in comp_edges if comp_rejected[r] <= max_ratio * comp_edges[r]}
+
+    all_t = np.arange(TEMP_IDX_SIZE)
+    all_e, all_d = row_col(all_t)
+    inferred = np.full(TEMP_IDX_SIZE, -1, dtype=np.int16)
+    for t, e, d in zip(all_t.tolist(), all_e.tolist(), all_d.tolist()):
+        v = uf.value(("e", e), ("d", d))
+        if v is not None and uf.find(("e", e))[0] in usable:
+            inferred[t] = v
+
+    tables = {}
+    for nib7, (xor, tidx, p, _) in group.items():
+        cells = np.zeros(TEMP_IDX_SIZE, dtype=np.uint8)
+        known = inferred >= 0
+        cells[known] = (PROV_INFERRED << 4) | ((inferred[known] ^ xor) & 0xF)
+        cells[tidx] = (PROV_OBSERVED << 4) | p
+        tables[nib7] = cells
+    stats = {
+        "edges": len(edges),
+        "rejected": len(accepted) - sum(accepted),
+        "components": len(comp_edges),
+        "disabled": len(comp_edges) - len(usable),
+    }
+    return tables, stats
+
+
+def fill_all(cells, max_ratio=MAX_CONFLICT_RATIO):
+    """Omple totes les taules. Retorna ({(house, nib7): cel·les}, {house: estadístiques})."""
+    by_house = {}
+    for (house, nib7), obs in cells.items():
+        by_house.setdefault(house, {})[nib7] = obs
+
+    filled, stats = {}, {}
+    for house, tabs in sorted(by_house.items()):
+        # nib7 amb transformació coneguda: un sol grup; la resta, cadascun pel seu compte
+        groups = [{n: (NIB7_XOR_TABLE[n],) + tabs[n] for n in tabs if n in NIB7_XOR_TABLE}]
+        groups += [{n: (0,) + tabs[n]} for n in tabs if n not in NIB7_XOR_TABLE]
+        hstats = {"edges": 0, "rejected": 0, "components": 0, "disabled": 0}
+        for group in groups:
+            if not group:
+                continue
+            tables, gstats = fill_group(group, max_ratio)
+            for nib7, table in tables.items():
+                filled[(house, nib7)] = table
+            for k, v in gstats.items():
+                hstats[k] += v
+        stats[house] = hstats
+    return filled, stats
+
+
+def holdout(cells, fraction, seed=0, max_ratio=MAX_CONFLICT_RATIO):
+    """Amaga una fracció de les cel·les observades i compta quantes s'infereixen bé."""
+    rng = np.random.default_rng(seed)
+    train, hidden = {}, []
+    for key, (tidx, p, support) in cells.items():
+        mask = rng.random(len(tidx)) < fraction
+        train[key] = (tidx[~mask], p[~mask], support[~mask])
+        hidden += [(key, t, v) for t, v in zip(tidx[mask].tolist(), p[mask].tolist())]
+    filled, _ = fill_all({k: v for k, v in train.items() if len(v[0])}, max_ratio)
+    hit = miss = unknown = 0
+    for key, t, v in hidden:
+        cell = filled[key][t] if key in filled else 0
+        if cell >> 4 == PROV_UNKNOWN:
+            unknown += 1
+        elif cell & 0xF == v:
+            hit += 1
+        else:
+            miss += 1
+    return hit, miss, unknown
+
+
+def write_module(filled, output_file):
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write('"""\n')
+        f.write("LUT de P (nibble 14) omplerta, generada automàticament per fill_lut_gaps.py.\n\n")
+        f.write("P_FILLED[(house, nib7)][temp_idx] = procedència << 4 | P,\n")
+        f.write("amb temp_idx = round((t + 40) * 10) i procedència 0 = unknown,\n")
+        f.write("1 = observed, 2 = inferred.\n")
+        f.write('"""\n\n')
+        f.write(f"TEMP_IDX_SIZE = {TEMP_IDX_SIZE}\n")
+        f.write(f"PROV_UNKNOWN, PROV_OBSERVED, PROV_INFERRED = {PROV_UNKNOWN}, {PROV_OBSERVED}, {PROV_INFERRED}\n")
+        f.write(f"PROVENANCE_NAMES = {PROVENANCE_NAMES!r}\n\n")
+        f.write("P_FILLED = {\n")
+        for (house, nib7), cells in sorted(filled.items()):
+            f.write(f"    ({house}, 0x{nib7:X}): bytes.fromhex(\n")
+            for line in textwrap.wrap(cells.tobytes().hex(), 96):
+                f.write(f"        '{line}'\n")
+            f.write("    ),\n")
+        f.write("}\n\n\n")
+        f.write("def _cell(temp_c, house, nib7):\n")
+        f.write("    table = P_FILLED.get((house, nib7))\n")
+        f.write("    temp_idx = int(round((temp_c + 40) * 10))\n")
+        f.write("    if table is None or not 0 <= temp_idx < TEMP_IDX_SIZE:\n")
+        f.write("        return 0\n")
+        f.write("    return table[temp_idx]\n\n\n")
+        f.write("def get_p(temp_c, house, nib7):\n")
+        f.write('    """P observada o inferida, o None si és desconeguda."""\n')
+        f.write("    cell = _cell(temp_c, house, nib7)\n")
+        f.write("    return cell & 0xF if cell >> 4 else None\n\n\n")
+        f.write("def provenance(temp_c, house, nib7):\n")
+        f.write("    \"\"\"'observed', 'inferred' o 'unknown'.\"\"\"\n")
+        f.write("    return PROVENANCE_NAMES[_cell(temp_c, house, nib7) >> 4]\n")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Omple els buits de les LUT de P amb l'estructura M[e] XOR P[d]")
+    ap.add_argument("-o", "--output", default=str(OUTPUT_FILE), help=f"mòdul de sortida (default: Docs/{OUTPUT_FILE.name})")
+    ap.add_argument("--max-conflicts", type=float, default=MAX_CONFLICT_RATIO,
+                    help=f"fracció màxima d'arestes rebutjades per inferir en una component (default: {MAX_CONFLICT_RATIO})")
+    ap.add_argument("--holdout", type=float, metavar="F", help="validar amagant una fracció F de les cel·les (no escriu res)")
+    args = ap.parse_args()
+
+    cells = observed_cells(load_store())
+    if args.holdout:
+        hit, miss, unknown = holdout(cells, args.holdout, max_ratio=args.max_conflicts)
+        total = hit + miss + unknown
+        print(f"Cel·les amagades: {total}")
+        print(f"  inferides bé: {hit}, malament: {miss}, sense inferir: {unknown}")
+        if hit + miss:
+            print(f"  encert sobre les inferides: {hit / (hit + miss) * 100:.1f}%")
+        return
+
+    filled, stats = fill_all(cells, args.max_conflicts)
+    print(f"{'House':>5s} {'Observades':>10s} {'Inferides':>9s} {'Arestes':>7s} {'Rebutjades':>10s} {'Comp. off':>9s}")
+    for house, st in stats.items():
+        tabs = [c for (h, _), c in filled.items() if h == house]
+        obs = sum(int(np.count_nonzero(c >> 4 == PROV_OBSERVED)) for c in tabs)
+        inf = sum(int(np.count_nonzero(c >> 4 == PROV_INFERRED)) for c in tabs)
+        print(f"{house:5d} {obs:10d} {inf:9d} {st['edges']:7d} {st['rejected']:10d} "
+              f"{st['disabled']:4d}/{st['components']:<4d}")
+
+    write_module(filled, args.output)
+    print(f"\nLUT omplerta guardada a {args.output}")
+
+
+if __name__ == "__main__":
+    main()
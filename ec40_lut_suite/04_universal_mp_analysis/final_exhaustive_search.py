@@ -2,51 +2,47 @@
 """
 Recerca FINAL: Brute force complet de (Poly, XOR_Param, Offset).
 Buscar la millor combinació possible.
+
+Les dades surten de la matriu de nibbles mapejada en memòria
+(04_utilities/nibble_matrix.py) i el hash es calcula per a totes les files
+alhora amb NumPy.
 """
 
-import csv
+import sys
 from pathlib import Path
 
+import numpy as np
+
 BASE_DIR = Path(__file__).parent.parent
 DATA_FILE = BASE_DIR / "ec40_capturas_merged.csv"
 
-def polynomial_hash(data, poly, init=0):
-    h = init
-    for nibble in data:
-        h = ((h << 4) ^ nibble) & 0xFF
-        if h & 0x80:
-            h ^= poly
+sys.path.insert(0, str(BASE_DIR / "04_utilities"))
+
+from nibble_matrix import load_matrix
+
+def polynomial_hash(nibbles, poly, init=0):
+    """Hash polinomial de cada fila d'una matriu N×16 de nibbles."""
+    h = np.full(len(nibbles), init, dtype=np.int32)
+    for j in range(nibbles.shape[1]):
+        h = ((h << 4) ^ nibbles[:, j]) & 0xFF
+        h = np.where(h & 0x80, h ^ poly, h)
     return h & 0xF
 
 def load_data_247():
-    data = []
-    with open(DATA_FILE, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            try:
-                if int(row['house']) != 247: continue
-                
-                payload_hex = row['payload64_hex']
-                r12_val = int(row['R12'], 16)
-                
-                nibbles = [int(c, 16) for c in payload_hex]
-                r1 = (r12_val >> 8) & 0xF
-                m = (r12_val >> 4) & 0xF
-                p = r12_val & 0xF
-                
-                data.append({
-                    'nibbles': nibbles,
-                    'r1': r1,
-                    'm': m,
-                    'p': p
-                })
-            except (ValueError, KeyError):
-                continue
-    return data
+    """Nibbles i R1/M/P (nibbles 7, 14 i 15, com la columna R12) de la casa 247."""
+    mx = load_matrix(DATA_FILE)
+    nibbles = mx['nibbles'][mx['house'] == 247].astype(np.int32)
+    return {
+        'nibbles': nibbles,
+        'r1': nibbles[:, 7],
+        'm': nibbles[:, 14],
+        'p': nibbles[:, 15]
+    }
 
 def final_exhaustive_search():
     data = load_data_247()
-    print(f"Dataset: {len(data)} registres\n")
+    n = len(data['p'])
+    print(f"Dataset: {n} registres\n")
     
     best_score = 0
     best_params = None
@@ -60,40 +56,24 @@ def final_exhaustive_search():
         if poly % 64 == 0:
             print(f"Progress: Poly {poly}/256...")
         
-        hashes = [polynomial_hash(d['nibbles'], poly) for d in data]
-        hash_cache[poly] = hashes
+        hash_cache[poly] = polynomial_hash(data['nibbles'], poly)
     
     print("\nBuscant millor combinació...")
     
+    # 0=None, 1=M, 2=R1, 3=House(0xF7&0xF), 4=House>>4
+    xor_values = [0, data['m'], data['r1'], 0x7, 0xF]
+    
     # Provar combinacions
     for poly in range(256):
         hashes = hash_cache[poly]
         
         # XOR amb diferents params
-        for xor_source in range(5):  # 0=None, 1=M, 2=R1, 3=House(0xF7&0xF), 4=House>>4
+        for xor_source in range(5):
+            xored = hashes ^ xor_values[xor_source]
             for offset in range(16):
-                matches = 0
-                
-                for i, d in enumerate(data):
-                    h = hashes[i]
-                    
-                    # Apply XOR
-                    if xor_source == 1:
-                        h ^= d['m']
-                    elif xor_source == 2:
-                        h ^= d['r1']
-                    elif xor_source == 3:
-                        h ^= 0x7  # House 247 & 0xF
-                    elif xor_source == 4:
-                        h ^= 0xF  # House 247 >> 4
-                    
-                    # Apply offset
-                    h = (h + offset) & 0xF
-                    
-                    if h == d['p']:
-                        matches += 1
+                matches = int(np.count_nonzero(((xored + offset) & 0xF) == data['p']))
                 
-                score = matches / len(data)
+                score = matches / n
                 
                 if score > best_score:
                     best_score = score
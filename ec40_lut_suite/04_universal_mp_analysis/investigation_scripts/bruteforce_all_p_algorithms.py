@@ -4,40 +4,36 @@ FORÇA BRUTA COMPLETA: Prova TOTS els algoritmes possibles per P.
 Sobre els primers 14 nibbles (sense P).
 """
 
-import csv
+import sys
 from pathlib import Path
 
-BASE_DIR = Path(__file__).parent.parent
+import numpy as np
+
+BASE_DIR = Path(__file__).parent.parent.parent
 DATA_FILE = BASE_DIR / "ec40_capturas_merged.csv"
 
+sys.path.insert(0, str(BASE_DIR / "04_utilities"))
+
+from nibble_matrix import load_matrix
+
 def load_data_with_14_nibbles():
-    """Carrega dades amb els primers 14 nibbles."""
-    data = []
-    
-    with open(DATA_FILE, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            try:
-                payload_hex = row['payload64_hex']
-                nibbles = [int(c, 16) for c in payload_hex]
-                
-                # Els primers 14 nibbles (sense P ni postamble)
-                nibbles_14 = nibbles[:14]
-                p_real = nibbles[14]
-                
-                data.append({
-                    'nibbles_14': nibbles_14,
-                    'p': p_real
-                })
-                
-            except (ValueError, KeyError):
-                continue
-    
-    return data
+    """
+    Carrega els primers 14 nibbles com a llista de columnes (arrays de
+    NumPy), de manera que cada algoritme s'avalua sobre totes les mostres
+    alhora: n[12] és la columna R1 sencera, sum(n) la suma per fila.
+    """
+    nibbles = load_matrix(DATA_FILE)['nibbles'].astype(np.int32)
+    
+    return {
+        # Els primers 14 nibbles (sense P ni postamble)
+        'nibbles_14': [nibbles[:, i] for i in range(14)],
+        'p': nibbles[:, 14]
+    }
 
 def test_all_algorithms():
     data = load_data_with_14_nibbles()
-    print(f"Dataset: {len(data)} mostres\n")
+    n_samples = len(data['p'])
+    print(f"Dataset: {n_samples} mostres\n")
     
     algorithms = {}
     
@@ -97,13 +93,10 @@ def test_all_algorithms():
     # Executar tots
     results = {}
     for name, func in algorithms.items():
-        matches = 0
-        for d in data:
-            try:
-                if func(d['nibbles_14']) == d['p']:
-                    matches += 1
-            except:
-                pass
+        try:
+            matches = int(np.count_nonzero(func(data['nibbles_14']) == data['p']))
+        except Exception:
+            matches = 0
         
         results[name] = matches
     
@@ -114,7 +107,7 @@ def test_all_algorithms():
     
     for name in sorted(results.keys(), key=lambda x: -results[x]):
         matches = results[name]
-        acc = matches / len(data) * 100
+        acc = matches / n_samples * 100
         status = "✅" if acc > 99 else "⚠️" if acc > 90 else "🔍" if acc > 50 else "❌"
         
         if acc > 5:  # Només mostrar si >5%
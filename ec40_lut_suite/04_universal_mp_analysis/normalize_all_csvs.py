@@ -2,9 +2,24 @@
 """
 Normalitza TOTS els CSVs de captures a un format estàndard.
 Format estàndard: timestamp,house,channel,temperature_C,payload64_hex
+
+Cada font es normalitza en un procés propi (--workers) que escriu el seu
+tros a un fitxer temporal; al final els trossos es concatenen en l'ordre de
+CSV_SOURCES, eliminant duplicats, a ec40_all_captures_normalized.csv.
+El mapatge de columnes detectat es desa per signatura de capçalera a
+.normalize_mappings.json i no es torna a detectar mentre la capçalera no canviï.
+
+Ús:
+  python3 normalize_all_csvs.py [--workers N]
 """
 
+import argparse
 import csv
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -37,8 +52,11 @@ CSV_SOURCES = {
 }
 
 OUTPUT_FILE = BASE_DIR / 'ec40_all_captures_normalized.csv'
+MAPPING_CACHE = Path(__file__).parent / '.normalize_mappings.json'
 
-def detect_column_mapping(header):
+FIELDNAMES = ['timestamp', 'house', 'channel', 'temperature_C', 'payload64_hex']
+
+def detect_column_mapping(header, verbose=True):
     """Detecta el mapatge de columnes segons les capçaleres."""
     
     # Possibles noms per cada camp
@@ -53,14 +71,16 @@ def detect_column_mapping(header):
     result = {}
     header_lower = [h.lower().strip() for h in header]
     
-    print(f"   Capçaleres trobades: {header}")
+    if verbose:
+        print(f"   Capçaleres trobades: {header}")
     
     for std_name, possible_names in mappings.items():
         for possible in possible_names:
             for i, col in enumerate(header_lower):
                 if possible.lower() == col or possible.lower() in col:
                     result[std_name] = header[i]
-                    print(f"   {std_name} -> {header[i]}")
+                    if verbose:
+                        print(f"   {std_name} -> {header[i]}")
                     break
             if std_name in result:
                 break
@@ -70,12 +90,50 @@ def detect_column_mapping(header):
     missing = [f for f in required_fields if f not in result]
     
     if missing:
-        print(f"   ⚠️  Camps obligatoris que falten: {missing}")
+        if verbose:
+            print(f"   ⚠️  Camps obligatoris que falten: {missing}")
         return None
     
-    print(f"   ✅ Mapatge detectat correctament ({len(result)} camps)")
+    if verbose:
+        print(f"   ✅ Mapatge detectat correctament ({len(result)} camps)")
     return result
 
+class MappingCache:
+    """Mapatges detectats, indexats per signatura de capçalera (persistent en JSON)."""
+    
+    def __init__(self, path=MAPPING_CACHE):
+        self.path = Path(path)
+        self.hits = 0
+        self.changed = False
+        try:
+            with open(self.path, 'r') as f:
+                self.mappings = json.load(f)
+        except (OSError, ValueError):
+            self.mappings = {}
+    
+    def get(self, header):
+        key = '\x1f'.join(header)
+        if key in self.mappings:
+            self.hits += 1
+            return self.mappings[key]
+        mapping = detect_column_mapping(header)
+        self.mappings[key] = mapping
+        self.changed = True
+        return mapping
+    
+    def save(self):
+        if self.changed:
+            with open(self.path, 'w') as f:
+                json.dump(self.mappings, f, indent=2)
+
+def read_header(source_file):
+    """Capçalera d'un CSV (None si no en té, com ec40_live_1.csv)."""
+    with open(source_file, 'r', newline='') as f:
+        first = f.readline()
+    if not first.strip() or not first[0].isalpha():
+        return None
+    return next(csv.reader([first]))
+
 def normalize_csv(source_file, column_mapping):
     """Normalitza un CSV al format estàndard."""
     
@@ -104,37 +162,51 @@ def normalize_csv(source_file, column_mapping):
                             continue
                 return normalized_rows
             
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return []
             
             # Si no tenim mapping, detectar-lo
             if column_mapping is None:
-                column_mapping = detect_column_mapping(reader.fieldnames)
+                column_mapping = detect_column_mapping(header)
                 if column_mapping is None:
                     return []
             
-            for row in reader:
+            # Posicions de les columnes calculades un sol cop (-1 = no hi és)
+            pos = {c: i for i, c in enumerate(header)}
+            payload_key = column_mapping.get('payload64_hex', '')
+            # Cas especial: ec40_live.csv usa 'raw64' per payload
+            # (si detectem sensor_type_hex, realment volem raw64)
+            if 'sensor_type_hex' in payload_key and 'raw64' in pos:
+                payload_key = 'raw64'
+            i_ts = pos.get(column_mapping.get('timestamp', ''), -1)
+            i_house = pos.get(column_mapping.get('house', ''), -1)
+            i_ch = pos.get(column_mapping.get('channel', ''), -1)
+            i_temp = pos.get(column_mapping.get('temperature_C', ''), -1)
+            i_pay = pos.get(payload_key, -1)
+            now = datetime.now().isoformat()
+            
+            def col(parts, i, default):
+                if i < 0:
+                    return default
+                return parts[i] if i < len(parts) else None
+            
+            for parts in reader:
+                if not parts:
+                    continue
                 try:
-                    # Cas especial: ec40_live.csv usa 'raw64' per payload
-                    payload_key = column_mapping.get('payload64_hex', '')
-                    payload = row.get(payload_key, '')
-                    
-                    # Si detectem sensor_type_hex, realment volem raw64
-                    if 'sensor_type_hex' in payload_key and 'raw64' in row:
-                        payload = row['raw64']
+                    payload = col(parts, i_pay, '')
                     
                     # Extreure dades segons mapping
                     normalized_row = {
-                        'timestamp': row.get(column_mapping.get('timestamp', ''), datetime.now().isoformat()),
-                        'house': row.get(column_mapping.get('house', ''), '0'),
-                        'channel': row.get(column_mapping.get('channel', ''), '1'),
-                        'temperature_C': row.get(column_mapping.get('temperature_C', ''), '0.0'),
+                        'timestamp': col(parts, i_ts, now) or now,
+                        'house': col(parts, i_house, '0'),
+                        'channel': col(parts, i_ch, '1'),
+                        'temperature_C': col(parts, i_temp, '0.0'),
                         'payload64_hex': payload
                     }
                     
-                    # Netejar timestamp si està buit
-                    if not normalized_row['timestamp'] or normalized_row['timestamp'] == '':
-                        normalized_row['timestamp'] = datetime.now().isoformat()
-                    
                     # Validar que tenim dades mínimes
                     if normalized_row['payload64_hex'] and len(normalized_row['payload64_hex']) >= 15:
                         normalized_rows.append(normalized_row)
@@ -147,71 +219,114 @@ def normalize_csv(source_file, column_mapping):
     
     return normalized_rows
 
-def merge_and_normalize_all():
-    """Fusiona i normalitza tots els CSVs."""
+def normalize_to_chunk(source_file, column_mapping, chunk_path):
+    """
+    Treball d'un procés: normalitza una font i escriu el tros a chunk_path.
+    Retorna (files, segons).
+    """
+    t0 = time.perf_counter()
+    rows = normalize_csv(Path(source_file), column_mapping)
+    with open(chunk_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writerows(rows)
+    return len(rows), time.perf_counter() - t0
+
+def merge_and_normalize_all(workers=None):
+    """Fusiona i normalitza tots els CSVs (una font per procés)."""
     
     print("=" * 60)
     print("NORMALITZACIÓ DE TOTS ELS CSVs")
     print("=" * 60)
     
-    all_rows = []
+    t_start = time.perf_counter()
     stats = {}
+    timings = {}
+    cache = MappingCache()
+    jobs = []
     
+    # Detecció de mapatges al procés principal (només llegeix capçaleres)
     for name, config in CSV_SOURCES.items():
         source_path = config['path']
-        column_map = config['columns']
-        
-        print(f"\n📊 Processant {name}...")
-        
         if not source_path.exists():
-            print(f"   ⚠️  No existeix")
+            print(f"\n📊 {name}: ⚠️  No existeix")
             stats[name] = 0
             continue
-        
-        rows = normalize_csv(source_path, column_map)
-        stats[name] = len(rows)
-        all_rows.extend(rows)
-        
-        print(f"   ✅ {len(rows)} trames normalitzades")
+        column_map = config['columns']
+        t0 = time.perf_counter()
+        if column_map is None:
+            header = read_header(source_path)
+            if header is not None:
+                column_map = cache.get(header)
+                if column_map is None:
+                    print(f"\n📊 {name}: ⚠️  Mapatge no detectat")
+                    stats[name] = 0
+                    continue
+        timings[name] = [time.perf_counter() - t0, 0.0]
+        jobs.append((name, source_path, column_map))
+    cache.save()
     
-    # Eliminar duplicats (mateix payload)
+    all_count = 0
+    unique_rows = 0
     seen_payloads = set()
-    unique_rows = []
     
-    for row in all_rows:
-        if row['payload64_hex'] not in seen_payloads:
-            seen_payloads.add(row['payload64_hex'])
-            unique_rows.append(row)
+    with tempfile.TemporaryDirectory(dir=OUTPUT_FILE.parent, prefix='.normalize_') as tmpdir:
+        chunks = {name: os.path.join(tmpdir, f'{i:02d}.csv') for i, (name, _, _) in enumerate(jobs)}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {name: pool.submit(normalize_to_chunk, str(path), mapping, chunks[name])
+                       for name, path, mapping in jobs}
+            for name, fut in futures.items():
+                stats[name], timings[name][1] = fut.result()
+                print(f"\n📊 {name}: ✅ {stats[name]} trames normalitzades")
+        
+        # Concatenació ordenada; eliminar duplicats (mateix payload, guanya el primer)
+        tmp_out = OUTPUT_FILE.with_suffix('.csv.tmp')
+        with open(tmp_out, 'w', newline='') as out:
+            writer = csv.writer(out)
+            writer.writerow(FIELDNAMES)
+            for name, _, _ in jobs:
+                with open(chunks[name], 'r', newline='') as f:
+                    for row in csv.reader(f):
+                        all_count += 1
+                        if row[4] not in seen_payloads:
+                            seen_payloads.add(row[4])
+                            writer.writerow(row)
+                            unique_rows += 1
+        if unique_rows:
+            os.replace(tmp_out, OUTPUT_FILE)
+        else:
+            os.remove(tmp_out)
     
     print(f"\n{'='*60}")
     print(f"RESUM")
     print(f"{'='*60}")
-    print(f"Total trames carregades: {len(all_rows)}")
-    print(f"Duplicats eliminats: {len(all_rows) - len(unique_rows)}")
-    print(f"Trames úniques: {len(unique_rows)}")
+    print(f"Total trames carregades: {all_count}")
+    print(f"Duplicats eliminats: {all_count - unique_rows}")
+    print(f"Trames úniques: {unique_rows}")
     print(f"\nPer font:")
     for name, count in stats.items():
         print(f"  - {name}: {count}")
     
-    # Guardar CSV normalitzat
+    print(f"\nTemps per font (mapatge / normalització):")
+    for name, (t_map, t_norm) in timings.items():
+        print(f"  - {name}: {t_map * 1000:.1f} ms / {t_norm * 1000:.1f} ms")
+    print(f"  Mapatges des de la memòria cau: {cache.hits}")
+    print(f"  Total: {(time.perf_counter() - t_start) * 1000:.1f} ms")
+    
     if unique_rows:
-        with open(OUTPUT_FILE, 'w', newline='') as f:
-            fieldnames = ['timestamp', 'house', 'channel', 'temperature_C', 'payload64_hex']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            writer.writerows(unique_rows)
-        
         print(f"\n✅ Fitxer normalitzat creat:")
         print(f"   {OUTPUT_FILE}")
-        print(f"   {len(unique_rows)} trames úniques")
+        print(f"   {unique_rows} trames úniques")
     else:
         print("\n❌ No s'han trobat trames vàlides")
     
-    return len(unique_rows)
+    return unique_rows
 
 if __name__ == "__main__":
-    count = merge_and_normalize_all()
+    ap = argparse.ArgumentParser(description="Normalitza tots els CSVs de captures")
+    ap.add_argument("--workers", type=int, default=None,
+                    help="processos en paral·lel (default: un per CPU)")
+    args = ap.parse_args()
+    count = merge_and_normalize_all(args.workers)
     print(f"\n{'='*60}")
     print(f"Procés completat: {count} trames normalitzades")
     print(f"{'='*60}")
@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 """
 GENERADOR FINAL OPTIMITZAT amb LUT Base + Transformació XOR.
-Només necessita una LUT per Nib7=2 (la més completa) i aplica XOR per altres nib7.
+La P surt de la LUT omplerta de fill_lut_gaps.py (observada o inferida amb
+M[e] XOR P[d] i NIB7_XOR_TABLE), amb una consulta O(1) per (house, nib7).
 """
 
 import csv
+import sys
 from pathlib import Path
 
 # Taula de transformació XOR (base: Nib7=2)
@@ -16,75 +18,38 @@ NIB7_XOR_TABLE = {
     0x8: 0x7,  # P(8) = P(2) XOR 0x7
 }
 
-# LUT Base per Nib7=2 (House 247)
-# Extreta de captures reals
-# Índex: temp_idx = int((temp_c + 40) * 10)
-P_LUT_BASE = {}
+# LUT de P omplerta (fill_lut_gaps.py): una taula densa per (house, nib7),
+# cel·la = procedència << 4 | P, indexada per temp_idx = round((t + 40) * 10)
+sys.path.insert(0, str(Path(__file__).parent / "Docs"))
+from oregon_p_lut_filled import P_FILLED, PROV_UNKNOWN, TEMP_IDX_SIZE
 
-def load_p_lut_base():
-    """Carrega la LUT base des de les captures."""
-    global P_LUT_BASE
-    
-    BASE_DIR = Path(__file__).parent.parent
-    DATA_FILE = BASE_DIR / "ec40_capturas_merged.csv"
-    
-    with open(DATA_FILE, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            try:
-                house = int(row['house'])
-                if house != 247:
-                    continue
-                
-                temp_c = float(row['temperature_C'])
-                payload_hex = row['payload64_hex']
-                
-                nibbles = [int(c, 16) for c in payload_hex]
-                nib7 = nibbles[7]
-                p = nibbles[14]
-                
-                # Només Nib7=2 per la LUT base
-                if nib7 != 0x2:
-                    continue
-                
-                temp_idx = int(round((temp_c + 40) * 10))
-                
-                if temp_idx not in P_LUT_BASE:
-                    P_LUT_BASE[temp_idx] = p
-                    
-            except (ValueError, KeyError):
-                continue
-    
-    print(f"LUT Base carregada: {len(P_LUT_BASE)} punts")
-    print(f"Rang: {(min(P_LUT_BASE.keys())-400)/10:.1f}°C - {(max(P_LUT_BASE.keys())-400)/10:.1f}°C")
+# House per defecte de calculate_p
+DEFAULT_HOUSE = 247
 
-def calculate_p(temp_celsius, nib7):
+def calculate_p(temp_celsius, nib7, house=DEFAULT_HOUSE):
     """
-    Calcula P utilitzant LUT base +transformació XOR.
+    Calcula P amb una consulta O(1) a la LUT omplerta.
     
     Args:
         temp_celsius: Temperatura en °C
-        nib7: Rolling code (0, 1, 2, o 8)
+        nib7: Rolling code
+        house: House code
         
     Returns:
         P nibble (0-F)
+        
+    Raises:
+        ValueError si (house, nib7) no té taula o la cel·la no s'ha
+        observat ni s'ha pogut inferir
     """
-    # Índex temperatura
     temp_idx = int(round((temp_celsius + 40) * 10))
-    
-    # Obtenir P base (per Nib7=2)
-    if temp_idx not in P_LUT_BASE:
-        # Temperatura fora de rang - usar el més proper
-        closest_idx = min(P_LUT_BASE.keys(), key=lambda k: abs(k - temp_idx))
-        p_base = P_LUT_BASE[closest_idx]
-    else:
-        p_base = P_LUT_BASE[temp_idx]
-    
-    # Aplicar transformació XOR
-    xor_val = NIB7_XOR_TABLE.get(nib7, 0x0)
-    p = p_base ^ xor_val
-    
-    return p & 0xF
+    table = P_FILLED.get((house, nib7))
+    if table is None:
+        raise ValueError(f"Sense taula de P per house {house}, nib7 {nib7:X}")
+    cell = table[temp_idx] if 0 <= temp_idx < TEMP_IDX_SIZE else 0
+    if cell >> 4 == PROV_UNKNOWN:
+        raise ValueError(f"P desconeguda per {temp_celsius:.1f}°C, house {house}, nib7 {nib7:X}")
+    return cell & 0xF
 
 def generate_frame(house_id, channel, temp_celsius, rolling_code=0x2):
     """Genera trama completa de 15 nibbles."""
@@ -122,19 +87,24 @@ def generate_frame(house_id, channel, temp_celsius, rolling_code=0x2):
     nibbles.extend([r1, m])
     
     # 8. P (LUT + XOR transform)
-    p = calculate_p(temp_celsius, rolling_code)
+    p = calculate_p(temp_celsius, rolling_code, house_id)
     nibbles.append(p)
     
     return ''.join(f'{n:x}' for n in nibbles)
 
 def verify_generator():
-    """Verifica el generador contra TOTES les captures."""
+    """
+    Verifica el generador contra totes les captures de ec40_capturas_merged.csv.
+    La LUT s'ha construït amb aquestes mateixes captures: mesura la coherència,
+    no l'encert en cel·les noves (per això, fill_lut_gaps.py --holdout).
+    """
     
     BASE_DIR = Path(__file__).parent.parent
     DATA_FILE = BASE_DIR / "ec40_capturas_merged.csv"
     
     matches = 0
     total = 0
+    unknown = 0
     errors_by_nib7 = {0: 0, 1: 0, 2: 0, 8: 0}
     total_by_nib7 = {0: 0, 1: 0, 2: 0, 8: 0}
     
@@ -151,7 +121,11 @@ def verify_generator():
                 nib7 = nibbles_captured[7]
                 
                 # Generar
-                generated = generate_frame(house, channel, temp_c, nib7)
+                try:
+                    generated = generate_frame(house, channel, temp_c, nib7)
+                except ValueError:
+                    unknown += 1
+                    continue
                 
                 # Comparar (15 nibbles)
                 captured_15 = captured[:15]
@@ -175,6 +149,7 @@ def verify_generator():
     print(f"\nTotal: {total} trames")
     print(f"Matches: {matches} ({matches/total*100:.2f}%)")
     print(f"Errors: {total-matches}")
+    print(f"Sense P coneguda (no comptades): {unknown}")
     
     print(f"\nPer Nib7:")
     for nib7 in sorted(total_by_nib7.keys()):
@@ -186,8 +161,7 @@ def verify_generator():
             print(f"  {status} Nib7={nib7:X}: {success}/{total_by_nib7[nib7]} ({pct:.1f}%)")
 
 if __name__ == "__main__":
-    print("Carregant LUT base...")
-    load_p_lut_base()
+    print(f"LUT omplerta: {len(P_FILLED)} taules (house, nib7)")
     
     print(f"\nTaula de transformació XOR:")
     for nib7, xor_val in sorted(NIB7_XOR_TABLE.items()):
@@ -2,25 +2,42 @@
 """
 Prepara el dataset 'Golden Master' per a l'anàlisi de força bruta.
 Llegeix els CSVs, filtra outliers, i guarda en format optimitzat.
+
+Resolució de conflictes (mateix house/temp_idx amb (M, P) diferents), en una
+sola passada agrupada amb NumPy:
+  --policy majority  es queda el valor més freqüent (empat: el primer vist)
+  --policy strict    descarta el punt, com abans
+
+Columnes afegides a golden_master.csv:
+  support     observacions del valor triat
+  total       observacions del punt
+  confidence  support / total
+  alternates  altres valors com 'm:p:n' separats per ';'
+
+Ús:
+  python3 prepare_data.py [--policy majority|strict]
 """
 
+import argparse
 import csv
 from pathlib import Path
-from collections import defaultdict
+
+import numpy as np
 
 BASE_DIR = Path(__file__).parent.parent
 OUTPUT_FILE = BASE_DIR / "04_universal_mp_analysis" / "golden_master.csv"
 
-def load_and_clean_data():
+FIELDNAMES = ['house', 'temp_idx', 'temp_c', 'm', 'p', 'support', 'total', 'confidence', 'alternates']
+
+def read_observations():
+    """Arrays (house, temp_idx, m, p) de totes les observacions, en ordre de lectura."""
     CSV_FILES = [
         BASE_DIR / "ec40_live.csv",
         BASE_DIR / "ec40_live_1.csv", 
         BASE_DIR / "ec40_capturas_merged.csv"
     ]
     
-    # Utilitzem un diccionari per filtrar duplicats i conflictes
-    # Key: (house, temp_idx) -> Value: list of (m, p)
-    data_map = defaultdict(list)
+    houses, temps, ms, ps = [], [], [], []
     
     for csv_file in CSV_FILES:
         if not csv_file.exists():
@@ -43,38 +60,101 @@ def load_and_clean_data():
                     m = (r12 >> 4) & 0xF
                     p = r12 & 0xF
                     
-                    data_map[(house, temp_idx)].append((m, p))
-                    
                 except (ValueError, KeyError, TypeError):
                     continue
+                houses.append(house)
+                temps.append(temp_idx)
+                ms.append(m)
+                ps.append(p)
     
-    # Processar conflictes
-    clean_data = []
-    conflicts = 0
+    return (np.asarray(houses, dtype=np.int64), np.asarray(temps, dtype=np.int64),
+            np.asarray(ms, dtype=np.int64), np.asarray(ps, dtype=np.int64))
+
+def resolve_conflicts(house, temp_idx, m, p, policy='majority'):
+    """
+    Agrupa per (house, temp_idx) i tria un (M, P) per grup.
+    Retorna un dict de columnes (arrays), un grup per fila, en l'ordre en
+    què cada punt apareix per primer cop.
+    """
+    n = len(house)
+    if n == 0:
+        return {k: np.zeros(0) for k in FIELDNAMES}
     
-    for (house, temp_idx), values in data_map.items():
-        # Comprovar si tots els valors són iguals
-        unique_values = set(values)
-        
-        if len(unique_values) == 1:
-            m, p = list(unique_values)[0]
-            clean_data.append({
-                'house': house,
-                'temp_idx': temp_idx,
-                'temp_c': (temp_idx / 10.0) - 40.0,
-                'm': m,
-                'p': p
-            })
-        else:
-            # Conflicte! (mateix house/temp, diferent M/P)
-            # Això sol passar amb l'oscil·lació 3/4 en M
-            # O soroll en P
-            # Per ara, els descartem per no contaminar l'anàlisi
-            conflicts += 1
-            # Opcional: Podríem agafar el valor més freqüent
+    # Identificador de grup i de valor (m, p) -> 0..255
+    _, first_obs, group = np.unique(np.stack([house, temp_idx], axis=1), axis=0,
+                                    return_index=True, return_inverse=True)
+    group = group.ravel()
+    value = m * 16 + p
+    
+    # Recompte per (grup, valor), amb la primera aparició per desempatar
+    pair_keys, pair_first, pair_count = np.unique(group * 256 + value,
+                                                  return_index=True, return_counts=True)
+    pair_group = pair_keys // 256
+    pair_value = pair_keys % 256
+    
+    # Ordenar cada grup per freqüència descendent i primera aparició
+    order = np.lexsort((pair_first, -pair_count, pair_group))
+    pair_group, pair_value = pair_group[order], pair_value[order]
+    pair_count, pair_first = pair_count[order], pair_first[order]
+    is_best = np.r_[True, pair_group[1:] != pair_group[:-1]]
+    
+    n_groups = len(first_obs)
+    total = np.bincount(group, minlength=n_groups)
+    distinct = np.bincount(pair_group, minlength=n_groups)
+    best_value = pair_value[is_best]
+    support = pair_count[is_best]
+    
+    # Alternatives: la resta de parelles de cada grup
+    alternates = [[] for _ in range(n_groups)]
+    for g, v, c in zip(pair_group[~is_best], pair_value[~is_best], pair_count[~is_best]):
+        alternates[g].append(f"{v >> 4}:{v & 0xF}:{c}")
+    
+    keep = np.ones(n_groups, dtype=bool) if policy == 'majority' else distinct == 1
+    out_order = np.argsort(first_obs, kind='stable')
+    out_order = out_order[keep[out_order]]
+    
+    g_house = house[first_obs]
+    g_temp = temp_idx[first_obs]
+    return {
+        'house': g_house[out_order],
+        'temp_idx': g_temp[out_order],
+        'temp_c': (g_temp[out_order] / 10.0) - 40.0,
+        'm': best_value[out_order] >> 4,
+        'p': best_value[out_order] & 0xF,
+        'support': support[out_order],
+        'total': total[out_order],
+        'confidence': support[out_order] / total[out_order],
+        'alternates': [';'.join(alternates[g]) for g in out_order],
+    }
+
+def load_and_clean_data(policy='majority'):
+    house, temp_idx, m, p = read_observations()
+    cols = resolve_conflicts(house, temp_idx, m, p, policy)
+    
+    n_points = len(np.unique(np.stack([house, temp_idx], axis=1), axis=0)) if len(house) else 0
+    kept = len(cols['house'])
+    conflicts = int(np.count_nonzero(cols['confidence'] < 1.0)) if policy == 'majority' else n_points - kept
+    
+    clean_data = [
+        {
+            'house': int(cols['house'][i]),
+            'temp_idx': int(cols['temp_idx'][i]),
+            'temp_c': float(cols['temp_c'][i]),
+            'm': int(cols['m'][i]),
+            'p': int(cols['p'][i]),
+            'support': int(cols['support'][i]),
+            'total': int(cols['total'][i]),
+            'confidence': round(float(cols['confidence'][i]), 4),
+            'alternates': cols['alternates'][i],
+        }
+        for i in range(kept)
+    ]
             
-    print(f"Processats {len(data_map)} punts únics (House+Temp).")
-    print(f"Descartats {conflicts} punts per conflictes/inconsistència.")
+    print(f"Processats {len(house)} observacions, {n_points} punts únics (House+Temp).")
+    if policy == 'majority':
+        print(f"Resolts per majoria {conflicts} punts amb conflictes (oscil·lació 3/4 en M o soroll en P).")
+    else:
+        print(f"Descartats {conflicts} punts per conflictes/inconsistència.")
     print(f"Dataset final: {len(clean_data)} registres.")
     
     return clean_data
@@ -84,18 +164,20 @@ def save_golden_master(data):
         print("No hi ha dades per guardar!")
         return
         
-    fieldnames = ['house', 'temp_idx', 'temp_c', 'm', 'p']
-    
     # Assegurar directori
     OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
     
     with open(OUTPUT_FILE, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
         writer.writeheader()
         writer.writerows(data)
         
     print(f"Guardat a: {OUTPUT_FILE}")
 
 if __name__ == "__main__":
-    data = load_and_clean_data()
+    ap = argparse.ArgumentParser(description="Prepara golden_master.csv")
+    ap.add_argument("--policy", choices=("majority", "strict"), default="majority",
+                    help="majority: valor més freqüent; strict: descartar punts amb conflictes")
+    args = ap.parse_args()
+    data = load_and_clean_data(args.policy)
     save_golden_master(data)
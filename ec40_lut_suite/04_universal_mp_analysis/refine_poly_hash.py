@@ -1,123 +1,98 @@
 #!/usr/bin/env python3
 """
 Refinem el Hash Polinomial (49.3%) afegint transformacions.
+
+Les dades surten de la matriu de nibbles mapejada en memòria
+(04_utilities/nibble_matrix.py); cada variant s'avalua sobre totes les
+files alhora.
 """
 
-import csv
+import sys
 from pathlib import Path
 
+import numpy as np
+
 BASE_DIR = Path(__file__).parent.parent
 DATA_FILE = BASE_DIR / "ec40_capturas_merged.csv"
 
-def polynomial_hash(data, poly):
-    """Hash polinomial sobre nibbles."""
-    h = 0
-    for nibble in data:
-        h = ((h << 4) ^ nibble) & 0xFF
-        if h & 0x80:
-            h ^= poly
+sys.path.insert(0, str(BASE_DIR / "04_utilities"))
+
+from nibble_matrix import load_matrix
+
+def polynomial_hash(nibbles, poly, init=0):
+    """Hash polinomial de cada fila d'una matriu N×16 de nibbles."""
+    h = np.full(len(nibbles), init, dtype=np.int32)
+    for j in range(nibbles.shape[1]):
+        h = ((h << 4) ^ nibbles[:, j]) & 0xFF
+        h = np.where(h & 0x80, h ^ poly, h)
     return h & 0xF
 
 def load_data():
-    data = []
-    with open(DATA_FILE, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            try:
-                house = int(row['house'])
-                temp_c = float(row['temperature_C'])
-                payload_hex = row['payload64_hex']
-                r12_val = int(row['R12'], 16)
-                
-                r1 = (r12_val >> 8) & 0xF
-                m = (r12_val >> 4) & 0xF
-                p = r12_val & 0xF
-                
-                nibbles = [int(c, 16) for c in payload_hex]
-                t_idx = int(round((temp_c + 40) * 10))
-                
-                data.append({
-                    'house': house,
-                    'temp_c': temp_c,
-                    'temp_idx': t_idx,
-                    'nibbles': nibbles,
-                    'r1': r1,
-                    'm': m,
-                    'p': p
-                })
-            except (ValueError, KeyError):
-                continue
-    return data
+    """Columnes de totes les trames; R1/M/P com la columna R12 (nibbles 7, 14 i 15)."""
+    mx = load_matrix(DATA_FILE)
+    nibbles = mx['nibbles'].astype(np.int32)
+    return {
+        'house': mx['house'].astype(np.int32),
+        'temp_idx': mx['temp_idx'],
+        'nibbles': nibbles,
+        'r1': nibbles[:, 7],
+        'm': nibbles[:, 14],
+        'p': nibbles[:, 15]
+    }
 
 def refine_polynomial_hash():
     data = load_data()
-    data_247 = [d for d in data if d['house'] == 247]
+    sel = data['house'] == 247
+    data_247 = {k: v[sel] for k, v in data.items()}
+    n = int(sel.sum())
     
-    print(f"Dataset House 247: {len(data_247)} registres\n")
+    print(f"Dataset House 247: {n} registres\n")
     
     best_poly = 0x07
     
     print(f"Refinant Hash Polinomial (Poly 0x{best_poly:02X})...\n")
     
+    h = polynomial_hash(data_247['nibbles'], best_poly)
+    house = data_247['house']
+    p = data_247['p']
+    
+    def score_of(pred):
+        return np.count_nonzero(pred == p) / n
+    
     # 1. Hash ^ House bits
     for mask in range(16):
-        matches = 0
-        for d in data_247:
-            h = polynomial_hash(d['nibbles'], best_poly)
-            p_pred = h ^ ((d['house'] >> mask) & 0xF) if mask < 8 else h ^ (d['house'] & 0xF)
-            if p_pred == d['p']: matches += 1
-            
-        score = matches / len(data_247)
+        p_pred = h ^ ((house >> mask) & 0xF) if mask < 8 else h ^ (house & 0xF)
+        score = score_of(p_pred)
         if score > 0.5:
             print(f"  Hash ^ (House >> {mask if mask < 8 else 0} & 0xF): {score*100:.1f}%")
     
     print()
     
     # 2. Hash ^ M
-    matches = sum(1 for d in data_247 if (polynomial_hash(d['nibbles'], best_poly) ^ d['m']) == d['p'])
-    print(f"  Hash ^ M: {matches/len(data_247)*100:.1f}%")
+    print(f"  Hash ^ M: {score_of(h ^ data_247['m'])*100:.1f}%")
     
     # 3. Hash ^ R1
-    matches = sum(1 for d in data_247 if (polynomial_hash(d['nibbles'], best_poly) ^ d['r1']) == d['p'])
-    print(f"  Hash ^ R1: {matches/len(data_247)*100:.1f}%")
+    print(f"  Hash ^ R1: {score_of(h ^ data_247['r1'])*100:.1f}%")
     
     # 4. Hash + offset
     print()
     for offset in range(16):
-        matches = sum(1 for d in data_247 if ((polynomial_hash(d['nibbles'], best_poly) + offset) & 0xF) == d['p'])
-        score = matches / len(data_247)
+        score = score_of((h + offset) & 0xF)
         if score > 0.5:
             print(f"  Hash + {offset}: {score*100:.1f}%")
     
     # 5. Hash amb diferents seeds (XOR inicial)
     print("\n  Provant Hash amb seed inicial...")
-    test_seeds = [data_247[0]['house'] & 0xF, data_247[0]['m']]
+    test_seeds = [int(house[0]) & 0xF, int(data_247['m'][0])]
     for seed in test_seeds:
-        # Modificar hash per incloure seed
-        matches = 0
-        for d in data_247:
-            h = seed
-            for nibble in d['nibbles']:
-                h = ((h << 4) ^ nibble) & 0xFF
-                if h & 0x80:
-                    h ^= best_poly
-            h &= 0xF
-            if h == d['p']: matches += 1
-            
-        score = matches / len(data_247)
+        score = score_of(polynomial_hash(data_247['nibbles'], best_poly, init=seed))
         if score > 0.5:
             print(f"    Seed {seed}: {score*100:.1f}%")
     
     # 6. Provar tots els polinomis amb XOR M
     print("\n  Provant altres polys amb XOR M...")
     for poly in range(256):
-        matches = 0
-        for d in data_247:
-            h = polynomial_hash(d['nibbles'], poly)
-            p_pred = h ^ d['m']
-            if p_pred == d['p']: matches += 1
-            
-        score = matches / len(data_247)
+        score = score_of(polynomial_hash(data_247['nibbles'], poly) ^ data_247['m'])
         if score > 0.9:
             print(f"    ✨ TROBAT! Poly 0x{poly:02X}, Hash ^ M: {score*100:.1f}%")
             return
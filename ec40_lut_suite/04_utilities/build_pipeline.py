@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Ejecutor del grafo de artefactos derivados de ec40_lut_suite.
+
+Cada paso declara su script productor, sus entradas y sus salidas. La clave
+de un paso es el hash (BLAKE2b) del script, de sus argumentos, del
+contenido de cada entrada y de los módulos de la suite que el script
+importa (directa o indirectamente, resolviendo sus sys.path.insert); si
+coincide con la de la última ejecución y las salidas siguen intactas, el
+paso se salta. Como las dependencias se deducen
+de entradas/salidas y se comparan por contenido, un paso que regenera un
+fichero idéntico no obliga a rehacer los siguientes.
+
+Los pasos independientes se lanzan en paralelo (--jobs). El estado se
+guarda en .build_state.json, en la raíz de la suite.
+
+Uso:
+  python3 build_pipeline.py                 # todo lo que esté desactualizado
+  python3 build_pipeline.py verification_table --jobs 4
+  python3 build_pipeline.py --list
+  python3 build_pipeline.py --dry-run
+  python3 build_pipeline.py --force r12_lut
+"""
+
+import argparse
+import ast
+import glob
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+SUITE_DIR = Path(__file__).parent.parent
+STATE_FILE = SUITE_DIR / ".build_state.json"
+
+MERGED = "ec40_capturas_merged.csv"
+
+
+def _path_value(node, names, file):
+    """Ruta de una expresión como str(Path(__file__).parent / "x"); None si no se puede evaluar."""
+    if isinstance(node, ast.Name):
+        return file if node.id == "__file__" else names.get(node.id)
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.Attribute) and node.attr == "parent":
+        base = _path_value(node.value, names, file)
+        return Path(base).parent if base is not None else None
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Div):
+        a, b = _path_value(node.left, names, file), _path_value(node.right, names, file)
+        return Path(a) / b if a is not None and b is not None else None
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in ("Path", "str") \
+            and len(node.args) == 1:
+        return _path_value(node.args[0], names, file)
+    return None
+
+
+def local_imports(script):
+    """
+    Módulos de la suite que importa script, directa o indirectamente (rutas
+    relativas a SUITE_DIR, ordenadas). Se buscan en el directorio del script
+    y en los que añaden los sys.path.insert de cada módulo recorrido.
+    """
+    main = (SUITE_DIR / script).resolve()
+    search = [main.parent]
+    found, stack = set(), [main]
+    while stack:
+        path = stack.pop()
+        try:
+            tree = ast.parse(path.read_text(encoding="utf-8"))
+        except (OSError, SyntaxError, ValueError):
+            continue
+        names, modules = {}, []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+                value = _path_value(node.value, names, path)
+                if value is not None:
+                    names[node.targets[0].id] = value
+            elif isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == "insert" \
+                    and ast.unparse(node.func.value) == "sys.path" and len(node.args) == 2:
+                value = _path_value(node.args[1], names, path)
+                if value is not None and Path(value).resolve() not in search:
+                    search.insert(0, Path(value).resolve())
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                modules.append(node.module.split(".")[0])
+            elif isinstance(node, ast.Import):
+                modules += [a.name.split(".")[0] for a in node.names]
+        for mod in modules:
+            for d in search:
+                cand = d / f"{mod}.py"
+                if cand.is_file() and cand != main and cand not in found:
+                    if cand.is_relative_to(SUITE_DIR.resolve()):
+                        found.add(cand)
+                        stack.append(cand)
+                    break
+    return sorted(str(p.relative_to(SUITE_DIR.resolve())) for p in found)
+
+
+class Step:
+    """
+    Un artefacto derivado. Rutas relativas a SUITE_DIR; las entradas admiten
+    patrones glob. '{inputs}' en args se sustituye por las entradas resueltas.
+    Un paso con patrones que no encuentran nada ('sin entradas') se salta y
+    sus salidas se tratan como datos de partida. Los módulos que importa el
+    script cuentan como entradas sin declararlos (imports).
+    """
+
+    def __init__(self, name, script, inputs=(), outputs=(), args=(), exclude=()):
+        self.name = name
+        self.script = script
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.args = list(args)
+        self.exclude = list(exclude)
+        self._imports = None
+
+    @property
+    def imports(self):
+        if self._imports is None:
+            self._imports = local_imports(self.script)
+        return self._imports
+
+    def resolve_inputs(self):
+        files = []
+        for pattern in self.inputs:
+            if glob.has_magic(pattern):
+                matches = sorted(glob.glob(pattern, root_dir=SUITE_DIR))
+                excluded = {m for ex in self.exclude for m in glob.glob(ex, root_dir=SUITE_DIR)}
+                files += [m for m in matches if m not in excluded]
+            else:
+                files.append(pattern)
+        return files
+
+    def command(self, inputs):
+        args = []
+        for a in self.args:
+            args += inputs if a == "{inputs}" else [a]
+        return [sys.executable, self.script] + args
+
+
+STEPS = [
+    Step("merged", "01_data_capture/merge_ec40_csvs.py",
+         inputs=["ec40_capturas_*.csv"], exclude=["ec40_capturas_merged*.csv"],
+         outputs=[MERGED], args=["{inputs}", "-o", MERGED]),
+    Step("merged_clean", "03_house_correlation/detect_outliers_find_rule.py",
+         inputs=[MERGED], outputs=["ec40_capturas_merged_clean.csv"], args=[MERGED]),
+    Step("golden_master", "04_universal_mp_analysis/prepare_data.py",
+         inputs=["ec40_live.csv", "ec40_live_1.csv", MERGED],
+         outputs=["04_universal_mp_analysis/golden_master.csv"]),
+    Step("r12_lut", "02_table_analysis/build_r12_lut.py",
+         inputs=[MERGED], outputs=["r12_lut.json", "02_table_analysis/r12_lut.py"],
+         args=[MERGED, "--json", "r12_lut.json", "--py", "02_table_analysis/r12_lut.py"]),
+    Step("p_table_247_h", "02_table_analysis/build_p_table_h.py",
+         inputs=["01_data_capture/tramas_thn132n.csv"], outputs=["oregon_p_table_247.h"]),
+    Step("p_lut_complete", "04_universal_mp_analysis/generate_complete_p_lut.py",
+         inputs=[MERGED], outputs=["04_universal_mp_analysis/Docs/oregon_p_lut_complete.py"]),
+    Step("verification_table", "04_universal_mp_analysis/generate_verification_table.py",
+         inputs=[MERGED, "ec40_capturas_merged_clean.csv", "ec40_live.csv", "ec40_live_1.csv",
+                 "01_data_capture/tramas_thn132n.csv",
+                 "04_universal_mp_analysis/Docs/oregon_p_lut_complete.py"],
+         outputs=["04_universal_mp_analysis/Docs/verification_table.csv",
+                  "04_universal_mp_analysis/Docs/verification_table.md"]),
+    Step("p_lut_filled", "04_universal_mp_analysis/fill_lut_gaps.py",
+         inputs=[MERGED, "ec40_live.csv", "ec40_live_1.csv", "01_data_capture/tramas_thn132n.csv",
+                 "04_universal_mp_analysis/Docs/oregon_p_lut_complete.py"],
+         outputs=["04_universal_mp_analysis/Docs/oregon_p_lut_filled.py"]),
+    Step("pm_tables", "04_utilities/table_bundle.py",
+         inputs=[MERGED, "ec40_live.csv", "ec40_live_1.csv", "01_data_capture/tramas_thn132n.csv"],
+         outputs=["tables/ec40_pm_tables.bin", "tables/ec40_pm_tables.h"]),
+    Step("p_progmem", "04_utilities/progmem_tables.py",
+         inputs=[MERGED, "ec40_live.csv", "ec40_live_1.csv", "01_data_capture/tramas_thn132n.csv",
+                 "04_universal_mp_analysis/Docs/oregon_p_lut_complete.py"],
+         outputs=["../attiny/ec40_p_progmem.h"]),
+]
+
+
+class BuildState:
+    """Claves por paso y caché de hashes por (tamaño, mtime) para no releer ficheros sin cambios."""
+
+    def __init__(self, path=STATE_FILE):
+        self.path = Path(path)
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        self.files = data.get("files", {})
+        self.steps = data.get("steps", {})
+
+    def digest(self, rel):
+        """Hash del contenido de un fichero (None si no existe)."""
+        path = SUITE_DIR / rel
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        sig = [st.st_size, st.st_mtime_ns]
+        cached = self.files.get(rel)
+        if cached and cached[:2] == sig:
+            return cached[2]
+        h = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        self.files[rel] = sig + [h.hexdigest()]
+        return h.hexdigest()
+
+    def step_key(self, step, inputs):
+        h = hashlib.blake2b(digest_size=16)
+        for part in [step.script, self.digest(step.script) or ""] + step.command(inputs)[2:]:
+            h.update(part.encode() + b"\0")
+        for rel in sorted(set(inputs) | set(step.imports)):
+            h.update(f"{rel}={self.digest(rel)}\0".encode())
+        return h.hexdigest()
+
+    def is_current(self, step, key):
+        rec = self.steps.get(step.name)
+        if not rec or rec["key"] != key:
+            return False
+        return all(self.digest(o) == rec["outputs"].get(o) for o in step.outputs)
+
+    def record(self, step, key):
+        self.steps[step.name] = {"key": key, "outputs": {o: self.digest(o) for o in step.outputs}}
+
+    def save(self):
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump({"files": self.files, "steps": self.steps}, f, indent=1)
+        os.replace(tmp, self.path)
+
+
+def dependencies(steps):
+    """name -> nombres de los pasos que producen alguna de sus entradas."""
+    producer = {o: s.name for s in steps for o in s.outputs}
+    deps = {}
+    for s in steps:
+        deps[s.name] = {producer[i] for i in s.inputs + s.imports if i in producer and producer[i] != s.name}
+    return deps
+
+
+def select_steps(steps, targets):
+    """Los pasos pedidos y todos sus antecesores, en el orden de STEPS."""
+    if not targets:
+        return list(steps)
+    by_name = {s.name: s for s in steps}
+    unknown = [t for t in targets if t not in by_name]
+    if unknown:
+        raise SystemExit(f"Pasos desconocidos: {', '.join(unknown)} (ver --list)")
+    deps = dependencies(steps)
+    wanted, stack = set(), list(targets)
+    while stack:
+        name = stack.pop()
+        if name not in wanted:
+            wanted.add(name)
+            stack.extend(deps[name])
+    return [s for s in steps if s.name in wanted]
+
+
+def run_step(step, inputs):
+    """Ejecuta el productor en SUITE_DIR. Devuelve (returncode, salida, segundos)."""
+    t0 = time.perf_counter()
+    proc = subprocess.run(step.command(inputs), cwd=SUITE_DIR, capture_output=True, text=True)
+    return proc.returncode, proc.stdout + proc.stderr, time.perf_counter() - t0
+
+
+def run_pipeline(steps, jobs=None, force=False, dry_run=False, verbose=False):
+    """
+    Ejecuta el grafo. Devuelve {paso: (estado, segundos)} con estado en
+    'ejecutado', 'al día', 'sin entradas', 'error', 'bloqueado' o 'pendiente' (dry-run).
+    """
+    state = BuildState()
+    deps = dependencies(steps)
+    deps = {name: d & {s.name for s in steps} for name, d in deps.items()}
+    results = {}
+    pending = {s.name: s for s in steps}
+    running = {}
+    rebuilt = set()
+
+    def settle(step):
+        """Decide qué hacer con un paso cuyas dependencias ya terminaron."""
+        if any(results[d][0] in ("error", "bloqueado") for d in deps[step.name]):
+            results[step.name] = ("bloqueado", 0.0)
+            return None
+        inputs = step.resolve_inputs()
+        if not inputs:
+            results[step.name] = ("sin entradas", 0.0)
+            return None
+        missing = [i for i in inputs if state.digest(i) is None]
+        if dry_run and (missing or deps[step.name] & rebuilt):
+            results[step.name] = ("pendiente", 0.0)
+            rebuilt.add(step.name)
+            return None
+        if missing:
+            print(f"[{step.name}] faltan entradas: {', '.join(missing)}")
+            results[step.name] = ("error", 0.0)
+            return None
+        key = state.step_key(step, inputs)
+        if not force and state.is_current(step, key):
+            results[step.name] = ("al día", 0.0)
+            return None
+        if dry_run:
+            results[step.name] = ("pendiente", 0.0)
+            rebuilt.add(step.name)
+            return None
+        return inputs, key
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            for name in list(pending):
+                if all(d in results for d in deps[name]):
+                    step = pending.pop(name)
+                    todo = settle(step)
+                    if todo:
+                        inputs, key = todo
+                        print(f"[{name}] ejecutando {step.script}")
+                        running[pool.submit(run_step, step, inputs)] = (step, key)
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                step, key = running.pop(fut)
+                code, output, secs = fut.result()
+                missing = [o for o in step.outputs if state.digest(o) is None]
+                if code != 0 or missing:
+                    results[step.name] = ("error", secs)
+                    tail = "\n".join(output.strip().splitlines()[-10:])
+                    print(f"[{step.name}] error (código {code}"
+                          f"{', faltan ' + ', '.join(missing) if missing else ''}):\n{tail}")
+                    continue
+                if verbose:
+                    print(output.rstrip())
+                # Los ficheros regenerados se vuelven a hashear
+                for o in step.outputs:
+                    state.files.pop(o, None)
+                state.record(step, key)
+                results[step.name] = ("ejecutado", secs)
+
+    if not dry_run:
+        state.save()
+    return results
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Regenera los artefactos derivados desactualizados")
+    ap.add_argument("targets", nargs="*", help="pasos a construir (default: todos)")
+    ap.add_argument("-j", "--jobs", type=int, default=None, help="pasos en paralelo (default: uno por CPU)")
+    ap.add_argument("--force", action="store_true", help="ejecutar aunque el paso esté al día")
+    ap.add_argument("--dry-run", action="store_true", help="solo mostrar qué se ejecutaría")
+    ap.add_argument("--list", action="store_true", help="listar pasos, entradas y salidas")
+    ap.add_argument("-v", "--verbose", action="store_true", help="mostrar la salida de cada productor")
+    args = ap.parse_args()
+
+    steps = select_steps(STEPS, args.targets)
+    if args.list:
+        deps = dependencies(STEPS)
+        for s in steps:
+            after = f"  (tras {', '.join(sorted(deps[s.name]))})" if deps[s.name] else ""
+            print(f"{s.name}: {s.script}{after}")
+            print(f"    entradas: {', '.join(s.inputs)}")
+            if s.imports:
+                print(f"    importa:  {', '.join(s.imports)}")
+            print(f"    salidas:  {', '.join(s.outputs)}")
+        return
+
+    t0 = time.perf_counter()
+    results = run_pipeline(steps, args.jobs, args.force, args.dry_run, args.verbose)
+    wall = time.perf_counter() - t0
+
+    print(f"\n{'Paso':22s} {'Estado':14s} {'Tiempo':>8s}")
+    for s in steps:
+        status, secs = results[s.name]
+        print(f"{s.name:22s} {status:14s} {secs:7.2f}s")
+    total = sum(secs for _, secs in results.values())
+    print(f"Total: {wall:.2f}s de reloj, {total:.2f}s sumando pasos")
+    if any(status in ("error", "bloqueado") for status, _ in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
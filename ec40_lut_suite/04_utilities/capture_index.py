@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Índice de consultas sobre el almacén de capturas (capture_store).
+
+Sustituye los bucles 'if house != 247: continue' y los defaultdict que cada
+script reconstruye. Se construye una vez sobre los arrays del almacén:
+
+  - dos órdenes ordenados por clave compuesta (house, nib7, temp_idx) y
+    (house, temp_idx): rangos de temperatura con np.searchsorted, O(log n)
+  - diccionarios temp_idx -> houses y (house, temp_idx) -> R12 distintos, O(1)
+
+R12 = ((byte3 & 0xF) << 8) | byte7 = nib7 << 8 | nib14 << 4 | nib15.
+
+Uso desde 03_house_correlation o 04_universal_mp_analysis:
+  sys.path.insert(0, str(Path(__file__).parent.parent / "04_utilities"))
+  from capture_index import CaptureIndex, temp_to_idx
+
+  idx = CaptureIndex()
+  rows = idx.frames(247, nib7=0x2, temp_range=(18.0, 22.5))
+  print(idx.rows(rows)["temp_c"])
+  idx.houses_at(temp_to_idx(21.5))
+  idx.r12_values(247, temp_to_idx(21.5))
+
+  python3 capture_index.py 247 --nib7 2 --temp 18 22.5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from capture_store import load_store, select
+
+# Desplazamiento para que temp_idx negativos (< -40 °C) sigan siendo positivos en la clave
+_T_OFF = 1 << 15
+
+
+def temp_to_idx(temp_c):
+    return int(round((temp_c + 40) * 10))
+
+
+def _key(house, nib7, temp_idx):
+    """Clave compuesta int64; nib7 = -1 (sin payload) queda en su propio bloque."""
+    return ((np.asarray(house, dtype=np.int64) * 32 + (np.asarray(nib7, dtype=np.int64) + 1)) << 16) \
+        + (np.asarray(temp_idx, dtype=np.int64) + _T_OFF)
+
+
+class CaptureIndex:
+    """
+    Índice inmutable sobre un almacén (dict de arrays de capture_store).
+    Las consultas devuelven índices de fila del almacén; rows() los materializa.
+    """
+
+    def __init__(self, store=None, payload_only=True):
+        self.store = load_store() if store is None else store
+        st = self.store
+        # Por defecto solo filas con payload (golden_master no tiene nibbles)
+        self.base = np.flatnonzero(st["nib7"] >= 0) if payload_only else np.arange(len(st["house"]))
+
+        house = st["house"][self.base]
+        nib7 = st["nib7"][self.base]
+        tidx = st["temp_idx"][self.base]
+
+        k1 = _key(house, nib7, tidx)
+        o1 = np.argsort(k1, kind="stable")
+        self._k1, self._o1 = k1[o1], self.base[o1]
+
+        k2 = _key(house, 0, tidx)
+        o2 = np.argsort(k2, kind="stable")
+        self._k2, self._o2 = k2[o2], self.base[o2]
+
+        # temp_idx -> houses (ordenados)
+        pairs = np.unique(np.stack([tidx, house], axis=1), axis=0)
+        self._houses_at = {}
+        for t, grp in zip(*_groups(pairs[:, 0], pairs[:, 1])):
+            self._houses_at[int(t)] = grp
+
+        # (house, temp_idx) -> R12 distintos
+        nib = st["nibbles"][self.base].astype(np.int64)
+        r12 = (nib[:, 7] << 8) | (nib[:, 14] << 4) | nib[:, 15]
+        triples = np.unique(np.stack([house, tidx, r12], axis=1), axis=0)
+        ht = triples[:, 0].astype(np.int64) * 65536 + triples[:, 1] + _T_OFF
+        self._r12 = {}
+        for k, grp in zip(*_groups(ht, triples[:, 2])):
+            self._r12[(int(k) >> 16, (int(k) & 0xFFFF) - _T_OFF)] = tuple(int(v) for v in grp)
+
+    def frames(self, house, nib7=None, temp_range=None, channel=None):
+        """
+        Filas de un house (y nib7) con temperatura en [a, b] (°C, ambos incluidos).
+        Búsqueda binaria sobre el orden correspondiente; channel filtra el resultado.
+        """
+        lo_t, hi_t = (-_T_OFF, _T_OFF - 1) if temp_range is None else \
+            (temp_to_idx(temp_range[0]), temp_to_idx(temp_range[1]))
+        if nib7 is None:
+            keys, order, n = self._k2, self._o2, 0
+        else:
+            keys, order, n = self._k1, self._o1, nib7
+        lo = np.searchsorted(keys, _key(house, n, lo_t), side="left")
+        hi = np.searchsorted(keys, _key(house, n, hi_t), side="right")
+        rows = order[lo:hi]
+        if channel is not None:
+            rows = rows[self.store["channel"][rows] == channel]
+        return rows
+
+    def houses_at(self, temp_idx):
+        """Houses con alguna trama en temp_idx (array ordenado)."""
+        return self._houses_at.get(int(temp_idx), np.zeros(0, dtype=np.int64))
+
+    def r12_values(self, house, temp_idx):
+        """R12 distintos observados para (house, temp_idx), ordenados."""
+        return self._r12.get((int(house), int(temp_idx)), ())
+
+    def rows(self, idx):
+        return select(self.store, idx)
+
+
+def _groups(keys, values):
+    """Agrupa values por keys (ambos ya ordenados por keys): (claves, lista de arrays)."""
+    keys = np.asarray(keys)
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    return keys[starts], np.split(np.asarray(values), starts[1:])
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Consultas indexadas sobre las capturas EC40")
+    ap.add_argument("house", type=int)
+    ap.add_argument("--nib7", type=lambda v: int(v, 16), default=None, help="nib7 en hex")
+    ap.add_argument("--temp", type=float, nargs=2, metavar=("A", "B"), help="rango de temperatura °C")
+    ap.add_argument("--channel", type=int, default=None)
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    index = CaptureIndex()
+    t1 = time.perf_counter()
+    rows = index.frames(args.house, args.nib7, args.temp, args.channel)
+    t2 = time.perf_counter()
+
+    sel = index.rows(rows)
+    print(f"Índice construido en {(t1 - t0) * 1000:.1f} ms; consulta en {(t2 - t1) * 1e6:.0f} µs")
+    print(f"{len(rows)} tramas del house {args.house}")
+    for tidx in np.unique(sel["temp_idx"])[:20]:
+        r12 = ", ".join(f"0x{v:03X}" for v in index.r12_values(args.house, tidx))
+        houses = ", ".join(str(h) for h in index.houses_at(tidx))
+        print(f"  {tidx / 10 - 40:6.1f}°C  R12: {r12:30s} houses: {houses}")
+
+
+if __name__ == "__main__":
+    main()
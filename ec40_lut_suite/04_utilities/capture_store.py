@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Almacén columnar único de capturas EC40 (caché .npz) con un solo cargador.
+
+Cada script de análisis leía por su cuenta ec40_capturas_merged.csv,
+ec40_live.csv, golden_master.csv o tramas_thn132n.csv, con nombres de
+columna distintos y int(c, 16) por nibble. Aquí todas las fuentes se
+materializan una vez en arrays tipados y se guardan en capture_store.npz;
+las siguientes cargas tardan milisegundos. Si un CSV cambia (tamaño o
+mtime), solo esa fuente se vuelve a leer.
+
+Columnas (un array de NumPy por clave, N filas):
+  house     int16    house code
+  channel   int8     canal (-1 si la fuente no lo tiene)
+  temp_c    float32  temperatura
+  temp_idx  int16    round((t + 40) * 10)
+  nib7      int8     nibble 7 del payload (-1 si no hay payload)
+  nibbles   int8     N×16 nibbles del payload EC40 (-1 si no hay payload)
+  r1, m, p  int8     nibbles 12, 13 y 14 (golden_master solo trae M/P)
+  ts        int64    epoch del timestamp (0 si no hay)
+  source    int8     índice en store["sources"]
+
+Uso:
+  from capture_store import load_store, select
+  st = load_store()
+  live = select(st, st["source"] == st["sources"].index("ec40_live.csv"))
+  real = select(st, captured(st))     # sin las tramas del generador
+
+  python3 capture_store.py            # construye/actualiza y resume
+  python3 capture_store.py --rebuild  # fuerza la reconstrucción
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from ec40_codec import hex_column
+
+BASE_DIR = Path(__file__).parent.parent
+CACHE_FILE = BASE_DIR / "capture_store.npz"
+
+# nombre -> ruta; el nombre es lo que se guarda en 'sources'
+SOURCES = {
+    "ec40_capturas_merged.csv": BASE_DIR / "ec40_capturas_merged.csv",
+    "ec40_live.csv": BASE_DIR / "ec40_live.csv",
+    "ec40_live_1.csv": BASE_DIR / "ec40_live_1.csv",
+    "tramas_thn132n.csv": BASE_DIR / "01_data_capture" / "tramas_thn132n.csv",
+    "golden_master.csv": BASE_DIR / "04_universal_mp_analysis" / "golden_master.csv",
+}
+
+# Fuentes con tramas recibidas de verdad; tramas_thn132n.csv sale del
+# generador y golden_master.csv se deriva de las capturas
+CAPTURE_SOURCES = ("ec40_capturas_merged.csv", "ec40_live.csv", "ec40_live_1.csv")
+
+COLUMNS = {
+    "house": np.int16,
+    "channel": np.int8,
+    "temp_c": np.float32,
+    "temp_idx": np.int16,
+    "nib7": np.int8,
+    "r1": np.int8,
+    "m": np.int8,
+    "p": np.int8,
+    "ts": np.int64,
+    "source": np.int8,
+}
+
+TIME_FMT = "%Y-%m-%d %H:%M:%S"
+
+
+def _signature(path):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _epoch(stamp):
+    try:
+        return int(time.mktime(time.strptime(stamp.strip()[:19], TIME_FMT)))
+    except (AttributeError, ValueError):
+        return 0
+
+
+def _read_rows(path):
+    """
+    Filas normalizadas (ts, payload_hex, house, channel, temp, m, p) de
+    cualquiera de los esquemas de captura; m/p solo en golden_master.
+    """
+    with open(path, "r", newline="") as f:
+        first = ""
+        for first in f:
+            if first.strip():
+                break
+        f.seek(0)
+        if first.strip() and not first[0].isalpha():
+            # ec40_live_1.csv: sin cabecera (ts, raw168, raw64, temp, channel, house, ...)
+            for parts in csv.reader(f):
+                if len(parts) >= 6:
+                    yield parts[0], parts[2], parts[5], parts[4], parts[3], None, None
+            return
+
+        for row in csv.DictReader(f):
+            if "payload64_hex" in row:
+                yield (row.get("timestamp", ""), row["payload64_hex"], row["house"],
+                       row["channel"], row["temperature_C"], None, None)
+            elif "raw64" in row:
+                yield (row["timestamp"], row["raw64"], row["house_code"],
+                       row["channel"], row["temp"], None, None)
+            elif "ec40_hex" in row:
+                yield "", row["ec40_hex"], row["device_id"], row["channel"], row["temperatura"], None, None
+            elif "temp_idx" in row:
+                yield "", "", row["house"], "", row["temp_c"], row["m"], row["p"]
+
+
+def read_source(path, index=0):
+    """Lee una fuente CSV y devuelve sus columnas como arrays."""
+    ts, payloads, house, channel, temp, m_col, p_col = [], [], [], [], [], [], []
+    for stamp, payload, h, ch, t, m, p in _read_rows(path):
+        try:
+            house_i = int(h)
+            temp_f = float(t)
+        except (TypeError, ValueError):
+            continue
+        ts.append(_epoch(stamp) if stamp else 0)
+        payloads.append(payload)
+        house.append(house_i)
+        channel.append(int(ch) if ch not in (None, "") else -1)
+        temp.append(temp_f)
+        m_col.append(int(m) if m not in (None, "") else -1)
+        p_col.append(int(p) if p not in (None, "") else -1)
+
+    n = len(house)
+    arr, valid = hex_column(payloads, 8)
+    nibbles = np.full((n, 16), -1, dtype=np.int8)
+    nibbles[valid, 0::2] = arr[valid] >> 4
+    nibbles[valid, 1::2] = arr[valid] & 0x0F
+
+    temp_c = np.asarray(temp, dtype=np.float32)
+    cols = {
+        "house": np.asarray(house),
+        "channel": np.asarray(channel),
+        "temp_c": temp_c,
+        "temp_idx": np.rint((np.asarray(temp, dtype=np.float64) + 40) * 10),
+        "nib7": nibbles[:, 7],
+        "r1": nibbles[:, 12],
+        "m": np.where(valid, nibbles[:, 13], np.asarray(m_col, dtype=np.int8)),
+        "p": np.where(valid, nibbles[:, 14], np.asarray(p_col, dtype=np.int8)),
+        "ts": np.asarray(ts),
+        "source": np.full(n, index),
+    }
+    out = {k: np.asarray(v).astype(COLUMNS[k]) for k, v in cols.items()}
+    out["nibbles"] = nibbles
+    return out
+
+
+def _empty():
+    out = {k: np.zeros(0, dtype=dt) for k, dt in COLUMNS.items()}
+    out["nibbles"] = np.zeros((0, 16), dtype=np.int8)
+    return out
+
+
+def select(store, mask):
+    """Subconjunto de filas (máscara booleana o índices) de todas las columnas."""
+    out = {k: store[k][mask] for k in list(COLUMNS) + ["nibbles"]}
+    out["sources"] = store["sources"]
+    return out
+
+
+def captured(store, names=CAPTURE_SOURCES):
+    """Máscara de las filas que vienen de capturas reales (names)."""
+    keep = [i for i, n in enumerate(store["sources"]) if n in names]
+    return np.isin(store["source"], keep)
+
+
+def _load_cache(cache):
+    try:
+        with np.load(cache, allow_pickle=False) as z:
+            data = {k: z[k] for k in z.files}
+        manifest = json.loads(str(data.pop("manifest")))
+        return data, manifest
+    except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+        # Caché ausente, truncada o de otra versión: se reconstruye
+        return None, None
+
+
+def _save_cache(cache, manifest, store):
+    """Escribe el .npz de forma atómica: un proceso que lo lea a la vez ve el viejo o el nuevo."""
+    cache = Path(cache)
+    tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            np.savez(f, manifest=np.array(manifest), **store)
+        os.replace(tmp, cache)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def load_store(sources=None, cache=CACHE_FILE, rebuild=False, verbose=False):
+    """
+    Devuelve el almacén como dict de arrays (más 'sources', lista de nombres).
+    Solo se releen las fuentes cuyo tamaño o mtime cambió desde la caché;
+    si nada cambió, es una lectura directa del .npz.
+    """
+    sources = SOURCES if sources is None else sources
+    names = [n for n, p in sources.items() if Path(p).exists()]
+    sigs = {n: _signature(sources[n]) for n in names}
+
+    cached, manifest = (None, None) if rebuild else _load_cache(cache)
+    if cached is not None and manifest.get("sources") == names and manifest.get("sigs") == sigs:
+        cached["sources"] = names
+        return cached
+
+    old_names = manifest.get("sources", []) if manifest else []
+    old_sigs = manifest.get("sigs", {}) if manifest else {}
+    if cached is not None:
+        cached["sources"] = old_names
+    parts = []
+    for i, name in enumerate(names):
+        if cached is not None and name in old_names and old_sigs.get(name) == sigs[name]:
+            part = select(cached, cached["source"] == old_names.index(name))
+            part["source"] = np.full(len(part["house"]), i, dtype=COLUMNS["source"])
+            state = "caché"
+        else:
+            part = read_source(sources[name], i)
+            state = "leída"
+        if verbose:
+            print(f"  {name}: {len(part['house'])} filas ({state})")
+        parts.append(part)
+
+    store = _empty()
+    if parts:
+        store = {k: np.concatenate([p[k] for p in parts]) for k in store}
+
+    manifest = json.dumps({"sources": names, "sigs": sigs})
+    _save_cache(cache, manifest, store)
+    store["sources"] = names
+    return store
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Almacén columnar de capturas EC40")
+    ap.add_argument("--rebuild", action="store_true", help="reconstruir la caché desde cero")
+    ap.add_argument("--cache", default=str(CACHE_FILE), help=f"fichero .npz (default: {CACHE_FILE.name})")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    store = load_store(cache=args.cache, rebuild=args.rebuild, verbose=True)
+    t1 = time.perf_counter()
+    load_store(cache=args.cache)
+    t2 = time.perf_counter()
+
+    n = len(store["house"])
+    print(f"\n{n} filas en {args.cache}")
+    print(f"Construcción/actualización: {(t1 - t0) * 1000:.1f} ms, carga desde caché: {(t2 - t1) * 1000:.1f} ms")
+    for i, name in enumerate(store["sources"]):
+        sel = store["source"] == i
+        houses = np.unique(store["house"][sel])
+        print(f"  [{i}] {name:28s} {int(sel.sum()):5d} filas, {len(houses)} houses")
+
+
+if __name__ == "__main__":
+    main()
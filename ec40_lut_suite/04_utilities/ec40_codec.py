@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Códec por lotes raw168 <-> payload64 (EC40) con NumPy.
+
+En vez de comprobar el preámbulo fila a fila y fiarse de la columna
+payload64_hex, decodifica la columna raw168 entera de una vez:
+
+  raw168 = 40 bits de cabecera (5555555599) + 128 bits Manchester
+  Manchester: par 10 = bit 0, par 01 = bit 1 (el bit es el segundo del par)
+  Los bits salen LSB primero por byte y cada byte lleva los nibbles
+  invertidos respecto al payload EC40 (reflexión de nibbles).
+
+Uso como módulo:
+  from ec40_codec import decode_raw168, check_payloads
+  payload, manchester_ok, preamble_ok = decode_raw168(df["raw168_hex"])
+  mismatch = check_payloads(df["raw168_hex"], df["payload64_hex"])
+
+Auditoría de un CSV (esquema merged o live):
+  python3 ec40_codec.py ../ec40_capturas_merged.csv
+"""
+
+import csv
+import sys
+import time
+
+import numpy as np
+
+KNOWN_PREAMBLE = "555555559995a5a6aa6a"
+HEADER_HEX = "5555555599"
+RAW_BYTES = 21
+PAYLOAD_BYTES = 8
+
+_PREAMBLE = np.frombuffer(bytes.fromhex(KNOWN_PREAMBLE), dtype=np.uint8)
+
+
+def hex_column(values, nbytes):
+    """
+    Convierte una columna de cadenas hex en una matriz N×nbytes uint8.
+    Las filas con longitud o caracteres no válidos quedan a cero y se
+    marcan en la máscara 'valid'.
+    """
+    values = ["" if v is None else str(v).strip() for v in values]
+    n = len(values)
+    out = np.zeros((n, nbytes), dtype=np.uint8)
+    valid = np.array([len(v) == nbytes * 2 for v in values], dtype=bool)
+    idx = np.flatnonzero(valid)
+    try:
+        out[idx] = np.frombuffer(bytes.fromhex("".join(values[i] for i in idx)),
+                                 dtype=np.uint8).reshape(-1, nbytes)
+    except ValueError:
+        # Algún carácter no hex: se resuelve fila a fila solo en este caso
+        for i in idx:
+            try:
+                out[i] = np.frombuffer(bytes.fromhex(values[i]), dtype=np.uint8)
+            except ValueError:
+                valid[i] = False
+    return out, valid
+
+
+def to_hex(arr):
+    """Matriz N×k uint8 -> lista de cadenas hex en minúsculas."""
+    arr = np.ascontiguousarray(arr, dtype=np.uint8)
+    width = arr.shape[1]
+    flat = arr.tobytes().hex()
+    return [flat[i:i + 2 * width] for i in range(0, len(flat), 2 * width)]
+
+
+def reflect_nibbles(arr):
+    return ((arr & 0x0F) << 4) | (arr >> 4)
+
+
+def decode_raw168(raw):
+    """
+    Decodifica una columna raw168 (hex o matriz N×21 uint8).
+
+    Devuelve (payload, manchester_ok, preamble_ok):
+      payload        N×8 uint8, EC40 post-reflect (como payload64_hex)
+      manchester_ok  N bool, los 64 pares Manchester son 10 o 01
+      preamble_ok    N bool, los 10 primeros bytes son KNOWN_PREAMBLE
+    Las filas con hex no válido salen con ambas máscaras a False.
+    """
+    if isinstance(raw, np.ndarray) and raw.dtype == np.uint8:
+        arr = raw.reshape(-1, RAW_BYTES)
+        valid = np.ones(len(arr), dtype=bool)
+    else:
+        arr, valid = hex_column(raw, RAW_BYTES)
+
+    preamble_ok = valid & (arr[:, :len(_PREAMBLE)] == _PREAMBLE).all(axis=1)
+
+    bits = np.unpackbits(arr[:, 5:], axis=1)          # N×128
+    first, second = bits[:, 0::2], bits[:, 1::2]      # N×64
+    manchester_ok = valid & (first != second).all(axis=1)
+
+    pre = np.packbits(second.reshape(-1, PAYLOAD_BYTES, 8), axis=2,
+                      bitorder="little").reshape(-1, PAYLOAD_BYTES)
+    return reflect_nibbles(pre), manchester_ok, preamble_ok
+
+
+def encode_payload64(payload):
+    """
+    Inverso de decode_raw168: payload N×8 (o columna hex) -> raw168 N×21.
+    """
+    if not (isinstance(payload, np.ndarray) and payload.dtype == np.uint8):
+        payload, _ = hex_column(payload, PAYLOAD_BYTES)
+    payload = payload.reshape(-1, PAYLOAD_BYTES)
+
+    data = np.unpackbits(reflect_nibbles(payload)[:, :, None], axis=2,
+                         bitorder="little").reshape(-1, 64)
+    pairs = np.stack([1 - data, data], axis=2).reshape(-1, 128).astype(np.uint8)
+
+    out = np.empty((len(payload), RAW_BYTES), dtype=np.uint8)
+    out[:, :5] = np.frombuffer(bytes.fromhex(HEADER_HEX), dtype=np.uint8)
+    out[:, 5:] = np.packbits(pairs, axis=1)
+    return out
+
+
+def check_payloads(raw, payloads):
+    """
+    Máscara N bool de filas cuyo payload64 no coincide con el que se deriva
+    de su raw168 (incluye raw168 con errores Manchester o hex no válido).
+    """
+    decoded, manchester_ok, _ = decode_raw168(raw)
+    given, valid = hex_column(payloads, PAYLOAD_BYTES)
+    return ~(manchester_ok & valid & (decoded == given).all(axis=1))
+
+
+def _read_columns(path):
+    """Columnas raw168 y payload64 de un CSV merged (raw168_hex) o live (raw168)."""
+    with open(path, "r", newline="") as f:
+        reader = csv.DictReader(f)
+        fields = reader.fieldnames or []
+        raw_col = "raw168_hex" if "raw168_hex" in fields else "raw168"
+        pay_col = "payload64_hex" if "payload64_hex" in fields else "raw64"
+        if raw_col not in fields or pay_col not in fields:
+            raise ValueError(f"{path}: faltan columnas raw168/payload64 ({', '.join(fields)})")
+        raws, pays = [], []
+        for row in reader:
+            raws.append(row[raw_col])
+            pays.append(row[pay_col])
+    return raws, pays
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Uso: python3 ec40_codec.py <csv de capturas>")
+        sys.exit(1)
+
+    try:
+        raws, pays = _read_columns(sys.argv[1])
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    t0 = time.perf_counter()
+    decoded, manchester_ok, preamble_ok = decode_raw168(raws)
+    mismatch = check_payloads(raws, pays)
+    elapsed = time.perf_counter() - t0
+
+    n = len(raws)
+    print(f"{n} tramas decodificadas en {elapsed * 1000:.1f} ms")
+    print(f"  Preámbulo desconocido:  {int((~preamble_ok).sum())}")
+    print(f"  Errores Manchester:     {int((~manchester_ok).sum())}")
+    print(f"  payload64 != raw168:    {int(mismatch.sum())}")
+
+    bad = np.flatnonzero(mismatch & manchester_ok)
+    if len(bad):
+        print("\nPrimeras discrepancias (fila, payload64 del CSV, derivado de raw168):")
+        derived = to_hex(decoded[bad[:10]])
+        for i, d in zip(bad[:10], derived):
+            print(f"  {i + 2:5d}  {pays[i]}  {d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Matriz de nibbles N×16 (uint8) de los payloads, mapeada en memoria.
+
+Los solvers de 04_universal_mp_analysis hacían [int(c, 16) for c in payload]
+por fila en cada ejecución. Aquí cada CSV se convierte una vez en .npy junto
+al propio CSV:
+
+  <csv>.nibbles.npy    N×16 uint8
+  <csv>.house.npy      N int16
+  <csv>.temp_idx.npy   N int16   round((t + 40) * 10)
+  <csv>.ts.npy         N int64   epoch (0 si la fuente no trae timestamp)
+  <csv>.nibbles.json   manifiesto (tamaño y mtime del CSV)
+
+Solo entran las filas con payload válido, en el orden del CSV. Si el CSV
+cambia, los .npy se regeneran en la siguiente carga; si no, se abren con
+np.load(mmap_mode="r"): sin parseo ni copia.
+
+Uso:
+  sys.path.insert(0, str(Path(__file__).parent.parent / "04_utilities"))
+  from nibble_matrix import load_matrix
+  mx = load_matrix()                        # ec40_capturas_merged.csv
+  nib = mx["nibbles"][mx["house"] == 247]
+
+  python3 nibble_matrix.py [CSV ...] [--rebuild]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from capture_store import BASE_DIR, read_source
+
+DEFAULT_CSV = BASE_DIR / "ec40_capturas_merged.csv"
+
+ARRAYS = {
+    "nibbles": np.uint8,
+    "house": np.int16,
+    "temp_idx": np.int16,
+    "ts": np.int64,
+}
+
+
+def _signature(path):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def matrix_paths(csv_path):
+    """Rutas de los .npy y del manifiesto de un CSV."""
+    csv_path = Path(csv_path)
+    paths = {k: csv_path.with_name(f"{csv_path.name}.{k}.npy") for k in ARRAYS}
+    paths["manifest"] = csv_path.with_name(f"{csv_path.name}.nibbles.json")
+    return paths
+
+
+def _is_current(csv_path, paths):
+    try:
+        with open(paths["manifest"], "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return manifest.get("sig") == _signature(csv_path) and all(paths[k].exists() for k in ARRAYS)
+
+
+def build_matrix(csv_path):
+    """Lee el CSV y escribe los .npy (cada uno de forma atómica); el manifiesto, al final."""
+    paths = matrix_paths(csv_path)
+    sig = _signature(csv_path)
+    cols = read_source(csv_path)
+    valid = cols["nib7"] >= 0
+    arrays = {
+        "nibbles": cols["nibbles"][valid],
+        "house": cols["house"][valid],
+        "temp_idx": cols["temp_idx"][valid],
+        "ts": cols["ts"][valid],
+    }
+    for k, dtype in ARRAYS.items():
+        tmp = paths[k].with_name(paths[k].name + ".tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, arrays[k].astype(dtype))
+        os.replace(tmp, paths[k])
+    with open(paths["manifest"], "w") as f:
+        json.dump({"csv": Path(csv_path).name, "rows": int(valid.sum()), "sig": sig}, f)
+    return int(valid.sum())
+
+
+def load_matrix(csv_path=DEFAULT_CSV, rebuild=False, mmap=True):
+    """
+    Devuelve {"nibbles", "house", "temp_idx", "ts"} para csv_path,
+    regenerando los .npy si el CSV cambió. Con mmap=True los arrays son
+    de solo lectura y mapeados en memoria.
+    """
+    paths = matrix_paths(csv_path)
+    if rebuild or not _is_current(csv_path, paths):
+        build_matrix(csv_path)
+    mode = "r" if mmap else None
+    return {k: np.load(paths[k], mmap_mode=mode) for k in ARRAYS}
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Matriz de nibbles mapeada en memoria")
+    ap.add_argument("csv", nargs="*", default=[str(DEFAULT_CSV)],
+                    help=f"CSV de capturas (default: {DEFAULT_CSV.name})")
+    ap.add_argument("--rebuild", action="store_true", help="regenerar aunque el CSV no haya cambiado")
+    args = ap.parse_args()
+
+    for csv_path in args.csv:
+        if not Path(csv_path).exists():
+            print(f"{csv_path}: no existe")
+            continue
+        t0 = time.perf_counter()
+        mx = load_matrix(csv_path, rebuild=args.rebuild)
+        t1 = time.perf_counter()
+        load_matrix(csv_path)
+        t2 = time.perf_counter()
+        n = len(mx["house"])
+        print(f"{csv_path}: {n} filas, {len(np.unique(mx['house']))} houses")
+        print(f"  construcción/comprobación: {(t1 - t0) * 1000:.1f} ms, carga mmap: {(t2 - t1) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Generador de tablas P comprimidas en PROGMEM para el ATtiny85
+(attiny/attiny85THN132N.ino).
+
+Para cada tabla P (nibble 14) por (house, nib7) de table_bundle.py prueba
+tres codificaciones y se queda con la más pequeña (empate: la de menos
+ciclos):
+
+  packed     dos nibbles por byte, ceil(span / 2) bytes
+  xor_delta  P = P_BASE[temp_idx] ^ NIB7_XOR_TABLE[nib7] salvo excepciones:
+             [xor][n_lo][n_hi] + n × uint16 LE (i << 4 | P), i ordenado.
+             P_BASE es P_LUT_BASE de Docs/oregon_p_lut_complete.py
+             (nib7 = 2), empaquetada una sola vez para todas las tablas
+  rle        rachas de un byte: P << 4 | (largo - 1), hasta 16 celdas
+
+Solo se garantizan las celdas observadas: las no observadas devuelven un
+valor sin definir (como el relleno 0x0 de oregon_p_table_247.h), lo que deja
+a RLE y a xor_delta alargar rachas o no anotar excepción en los huecos.
+M (nibble 13) y R1 salen de la suma de nibbles y no necesitan tabla.
+
+Los ciclos son una estimación para AVR (LPM = 3 ciclos, bucles de ~11
+ciclos por racha o excepción recorrida), sin contar la búsqueda de la tabla
+en el directorio; se dan de media sobre las celdas observadas y en el peor
+caso.
+
+Salida: una cabecera con los datos en un solo array PROGMEM, el directorio
+(también en PROGMEM: la SRAM del ATtiny85 es de 512 bytes), solo los
+decodificadores de las codificaciones usadas y ec40_progmem_p().
+
+Uso:
+  python3 progmem_tables.py                          # todos los houses
+  python3 progmem_tables.py --house 247 -o ../../attiny/ec40_p_progmem.h
+  python3 progmem_tables.py --flash 8192 --report    # solo el informe
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "04_universal_mp_analysis" / "Docs"))
+
+from capture_store import load_store
+from oregon_p_lut_complete import NIB7_XOR_TABLE, P_LUT_BASE
+from table_bundle import compile_tables, pack_nibbles, unpack_nibbles
+
+BASE_DIR = Path(__file__).parent.parent
+OUT_FILE = BASE_DIR.parent / "attiny" / "ec40_p_progmem.h"
+
+FLASH_BYTES = 8192
+DIR_ENTRY_BYTES = 8        # house, nib7|enc, t_lo, span, offset
+PER_LINE = 16
+
+# Estimación de ciclos AVR por consulta
+CYC_PACKED = 16
+CYC_RLE_BASE, CYC_RLE_RUN = 10, 11
+CYC_XOR_BASE, CYC_XOR_EXC = 20, 14
+
+ENCODINGS = ("packed", "xor_delta", "rle")
+
+
+def base_table():
+    """(t_lo, span, valores) de P_LUT_BASE como tabla contigua (0 en los huecos)."""
+    t_lo, t_hi = min(P_LUT_BASE), max(P_LUT_BASE)
+    values = np.zeros(t_hi - t_lo + 1, dtype=np.uint8)
+    for t, p in P_LUT_BASE.items():
+        values[t - t_lo] = p
+    return t_lo, len(values), values
+
+
+def base_at(base, t_lo, span):
+    """P_BASE para temp_idx t_lo .. t_lo + span - 1 (0 fuera de su rango)."""
+    b_lo, b_span, b_values = base
+    out = np.zeros(span, dtype=np.uint8)
+    a, b = max(t_lo, b_lo), min(t_lo + span, b_lo + b_span)
+    if a < b:
+        out[a - t_lo:b - t_lo] = b_values[a - b_lo:b - b_lo]
+    return out
+
+
+def encode_packed(values, valid):
+    v = np.where(valid, values, 0)
+    data = pack_nibbles(v)
+    return data, CYC_PACKED, CYC_PACKED
+
+
+def encode_rle(values, valid):
+    """Rachas de un byte; las celdas no observadas alargan la racha en curso."""
+    n = len(values)
+    last = np.maximum.accumulate(np.where(valid, np.arange(n), -1))
+    first = values[valid][0] if valid.any() else 0
+    v = np.where(last >= 0, values[np.maximum(last, 0)], first).tolist()
+    data = bytearray()
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and j + 1 - i < 16 and v[j + 1] == v[i]:
+            j += 1
+        data.append(v[i] << 4 | (j - i))
+        i = j + 1
+    cyc = CYC_RLE_BASE + CYC_RLE_RUN * decode_rle_runs(bytes(data), n)
+    return bytes(data), float(cyc[valid].mean()), int(cyc.max())
+
+
+def decode_rle_runs(data, span):
+    """Rachas recorridas para llegar a cada celda (1 = la primera)."""
+    lengths = np.array([(b & 0xF) + 1 for b in data], dtype=np.int64)
+    run = np.repeat(np.arange(1, len(data) + 1), lengths)
+    return run[:span]
+
+
+def encode_xor_delta(values, valid, nib7, t_lo, base):
+    """None si nib7 no tiene transformación en NIB7_XOR_TABLE."""
+    if nib7 not in NIB7_XOR_TABLE:
+        return None
+    xor = NIB7_XOR_TABLE[nib7]
+    predicted = base_at(base, t_lo, len(values)) ^ xor
+    exc = np.flatnonzero(valid & (values != predicted))
+    if len(exc) and exc[-1] >= 1 << 12:
+        return None
+    words = (exc << 4) | values[exc]
+    data = bytes([xor, len(exc) & 0xFF, len(exc) >> 8]) + words.astype("<u2").tobytes()
+    # Excepciones recorridas: las de índice < i, más la que coincide o la que corta
+    scanned = np.minimum(np.searchsorted(exc, np.arange(len(values)), side="left") + 1, len(exc))
+    hit = np.isin(np.arange(len(values)), exc)
+    cyc = CYC_XOR_BASE + CYC_XOR_EXC * scanned + np.where(hit, 0, CYC_PACKED)
+    return data, float(cyc[valid].mean()), int(cyc.max())
+
+
+def decode(enc, data, span, t_lo, base):
+    """Decodificador de referencia (misma lógica que el C)."""
+    if enc == "packed":
+        return unpack_nibbles(data, span)
+    if enc == "rle":
+        out = np.repeat([b >> 4 for b in data], [(b & 0xF) + 1 for b in data])
+        return out[:span].astype(np.uint8)
+    xor, n = data[0], data[1] | data[2] << 8
+    out = base_at(base, t_lo, span) ^ xor
+    words = np.frombuffer(data[3:3 + 2 * n], dtype="<u2")
+    out[words >> 4] = words & 0xF
+    return out
+
+
+class Encoded:
+    def __init__(self, house, nib7, t_lo, span, options):
+        self.house = house
+        self.nib7 = nib7
+        self.t_lo = t_lo
+        self.span = span
+        self.options = options     # enc -> (bytes, ciclos medios, ciclos peor caso)
+        self.choice = None
+
+    def choose(self, allowed):
+        cands = [e for e in ENCODINGS if e in allowed and e in self.options]
+        self.choice = min(cands, key=lambda e: (len(self.options[e][0]), self.options[e][2]))
+        return self.choice
+
+    @property
+    def data(self):
+        return self.options[self.choice][0]
+
+
+def encode_tables(tables, base):
+    out = []
+    for tb in tables:
+        valid, _, p = tb.cells()
+        options = {"packed": encode_packed(p, valid), "rle": encode_rle(p, valid)}
+        xd = encode_xor_delta(p, valid, tb.nib7, tb.t_lo, base)
+        if xd is not None:
+            options["xor_delta"] = xd
+        for enc, (data, _, _) in options.items():
+            got = decode(enc, data, tb.span, tb.t_lo, base)
+            assert np.array_equal(got[valid], p[valid]), (tb.house, tb.nib7, enc)
+        out.append(Encoded(tb.house, tb.nib7, tb.t_lo, tb.span, options))
+    return out
+
+
+def select(encoded, base):
+    """
+    Elige la codificación de cada tabla. P_BASE solo cuesta si alguna tabla
+    usa xor_delta, así que se comparan los dos totales. Devuelve los bytes
+    de P_BASE incluidos (0 si no se usa).
+    """
+    base_bytes = (base[1] + 1) // 2
+
+    def total(allowed):
+        for e in encoded:
+            e.choose(allowed)
+        used = any(e.choice == "xor_delta" for e in encoded)
+        return sum(len(e.data) for e in encoded) + (base_bytes if used else 0), used
+
+    with_xor, used = total(ENCODINGS)
+    without, _ = total(("packed", "rle"))
+    if used and with_xor < without:
+        total(ENCODINGS)
+        return base_bytes
+    return 0
+
+
+def report(encoded, base_bytes, flash):
+    lines = [f"{'house':>5s} {'nib7':>4s} {'span':>5s} {'packed':>15s} {'xor_delta':>15s} {'rle':>15s}  elegida"]
+    for e in encoded:
+        cols = []
+        for enc in ENCODINGS:
+            if enc in e.options:
+                data, avg, worst = e.options[enc]
+                cols.append(f"{len(data):4d}B {avg:4.0f}/{worst:<4d}".rjust(15))
+            else:
+                cols.append(f"{'-':>15s}")
+        lines.append(f"{e.house:5d}  0x{e.nib7:X} {e.span:5d} {' '.join(cols)}  {e.choice}")
+    data = sum(len(e.data) for e in encoded)
+    directory = DIR_ENTRY_BYTES * len(encoded)
+    total = data + directory + base_bytes
+    uint8 = sum(e.span for e in encoded)
+    counts = {enc: sum(1 for e in encoded if e.choice == enc) for enc in ENCODINGS}
+    lines += [
+        "(bytes, ciclos medio/peor caso)",
+        "",
+        f"{len(encoded)} tablas: " + ", ".join(f"{n} {enc}" for enc, n in counts.items() if n),
+        f"  datos {data} B + directorio {directory} B + P_BASE {base_bytes} B = {total} B de flash",
+        f"  con un uint8_t por temp_idx (como oregon_p_table_247.h): {uint8} B",
+        f"  {total / flash * 100:.1f}% de {flash} B de flash",
+    ]
+    return lines, total
+
+
+def _c_bytes(data):
+    lines = []
+    for i in range(0, len(data), PER_LINE):
+        chunk = data[i:i + PER_LINE]
+        last = i + PER_LINE >= len(data)
+        lines.append("    " + ", ".join(f"0x{v:02X}" for v in chunk) + ("" if last else ","))
+    return lines
+
+
+DECODERS = {
+    "packed": [
+        "static inline uint8_t ec40_dec_packed(uint16_t off, uint16_t i)",
+        "{",
+        "    uint8_t b = pgm_read_byte(&EC40_P_DATA[off + (i >> 1)]);",
+        "    return (i & 1) ? (b & 0x0F) : (b >> 4);",
+        "}",
+    ],
+    "rle": [
+        "static inline uint8_t ec40_dec_rle(uint16_t off, uint16_t i)",
+        "{",
+        "    const uint8_t *q = &EC40_P_DATA[off];",
+        "    for (;;) {",
+        "        uint8_t b = pgm_read_byte(q++);",
+        "        uint8_t n = (b & 0x0F) + 1;",
+        "        if (i < n) return b >> 4;",
+        "        i -= n;",
+        "    }",
+        "}",
+    ],
+    "xor_delta": [
+        "static inline uint8_t ec40_base_p(uint16_t temp_idx)",
+        "{",
+        "    if (temp_idx < EC40_P_BASE_T_LO || temp_idx - EC40_P_BASE_T_LO >= EC40_P_BASE_SPAN) return 0;",
+        "    uint16_t i = temp_idx - EC40_P_BASE_T_LO;",
+        "    uint8_t b = pgm_read_byte(&EC40_P_BASE[i >> 1]);",
+        "    return (i & 1) ? (b & 0x0F) : (b >> 4);",
+        "}",
+        "",
+        "static inline uint8_t ec40_dec_xor_delta(uint16_t off, uint16_t t_lo, uint16_t i)",
+        "{",
+        "    const uint8_t *q = &EC40_P_DATA[off];",
+        "    uint8_t x = pgm_read_byte(q);",
+        "    uint16_t n = pgm_read_word(q + 1);",
+        "    for (q += 3; n; n--, q += 2) {",
+        "        uint16_t e = pgm_read_word(q);",
+        "        if ((e >> 4) == i) return e & 0x0F;",
+        "        if ((e >> 4) > i) break;",
+        "    }",
+        "    return ec40_base_p(t_lo + i) ^ x;",
+        "}",
+    ],
+}
+
+_ENC_ID = {enc: i for i, enc in enumerate(ENCODINGS)}
+
+
+def write_header(encoded, base, base_bytes, total, path):
+    used = [enc for enc in ENCODINGS if any(e.choice == enc for e in encoded)]
+    blob, offsets = bytearray(), []
+    for e in encoded:
+        offsets.append(len(blob))
+        blob += e.data
+    lines = [
+        "#ifndef EC40_P_PROGMEM_H",
+        "#define EC40_P_PROGMEM_H",
+        "",
+        "// Tablas P (nibble 14) comprimidas, auto-generadas por progmem_tables.py",
+        "// Índice = (Temp_C + 40) * 10; las celdas no observadas devuelven un valor sin definir",
+        f"// {len(encoded)} tablas, {total} bytes de flash",
+        "",
+        "#include <stdint.h>",
+        "#include <avr/pgmspace.h>",
+        "",
+    ]
+    for enc in ENCODINGS:
+        lines.append(f"#define EC40_ENC_{enc.upper()} {_ENC_ID[enc]}")
+    lines += [
+        "",
+        "// house, nib7 | codificación << 4, t_lo, span, offset en EC40_P_DATA",
+        "typedef struct {",
+        "    uint8_t house;",
+        "    uint8_t nib7_enc;",
+        "    uint16_t t_lo;",
+        "    uint16_t span;",
+        "    uint16_t off;",
+        "} ec40_ptable_t;",
+        "",
+        f"#define EC40_P_TABLE_COUNT {len(encoded)}",
+        "",
+        "static const ec40_ptable_t EC40_P_DIR[EC40_P_TABLE_COUNT] PROGMEM = {",
+    ]
+    for e, off in zip(encoded, offsets):
+        lines.append(f"    {{{e.house}, 0x{e.nib7:X} | (EC40_ENC_{e.choice.upper()} << 4), "
+                     f"{e.t_lo}, {e.span}, {off}}},")
+    lines += ["};", "", f"static const uint8_t EC40_P_DATA[{len(blob)}] PROGMEM = {{"]
+    lines += _c_bytes(bytes(blob)) + ["};", ""]
+    if base_bytes:
+        b_lo, b_span, b_values = base
+        lines += [
+            "// P_BASE (nib7 = 2) de oregon_p_lut_complete.py, dos nibbles por byte",
+            f"#define EC40_P_BASE_T_LO {b_lo}",
+            f"#define EC40_P_BASE_SPAN {b_span}",
+            f"static const uint8_t EC40_P_BASE[{base_bytes}] PROGMEM = {{",
+        ]
+        lines += _c_bytes(pack_nibbles(b_values)) + ["};", ""]
+    for enc in used:
+        lines += DECODERS[enc] + [""]
+    lines += [
+        "// P de (house, nib7, temp_idx); 0xFF si no hay tabla o temp_idx queda fuera de su rango",
+        "static inline uint8_t ec40_progmem_p(uint8_t house, uint8_t nib7, uint16_t temp_idx)",
+        "{",
+        "    for (uint8_t k = 0; k < EC40_P_TABLE_COUNT; k++) {",
+        "        const ec40_ptable_t *t = &EC40_P_DIR[k];",
+        "        uint8_t ne = pgm_read_byte(&t->nib7_enc);",
+        "        if (pgm_read_byte(&t->house) != house || (ne & 0x0F) != nib7) continue;",
+        "        uint16_t t_lo = pgm_read_word(&t->t_lo);",
+        "        uint16_t off = pgm_read_word(&t->off);",
+        "        if (temp_idx < t_lo || temp_idx - t_lo >= pgm_read_word(&t->span)) return 0xFF;",
+        "        uint16_t i = temp_idx - t_lo;",
+        "        switch (ne >> 4) {",
+    ]
+    for enc in used:
+        call = {"packed": "ec40_dec_packed(off, i)", "rle": "ec40_dec_rle(off, i)",
+                "xor_delta": "ec40_dec_xor_delta(off, t_lo, i)"}[enc]
+        lines.append(f"        case EC40_ENC_{enc.upper()}: return {call};")
+    lines += [
+        "        }",
+        "        return 0xFF;",
+        "    }",
+        "    return 0xFF;",
+        "}",
+        "",
+        "#endif",
+        "",
+    ]
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        f.write("\n".join(lines))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Tablas P comprimidas en PROGMEM para el ATtiny85")
+    ap.add_argument("--house", type=int, action="append", help="solo este house (repetible)")
+    ap.add_argument("-o", "--output", default=str(OUT_FILE), help=f"cabecera de salida (default: attiny/{OUT_FILE.name})")
+    ap.add_argument("--flash", type=int, default=FLASH_BYTES, help=f"flash disponible (default: {FLASH_BYTES})")
+    ap.add_argument("--report", action="store_true", help="solo el informe, sin escribir la cabecera")
+    args = ap.parse_args()
+
+    tables = compile_tables(load_store(), args.house)
+    if not tables:
+        print("No hay tramas con payload para esos houses")
+        return
+    base = base_table()
+    encoded = encode_tables(tables, base)
+    base_bytes = select(encoded, base)
+    lines, total = report(encoded, base_bytes, args.flash)
+    print("\n".join(lines))
+    if not args.report:
+        write_header(encoded, base, base_bytes, total, args.output)
+        print(f"\nCabecera guardada en {args.output}")
+
+
+if __name__ == "__main__":
+    main()
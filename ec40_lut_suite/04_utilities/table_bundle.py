@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Compilador de tablas P/M empaquetadas a 4 bits, una por (house, nib7).
+
+Las tablas P y M se mantenían a mano en varias formas (P_LUT_BASE de
+Docs/oregon_p_lut_complete.py, oregon_p_table_247.h con un uint8_t por
+paso de 0.1 °C y casi todo relleno 0x0, P_TABLE/M_TABLE de
+gen_tramas_thn132n.py, oregon_parameters.py y los .ino). Aquí se compilan
+desde las capturas reales de capture_store (sin tramas_thn132n.csv, que
+sale del generador): para cada (house, nib7, temp_idx) se toma la moda del
+par (M, P) = (nibble 13, nibble 14) de las tramas observadas (empate: el
+visto primero) y cada tabla se recorta al rango de temp_idx observado.
+
+Formato de una tabla (span = t_hi - t_lo + 1 celdas, celda i = temp_idx t_lo + i):
+  validez  ceil(span / 8) bytes, bit i = byte i >> 3, bit (i & 7) (LSB primero)
+  P        ceil(span / 2) bytes, dos nibbles por byte: i par en el nibble alto
+  M        ceil(span / 2) bytes, igual que P
+
+Salidas (mismas tablas, mismo empaquetado):
+  tables/ec40_pm_tables.bin  cabecera '<4sHHHH' (MAGIC, versión, nº tablas,
+                             TEMP_IDX_SIZE, 0), directorio de entradas
+                             '<BBHHI' (house, nib7, t_lo, span, offset) y
+                             bloques; se lee con TableBundle (mmap)
+  tables/ec40_pm_tables.h    arrays const uint8_t y directorio EC40_PM_TABLES[],
+                             todo en PROGMEM en AVR, y ec40_pm_lookup()
+
+Uso:
+  from table_bundle import TableBundle
+  with TableBundle() as tb:
+      m, p = tb.lookup(21.5, 247, 0x1)      # None si la celda no se observó
+
+  python3 table_bundle.py                      # compila y muestra tamaños
+  python3 table_bundle.py --house 247          # solo las tablas del house 247
+  python3 table_bundle.py --info tables/ec40_pm_tables.bin
+"""
+
+import argparse
+import mmap
+import struct
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from capture_store import captured, load_store
+
+BASE_DIR = Path(__file__).parent.parent
+OUT_DIR = BASE_DIR / "tables"
+BIN_FILE = OUT_DIR / "ec40_pm_tables.bin"
+HEADER_FILE = OUT_DIR / "ec40_pm_tables.h"
+
+MAGIC = b"EC4T"
+VERSION = 1
+TEMP_IDX_SIZE = 1024
+_HEAD = struct.Struct("<4sHHHH")
+_ENTRY = struct.Struct("<BBHHI")
+PER_LINE = 16
+# sizeof(ec40_pm_table_t) en AVR: 1 + 1 + 2 + 2 + 3 punteros de 16 bits
+DIR_ENTRY_BYTES = 12
+
+
+def temp_to_idx(temp_c):
+    return int(round((temp_c + 40) * 10))
+
+
+class Table:
+    """Tabla empaquetada de un (house, nib7): bytes de validez, P y M."""
+
+    def __init__(self, house, nib7, t_lo, span, valid, p, m):
+        self.house = house
+        self.nib7 = nib7
+        self.t_lo = t_lo
+        self.span = span
+        self.valid = valid
+        self.p = p
+        self.m = m
+
+    @property
+    def t_hi(self):
+        return self.t_lo + self.span - 1
+
+    @property
+    def observed(self):
+        return int(np.unpackbits(np.frombuffer(self.valid, dtype=np.uint8), bitorder="little")[:self.span].sum())
+
+    def cells(self):
+        """(valid, M, P) como arrays de span celdas, desde t_lo."""
+        valid = np.unpackbits(np.frombuffer(self.valid, dtype=np.uint8), bitorder="little")[:self.span]
+        return valid.astype(bool), unpack_nibbles(self.m, self.span), unpack_nibbles(self.p, self.span)
+
+    def blob(self):
+        return self.valid + self.p + self.m
+
+    def __len__(self):
+        return len(self.valid) + len(self.p) + len(self.m)
+
+
+def pack_nibbles(values):
+    """Dos nibbles por byte, el de índice par en el nibble alto."""
+    v = np.asarray(values, dtype=np.uint8) & 0xF
+    if len(v) % 2:
+        v = np.append(v, np.uint8(0))
+    return ((v[0::2] << 4) | v[1::2]).tobytes()
+
+
+def unpack_nibbles(data, count):
+    b = np.frombuffer(data, dtype=np.uint8)
+    out = np.empty(len(b) * 2, dtype=np.uint8)
+    out[0::2] = b >> 4
+    out[1::2] = b & 0xF
+    return out[:count]
+
+
+def cell_modes(house, nib7, temp_idx, mp):
+    """
+    Moda de mp = M << 4 | P por (house, nib7, temp_idx), vectorizado.
+    Devuelve (house, nib7, temp_idx, mp, soporte) por celda, ordenado por clave.
+    """
+    key = (((house.astype(np.int64) << 4) | nib7.astype(np.int64)) << 16) | temp_idx.astype(np.int64)
+    pair = (key << 8) | mp.astype(np.int64)
+    pairs, first, counts = np.unique(pair, return_index=True, return_counts=True)
+    pkey = pairs >> 8
+    order = np.lexsort((first, -counts, pkey))
+    pairs, pkey, counts = pairs[order], pkey[order], counts[order]
+    is_mode = np.r_[True, pkey[1:] != pkey[:-1]]
+    keys = pkey[is_mode]
+    return keys >> 20, (keys >> 16) & 0xF, keys & 0xFFFF, pairs[is_mode] & 0xFF, counts[is_mode]
+
+
+def compile_tables(store, houses=None):
+    """
+    Tablas (lista de Table, ordenada por (house, nib7)) desde un capture_store.
+    Solo cuentan las capturas reales: las tramas del generador repetirían su
+    propia tabla en vez de lo que emite el sensor.
+    """
+    ok = captured(store) & (store["nib7"] >= 0) & (store["m"] >= 0) & (store["p"] >= 0)
+    ok &= (store["temp_idx"] >= 0) & (store["temp_idx"] < TEMP_IDX_SIZE)
+    if houses:
+        ok &= np.isin(store["house"], list(houses))
+    mp = (store["m"][ok].astype(np.int64) << 4) | store["p"][ok]
+    house, nib7, tidx, mp, _ = cell_modes(store["house"][ok], store["nib7"][ok], store["temp_idx"][ok], mp)
+
+    tables = []
+    table_key = house * 16 + nib7
+    bounds = np.flatnonzero(np.r_[True, table_key[1:] != table_key[:-1], True])
+    for a, b in zip(bounds[:-1], bounds[1:]):
+        t = tidx[a:b]
+        t_lo = int(t[0])
+        span = int(t[-1]) - t_lo + 1
+        valid = np.zeros(span, dtype=bool)
+        p = np.zeros(span, dtype=np.uint8)
+        m = np.zeros(span, dtype=np.uint8)
+        valid[t - t_lo] = True
+        p[t - t_lo] = mp[a:b] & 0xF
+        m[t - t_lo] = mp[a:b] >> 4
+        tables.append(Table(int(house[a]), int(nib7[a]), t_lo, span,
+                            np.packbits(valid, bitorder="little").tobytes(),
+                            pack_nibbles(p), pack_nibbles(m)))
+    return tables
+
+
+def write_bin(tables, path):
+    head = _HEAD.pack(MAGIC, VERSION, len(tables), TEMP_IDX_SIZE, 0)
+    offset = _HEAD.size + _ENTRY.size * len(tables)
+    directory, blobs = [], []
+    for tb in tables:
+        directory.append(_ENTRY.pack(tb.house, tb.nib7, tb.t_lo, tb.span, offset))
+        blobs.append(tb.blob())
+        offset += len(tb)
+    data = head + b"".join(directory) + b"".join(blobs)
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def _c_array(name, data):
+    lines = [f"static const uint8_t {name}[{len(data)}] EC40_PROGMEM = {{"]
+    for i in range(0, len(data), PER_LINE):
+        chunk = data[i:i + PER_LINE]
+        last = i + PER_LINE >= len(data)
+        lines.append("    " + ", ".join(f"0x{v:02X}" for v in chunk) + ("" if last else ","))
+    lines.append("};")
+    return lines
+
+
+def write_header(tables, path):
+    """Cabecera C con los arrays empaquetados. Devuelve (bytes de datos, bytes del directorio)."""
+    data_bytes = sum(len(tb) for tb in tables)
+    dir_bytes = DIR_ENTRY_BYTES * len(tables)
+    lines = [
+        "#ifndef EC40_PM_TABLES_H",
+        "#define EC40_PM_TABLES_H",
+        "",
+        "// Tablas P/M auto-generadas por table_bundle.py desde capture_store",
+        "// Una tabla por (house, nib7); celda i = temp_idx t_lo + i, temp_idx = (Temp_C + 40) * 10",
+        "// valid: bit i en valid[i >> 3] (LSB primero); P/M: nibble i en [i >> 1], i par = nibble alto",
+        f"// {len(tables)} tablas, {data_bytes} bytes de datos + {dir_bytes} de directorio, todo en flash",
+        "",
+        "#include <stdint.h>",
+        "",
+        "#ifdef __AVR__",
+        "#include <avr/pgmspace.h>",
+        "#define EC40_PROGMEM PROGMEM",
+        "#define EC40_READ(p) pgm_read_byte(p)",
+        "#define EC40_READ_WORD(p) pgm_read_word(p)",
+        "#define EC40_READ_PTR(p) ((const uint8_t *)pgm_read_ptr(p))",
+        "#else",
+        "#define EC40_PROGMEM",
+        "#define EC40_READ(p) (*(p))",
+        "#define EC40_READ_WORD(p) (*(p))",
+        "#define EC40_READ_PTR(p) (*(p))",
+        "#endif",
+        "",
+        "typedef struct {",
+        "    uint8_t house;",
+        "    uint8_t nib7;",
+        "    uint16_t t_lo;",
+        "    uint16_t span;",
+        "    const uint8_t *valid;",
+        "    const uint8_t *p;",
+        "    const uint8_t *m;",
+        "} ec40_pm_table_t;",
+        "",
+    ]
+    entries = []
+    for tb in tables:
+        name = f"EC40_H{tb.house}_N{tb.nib7:X}"
+        lines.append(f"// house {tb.house}, nib7 0x{tb.nib7:X}: temp_idx {tb.t_lo}..{tb.t_hi}, "
+                     f"{tb.observed} celdas observadas, {len(tb)} bytes")
+        lines += _c_array(name + "_VALID", tb.valid)
+        lines += _c_array(name + "_P", tb.p)
+        lines += _c_array(name + "_M", tb.m)
+        lines.append("")
+        entries.append(f"    {{{tb.house}, 0x{tb.nib7:X}, {tb.t_lo}, {tb.span}, "
+                       f"{name}_VALID, {name}_P, {name}_M}},")
+    lines += [
+        f"#define EC40_PM_TABLE_COUNT {len(tables)}",
+        "",
+        "// También en flash: en SRAM no cabría en un ATtiny85 (512 bytes)",
+        "static const ec40_pm_table_t EC40_PM_TABLES[EC40_PM_TABLE_COUNT] EC40_PROGMEM = {",
+        *entries,
+        "};",
+        "",
+        "static inline uint8_t ec40_nibble(const uint8_t *packed, uint16_t i)",
+        "{",
+        "    uint8_t b = EC40_READ(&packed[i >> 1]);",
+        "    return (i & 1) ? (b & 0x0F) : (b >> 4);",
+        "}",
+        "",
+        "// 1 y *m, *p si la celda (house, nib7, temp_idx) se observó; 0 si no",
+        "static inline uint8_t ec40_pm_lookup(uint8_t house, uint8_t nib7, uint16_t temp_idx,",
+        "                                     uint8_t *m, uint8_t *p)",
+        "{",
+        "    for (uint8_t k = 0; k < EC40_PM_TABLE_COUNT; k++) {",
+        "        const ec40_pm_table_t *t = &EC40_PM_TABLES[k];",
+        "        if (EC40_READ(&t->house) != house || EC40_READ(&t->nib7) != nib7) continue;",
+        "        uint16_t t_lo = EC40_READ_WORD(&t->t_lo);",
+        "        if (temp_idx < t_lo || temp_idx - t_lo >= EC40_READ_WORD(&t->span)) return 0;",
+        "        uint16_t i = temp_idx - t_lo;",
+        "        const uint8_t *valid = EC40_READ_PTR(&t->valid);",
+        "        if (!((EC40_READ(&valid[i >> 3]) >> (i & 7)) & 1)) return 0;",
+        "        *p = ec40_nibble(EC40_READ_PTR(&t->p), i);",
+        "        *m = ec40_nibble(EC40_READ_PTR(&t->m), i);",
+        "        return 1;",
+        "    }",
+        "    return 0;",
+        "}",
+        "",
+        "#endif",
+        "",
+    ]
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        f.write("\n".join(lines))
+    return data_bytes, dir_bytes
+
+
+class TableBundle:
+    """
+    Acceso de solo lectura a un .bin de tablas mapeado en memoria: solo se
+    leen el directorio y los bytes de las celdas consultadas.
+    """
+
+    def __init__(self, path=BIN_FILE):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, n, size, _ = _HEAD.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"{self.path}: no es un bundle de tablas EC40 v{VERSION}")
+        self.temp_idx_size = size
+        self._dir = {}
+        for k in range(n):
+            house, nib7, t_lo, span, offset = _ENTRY.unpack_from(self._mm, _HEAD.size + k * _ENTRY.size)
+            self._dir[(house, nib7)] = (t_lo, span, offset)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._mm.close()
+
+    def keys(self):
+        return sorted(self._dir)
+
+    def get(self, house, nib7, temp_idx):
+        """(M, P) de una celda, o None si no se observó."""
+        entry = self._dir.get((house, nib7))
+        if entry is None:
+            return None
+        t_lo, span, offset = entry
+        i = temp_idx - t_lo
+        if not 0 <= i < span:
+            return None
+        mm = self._mm
+        if not (mm[offset + (i >> 3)] >> (i & 7)) & 1:
+            return None
+        base = offset + (span + 7) // 8
+        half = (span + 1) // 2
+        shift = 0 if i & 1 else 4
+        p = (mm[base + (i >> 1)] >> shift) & 0xF
+        m = (mm[base + half + (i >> 1)] >> shift) & 0xF
+        return m, p
+
+    def lookup(self, temp_c, house, nib7):
+        return self.get(house, nib7, temp_to_idx(temp_c))
+
+    def arrays(self, house, nib7):
+        """(valid, M, P) como arrays de TEMP_IDX_SIZE celdas (0 donde no hay dato)."""
+        valid = np.zeros(self.temp_idx_size, dtype=bool)
+        m = np.zeros(self.temp_idx_size, dtype=np.uint8)
+        p = np.zeros(self.temp_idx_size, dtype=np.uint8)
+        entry = self._dir.get((house, nib7))
+        if entry is None:
+            return valid, m, p
+        t_lo, span, offset = entry
+        nv, half = (span + 7) // 8, (span + 1) // 2
+        block = self._mm[offset:offset + nv + 2 * half]
+        sl = slice(t_lo, t_lo + span)
+        valid[sl] = np.unpackbits(np.frombuffer(block[:nv], dtype=np.uint8), bitorder="little")[:span]
+        p[sl] = unpack_nibbles(block[nv:nv + half], span)
+        m[sl] = unpack_nibbles(block[nv + half:], span)
+        p[~valid] = 0
+        m[~valid] = 0
+        return valid, m, p
+
+
+def size_report(tables, bin_bytes, header_bytes):
+    """Líneas con el tamaño por tabla y por salida."""
+    lines = [f"{'house':>5s} {'nib7':>4s} {'temp_idx':>10s} {'obs':>5s} {'bytes':>6s} {'uint8/celda':>12s}"]
+    for tb in tables:
+        lines.append(f"{tb.house:5d}  0x{tb.nib7:X} {tb.t_lo:4d}..{tb.t_hi:<4d} "
+                     f"{tb.observed:5d} {len(tb):6d} {2 * tb.span:12d}")
+    data = sum(len(tb) for tb in tables)
+    cells = sum(tb.observed for tb in tables)
+    unpacked = sum(2 * tb.span for tb in tables)
+    dense = 2 * TEMP_IDX_SIZE * len(tables)
+    data_h, dir_h = header_bytes
+    lines += [
+        "",
+        f"{len(tables)} tablas, {cells} celdas observadas",
+        f"  datos empaquetados: {data} bytes ({unpacked} con un uint8_t por valor en el mismo rango, "
+        f"{dense} con tablas densas de {TEMP_IDX_SIZE})",
+        f"  .bin:               {bin_bytes} bytes (cabecera {_HEAD.size} + directorio {_ENTRY.size * len(tables)} + datos)",
+        f"  .h:                 {data_h + dir_h} bytes de flash (datos {data_h} + directorio {dir_h}), 0 de SRAM",
+        f"  TableBundle:        mmap de {bin_bytes} bytes, {len(tables)} entradas de directorio en memoria",
+    ]
+    return lines
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Compila las tablas P/M empaquetadas por (house, nib7)")
+    ap.add_argument("--house", type=int, action="append", help="solo este house (repetible)")
+    ap.add_argument("--bin", default=str(BIN_FILE), help=f"salida binaria (default: tables/{BIN_FILE.name})")
+    ap.add_argument("--header", default=str(HEADER_FILE), help=f"cabecera C (default: tables/{HEADER_FILE.name})")
+    ap.add_argument("--info", metavar="BIN", help="listar las tablas de un .bin existente")
+    args = ap.parse_args()
+
+    if args.info:
+        with TableBundle(args.info) as tb:
+            for house, nib7 in tb.keys():
+                valid, _, _ = tb.arrays(house, nib7)
+                t = np.flatnonzero(valid)
+                print(f"house {house:3d} nib7 0x{nib7:X}: {len(t):4d} celdas, temp_idx {t[0]}..{t[-1]}")
+        return
+
+    tables = compile_tables(load_store(), args.house)
+    if not tables:
+        print("No hay tramas con payload para esos houses")
+        return
+    bin_bytes = write_bin(tables, args.bin)
+    header_bytes = write_header(tables, args.header)
+
+    # Comprobación: el .bin devuelve lo mismo que se compiló
+    with TableBundle(args.bin) as tb:
+        for t in tables:
+            valid, m, p = tb.arrays(t.house, t.nib7)
+            sl = slice(t.t_lo, t.t_hi + 1)
+            assert np.array_equal(p[sl] * valid[sl], unpack_nibbles(t.p, t.span) * valid[sl])
+            assert np.array_equal(m[sl] * valid[sl], unpack_nibbles(t.m, t.span) * valid[sl])
+
+    print("\n".join(size_report(tables, bin_bytes, header_bytes)))
+    print(f"\nTablas guardadas en {args.bin} y {args.header}")
+
+
+if __name__ == "__main__":
+    main()
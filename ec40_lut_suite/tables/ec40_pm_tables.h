@@ -0,0 +1,942 @@
+#ifndef EC40_PM_TABLES_H
+#define EC40_PM_TABLES_H
+
+// Tablas P/M auto-generadas por table_bundle.py desde capture_store
+// Una tabla por (house, nib7); celda i = temp_idx t_lo + i, temp_idx = (Temp_C + 40) * 10
+// valid: bit i en valid[i >> 3] (LSB primero); P/M: nibble i en [i >> 1], i par = nibble alto
+// 49 tablas, 5637 bytes de datos + 588 de directorio, todo en flash
+
+#include <stdint.h>
+
+#ifdef __AVR__
+#include <avr/pgmspace.h>
+#define EC40_PROGMEM PROGMEM
+#define EC40_READ(p) pgm_read_byte(p)
+#define EC40_READ_WORD(p) pgm_read_word(p)
+#define EC40_READ_PTR(p) ((const uint8_t *)pgm_read_ptr(p))
+#else
+#define EC40_PROGMEM
+#define EC40_READ(p) (*(p))
+#define EC40_READ_WORD(p) (*(p))
+#define EC40_READ_PTR(p) (*(p))
+#endif
+
+typedef struct {
+    uint8_t house;
+    uint8_t nib7;
+    uint16_t t_lo;
+    uint16_t span;
+    const uint8_t *valid;
+    const uint8_t *p;
+    const uint8_t *m;
+} ec40_pm_table_t;
+
+// house 0, nib7 0x8: temp_idx 896..922, 2 celdas observadas, 32 bytes
+static const uint8_t EC40_H0_N8_VALID[4] EC40_PROGMEM = {
+    0x01, 0x00, 0x00, 0x04
+};
+static const uint8_t EC40_H0_N8_P[14] EC40_PROGMEM = {
+    0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x80
+};
+static const uint8_t EC40_H0_N8_M[14] EC40_PROGMEM = {
+    0x30, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x30
+};
+
+// house 3, nib7 0x0: temp_idx 531..579, 26 celdas observadas, 57 bytes
+static const uint8_t EC40_H3_N0_VALID[7] EC40_PROGMEM = {
+    0x93, 0x94, 0x42, 0x65, 0xAD, 0xFE, 0x01
+};
+static const uint8_t EC40_H3_N0_P[25] EC40_PROGMEM = {
+    0x2B, 0x00, 0x90, 0x03, 0x00, 0x90, 0x70, 0x0B, 0x08, 0x00, 0x00, 0x20, 0x70, 0x90, 0x04, 0x30,
+    0xD0, 0x81, 0x02, 0x01, 0x0F, 0x8A, 0xD4, 0x37, 0x00
+};
+static const uint8_t EC40_H3_N0_M[25] EC40_PROGMEM = {
+    0x22, 0x00, 0x20, 0x02, 0x00, 0x20, 0x20, 0x02, 0x02, 0x00, 0x00, 0x20, 0x20, 0x20, 0x02, 0x20,
+    0x20, 0x22, 0x03, 0x02, 0x02, 0x22, 0x23, 0x33, 0x30
+};
+
+// house 3, nib7 0x1: temp_idx 580..801, 87 celdas observadas, 250 bytes
+static const uint8_t EC40_H3_N1_VALID[28] EC40_PROGMEM = {
+    0xEF, 0x11, 0x84, 0x20, 0x44, 0x48, 0x44, 0x22, 0x25, 0xA9, 0xAA, 0x6A, 0xED, 0xBE, 0xFF, 0xFF,
+    0x57, 0xED, 0xFF, 0x07, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20
+};
+static const uint8_t EC40_H3_N1_P[111] EC40_PROGMEM = {
+    0x9E, 0x70, 0x05, 0xCB, 0xF0, 0x00, 0x20, 0x00, 0x00, 0xA0, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0xF0, 0x00, 0x20, 0x00, 0x02, 0x00, 0xE0, 0x00, 0xE0, 0x00, 0x50, 0x0C, 0x00, 0x02, 0x00,
+    0xE0, 0x00, 0x04, 0x00, 0xE0, 0x0C, 0x02, 0x01, 0x08, 0x06, 0x03, 0x0D, 0x0E, 0x0D, 0x03, 0x10,
+    0xF0, 0xCB, 0x0E, 0x70, 0x05, 0xCB, 0xF8, 0x0B, 0x25, 0x70, 0x9E, 0xAD, 0x16, 0xF8, 0xAD, 0x43,
+    0x70, 0x40, 0xA0, 0xF0, 0x10, 0x25, 0x0C, 0x52, 0x07, 0xE9, 0xDA, 0xE9, 0x07, 0x50, 0x00, 0x00,
+    0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01
+};
+static const uint8_t EC40_H3_N1_M[111] EC40_PROGMEM = {
+    0x22, 0x22, 0x03, 0x33, 0x30, 0x00, 0x20, 0x00, 0x00, 0x30, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00,
+    0x00, 0x20, 0x00, 0x20, 0x00, 0x02, 0x00, 0x20, 0x00, 0x20, 0x00, 0x20, 0x02, 0x00, 0x02, 0x00,
+    0x20, 0x20, 0x03, 0x00, 0x20, 0x02, 0x03, 0x03, 0x02, 0x02, 0x03, 0x03, 0x03, 0x02, 0x02, 0x30,
+    0x30, 0x33, 0x02, 0x23, 0x03, 0x33, 0x33, 0x02, 0x33, 0x33, 0x33, 0x33, 0x22, 0x22, 0x22, 0x22,
+    0x22, 0x20, 0x20, 0x20, 0x20, 0x23, 0x02, 0x22, 0x22, 0x22, 0x33, 0x22, 0x22, 0x20, 0x00, 0x00,
+    0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02
+};
+
+// house 3, nib7 0x2: temp_idx 535..549, 15 celdas observadas, 18 bytes
+static const uint8_t EC40_H3_N2_VALID[2] EC40_PROGMEM = {
+    0xFF, 0x7F
+};
+static const uint8_t EC40_H3_N2_P[8] EC40_PROGMEM = {
+    0xF6, 0x15, 0x28, 0xF6, 0x13, 0x4D, 0xAE, 0x90
+};
+static const uint8_t EC40_H3_N2_M[8] EC40_PROGMEM = {
+    0x22, 0x23, 0x32, 0x22, 0x22, 0x22, 0x33, 0x30
+};
+
+// house 18, nib7 0x0: temp_idx 597..599, 3 celdas observadas, 5 bytes
+static const uint8_t EC40_H18_N0_VALID[1] EC40_PROGMEM = {
+    0x07
+};
+static const uint8_t EC40_H18_N0_P[2] EC40_PROGMEM = {
+    0x25, 0x60
+};
+static const uint8_t EC40_H18_N0_M[2] EC40_PROGMEM = {
+    0x33, 0x30
+};
+
+// house 18, nib7 0x2: temp_idx 594..599, 6 celdas observadas, 7 bytes
+static const uint8_t EC40_H18_N2_VALID[1] EC40_PROGMEM = {
+    0x3F
+};
+static const uint8_t EC40_H18_N2_P[3] EC40_PROGMEM = {
+    0x8A, 0xD4, 0x37
+};
+static const uint8_t EC40_H18_N2_M[3] EC40_PROGMEM = {
+    0x33, 0x33, 0x33
+};
+
+// house 18, nib7 0x8: temp_idx 600..761, 42 celdas observadas, 183 bytes
+static const uint8_t EC40_H18_N8_VALID[21] EC40_PROGMEM = {
+    0xFF, 0xDD, 0x52, 0xA5, 0x92, 0x24, 0x89, 0x10, 0x21, 0x08, 0x02, 0x81, 0x00, 0x01, 0x02, 0x10,
+    0x80, 0x00, 0x20, 0x00, 0x02
+};
+static const uint8_t EC40_H18_N8_P[81] EC40_PROGMEM = {
+    0x7B, 0xC5, 0x20, 0x7E, 0xD0, 0xAE, 0x90, 0x05, 0x0C, 0x00, 0x80, 0x10, 0xF0, 0xA0, 0x04, 0x00,
+    0x03, 0x00, 0xD0, 0x01, 0x00, 0x50, 0x01, 0x00, 0x30, 0x09, 0x00, 0x0D, 0x00, 0x00, 0x60, 0x00,
+    0x50, 0x00, 0x0E, 0x00, 0x00, 0x04, 0x00, 0x00, 0x0C, 0x00, 0x00, 0x00, 0x40, 0x00, 0x00, 0x05,
+    0x00, 0x00, 0x00, 0x00, 0xA0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x70, 0x00,
+    0x00, 0x00, 0x00, 0x0A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x0E
+};
+static const uint8_t EC40_H18_N8_M[81] EC40_PROGMEM = {
+    0x32, 0x22, 0x23, 0x33, 0x30, 0x32, 0x20, 0x23, 0x03, 0x00, 0x30, 0x20, 0x30, 0x30, 0x03, 0x03,
+    0x03, 0x00, 0x30, 0x03, 0x00, 0x30, 0x03, 0x00, 0x30, 0x03, 0x00, 0x03, 0x00, 0x00, 0x30, 0x00,
+    0x30, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x30, 0x00, 0x00, 0x03,
+    0x00, 0x00, 0x00, 0x00, 0x30, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x30, 0x00,
+    0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x03
+};
+
+// house 39, nib7 0x8: temp_idx 533..568, 15 celdas observadas, 41 bytes
+static const uint8_t EC40_H39_N8_VALID[5] EC40_PROGMEM = {
+    0x81, 0x20, 0x92, 0xEA, 0x0F
+};
+static const uint8_t EC40_H39_N8_P[18] EC40_PROGMEM = {
+    0xF0, 0x00, 0x00, 0x0A, 0x00, 0x00, 0x0A, 0x00, 0x03, 0x00, 0xF0, 0x0C, 0x05, 0x0B, 0x0C, 0xE9,
+    0x07, 0x30
+};
+static const uint8_t EC40_H39_N8_M[18] EC40_PROGMEM = {
+    0x30, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x03, 0x00, 0x30, 0x03, 0x03, 0x03, 0x03, 0x33,
+    0x33, 0x33
+};
+
+// house 44, nib7 0x8: temp_idx 575..575, 1 celdas observadas, 3 bytes
+static const uint8_t EC40_H44_N8_VALID[1] EC40_PROGMEM = {
+    0x01
+};
+static const uint8_t EC40_H44_N8_P[1] EC40_PROGMEM = {
+    0xC0
+};
+static const uint8_t EC40_H44_N8_M[1] EC40_PROGMEM = {
+    0x40
+};
+
+// house 53, nib7 0x2: temp_idx 534..536, 3 celdas observadas, 5 bytes
+static const uint8_t EC40_H53_N2_VALID[1] EC40_PROGMEM = {
+    0x07
+};
+static const uint8_t EC40_H53_N2_P[2] EC40_PROGMEM = {
+    0xA8, 0x60
+};
+static const uint8_t EC40_H53_N2_M[2] EC40_PROGMEM = {
+    0x33, 0x30
+};
+
+// house 53, nib7 0x8: temp_idx 533..602, 32 celdas observadas, 79 bytes
+static const uint8_t EC40_H53_N8_VALID[9] EC40_PROGMEM = {
+    0xF1, 0xBF, 0xBD, 0x56, 0x49, 0x22, 0x42, 0x08, 0x24
+};
+static const uint8_t EC40_H53_N8_P[35] EC40_PROGMEM = {
+    0xD0, 0x00, 0x16, 0x25, 0xF8, 0x16, 0x43, 0x0A, 0x90, 0xED, 0x43, 0x01, 0x0F, 0xC0, 0xB0, 0x20,
+    0xC0, 0x09, 0x00, 0x30, 0x07, 0x00, 0x0B, 0x00, 0x06, 0x00, 0x00, 0xD0, 0x00, 0x01, 0x00, 0x00,
+    0x00, 0x80, 0x07
+};
+static const uint8_t EC40_H53_N8_M[35] EC40_PROGMEM = {
+    0x30, 0x00, 0x33, 0x33, 0x33, 0x33, 0x33, 0x03, 0x30, 0x33, 0x33, 0x03, 0x03, 0x30, 0x30, 0x30,
+    0x30, 0x03, 0x00, 0x30, 0x03, 0x00, 0x03, 0x00, 0x03, 0x00, 0x00, 0x30, 0x00, 0x03, 0x00, 0x00,
+    0x00, 0x30, 0x04
+};
+
+// house 71, nib7 0x1: temp_idx 560..561, 2 celdas observadas, 3 bytes
+static const uint8_t EC40_H71_N1_VALID[1] EC40_PROGMEM = {
+    0x03
+};
+static const uint8_t EC40_H71_N1_P[1] EC40_PROGMEM = {
+    0x81
+};
+static const uint8_t EC40_H71_N1_M[1] EC40_PROGMEM = {
+    0x33
+};
+
+// house 71, nib7 0x8: temp_idx 498..559, 28 celdas observadas, 70 bytes
+static const uint8_t EC40_H71_N8_VALID[8] EC40_PROGMEM = {
+    0x01, 0x00, 0x21, 0x49, 0x49, 0xBB, 0xFE, 0x3F
+};
+static const uint8_t EC40_H71_N8_P[31] EC40_PROGMEM = {
+    0x50, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xF0, 0x00, 0x0F, 0x00, 0xD0, 0x07, 0x00, 0x40,
+    0xD0, 0x01, 0x00, 0x20, 0x58, 0x01, 0x63, 0x0D, 0x09, 0xEA, 0xD4, 0x31, 0x6F, 0x8C, 0xB5
+};
+static const uint8_t EC40_H71_N8_M[31] EC40_PROGMEM = {
+    0x30, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x30, 0x00, 0x03, 0x00, 0x30, 0x03, 0x00, 0x30,
+    0x30, 0x03, 0x00, 0x30, 0x33, 0x03, 0x33, 0x03, 0x03, 0x43, 0x33, 0x33, 0x33, 0x34, 0x43
+};
+
+// house 73, nib7 0x8: temp_idx 601..622, 12 celdas observadas, 25 bytes
+static const uint8_t EC40_H73_N8_VALID[3] EC40_PROGMEM = {
+    0xBF, 0xC8, 0x22
+};
+static const uint8_t EC40_H73_N8_P[11] EC40_PROGMEM = {
+    0x2C, 0xD5, 0x07, 0x0B, 0x00, 0x0E, 0x00, 0x0F, 0x02, 0x00, 0x08
+};
+static const uint8_t EC40_H73_N8_M[11] EC40_PROGMEM = {
+    0x33, 0x33, 0x34, 0x03, 0x00, 0x03, 0x00, 0x33, 0x03, 0x00, 0x03
+};
+
+// house 79, nib7 0x8: temp_idx 609..609, 1 celdas observadas, 3 bytes
+static const uint8_t EC40_H79_N8_VALID[1] EC40_PROGMEM = {
+    0x01
+};
+static const uint8_t EC40_H79_N8_P[1] EC40_PROGMEM = {
+    0xA0
+};
+static const uint8_t EC40_H79_N8_M[1] EC40_PROGMEM = {
+    0x40
+};
+
+// house 92, nib7 0x8: temp_idx 945..945, 1 celdas observadas, 3 bytes
+static const uint8_t EC40_H92_N8_VALID[1] EC40_PROGMEM = {
+    0x01
+};
+static const uint8_t EC40_H92_N8_P[1] EC40_PROGMEM = {
+    0x40
+};
+static const uint8_t EC40_H92_N8_M[1] EC40_PROGMEM = {
+    0x40
+};
+
+// house 94, nib7 0x8: temp_idx 590..591, 2 celdas observadas, 3 bytes
+static const uint8_t EC40_H94_N8_VALID[1] EC40_PROGMEM = {
+    0x03
+};
+static const uint8_t EC40_H94_N8_P[1] EC40_PROGMEM = {
+    0x21
+};
+static const uint8_t EC40_H94_N8_M[1] EC40_PROGMEM = {
+    0x54
+};
+
+// house 95, nib7 0x1: temp_idx 566..639, 53 celdas observadas, 84 bytes
+static const uint8_t EC40_H95_N1_VALID[10] EC40_PROGMEM = {
+    0x17, 0x22, 0x49, 0x75, 0xFF, 0xFF, 0xFF, 0xFF, 0x7B, 0x02
+};
+static const uint8_t EC40_H95_N1_P[37] EC40_PROGMEM = {
+    0xD9, 0xA0, 0x60, 0x00, 0x0B, 0x00, 0x07, 0x00, 0x50, 0x0F, 0x00, 0xC0, 0x20, 0x70, 0x09, 0xA0,
+    0xD1, 0x6F, 0x8A, 0xD4, 0x37, 0x04, 0x3A, 0xDF, 0x81, 0x62, 0x5B, 0xC5, 0x20, 0x7E, 0x9D, 0xAE,
+    0x97, 0x05, 0x2B, 0xF0, 0x02
+};
+static const uint8_t EC40_H95_N1_M[37] EC40_PROGMEM = {
+    0x44, 0x30, 0x40, 0x00, 0x04, 0x00, 0x03, 0x00, 0x40, 0x04, 0x00, 0x30, 0x40, 0x40, 0x44, 0x40,
+    0x43, 0x33, 0x33, 0x33, 0x33, 0x33, 0x33, 0x33, 0x33, 0x33, 0x43, 0x33, 0x33, 0x33, 0x34, 0x43,
+    0x33, 0x03, 0x33, 0x40, 0x03
+};
+
+// house 95, nib7 0x8: temp_idx 516..639, 28 celdas observadas, 140 bytes
+static const uint8_t EC40_H95_N8_VALID[16] EC40_PROGMEM = {
+    0x41, 0x10, 0x91, 0xD4, 0xEE, 0xFF, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08
+};
+static const uint8_t EC40_H95_N8_P[62] EC40_PROGMEM = {
+    0xF0, 0x00, 0x00, 0x70, 0x00, 0x00, 0xA0, 0x00, 0x10, 0x00, 0x50, 0x01, 0x00, 0x40, 0xA0, 0xDE,
+    0x0A, 0xD3, 0x01, 0x6F, 0x8C, 0xB5, 0x2B, 0xCE, 0x90, 0x70, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02
+};
+static const uint8_t EC40_H95_N8_M[62] EC40_PROGMEM = {
+    0x40, 0x00, 0x00, 0x40, 0x00, 0x00, 0x40, 0x00, 0x40, 0x00, 0x40, 0x04, 0x00, 0x40, 0x40, 0x44,
+    0x04, 0x44, 0x04, 0x44, 0x44, 0x44, 0x44, 0x44, 0x44, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04
+};
+
+// house 96, nib7 0x2: temp_idx 666..718, 38 celdas observadas, 61 bytes
+static const uint8_t EC40_H96_N2_VALID[7] EC40_PROGMEM = {
+    0xFF, 0xF6, 0xEF, 0xD5, 0xB6, 0xAC, 0x15
+};
+static const uint8_t EC40_H96_N2_P[27] EC40_PROGMEM = {
+    0x70, 0x43, 0x70, 0x9E, 0x0B, 0x20, 0x16, 0x43, 0xAD, 0xF8, 0x06, 0x25, 0x10, 0xF0, 0xA0, 0x43,
+    0x00, 0xC0, 0x25, 0x00, 0x00, 0xAD, 0x0E, 0x00, 0x20, 0xC0, 0xF0
+};
+static const uint8_t EC40_H96_N2_M[27] EC40_PROGMEM = {
+    0x33, 0x33, 0x33, 0x33, 0x03, 0x30, 0x33, 0x33, 0x33, 0x33, 0x03, 0x33, 0x30, 0x30, 0x30, 0x33,
+    0x03, 0x20, 0x22, 0x02, 0x00, 0x33, 0x02, 0x02, 0x20, 0x30, 0x30
+};
+
+// house 96, nib7 0x8: temp_idx 720..889, 43 celdas observadas, 192 bytes
+static const uint8_t EC40_H96_N8_VALID[22] EC40_PROGMEM = {
+    0xAD, 0x4A, 0x95, 0x08, 0x29, 0x49, 0x12, 0x24, 0x91, 0x48, 0x40, 0x84, 0x08, 0x41, 0x08, 0x21,
+    0x04, 0x41, 0x10, 0x04, 0x00, 0x02
+};
+static const uint8_t EC40_H96_N8_P[85] EC40_PROGMEM = {
+    0x10, 0xF8, 0x0D, 0x03, 0x00, 0x03, 0x00, 0xF0, 0x10, 0x20, 0xF0, 0x06, 0x00, 0x0D, 0x00, 0x00,
+    0x40, 0x06, 0x08, 0x00, 0x50, 0x0C, 0x00, 0x00, 0x04, 0x00, 0xE0, 0x00, 0x00, 0x60, 0x04, 0x00,
+    0x80, 0x00, 0x50, 0x01, 0x00, 0x0A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x90, 0x00, 0x90, 0x00, 0x05,
+    0x00, 0x08, 0x00, 0x00, 0xD0, 0x00, 0x00, 0x30, 0x00, 0x0F, 0x00, 0x00, 0x80, 0x00, 0x04, 0x00,
+    0x00, 0xD0, 0x00, 0x00, 0x80, 0x00, 0x00, 0xC0, 0x00, 0x00, 0x40, 0x00, 0x00, 0xC0, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x05
+};
+static const uint8_t EC40_H96_N8_M[85] EC40_PROGMEM = {
+    0x30, 0x33, 0x03, 0x03, 0x03, 0x03, 0x00, 0x30, 0x30, 0x30, 0x30, 0x03, 0x00, 0x03, 0x00, 0x00,
+    0x30, 0x03, 0x03, 0x00, 0x30, 0x03, 0x00, 0x30, 0x03, 0x00, 0x30, 0x00, 0x00, 0x30, 0x03, 0x00,
+    0x30, 0x00, 0x40, 0x03, 0x00, 0x03, 0x00, 0x40, 0x00, 0x00, 0x00, 0x30, 0x00, 0x30, 0x00, 0x03,
+    0x00, 0x03, 0x00, 0x00, 0x30, 0x00, 0x00, 0x30, 0x00, 0x03, 0x00, 0x00, 0x30, 0x00, 0x03, 0x00,
+    0x00, 0x30, 0x00, 0x00, 0x30, 0x00, 0x00, 0x30, 0x00, 0x00, 0x30, 0x00, 0x00, 0x30, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x04
+};
+
+// house 121, nib7 0x1: temp_idx 590..663, 56 celdas observadas, 84 bytes
+static const uint8_t EC40_H121_N1_VALID[10] EC40_PROGMEM = {
+    0xDD, 0xFF, 0x9F, 0xAD, 0xAA, 0xC6, 0xED, 0xFB, 0xFF, 0x03
+};
+static const uint8_t EC40_H121_N1_P[37] EC40_PROGMEM = {
+    0x20, 0x57, 0x90, 0xEA, 0xD1, 0x6F, 0x8A, 0xD4, 0x37, 0x04, 0xD0, 0x0F, 0x10, 0x65, 0x0C, 0x02,
+    0x07, 0x09, 0x0A, 0x09, 0x00, 0xB0, 0x00, 0xC8, 0x50, 0x2C, 0x0E, 0x90, 0x74, 0x00, 0x7E, 0x9B,
+    0xC5, 0x26, 0x1F, 0x81, 0x64
+};
+static const uint8_t EC40_H121_N1_M[37] EC40_PROGMEM = {
+    0x30, 0x33, 0x40, 0x44, 0x43, 0x33, 0x33, 0x33, 0x33, 0x33, 0x30, 0x03, 0x30, 0x33, 0x03, 0x03,
+    0x03, 0x03, 0x03, 0x03, 0x03, 0x30, 0x00, 0x33, 0x30, 0x33, 0x03, 0x33, 0x33, 0x03, 0x33, 0x33,
+    0x33, 0x33, 0x43, 0x33, 0x33
+};
+
+// house 121, nib7 0x8: temp_idx 530..664, 38 celdas observadas, 153 bytes
+static const uint8_t EC40_H121_N8_VALID[17] EC40_PROGMEM = {
+    0x41, 0x52, 0xDD, 0xFD, 0x53, 0xB5, 0xED, 0x0F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x40
+};
+static const uint8_t EC40_H121_N8_P[68] EC40_PROGMEM = {
+    0x10, 0x00, 0x00, 0x50, 0x01, 0x00, 0x40, 0xA0, 0x90, 0xEA, 0x40, 0x31, 0xF0, 0x8C, 0xB5, 0x2B,
+    0xC0, 0x00, 0x30, 0x00, 0xE0, 0xB0, 0xC2, 0x06, 0x30, 0x4A, 0x08, 0xF6, 0x15, 0x26, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0xC0
+};
+static const uint8_t EC40_H121_N8_M[68] EC40_PROGMEM = {
+    0x40, 0x00, 0x00, 0x40, 0x03, 0x00, 0x40, 0x40, 0x40, 0x43, 0x30, 0x44, 0x40, 0x44, 0x43, 0x34,
+    0x44, 0x00, 0x40, 0x30, 0x40, 0x40, 0x44, 0x04, 0x40, 0x44, 0x04, 0x44, 0x44, 0x44, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x30
+};
+
+// house 124, nib7 0x2: temp_idx 530..584, 33 celdas observadas, 63 bytes
+static const uint8_t EC40_H124_N2_VALID[7] EC40_PROGMEM = {
+    0xFF, 0xFF, 0x6D, 0x53, 0x91, 0x84, 0x68
+};
+static const uint8_t EC40_H124_N2_P[28] EC40_PROGMEM = {
+    0x73, 0x4D, 0xA8, 0xF6, 0x15, 0x28, 0xF6, 0x13, 0x40, 0xDE, 0x09, 0xA0, 0x36, 0x00, 0x10, 0xB0,
+    0x20, 0x00, 0xC0, 0x07, 0x00, 0x30, 0x00, 0x09, 0x00, 0x05, 0x03, 0xF0
+};
+static const uint8_t EC40_H124_N2_M[28] EC40_PROGMEM = {
+    0x43, 0x33, 0x33, 0x33, 0x34, 0x43, 0x33, 0x33, 0x30, 0x34, 0x04, 0x30, 0x33, 0x00, 0x30, 0x40,
+    0x30, 0x00, 0x30, 0x04, 0x00, 0x40, 0x00, 0x03, 0x00, 0x04, 0x03, 0x40
+};
+
+// house 124, nib7 0x8: temp_idx 529..652, 35 celdas observadas, 140 bytes
+static const uint8_t EC40_H124_N8_VALID[16] EC40_PROGMEM = {
+    0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xFF, 0xBF, 0xBB, 0x91, 0x52, 0x12, 0x11, 0x01, 0x09
+};
+static const uint8_t EC40_H124_N8_P[62] EC40_PROGMEM = {
+    0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x8F, 0x61, 0x52, 0x61,
+    0x8F, 0xDA, 0x34, 0x00, 0xBC, 0x05, 0x07, 0x0E, 0xD0, 0x00, 0xA0, 0x07, 0x0B, 0x00, 0x80, 0x60,
+    0x08, 0x00, 0x40, 0x00, 0x00, 0x00, 0xD0, 0x00, 0x80, 0x00, 0x00, 0x00, 0x30, 0x0E
+};
+static const uint8_t EC40_H124_N8_M[62] EC40_PROGMEM = {
+    0x30, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x44, 0x44, 0x44, 0x44,
+    0x44, 0x44, 0x44, 0x04, 0x33, 0x03, 0x44, 0x04, 0x40, 0x00, 0x40, 0x04, 0x04, 0x00, 0x40, 0x30,
+    0x04, 0x00, 0x40, 0x00, 0x40, 0x00, 0x40, 0x00, 0x40, 0x00, 0x00, 0x00, 0x40, 0x04
+};
+
+// house 131, nib7 0x1: temp_idx 517..519, 2 celdas observadas, 5 bytes
+static const uint8_t EC40_H131_N1_VALID[1] EC40_PROGMEM = {
+    0x05
+};
+static const uint8_t EC40_H131_N1_P[2] EC40_PROGMEM = {
+    0xC0, 0x10
+};
+static const uint8_t EC40_H131_N1_M[2] EC40_PROGMEM = {
+    0x40, 0x30
+};
+
+// house 131, nib7 0x2: temp_idx 516..533, 6 celdas observadas, 21 bytes
+static const uint8_t EC40_H131_N2_VALID[3] EC40_PROGMEM = {
+    0x01, 0xE0, 0x03
+};
+static const uint8_t EC40_H131_N2_P[9] EC40_PROGMEM = {
+    0xD0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x73, 0x4D
+};
+static const uint8_t EC40_H131_N2_M[9] EC40_PROGMEM = {
+    0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x33, 0x33
+};
+
+// house 131, nib7 0x8: temp_idx 528..663, 39 celdas observadas, 153 bytes
+static const uint8_t EC40_H131_N8_VALID[17] EC40_PROGMEM = {
+    0xC1, 0xFF, 0xBD, 0x96, 0x92, 0x24, 0x11, 0x11, 0x82, 0x20, 0x20, 0x40, 0x00, 0x01, 0x08, 0x40,
+    0x80
+};
+static const uint8_t EC40_H131_N8_P[68] EC40_PROGMEM = {
+    0x00, 0x00, 0x00, 0xDF, 0x81, 0x62, 0x5F, 0x81, 0x60, 0x4A, 0xD9, 0x0E, 0x0D, 0x30, 0x10, 0x0F,
+    0x0B, 0x00, 0x20, 0x0E, 0x00, 0x70, 0x00, 0x00, 0x90, 0x00, 0x50, 0x00, 0x30, 0x00, 0x80, 0x00,
+    0x05, 0x00, 0x00, 0x0F, 0x00, 0x00, 0x07, 0x00, 0x00, 0x00, 0x07, 0x00, 0x00, 0x00, 0x00, 0x70,
+    0x00, 0x00, 0x00, 0x00, 0xF0, 0x00, 0x00, 0x00, 0x00, 0x0A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x60,
+    0x00, 0x00, 0x00, 0x01
+};
+static const uint8_t EC40_H131_N8_M[68] EC40_PROGMEM = {
+    0x40, 0x00, 0x00, 0x33, 0x33, 0x33, 0x33, 0x33, 0x30, 0x33, 0x33, 0x04, 0x03, 0x30, 0x30, 0x03,
+    0x04, 0x00, 0x30, 0x03, 0x00, 0x40, 0x03, 0x00, 0x30, 0x00, 0x40, 0x00, 0x30, 0x00, 0x30, 0x00,
+    0x04, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x30,
+    0x00, 0x00, 0x00, 0x00, 0x30, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x30,
+    0x00, 0x00, 0x00, 0x03
+};
+
+// house 132, nib7 0x8: temp_idx 603..618, 12 celdas observadas, 18 bytes
+static const uint8_t EC40_H132_N8_VALID[2] EC40_PROGMEM = {
+    0xFF, 0x95
+};
+static const uint8_t EC40_H132_N8_P[8] EC40_PROGMEM = {
+    0x52, 0x07, 0xE9, 0xDA, 0xE0, 0x90, 0x20, 0x0B
+};
+static const uint8_t EC40_H132_N8_M[8] EC40_PROGMEM = {
+    0x33, 0x33, 0x33, 0x33, 0x30, 0x30, 0x30, 0x03
+};
+
+// house 135, nib7 0x8: temp_idx 803..945, 3 celdas observadas, 162 bytes
+static const uint8_t EC40_H135_N8_VALID[18] EC40_PROGMEM = {
+    0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x40
+};
+static const uint8_t EC40_H135_N8_P[72] EC40_PROGMEM = {
+    0x50, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x60, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x40
+};
+static const uint8_t EC40_H135_N8_M[72] EC40_PROGMEM = {
+    0x30, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x40
+};
+
+// house 151, nib7 0x8: temp_idx 604..617, 8 celdas observadas, 16 bytes
+static const uint8_t EC40_H151_N8_VALID[2] EC40_PROGMEM = {
+    0x3D, 0x29
+};
+static const uint8_t EC40_H151_N8_P[7] EC40_PROGMEM = {
+    0xE0, 0x9D, 0xA0, 0x00, 0x20, 0x0C, 0x07
+};
+static const uint8_t EC40_H151_N8_M[7] EC40_PROGMEM = {
+    0x30, 0x44, 0x43, 0x00, 0x30, 0x04, 0x03
+};
+
+// house 155, nib7 0x8: temp_idx 601..627, 13 celdas observadas, 32 bytes
+static const uint8_t EC40_H155_N8_VALID[4] EC40_PROGMEM = {
+    0xAF, 0x54, 0x58, 0x04
+};
+static const uint8_t EC40_H155_N8_P[14] EC40_PROGMEM = {
+    0xBC, 0x50, 0x0E, 0x02, 0x00, 0xA0, 0x90, 0x60, 0x00, 0x0C, 0x30, 0x10, 0x00, 0x80
+};
+static const uint8_t EC40_H155_N8_M[14] EC40_PROGMEM = {
+    0x33, 0x34, 0x04, 0x04, 0x00, 0x40, 0x30, 0x40, 0x00, 0x04, 0x40, 0x30, 0x00, 0x40
+};
+
+// house 173, nib7 0x1: temp_idx 583..762, 83 celdas observadas, 203 bytes
+static const uint8_t EC40_H173_N1_VALID[23] EC40_PROGMEM = {
+    0xE7, 0xBB, 0xA9, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x54, 0xB3, 0xFF,
+    0xFF, 0xFF, 0xFF, 0xED, 0xFF, 0xFF, 0x0F
+};
+static const uint8_t EC40_H173_N1_P[90] EC40_PROGMEM = {
+    0x02, 0x50, 0x0B, 0xF8, 0xC2, 0x07, 0x09, 0x0E, 0xA0, 0x06, 0x0F, 0x04, 0x30, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0xB0, 0x50, 0x00, 0x9D, 0x00, 0x1F, 0x08, 0xAD, 0x43, 0x70, 0x43,
+    0xAD, 0xF8, 0x16, 0x25, 0xBC, 0x52, 0x07, 0xE9, 0xD9, 0xA9, 0x07, 0x25, 0xC0, 0x85, 0x02, 0xBC,
+    0xE9, 0x07, 0x34, 0x07, 0xE9, 0xBC, 0x52, 0x61, 0xF8, 0x11
+};
+static const uint8_t EC40_H173_N1_M[90] EC40_PROGMEM = {
+    0x44, 0x40, 0x04, 0x44, 0x44, 0x04, 0x44, 0x04, 0x40, 0x03, 0x03, 0x03, 0x40, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x40, 0x40, 0x40, 0x44, 0x00, 0x33, 0x03, 0x33, 0x44, 0x44, 0x33,
+    0x33, 0x34, 0x44, 0x44, 0x33, 0x33, 0x44, 0x44, 0x44, 0x43, 0x34, 0x44, 0x40, 0x43, 0x03, 0x44,
+    0x44, 0x44, 0x44, 0x34, 0x44, 0x44, 0x44, 0x44, 0x44, 0x44
+};
+
+// house 173, nib7 0x2: temp_idx 580..686, 17 celdas observadas, 122 bytes
+static const uint8_t EC40_H173_N2_VALID[14] EC40_PROGMEM = {
+    0x03, 0x78, 0x02, 0x00, 0x00, 0x04, 0x00, 0x20, 0x00, 0x02, 0x04, 0x21, 0x22, 0x05
+};
+static const uint8_t EC40_H173_N2_P[54] EC40_PROGMEM = {
+    0x63, 0x00, 0x00, 0x00, 0x00, 0x08, 0x68, 0xF0, 0x0A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0xF0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x0C, 0x00, 0x00, 0x00, 0x00, 0x40, 0x00, 0x00, 0xE0, 0x00, 0x05, 0x00,
+    0x03, 0x00, 0x0F, 0x00, 0x10, 0x50
+};
+static const uint8_t EC40_H173_N2_M[54] EC40_PROGMEM = {
+    0x44, 0x00, 0x00, 0x00, 0x00, 0x04, 0x43, 0x40, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x30, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x40, 0x00, 0x00, 0x40, 0x00, 0x04, 0x00,
+    0x04, 0x00, 0x04, 0x00, 0x40, 0x40
+};
+
+// house 173, nib7 0x8: temp_idx 584..763, 21 celdas observadas, 203 bytes
+static const uint8_t EC40_H173_N8_VALID[23] EC40_PROGMEM = {
+    0xA1, 0xBD, 0xFF, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08
+};
+static const uint8_t EC40_H173_N8_P[90] EC40_PROGMEM = {
+    0x10, 0x00, 0x02, 0x08, 0xD0, 0xA3, 0x40, 0x0B, 0xC5, 0x20, 0x7E, 0x9D, 0xAE, 0x90, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02
+};
+static const uint8_t EC40_H173_N8_M[90] EC40_PROGMEM = {
+    0x40, 0x00, 0x05, 0x04, 0x40, 0x44, 0x45, 0x04, 0x44, 0x44, 0x44, 0x44, 0x44, 0x40, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03
+};
+
+// house 184, nib7 0x2: temp_idx 525..533, 8 celdas observadas, 12 bytes
+static const uint8_t EC40_H184_N2_VALID[2] EC40_PROGMEM = {
+    0xBF, 0x01
+};
+static const uint8_t EC40_H184_N2_P[5] EC40_PROGMEM = {
+    0xDA, 0x34, 0x07, 0x03, 0xD0
+};
+static const uint8_t EC40_H184_N2_M[5] EC40_PROGMEM = {
+    0x33, 0x33, 0x34, 0x03, 0x30
+};
+
+// house 184, nib7 0x8: temp_idx 524..638, 38 celdas observadas, 131 bytes
+static const uint8_t EC40_H184_N8_VALID[15] EC40_PROGMEM = {
+    0x01, 0xFC, 0xBF, 0xA6, 0x9A, 0x25, 0x45, 0x08, 0x21, 0x08, 0x04, 0x04, 0x01, 0x41, 0x04
+};
+static const uint8_t EC40_H184_N8_P[58] EC40_PROGMEM = {
+    0xD0, 0x00, 0x00, 0x00, 0x00, 0xDF, 0x81, 0x62, 0x5F, 0x81, 0x64, 0x03, 0x0D, 0xE0, 0x0A, 0x03,
+    0x06, 0x08, 0xB0, 0x05, 0xC0, 0xE0, 0x00, 0x00, 0x40, 0xE0, 0x00, 0xB0, 0x00, 0x06, 0x00, 0x00,
+    0xA0, 0x00, 0x05, 0x00, 0x00, 0x0F, 0x00, 0x00, 0x00, 0x70, 0x00, 0x00, 0x00, 0xE0, 0x00, 0x00,
+    0x50, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x70, 0x00, 0xF0
+};
+static const uint8_t EC40_H184_N8_M[58] EC40_PROGMEM = {
+    0x40, 0x00, 0x00, 0x00, 0x00, 0x44, 0x44, 0x44, 0x43, 0x44, 0x44, 0x04, 0x04, 0x40, 0x04, 0x04,
+    0x04, 0x04, 0x40, 0x04, 0x40, 0x40, 0x04, 0x00, 0x40, 0x40, 0x00, 0x40, 0x00, 0x04, 0x00, 0x00,
+    0x40, 0x00, 0x04, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x40, 0x00, 0x00, 0x00, 0x40, 0x00, 0x00,
+    0x40, 0x00, 0x00, 0x00, 0x30, 0x00, 0x00, 0x40, 0x00, 0x40
+};
+
+// house 187, nib7 0x1: temp_idx 582..650, 28 celdas observadas, 79 bytes
+static const uint8_t EC40_H187_N1_VALID[9] EC40_PROGMEM = {
+    0x21, 0x40, 0x48, 0x92, 0x54, 0x69, 0x95, 0xB3, 0x1B
+};
+static const uint8_t EC40_H187_N1_P[35] EC40_PROGMEM = {
+    0xB0, 0x00, 0x09, 0x00, 0x00, 0x00, 0x00, 0x60, 0x00, 0x0A, 0x00, 0x30, 0x04, 0x00, 0xD0, 0x01,
+    0x00, 0x20, 0xB0, 0x50, 0x70, 0x09, 0x0D, 0xE0, 0x00, 0x50, 0xC0, 0x08, 0xFB, 0x00, 0xC9, 0x00,
+    0x74, 0x00, 0x70
+};
+static const uint8_t EC40_H187_N1_M[35] EC40_PROGMEM = {
+    0x40, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x30, 0x00, 0x03, 0x00, 0x30, 0x03, 0x00, 0x30, 0x03,
+    0x00, 0x40, 0x30, 0x30, 0x30, 0x04, 0x04, 0x30, 0x30, 0x30, 0x40, 0x04, 0x43, 0x00, 0x34, 0x04,
+    0x44, 0x03, 0x30
+};
+
+// house 187, nib7 0x8: temp_idx 525..651, 27 celdas observadas, 144 bytes
+static const uint8_t EC40_H187_N8_VALID[16] EC40_PROGMEM = {
+    0x11, 0x51, 0x6A, 0xD7, 0xFF, 0x11, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x40
+};
+static const uint8_t EC40_H187_N8_P[64] EC40_PROGMEM = {
+    0x00, 0x00, 0xD0, 0x00, 0x60, 0x00, 0x50, 0x10, 0x04, 0x0A, 0x0D, 0xE0, 0xAD, 0x30, 0x60, 0xF8,
+    0xCB, 0x52, 0xBC, 0xE9, 0x40, 0x00, 0x20, 0x00, 0x00, 0x00, 0xD0, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x40
+};
+static const uint8_t EC40_H187_N8_M[64] EC40_PROGMEM = {
+    0x40, 0x00, 0x40, 0x00, 0x40, 0x00, 0x40, 0x40, 0x04, 0x04, 0x04, 0x40, 0x44, 0x40, 0x40, 0x44,
+    0x44, 0x44, 0x44, 0x44, 0x40, 0x00, 0x40, 0x00, 0x00, 0x00, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x40
+};
+
+// house 205, nib7 0x1: temp_idx 516..594, 27 celdas observadas, 90 bytes
+static const uint8_t EC40_H205_N1_VALID[10] EC40_PROGMEM = {
+    0xBF, 0x55, 0x65, 0x92, 0x44, 0x44, 0x08, 0x42, 0x40, 0x40
+};
+static const uint8_t EC40_H205_N1_P[40] EC40_PROGMEM = {
+    0x81, 0x62, 0x5B, 0x0C, 0x20, 0x00, 0xE0, 0xD0, 0xE0, 0x00, 0x05, 0xC0, 0x08, 0x00, 0x20, 0x0E,
+    0x00, 0x70, 0x00, 0x00, 0x00, 0xB0, 0x00, 0x60, 0x00, 0x01, 0x00, 0x00, 0x0D, 0x00, 0x00, 0x30,
+    0x00, 0x00, 0x00, 0xC0, 0x00, 0x00, 0x00, 0xC0
+};
+static const uint8_t EC40_H205_N1_M[40] EC40_PROGMEM = {
+    0x44, 0x44, 0x43, 0x03, 0x30, 0x40, 0x40, 0x40, 0x30, 0x30, 0x04, 0x40, 0x04, 0x00, 0x30, 0x04,
+    0x00, 0x40, 0x00, 0x30, 0x00, 0x40, 0x00, 0x40, 0x00, 0x04, 0x00, 0x00, 0x04, 0x00, 0x00, 0x40,
+    0x00, 0x00, 0x00, 0x40, 0x00, 0x00, 0x00, 0x40
+};
+
+// house 205, nib7 0x8: temp_idx 516..687, 36 celdas observadas, 194 bytes
+static const uint8_t EC40_H205_N8_VALID[22] EC40_PROGMEM = {
+    0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x4A, 0x89, 0x00, 0x81, 0x20, 0x84, 0x88,
+    0x88, 0x46, 0xD2, 0xF6, 0x6B, 0x09
+};
+static const uint8_t EC40_H205_N8_P[86] EC40_PROGMEM = {
+    0xB0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x01, 0x0D, 0x00, 0x30, 0x70, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0xF0, 0x00, 0x00, 0x0D, 0x00, 0x00, 0x04, 0x00, 0x00, 0x80, 0x00, 0x05, 0x00, 0x06, 0x00, 0x0D,
+    0x00, 0x0D, 0x00, 0x01, 0x02, 0xC0, 0x00, 0x20, 0x0E, 0x00, 0x00, 0x74, 0x00, 0xE0, 0x9B, 0xC5,
+    0x21, 0x04, 0x0D, 0x80, 0x10, 0x06
+};
+static const uint8_t EC40_H205_N8_M[86] EC40_PROGMEM = {
+    0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x04, 0x04, 0x00, 0x50, 0x50, 0x04, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00,
+    0x40, 0x00, 0x00, 0x04, 0x00, 0x00, 0x04, 0x00, 0x00, 0x40, 0x00, 0x04, 0x00, 0x04, 0x00, 0x04,
+    0x00, 0x04, 0x00, 0x04, 0x04, 0x40, 0x00, 0x40, 0x04, 0x00, 0x40, 0x45, 0x04, 0x40, 0x44, 0x44,
+    0x55, 0x04, 0x04, 0x40, 0x50, 0x05
+};
+
+// house 232, nib7 0x1: temp_idx 584..676, 20 celdas observadas, 106 bytes
+static const uint8_t EC40_H232_N1_VALID[12] EC40_PROGMEM = {
+    0x01, 0x00, 0xD0, 0x94, 0x88, 0x0A, 0x82, 0x40, 0x10, 0x01, 0x91, 0x10
+};
+static const uint8_t EC40_H232_N1_P[47] EC40_PROGMEM = {
+    0x70, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xF0, 0xA4, 0x00, 0x30, 0x40, 0x0A,
+    0x00, 0x08, 0x00, 0x05, 0x0E, 0x02, 0x00, 0x00, 0x09, 0x00, 0x00, 0x07, 0x00, 0x00, 0x00, 0xF0,
+    0x00, 0x00, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0xD0, 0x00, 0x50, 0x0F, 0x00, 0x00, 0x90
+};
+static const uint8_t EC40_H232_N1_M[47] EC40_PROGMEM = {
+    0x30, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x30, 0x33, 0x00, 0x30, 0x30, 0x03,
+    0x00, 0x03, 0x00, 0x04, 0x03, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x40,
+    0x00, 0x00, 0x40, 0x00, 0x40, 0x00, 0x00, 0x00, 0x40, 0x00, 0x40, 0x04, 0x00, 0x00, 0x40
+};
+
+// house 232, nib7 0x8: temp_idx 529..602, 30 celdas observadas, 84 bytes
+static const uint8_t EC40_H232_N8_VALID[10] EC40_PROGMEM = {
+    0x01, 0x42, 0x24, 0xA5, 0xDA, 0xFF, 0x7F, 0x00, 0x00, 0x02
+};
+static const uint8_t EC40_H232_N8_P[37] EC40_PROGMEM = {
+    0x20, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0xD0, 0x00, 0xA0, 0x03, 0x00, 0x60, 0xC0, 0x05, 0x0B,
+    0x0E, 0x09, 0x70, 0x34, 0x07, 0xE9, 0xBC, 0x52, 0x61, 0x34, 0xDA, 0x80, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x05
+};
+static const uint8_t EC40_H232_N8_M[37] EC40_PROGMEM = {
+    0x40, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x40, 0x00, 0x40, 0x04, 0x00, 0x40, 0x40, 0x04, 0x04,
+    0x04, 0x04, 0x40, 0x44, 0x44, 0x44, 0x44, 0x44, 0x44, 0x44, 0x44, 0x40, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x03
+};
+
+// house 247, nib7 0x0: temp_idx 254..670, 73 celdas observadas, 471 bytes
+static const uint8_t EC40_H247_N0_VALID[53] EC40_PROGMEM = {
+    0xA9, 0x4C, 0x2A, 0x49, 0x49, 0x52, 0x52, 0x92, 0x94, 0x94, 0x94, 0x92, 0x54, 0x4A, 0x84, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x08, 0x00, 0x02, 0x08, 0x9E,
+    0xDC, 0xA2, 0xAD, 0x5B, 0x01
+};
+static const uint8_t EC40_H247_N0_P[209] EC40_PROGMEM = {
+    0x30, 0x0F, 0x01, 0x0C, 0x00, 0x81, 0x00, 0x30, 0x09, 0x0A, 0x04, 0x00, 0x60, 0x06, 0x00, 0x20,
+    0xC0, 0x00, 0x00, 0x40, 0x0E, 0x00, 0xC0, 0x20, 0x0D, 0x00, 0x40, 0x10, 0x0B, 0x00, 0xF0, 0x03,
+    0x00, 0xA0, 0xF0, 0x05, 0x00, 0x70, 0x90, 0x0E, 0x00, 0x70, 0x20, 0x02, 0x01, 0x00, 0x80, 0x04,
+    0x00, 0x00, 0x30, 0xD0, 0x01, 0x0C, 0x00, 0x80, 0x00, 0x30, 0x00, 0x0A, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0D, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x0C, 0x00, 0x00, 0x02, 0xBC, 0xE0, 0x07,
+    0x00, 0xE9, 0x00, 0x52, 0x0C, 0x00, 0x0C, 0x02, 0x00, 0xE9, 0x0A, 0x03, 0xAD, 0x08, 0x10, 0x20,
+    0x10
+};
+static const uint8_t EC40_H247_N0_M[209] EC40_PROGMEM = {
+    0x40, 0x04, 0x04, 0x04, 0x00, 0x44, 0x00, 0x40, 0x04, 0x04, 0x04, 0x00, 0x40, 0x04, 0x00, 0x40,
+    0x40, 0x04, 0x00, 0x40, 0x04, 0x00, 0x40, 0x30, 0x04, 0x00, 0x40, 0x40, 0x04, 0x00, 0x40, 0x04,
+    0x00, 0x40, 0x40, 0x04, 0x00, 0x40, 0x40, 0x04, 0x00, 0x40, 0x40, 0x04, 0x04, 0x00, 0x40, 0x04,
+    0x00, 0x40, 0x40, 0x40, 0x04, 0x04, 0x00, 0x40, 0x00, 0x40, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x33, 0x30, 0x04,
+    0x00, 0x33, 0x30, 0x34, 0x04, 0x00, 0x03, 0x03, 0x40, 0x44, 0x04, 0x03, 0x34, 0x04, 0x40, 0x40,
+    0x30
+};
+
+// house 247, nib7 0x1: temp_idx 376..1014, 222 celdas observadas, 720 bytes
+static const uint8_t EC40_H247_N1_VALID[80] EC40_PROGMEM = {
+    0x95, 0x4A, 0x55, 0x4D, 0x34, 0xAB, 0x5A, 0xAD, 0xD2, 0xB5, 0x6D, 0x37, 0xEF, 0x77, 0xAF, 0xFF,
+    0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x1F, 0x00, 0x00, 0x00, 0xC0, 0xFF, 0xAE,
+    0x92, 0xFF, 0x52, 0x99, 0xCC, 0x11, 0x41, 0x10, 0x08, 0x08, 0x20, 0x00, 0x01, 0x10, 0x00, 0x02,
+    0x00, 0x02, 0x00, 0x04, 0x00, 0x80, 0x20, 0x00, 0x40, 0x04, 0x00, 0x00, 0x08, 0x04, 0x00, 0x00,
+    0x02, 0x41, 0x40, 0x08, 0x40, 0x08, 0x00, 0x00, 0x00, 0x00, 0x0C, 0x08, 0x00, 0x00, 0x00, 0x40
+};
+static const uint8_t EC40_H247_N1_P[320] EC40_PROGMEM = {
+    0x80, 0xD0, 0x30, 0x0E, 0x00, 0x05, 0x00, 0xC0, 0xF0, 0xC0, 0x20, 0x70, 0x90, 0xF8, 0x00, 0x40,
+    0x00, 0x40, 0xAD, 0x00, 0x16, 0x05, 0x0C, 0x02, 0x07, 0x09, 0xD0, 0xE0, 0x00, 0x52, 0x0C, 0x0F,
+    0x02, 0x00, 0xE0, 0x07, 0x30, 0x00, 0xE9, 0x0C, 0x50, 0x61, 0x08, 0x10, 0x43, 0xA0, 0x9E, 0x00,
+    0x43, 0x16, 0x08, 0xCB, 0x9E, 0x70, 0x25, 0xC0, 0xF8, 0xCB, 0x05, 0x00, 0x9E, 0xAD, 0x16, 0xF8,
+    0xAD, 0x43, 0x70, 0x43, 0xAD, 0xF8, 0x16, 0x25, 0xBC, 0x52, 0x07, 0xE9, 0xDA, 0xE9, 0x07, 0x52,
+    0xBC, 0x8F, 0x52, 0xBC, 0xE9, 0x07, 0x34, 0x07, 0xE9, 0xBC, 0x52, 0x61, 0xF8, 0x16, 0x43, 0xAD,
+    0x9E, 0xAD, 0x43, 0x16, 0xF8, 0xCB, 0x90, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xF8, 0x16, 0x25, 0xBC, 0x52, 0x07, 0xE9, 0x0A, 0x09,
+    0x07, 0x00, 0xB0, 0x0F, 0x52, 0xBC, 0xE9, 0x07, 0x04, 0x00, 0xE0, 0xB0, 0x50, 0x01, 0xF0, 0x06,
+    0x00, 0xAD, 0x00, 0xAD, 0x40, 0x00, 0xF0, 0x00, 0x90, 0x00, 0x00, 0xC0, 0x00, 0x00, 0x20, 0x00,
+    0x00, 0x0D, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0xD0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x50, 0x00, 0x00, 0x00, 0x00, 0x00, 0x09, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x0E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xC0, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x0A, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x90, 0x00, 0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x06, 0x00, 0x00, 0x00, 0xD0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x0F, 0x00, 0x00, 0x00, 0xE0, 0x00, 0x00, 0x80, 0x00, 0x00, 0x00, 0x30, 0x00, 0x0F, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x90, 0x00, 0x0E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xDA, 0x00, 0x00, 0x00, 0x0C, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x80
+};
+static const uint8_t EC40_H247_N1_M[320] EC40_PROGMEM = {
+    0x40, 0x40, 0x40, 0x04, 0x04, 0x04, 0x00, 0x30, 0x40, 0x40, 0x40, 0x40, 0x30, 0x33, 0x00, 0x30,
+    0x00, 0x30, 0x33, 0x00, 0x33, 0x04, 0x03, 0x03, 0x03, 0x03, 0x40, 0x30, 0x30, 0x33, 0x04, 0x04,
+    0x03, 0x00, 0x30, 0x44, 0x40, 0x30, 0x33, 0x04, 0x40, 0x44, 0x03, 0x30, 0x44, 0x40, 0x44, 0x00,
+    0x34, 0x44, 0x04, 0x44, 0x33, 0x40, 0x44, 0x40, 0x44, 0x34, 0x04, 0x04, 0x44, 0x44, 0x33, 0x33,
+    0x33, 0x33, 0x34, 0x33, 0x33, 0x33, 0x33, 0x44, 0x33, 0x33, 0x33, 0x34, 0x44, 0x33, 0x33, 0x33,
+    0x44, 0x44, 0x33, 0x33, 0x34, 0x44, 0x44, 0x33, 0x33, 0x44, 0x44, 0x44, 0x33, 0x34, 0x44, 0x44,
+    0x44, 0x33, 0x44, 0x44, 0x44, 0x44, 0x30, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x33, 0x34, 0x44, 0x33, 0x33, 0x03, 0x44, 0x04, 0x03,
+    0x03, 0x00, 0x40, 0x04, 0x33, 0x33, 0x44, 0x44, 0x04, 0x00, 0x30, 0x40, 0x40, 0x04, 0x30, 0x04,
+    0x00, 0x44, 0x00, 0x34, 0x40, 0x00, 0x40, 0x00, 0x40, 0x00, 0x00, 0x40, 0x00, 0x00, 0x40, 0x00,
+    0x00, 0x04, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x30, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x40, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x30, 0x00, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x04, 0x00, 0x00, 0x00, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x04, 0x00, 0x00, 0x00, 0x40, 0x00, 0x00, 0x30, 0x00, 0x00, 0x00, 0x30, 0x00, 0x04, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x40, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x44, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x40
+};
+
+// house 247, nib7 0x2: temp_idx 240..986, 216 celdas observadas, 842 bytes
+static const uint8_t EC40_H247_N2_VALID[94] EC40_PROGMEM = {
+    0xFF, 0xFF, 0xFF, 0xF7, 0xFD, 0x6F, 0xBF, 0xAA, 0x6D, 0xBF, 0x77, 0xDB, 0x75, 0x6D, 0x2D, 0xAD,
+    0x6A, 0xA9, 0x4A, 0x55, 0x57, 0x55, 0x55, 0xA8, 0x4A, 0x15, 0x4A, 0xA5, 0x84, 0x52, 0x52, 0x0A,
+    0x52, 0x92, 0x24, 0x24, 0x49, 0x49, 0x82, 0x4D, 0x4B, 0xDB, 0xFF, 0x02, 0x10, 0xFF, 0x7F, 0x20,
+    0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x00, 0x04
+};
+static const uint8_t EC40_H247_N2_P[374] EC40_PROGMEM = {
+    0xA4, 0x37, 0x09, 0xEC, 0xB2, 0x51, 0x62, 0x5C, 0xB9, 0xE7, 0x0A, 0xD9, 0xE7, 0x00, 0x5C, 0xBF,
+    0x80, 0xB2, 0x57, 0x09, 0xE0, 0x73, 0x0D, 0xA0, 0xF6, 0x15, 0x26, 0x08, 0x0D, 0x03, 0x08, 0x0B,
+    0xC0, 0x20, 0x0E, 0x90, 0xAE, 0x90, 0x75, 0x0B, 0xCE, 0x90, 0xA3, 0x40, 0x18, 0x0B, 0xC0, 0xF6,
+    0x10, 0x40, 0xA4, 0x30, 0x00, 0xEC, 0x02, 0x50, 0x60, 0x5C, 0x09, 0x00, 0x00, 0xD9, 0x07, 0x02,
+    0x0C, 0x0F, 0x0C, 0xB0, 0x50, 0x09, 0x00, 0x03, 0x0D, 0x08, 0x00, 0x10, 0x20, 0x10, 0xF0, 0xA0,
+    0x4B, 0x20, 0x70, 0x90, 0xA0, 0x90, 0x70, 0x20, 0xC0, 0xF0, 0x60, 0x80, 0x00, 0x04, 0x07, 0x04,
+    0x0A, 0x0F, 0x00, 0x50, 0x80, 0x60, 0x30, 0x00, 0x09, 0x0A, 0x00, 0x60, 0x80, 0xB0, 0x05, 0x0B,
+    0x00, 0x70, 0x00, 0x00, 0x0E, 0x00, 0x20, 0x10, 0x03, 0x00, 0xF0, 0x10, 0x05, 0x06, 0x00, 0x00,
+    0x03, 0x00, 0xC0, 0x20, 0x00, 0x00, 0xA0, 0x0E, 0x00, 0x20, 0x0B, 0x00, 0x00, 0x80, 0x0A, 0x00,
+    0x00, 0x04, 0x00, 0x80, 0x60, 0x02, 0x00, 0x60, 0x04, 0x00, 0x00, 0x0A, 0x30, 0x61, 0x00, 0xB0,
+    0x25, 0x0B, 0x00, 0x70, 0x43, 0x00, 0x90, 0xCB, 0x25, 0x16, 0x43, 0xAD, 0x08, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x40, 0x00, 0xCB, 0x25, 0x70, 0x9E, 0xAD, 0x9E, 0x70, 0x20, 0x00, 0x00, 0x01, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0xB0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xD0, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x09, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x09, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x60
+};
+static const uint8_t EC40_H247_N2_M[374] EC40_PROGMEM = {
+    0x44, 0x44, 0x44, 0x44, 0x44, 0x44, 0x44, 0x44, 0x44, 0x44, 0x44, 0x44, 0x44, 0x40, 0x44, 0x44,
+    0x40, 0x44, 0x44, 0x44, 0x44, 0x44, 0x04, 0x40, 0x44, 0x44, 0x44, 0x04, 0x04, 0x04, 0x05, 0x04,
+    0x40, 0x44, 0x04, 0x40, 0x44, 0x44, 0x44, 0x04, 0x44, 0x40, 0x44, 0x40, 0x44, 0x04, 0x40, 0x44,
+    0x40, 0x40, 0x44, 0x40, 0x40, 0x44, 0x04, 0x40, 0x40, 0x44, 0x04, 0x00, 0x40, 0x44, 0x04, 0x04,
+    0x04, 0x04, 0x04, 0x40, 0x40, 0x04, 0x04, 0x04, 0x04, 0x04, 0x00, 0x40, 0x40, 0x40, 0x40, 0x40,
+    0x33, 0x30, 0x30, 0x30, 0x30, 0x30, 0x30, 0x30, 0x30, 0x40, 0x30, 0x30, 0x00, 0x04, 0x04, 0x03,
+    0x03, 0x03, 0x00, 0x40, 0x30, 0x30, 0x30, 0x00, 0x04, 0x03, 0x00, 0x40, 0x40, 0x40, 0x03, 0x04,
+    0x00, 0x40, 0x00, 0x03, 0x04, 0x00, 0x40, 0x40, 0x04, 0x00, 0x40, 0x40, 0x04, 0x04, 0x00, 0x00,
+    0x04, 0x00, 0x30, 0x30, 0x03, 0x00, 0x40, 0x03, 0x00, 0x30, 0x04, 0x00, 0x00, 0x30, 0x03, 0x00,
+    0x40, 0x03, 0x00, 0x30, 0x40, 0x04, 0x00, 0x30, 0x04, 0x00, 0x00, 0x03, 0x30, 0x44, 0x00, 0x40,
+    0x33, 0x04, 0x00, 0x40, 0x44, 0x04, 0x40, 0x44, 0x44, 0x44, 0x44, 0x44, 0x04, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x40, 0x00, 0x33, 0x33, 0x33, 0x34, 0x44, 0x33, 0x33, 0x30, 0x00, 0x00, 0x03, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x40, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x40
+};
+
+// house 247, nib7 0x8: temp_idx 550..609, 35 celdas observadas, 68 bytes
+static const uint8_t EC40_H247_N8_VALID[8] EC40_PROGMEM = {
+    0x29, 0xA5, 0x44, 0xAA, 0xD6, 0xEE, 0xFF, 0x0E
+};
+static const uint8_t EC40_H247_N8_P[30] EC40_PROGMEM = {
+    0xA0, 0x03, 0x06, 0x00, 0xC0, 0x50, 0x0C, 0x09, 0x00, 0x30, 0x00, 0xE0, 0x0C, 0x02, 0x01, 0x04,
+    0x0A, 0x80, 0x60, 0x52, 0x01, 0x8F, 0x0A, 0x34, 0x07, 0xBC, 0x52, 0x07, 0x09, 0xDA
+};
+static const uint8_t EC40_H247_N8_M[30] EC40_PROGMEM = {
+    0x40, 0x04, 0x04, 0x00, 0x40, 0x40, 0x04, 0x04, 0x00, 0x40, 0x00, 0x40, 0x04, 0x04, 0x04, 0x04,
+    0x04, 0x40, 0x40, 0x44, 0x04, 0x44, 0x04, 0x44, 0x45, 0x34, 0x44, 0x44, 0x04, 0x44
+};
+
+// house 251, nib7 0x8: temp_idx 610..610, 1 celdas observadas, 3 bytes
+static const uint8_t EC40_H251_N8_VALID[1] EC40_PROGMEM = {
+    0x01
+};
+static const uint8_t EC40_H251_N8_P[1] EC40_PROGMEM = {
+    0xE0
+};
+static const uint8_t EC40_H251_N8_M[1] EC40_PROGMEM = {
+    0x40
+};
+
+// house 255, nib7 0x8: temp_idx 584..630, 27 celdas observadas, 54 bytes
+static const uint8_t EC40_H255_N8_VALID[6] EC40_PROGMEM = {
+    0x7F, 0xBF, 0x1F, 0x63, 0x82, 0x48
+};
+static const uint8_t EC40_H255_N8_P[24] EC40_PROGMEM = {
+    0xA8, 0xF6, 0x12, 0x60, 0x18, 0xFD, 0xA3, 0x04, 0x7B, 0x52, 0x00, 0x00, 0x59, 0x00, 0x0A, 0x80,
+    0x07, 0x00, 0x00, 0x03, 0x00, 0x04, 0x00, 0x00
+};
+static const uint8_t EC40_H255_N8_M[24] EC40_PROGMEM = {
+    0x55, 0x55, 0x55, 0x40, 0x55, 0x55, 0x55, 0x05, 0x54, 0x44, 0x40, 0x00, 0x44, 0x00, 0x05, 0x40,
+    0x04, 0x00, 0x00, 0x05, 0x00, 0x04, 0x00, 0x50
+};
+
+#define EC40_PM_TABLE_COUNT 49
+
+// También en flash: en SRAM no cabría en un ATtiny85 (512 bytes)
+static const ec40_pm_table_t EC40_PM_TABLES[EC40_PM_TABLE_COUNT] EC40_PROGMEM = {
+    {0, 0x8, 896, 27, EC40_H0_N8_VALID, EC40_H0_N8_P, EC40_H0_N8_M},
+    {3, 0x0, 531, 49, EC40_H3_N0_VALID, EC40_H3_N0_P, EC40_H3_N0_M},
+    {3, 0x1, 580, 222, EC40_H3_N1_VALID, EC40_H3_N1_P, EC40_H3_N1_M},
+    {3, 0x2, 535, 15, EC40_H3_N2_VALID, EC40_H3_N2_P, EC40_H3_N2_M},
+    {18, 0x0, 597, 3, EC40_H18_N0_VALID, EC40_H18_N0_P, EC40_H18_N0_M},
+    {18, 0x2, 594, 6, EC40_H18_N2_VALID, EC40_H18_N2_P, EC40_H18_N2_M},
+    {18, 0x8, 600, 162, EC40_H18_N8_VALID, EC40_H18_N8_P, EC40_H18_N8_M},
+    {39, 0x8, 533, 36, EC40_H39_N8_VALID, EC40_H39_N8_P, EC40_H39_N8_M},
+    {44, 0x8, 575, 1, EC40_H44_N8_VALID, EC40_H44_N8_P, EC40_H44_N8_M},
+    {53, 0x2, 534, 3, EC40_H53_N2_VALID, EC40_H53_N2_P, EC40_H53_N2_M},
+    {53, 0x8, 533, 70, EC40_H53_N8_VALID, EC40_H53_N8_P, EC40_H53_N8_M},
+    {71, 0x1, 560, 2, EC40_H71_N1_VALID, EC40_H71_N1_P, EC40_H71_N1_M},
+    {71, 0x8, 498, 62, EC40_H71_N8_VALID, EC40_H71_N8_P, EC40_H71_N8_M},
+    {73, 0x8, 601, 22, EC40_H73_N8_VALID, EC40_H73_N8_P, EC40_H73_N8_M},
+    {79, 0x8, 609, 1, EC40_H79_N8_VALID, EC40_H79_N8_P, EC40_H79_N8_M},
+    {92, 0x8, 945, 1, EC40_H92_N8_VALID, EC40_H92_N8_P, EC40_H92_N8_M},
+    {94, 0x8, 590, 2, EC40_H94_N8_VALID, EC40_H94_N8_P, EC40_H94_N8_M},
+    {95, 0x1, 566, 74, EC40_H95_N1_VALID, EC40_H95_N1_P, EC40_H95_N1_M},
+    {95, 0x8, 516, 124, EC40_H95_N8_VALID, EC40_H95_N8_P, EC40_H95_N8_M},
+    {96, 0x2, 666, 53, EC40_H96_N2_VALID, EC40_H96_N2_P, EC40_H96_N2_M},
+    {96, 0x8, 720, 170, EC40_H96_N8_VALID, EC40_H96_N8_P, EC40_H96_N8_M},
+    {121, 0x1, 590, 74, EC40_H121_N1_VALID, EC40_H121_N1_P, EC40_H121_N1_M},
+    {121, 0x8, 530, 135, EC40_H121_N8_VALID, EC40_H121_N8_P, EC40_H121_N8_M},
+    {124, 0x2, 530, 55, EC40_H124_N2_VALID, EC40_H124_N2_P, EC40_H124_N2_M},
+    {124, 0x8, 529, 124, EC40_H124_N8_VALID, EC40_H124_N8_P, EC40_H124_N8_M},
+    {131, 0x1, 517, 3, EC40_H131_N1_VALID, EC40_H131_N1_P, EC40_H131_N1_M},
+    {131, 0x2, 516, 18, EC40_H131_N2_VALID, EC40_H131_N2_P, EC40_H131_N2_M},
+    {131, 0x8, 528, 136, EC40_H131_N8_VALID, EC40_H131_N8_P, EC40_H131_N8_M},
+    {132, 0x8, 603, 16, EC40_H132_N8_VALID, EC40_H132_N8_P, EC40_H132_N8_M},
+    {135, 0x8, 803, 143, EC40_H135_N8_VALID, EC40_H135_N8_P, EC40_H135_N8_M},
+    {151, 0x8, 604, 14, EC40_H151_N8_VALID, EC40_H151_N8_P, EC40_H151_N8_M},
+    {155, 0x8, 601, 27, EC40_H155_N8_VALID, EC40_H155_N8_P, EC40_H155_N8_M},
+    {173, 0x1, 583, 180, EC40_H173_N1_VALID, EC40_H173_N1_P, EC40_H173_N1_M},
+    {173, 0x2, 580, 107, EC40_H173_N2_VALID, EC40_H173_N2_P, EC40_H173_N2_M},
+    {173, 0x8, 584, 180, EC40_H173_N8_VALID, EC40_H173_N8_P, EC40_H173_N8_M},
+    {184, 0x2, 525, 9, EC40_H184_N2_VALID, EC40_H184_N2_P, EC40_H184_N2_M},
+    {184, 0x8, 524, 115, EC40_H184_N8_VALID, EC40_H184_N8_P, EC40_H184_N8_M},
+    {187, 0x1, 582, 69, EC40_H187_N1_VALID, EC40_H187_N1_P, EC40_H187_N1_M},
+    {187, 0x8, 525, 127, EC40_H187_N8_VALID, EC40_H187_N8_P, EC40_H187_N8_M},
+    {205, 0x1, 516, 79, EC40_H205_N1_VALID, EC40_H205_N1_P, EC40_H205_N1_M},
+    {205, 0x8, 516, 172, EC40_H205_N8_VALID, EC40_H205_N8_P, EC40_H205_N8_M},
+    {232, 0x1, 584, 93, EC40_H232_N1_VALID, EC40_H232_N1_P, EC40_H232_N1_M},
+    {232, 0x8, 529, 74, EC40_H232_N8_VALID, EC40_H232_N8_P, EC40_H232_N8_M},
+    {247, 0x0, 254, 417, EC40_H247_N0_VALID, EC40_H247_N0_P, EC40_H247_N0_M},
+    {247, 0x1, 376, 639, EC40_H247_N1_VALID, EC40_H247_N1_P, EC40_H247_N1_M},
+    {247, 0x2, 240, 747, EC40_H247_N2_VALID, EC40_H247_N2_P, EC40_H247_N2_M},
+    {247, 0x8, 550, 60, EC40_H247_N8_VALID, EC40_H247_N8_P, EC40_H247_N8_M},
+    {251, 0x8, 610, 1, EC40_H251_N8_VALID, EC40_H251_N8_P, EC40_H251_N8_M},
+    {255, 0x8, 584, 47, EC40_H255_N8_VALID, EC40_H255_N8_P, EC40_H255_N8_M},
+};
+
+static inline uint8_t ec40_nibble(const uint8_t *packed, uint16_t i)
+{
+    uint8_t b = EC40_READ(&packed[i >> 1]);
+    return (i & 1) ? (b & 0x0F) : (b >> 4);
+}
+
+// 1 y *m, *p si la celda (house, nib7, temp_idx) se observó; 0 si no
+static inline uint8_t ec40_pm_lookup(uint8_t house, uint8_t nib7, uint16_t temp_idx,
+                                     uint8_t *m, uint8_t *p)
+{
+    for (uint8_t k = 0; k < EC40_PM_TABLE_COUNT; k++) {
+        const ec40_pm_table_t *t = &EC40_PM_TABLES[k];
+        if (EC40_READ(&t->house) != house || EC40_READ(&t->nib7) != nib7) continue;
+        uint16_t t_lo = EC40_READ_WORD(&t->t_lo);
+        if (temp_idx < t_lo || temp_idx - t_lo >= EC40_READ_WORD(&t->span)) return 0;
+        uint16_t i = temp_idx - t_lo;
+        const uint8_t *valid = EC40_READ_PTR(&t->valid);
+        if (!((EC40_READ(&valid[i >> 3]) >> (i & 7)) & 1)) return 0;
+        *p = ec40_nibble(EC40_READ_PTR(&t->p), i);
+        *m = ec40_nibble(EC40_READ_PTR(&t->m), i);
+        return 1;
+    }
+    return 0;
+}
+
+#endif